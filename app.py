@@ -20,6 +20,11 @@ import time
 import webbrowser
 from pathlib import Path
 
+# isort: split
+# Startup profiler first, so its import hook also times the imports below
+from utils.startup_profiler import startup_profiler
+
+# isort: split
 # Third-party library imports
 import dash
 import diskcache
@@ -32,6 +37,7 @@ from callbacks import register_all_callbacks
 from configuration import __version__
 from configuration.logging_config import cleanup_old_logs, setup_logging
 from configuration.server import get_server_config
+from data.figure_cache import get_figure_cache_stats
 from data.installation_context import get_installation_context
 from data.persistence.factory import get_backend
 from data.task_progress import TaskProgress
@@ -48,6 +54,8 @@ from ui.app_config import (
 )
 from utils.license_extractor import extract_license_on_first_run
 
+startup_profiler.mark("imports")
+
 # Global reference to server for clean shutdown
 _server = None
 
@@ -75,15 +83,17 @@ logger_init.info(f"Installation context: {installation_context}")
 extract_license_on_first_run()
 
 # Initialize logging first (before any other operations)
-setup_logging(log_dir=str(installation_context.logs_path), log_level="INFO")
-cleanup_old_logs(log_dir=str(installation_context.logs_path), max_age_days=30)
+with startup_profiler.phase("logging setup"):
+    setup_logging(log_dir=str(installation_context.logs_path), log_level="INFO")
+    cleanup_old_logs(log_dir=str(installation_context.logs_path), max_age_days=30)
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 logger.info("Starting Burndown application")
 
 # Clean up orphaned temp updaters from previous sessions
-cleanup_orphaned_temp_updaters()
+with startup_profiler.phase("updater cleanup"):
+    cleanup_orphaned_temp_updaters()
 
 #######################################################################
 # DATABASE MIGRATION
@@ -95,7 +105,8 @@ try:
     from data.migration.migrator import run_migration_if_needed
 
     logger.info("Checking if database migration needed...")
-    migration_success = run_migration_if_needed()
+    with startup_profiler.phase("migration"):
+        migration_success = run_migration_if_needed()
 
     if migration_success:
         logger.info("Database ready (migration complete or not needed)")
@@ -112,7 +123,8 @@ except Exception as e:
 # VERSION CHECK
 #######################################################################
 
-VERSION_CHECK_RESULT: UpdateProgress | None = restore_pending_update()
+with startup_profiler.phase("pending update restore"):
+    VERSION_CHECK_RESULT: UpdateProgress | None = restore_pending_update()
 
 
 def _set_version_check_result(result: UpdateProgress) -> None:
@@ -125,7 +137,8 @@ update_check_thread = start_update_check(
 )
 
 # Validate workspace before app initialization
-ensure_valid_workspace()
+with startup_profiler.phase("workspace validation"):
+    ensure_valid_workspace()
 
 # Configure background callback manager for long-running tasks
 cache = diskcache.Cache("./cache")
@@ -157,12 +170,24 @@ app.index_string = INDEX_STRING
 # Set the layout function as the app's layout
 app.layout = serve_layout
 
+startup_profiler.mark("dash app init")
+
 #######################################################################
 # REGISTER CALLBACKS
 #######################################################################
 
 # Register all callbacks from the modular callback system
-register_all_callbacks(app)
+with startup_profiler.phase("callback registration"):
+    register_all_callbacks(app)
+
+# Startup profile mode: build the layout once to time it, then write the report
+if startup_profiler.enabled:
+    with startup_profiler.phase("layout build"):
+        try:
+            serve_layout()
+        except Exception as e:
+            logger.warning(f"[Startup Profile] Layout build failed: {e}")
+    startup_profiler.write_report(installation_context.logs_path)
 
 #######################################################################
 # FLASK API ENDPOINTS
@@ -223,6 +248,21 @@ def clear_post_update():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.server.route("/api/figure-cache-stats", methods=["GET"])
+def figure_cache_stats():
+    """API endpoint exposing the server-side figure cache counters.
+
+    Returns:
+        JSON response with hits, misses, hit_rate, evictions, entries,
+        size_bytes and max_bytes
+
+    Example:
+        GET /api/figure-cache-stats
+        Response: {"hits": 42, "misses": 7, "hit_rate": 0.857, ...}
+    """
+    return jsonify(get_figure_cache_stats())
+
+
 #######################################################################
 # MAIN
 #######################################################################
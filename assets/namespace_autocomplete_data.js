@@ -6,6 +6,9 @@
  *
  * Exposed on window._nsa (internal cross-file namespace):
  *   window._nsa.buildDataset(metadata)         -> dataset object
+ *   window._nsa.buildIndex(items, getTerms)     -> ranked prefix index
+ *   window._nsa.searchIndex(index, query, max)  -> matching items, best first
+ *   window._nsa.getIndexes(data)                -> indexes of a dataset
  *   window._nsa.filterSuggestions(input, data) -> suggestion array
  *   window._nsa.renderSuggestionsHtml(arr)      -> HTML string
  *   window._nsa.escapeHtml(text)                -> safe HTML string
@@ -13,6 +16,152 @@
 
 window._nsa = window._nsa || {};
 
+/**
+ * Build a ranked prefix index over metadata items.
+ *
+ * Same ranking as data/autocomplete_index.py:
+ *   1. key/id or name starts with the query (exact match first)
+ *   2. a later word of the name starts with it ("points" -> "Story Points")
+ *   3. the name's initials start with it ("sp" -> "Story Points")
+ *   4. substring of key/id or name (scan, only if 1-3 return too few)
+ *
+ * @param {Array} items - Dataset items (projects, fields or statuses)
+ * @param {Function} getTerms - item -> [key or id, name]
+ * @returns {Object} Index for searchIndex
+ */
+window._nsa.buildIndex = function (items, getTerms) {
+  var prefixTerms = [];
+  var wordTerms = [];
+  var initialsTerms = [];
+  var haystacks = [];
+
+  items.forEach(function (item, position) {
+    var terms = getTerms(item);
+    var key = (terms[0] || '').toLowerCase();
+    var name = (terms[1] || '').toLowerCase();
+
+    prefixTerms.push([key, position]);
+    if (name && name !== key) {
+      prefixTerms.push([name, position]);
+    }
+
+    var words = name.split(/[^0-9a-z]+/).filter(Boolean);
+    words.slice(1).forEach(function (word) {
+      wordTerms.push([word, position]);
+    });
+    if (words.length > 1) {
+      initialsTerms.push([
+        words
+          .map(function (word) {
+            return word[0];
+          })
+          .join(''),
+        position,
+      ]);
+    }
+
+    haystacks.push(key + '\n' + name);
+  });
+
+  var byTerm = function (a, b) {
+    return a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : a[1] - b[1];
+  };
+
+  return {
+    items: items,
+    tiers: [prefixTerms.sort(byTerm), wordTerms.sort(byTerm), initialsTerms.sort(byTerm)],
+    haystacks: haystacks,
+  };
+};
+
+/**
+ * Return up to limit items matching query, best matches first.
+ *
+ * @param {Object} index - Output of buildIndex
+ * @param {string} query - Text typed so far (case-insensitive)
+ * @param {number} limit - Maximum number of items
+ * @returns {Array} Matching items
+ */
+window._nsa.searchIndex = function (index, query, limit) {
+  if (!index || limit <= 0) {
+    return [];
+  }
+  query = (query || '').trim().toLowerCase();
+  if (!query) {
+    return index.items.slice(0, limit);
+  }
+
+  var found = [];
+  var seen = new Set();
+
+  for (var t = 0; t < index.tiers.length && found.length < limit; t++) {
+    var terms = index.tiers[t];
+
+    // Binary search for the first term >= query
+    var lo = 0;
+    var hi = terms.length;
+    while (lo < hi) {
+      var mid = (lo + hi) >>> 1;
+      if (terms[mid][0] < query) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+
+    for (var i = lo; i < terms.length && terms[i][0].startsWith(query); i++) {
+      var position = terms[i][1];
+      if (!seen.has(position)) {
+        seen.add(position);
+        found.push(position);
+        if (found.length >= limit) {
+          break;
+        }
+      }
+    }
+  }
+
+  // Substring fallback, only when the prefix tiers did not fill the list
+  for (var p = 0; p < index.haystacks.length && found.length < limit; p++) {
+    if (!seen.has(p) && index.haystacks[p].includes(query)) {
+      found.push(p);
+    }
+  }
+
+  return found.map(function (position) {
+    return index.items[position];
+  });
+};
+
+// Indexes per dataset object. Kept out of the dataset itself so the
+// namespace-autocomplete-data store does not serialize them.
+var _indexesByDataset = new WeakMap();
+
+/**
+ * Indexes of a dataset, built on first use (once per metadata refresh).
+ *
+ * @param {Object} autocompleteData - Dataset from buildDataset
+ * @returns {Object} { projects, fields, statuses } indexes
+ */
+window._nsa.getIndexes = function (autocompleteData) {
+  var indexes = _indexesByDataset.get(autocompleteData);
+  if (!indexes) {
+    indexes = {
+      projects: window._nsa.buildIndex(autocompleteData.projects || [], function (p) {
+        return [p.key, p.name];
+      }),
+      fields: window._nsa.buildIndex(autocompleteData.fields || [], function (f) {
+        return [f.id, f.name];
+      }),
+      statuses: window._nsa.buildIndex(autocompleteData.statuses || [], function (s) {
+        return [s.name, s.name];
+      }),
+    };
+    _indexesByDataset.set(autocompleteData, indexes);
+  }
+  return indexes;
+};
+
 /**
  * Build the autocomplete dataset from raw JIRA metadata.
  *
@@ -24,7 +173,7 @@ window._nsa.buildDataset = function (metadata) {
     return { fields: [], projects: [], statuses: [], issueTypes: [] };
   }
 
-  return {
+  var dataset = {
     fields: (metadata.fields || []).map(function (f) {
       return {
         id: f.id || f.field_id || '',
@@ -54,6 +203,10 @@ window._nsa.buildDataset = function (metadata) {
       };
     }),
   };
+
+  // Build the indexes now, not on the first keystroke
+  window._nsa.getIndexes(dataset);
+  return dataset;
 };
 
 /**
@@ -76,6 +229,7 @@ window._nsa.filterSuggestions = function (inputValue, autocompleteData) {
   var suggestions = [];
   var maxResults = 15;
   var parts = inputValue.split('.');
+  var indexes = window._nsa.getIndexes(autocompleteData);
 
   if (parts.length === 1 && !inputValue.includes(':')) {
     // First token: could be project prefix or bare field
@@ -89,19 +243,20 @@ window._nsa.filterSuggestions = function (inputValue, autocompleteData) {
       });
     }
 
-    autocompleteData.projects.forEach(function (p) {
-      if (p.searchText.includes(query) && suggestions.length < maxResults) {
+    window._nsa
+      .searchIndex(indexes.projects, query, maxResults - suggestions.length)
+      .forEach(function (p) {
         suggestions.push({
           label: p.key,
           value: p.key + '.',
           description: p.name,
           type: 'project',
         });
-      }
-    });
+      });
 
-    autocompleteData.fields.forEach(function (f) {
-      if (f.searchText.includes(query) && suggestions.length < maxResults) {
+    window._nsa
+      .searchIndex(indexes.fields, query, maxResults - suggestions.length)
+      .forEach(function (f) {
         suggestions.push({
           label: f.name,
           value: f.id,
@@ -109,23 +264,20 @@ window._nsa.filterSuggestions = function (inputValue, autocompleteData) {
           type: 'field',
           fieldType: f.type,
         });
-      }
-    });
+      });
   } else if (parts.length >= 2) {
     // "Project." typed - suggest fields
     var fieldQuery = parts[parts.length - 1].toLowerCase();
     var prefix = parts.slice(0, -1).join('.') + '.';
 
-    autocompleteData.fields.forEach(function (f) {
-      if (f.searchText.includes(fieldQuery) && suggestions.length < maxResults) {
-        suggestions.push({
-          label: f.name,
-          value: prefix + f.id,
-          description: f.id + ' (' + f.type + ')',
-          type: 'field',
-          fieldType: f.type,
-        });
-      }
+    window._nsa.searchIndex(indexes.fields, fieldQuery, maxResults).forEach(function (f) {
+      suggestions.push({
+        label: f.name,
+        value: prefix + f.id,
+        description: f.id + ' (' + f.type + ')',
+        type: 'field',
+        fieldType: f.type,
+      });
     });
   }
 
@@ -160,16 +312,16 @@ window._nsa.filterSuggestions = function (inputValue, autocompleteData) {
       // Typing status value after colon
       var statusQuery = afterColon.toLowerCase();
 
-      autocompleteData.statuses.forEach(function (s) {
-        if (s.searchText.includes(statusQuery) && suggestions.length < maxResults) {
+      window._nsa
+        .searchIndex(indexes.statuses, statusQuery, maxResults - suggestions.length)
+        .forEach(function (s) {
           suggestions.push({
             label: s.name,
             value: colonParts[0] + ':' + s.name,
             description: 'Status: ' + (s.category || 'Unknown') + ' (add .DateTime for timestamp)',
             type: 'status',
           });
-        }
-      });
+        });
     }
   }
 
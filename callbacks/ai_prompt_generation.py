@@ -6,10 +6,8 @@ Follows Constitution Principle I (Layered Architecture) - delegates to data laye
 
 import logging
 
-import pyperclip  # Cross-platform clipboard support
 from dash import Input, Output, State, callback, no_update
 
-from data.ai_prompt_generator import generate_ai_analysis_prompt
 from ui.toast_notifications import create_toast
 
 logger = logging.getLogger(__name__)
@@ -48,6 +46,11 @@ def generate_and_copy_ai_prompt(n_clicks: int, data_points: int):
     Returns:
         Toast notification component (success or error)
     """
+    # Only needed when the button is clicked, so not loaded at startup
+    import pyperclip  # noqa: PLC0415  # Cross-platform clipboard support
+
+    from data.ai_prompt_generator import generate_ai_analysis_prompt  # noqa: PLC0415
+
     if not n_clicks:
         return no_update
 
@@ -16,7 +16,7 @@ from datetime import datetime
 
 from dash import Input, Output, State, callback, ctx
 
-from data.persistence.factory import get_backend
+from data.task_progress import TaskProgress
 from utils.datetime_utils import parse_iso_datetime
 
 logger = logging.getLogger(__name__)
@@ -73,8 +73,7 @@ def update_banner_status_icons(
         return "fas fa-folder me-1", "fas fa-search me-1"
 
     try:
-        backend = get_backend()
-        progress_data = backend.get_task_state()
+        progress_data = TaskProgress.get_task_state()
 
         # PRIORITY 1: Update Data operation (highest priority - background sync)
         if progress_data:
@@ -18,7 +18,6 @@ import dash_bootstrap_components as dbc
 from dash import html
 
 from configuration.settings import get_bug_analysis_config
-from data.bug_insights import generate_quality_insights
 
 # Application imports
 from data.bug_processing import (
@@ -30,11 +29,6 @@ from data.bug_processing import (
 from data.issue_filtering import filter_issues_for_metrics
 from data.persistence import load_app_settings, load_jira_configuration
 from data.persistence.factory import get_backend
-from ui.bug_analysis import (
-    create_bug_metrics_cards,
-    create_quality_insights_panel,
-)
-from ui.bug_charts import BugInvestmentChart, BugTrendChart
 from ui.empty_states import create_no_bugs_state
 from ui.loading_utils import create_content_placeholder
 
@@ -66,6 +60,14 @@ def _render_bug_analysis_content(
     Returns:
         Complete bug analysis tab content (html.Div)
     """
+    # Chart and insight modules are loaded with the tab instead of at app startup
+    from data.bug_insights import generate_quality_insights  # noqa: PLC0415
+    from ui.bug_analysis import (  # noqa: PLC0415
+        create_bug_metrics_cards,
+        create_quality_insights_panel,
+    )
+    from ui.bug_charts import BugInvestmentChart, BugTrendChart  # noqa: PLC0415
+
     logger.info(f"Rendering bug analysis content with data_points: {data_points_count}")
 
     try:
@@ -91,7 +93,9 @@ def _render_bug_analysis_content(
 
             # Get all issues from database
             if active_profile_id and active_query_id:
-                all_issues = backend.get_issues(active_profile_id, active_query_id)
+                all_issues = backend.get_issues(
+                    active_profile_id, active_query_id, lazy=True
+                )
 
                 if all_issues:
                     logger.debug(
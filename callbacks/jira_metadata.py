@@ -8,6 +8,8 @@ opening the field mapping modal.
 
 Architecture:
 - jira-metadata-store: App-level store containing fields, projects, statuses
+- data.jira.metadata_cache: persistent cache behind the fetcher (shared by
+  all fetchers, survives restarts, warmed on profile switch)
 - jira-config-hash: Tracks config version to detect changes
 - Metadata fetch triggered by: app init, JIRA config save, page refresh
 """
@@ -41,11 +43,16 @@ def _compute_config_hash(jira_config: dict[str, Any]) -> str:
 
 def _fetch_jira_metadata(
     jira_config: dict[str, Any],
+    force_refresh: bool = False,
 ) -> tuple[dict[str, Any], str | None]:
     """Fetch all JIRA metadata for field mapping.
 
+    Metadata comes from the shared JIRA metadata cache when it is fresh, so
+    this is only slow the first time a JIRA instance is used.
+
     Args:
         jira_config: JIRA configuration with base_url, token, api_version
+        force_refresh: Bypass the metadata cache (after a JIRA config save)
 
     Returns:
         Tuple of (metadata_dict, error_message)
@@ -74,10 +81,10 @@ def _fetch_jira_metadata(
         start_time = time.time()
 
         # Fetch all metadata types
-        fields = fetcher.fetch_fields()
-        projects = fetcher.fetch_projects()
-        issue_types = fetcher.fetch_issue_types()
-        statuses = fetcher.fetch_statuses()
+        fields = fetcher.fetch_fields(force_refresh=force_refresh)
+        projects = fetcher.fetch_projects(force_refresh=force_refresh)
+        issue_types = fetcher.fetch_issue_types(force_refresh=force_refresh)
+        statuses = fetcher.fetch_statuses(force_refresh=force_refresh)
 
         # Auto-detect configurations
         auto_detected_types = fetcher.auto_detect_issue_types(issue_types)
@@ -218,7 +225,9 @@ def fetch_metadata_on_startup_or_config_change(
         logger.info("[JiraMetadata] Initial load or config changed, fetching metadata")
 
     # Fetch metadata
-    metadata, error = _fetch_jira_metadata(jira_config)
+    metadata, error = _fetch_jira_metadata(
+        jira_config, force_refresh=triggered_id == "jira-config-save-trigger"
+    )
 
     if error:
         logger.warning(f"[JiraMetadata] Fetch failed: {error}")
@@ -6,7 +6,9 @@ The autocomplete data is pre-built from JIRA metadata when the modal opens.
 
 Architecture:
 1. buildAutocompleteData: Runs when metadata loads, builds searchable dataset
-2. filterSuggestions: Runs on each keystroke via JavaScript (no Dash callback)
+   and its ranked prefix indexes (once per metadata refresh)
+2. filterSuggestions: Runs on each keystroke via JavaScript (no Dash callback),
+   looking up the indexes instead of scanning every field
 3. collectNamespaceValues: Runs on save/validate button click to gather input values
 4. DOM event handlers: Initialize keyboard/click handlers on container elements
 
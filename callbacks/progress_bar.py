@@ -8,7 +8,6 @@ from dash import Input, Output, callback, html, no_update
 from dash.exceptions import PreventUpdate
 
 from data.persistence.adapters import load_statistics
-from data.persistence.factory import get_backend
 from data.query_manager import get_query_dropdown_options
 from data.task_progress import TaskProgress
 from utils.datetime_utils import parse_iso_datetime
@@ -46,8 +45,7 @@ def update_progress_bars(n_intervals):
     """
     try:
         # Read task progress from database
-        backend = get_backend()
-        progress_data = backend.get_task_state()
+        progress_data = TaskProgress.get_task_state()
 
         if progress_data is None:
             # No progress data - hide progress bar and disable polling
@@ -583,8 +581,7 @@ def reload_data_after_update(refresh_trigger):
     try:
         # Load statistics from disk
         # Check if task is already complete (avoid redundant complete_task calls)
-        backend = get_backend()
-        progress_data = backend.get_task_state()
+        progress_data = TaskProgress.get_task_state()
         task_status = progress_data.get("status") if progress_data else None
         already_complete = task_status == "complete"
 
@@ -690,8 +687,7 @@ def cleanup_stale_tasks_on_load(pathname):
         bool: False to enable polling if stale task exists, True to keep disabled
     """
     try:
-        backend = get_backend()
-        state = backend.get_task_state()
+        state = TaskProgress.get_task_state()
 
         if state is None:
             # No task state, keep polling disabled
@@ -710,7 +706,7 @@ def cleanup_stale_tasks_on_load(pathname):
                     logger.warning(
                         f"[Progress] Invalid {time_key} value, clearing stale state"
                     )
-                    backend.clear_task_state()
+                    TaskProgress.clear_task_state()
                     return True
 
                 elapsed = (datetime.now() - parsed_timestamp).total_seconds()
@@ -721,7 +717,7 @@ def cleanup_stale_tasks_on_load(pathname):
                         f"[Progress] Clearing stale {status} task state "
                         f"({elapsed:.0f}s old)"
                     )
-                    backend.clear_task_state()
+                    TaskProgress.clear_task_state()
                     return True  # Keep polling disabled
                 else:
                     # Recent error/complete - enable polling to show and auto-hide
@@ -735,7 +731,7 @@ def cleanup_stale_tasks_on_load(pathname):
                 logger.info(
                     f"[Progress] Clearing {status} task state with no timestamp"
                 )
-                backend.clear_task_state()
+                TaskProgress.clear_task_state()
                 return True
 
         # Task is in_progress or idle - enable polling to update UI
@@ -748,7 +744,7 @@ def cleanup_stale_tasks_on_load(pathname):
         # Idle status - clear state
         if status == "idle":
             logger.info("[Progress] Clearing idle task state")
-            backend.clear_task_state()
+            TaskProgress.clear_task_state()
             return True
 
         return True  # Keep polling disabled by default
@@ -1,12 +1,11 @@
 """Callbacks for HTML report generation (simplified synchronous version)."""
 
 import logging
-from datetime import datetime
 
 from dash import Input, Output, State, callback, no_update
 
 from data.query_manager import get_active_profile_id
-from data.report import generate_html_report
+from data.report import build_report_filename, generate_html_report
 from ui.toast_notifications import create_error_toast, create_warning_toast
 
 logger = logging.getLogger(__name__)
@@ -85,10 +84,7 @@ def generate_and_download_report(n_clicks, sections, data_points):
         )
 
         # Create filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        profile_name = metadata["profile_name"].replace(" ", "_").replace("/", "_")
-        query_name = metadata["query_name"].replace(" ", "_").replace("/", "_")
-        filename = f"{timestamp}_{profile_name}_{query_name}_{time_period}w.html"
+        filename = build_report_filename(metadata, time_period)
 
         logger.info(f"Report generated: {filename} ({len(html_content):,} bytes)")
 
@@ -510,7 +510,9 @@ def _should_force_refresh(force_refresh):
         active_query_id = backend.get_app_state("active_query_id")
 
         if active_profile_id and active_query_id:
-            issues = backend.get_issues(active_profile_id, active_query_id, limit=1)
+            issues = backend.get_issues(
+                active_profile_id, active_query_id, limit=1, columns=["issue_key"]
+            )
             if not issues:
                 logger.info(
                     "[Settings] New query detected (no issues in database), "
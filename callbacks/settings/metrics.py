@@ -13,6 +13,10 @@ from dash.exceptions import PreventUpdate
 
 from configuration import logger
 from data.iso_week_bucketing import get_weeks_from_date_range
+from data.metrics.delta_recompute import (
+    get_incremental_changed_keys,
+    record_metrics_settings,
+)
 from data.metrics_calculator import calculate_metrics_for_last_n_weeks
 from data.metrics_snapshots import clear_snapshots_cache
 from data.persistence.adapters.statistics import load_statistics
@@ -125,11 +129,22 @@ def register(app):
                 "Starting metrics calculation...",
             )
 
-            # Clear existing metrics to force fresh calculation
-            _clear_existing_metrics()
+            # After a delta fetch only the weeks touched by changed issues are
+            # recalculated; otherwise clear metrics to force a full run
+            changed_keys = get_incremental_changed_keys()
+            if changed_keys is None:
+                _clear_existing_metrics()
+            else:
+                logger.info(
+                    f"[Metrics] Incremental recalculation for "
+                    f"{len(changed_keys)} changed issues"
+                )
+                clear_snapshots_cache()
 
             # Start background calculation
-            _start_background_metrics_calculation(custom_weeks, total_weeks)
+            _start_background_metrics_calculation(
+                custom_weeks, total_weeks, changed_keys
+            )
 
         except Exception as e:
             logger.error(f"[Metrics] Auto-metrics setup failed: {e}", exc_info=True)
@@ -198,12 +213,16 @@ def _clear_existing_metrics() -> None:
             logger.warning(f"[Metrics] Failed to clear metrics cache: {e}")
 
 
-def _start_background_metrics_calculation(custom_weeks: list, total_weeks: int) -> None:
+def _start_background_metrics_calculation(
+    custom_weeks: list, total_weeks: int, changed_keys: list[str] | None = None
+) -> None:
     """Start background thread for metrics calculation.
 
     Args:
         custom_weeks: List of ISO weeks to calculate metrics for
         total_weeks: Total number of weeks for progress tracking
+        changed_keys: Issue keys changed by the last delta fetch, or None
+            for a full recalculation
     """
 
     def metrics_progress_callback(message: str):
@@ -231,9 +250,11 @@ def _start_background_metrics_calculation(custom_weeks: list, total_weeks: int)
             metrics_success, metrics_message = calculate_metrics_for_last_n_weeks(
                 custom_weeks=custom_weeks,
                 progress_callback=metrics_progress_callback,
+                changed_keys=changed_keys,
             )
 
             if metrics_success:
+                record_metrics_settings()
                 logger.info(f"[Metrics] Auto-calculated metrics: {metrics_message}")
                 TaskProgress.start_postprocess(
                     "update_data", "Data and metrics updated successfully"
@@ -9,24 +9,6 @@ import dash_bootstrap_components as dbc
 from dash import Input, Output, callback, callback_context, html, no_update
 
 from data.persistence.factory import get_backend
-from data.sprint_manager import (
-    calculate_sprint_progress,
-    calculate_sprint_scope_change_points,
-    calculate_sprint_scope_changes,
-    get_sprint_dates,
-    get_sprint_scope_change_issues,
-    reconcile_active_sprint_membership,
-    select_preferred_sprint,
-)
-from data.sprint_tracker_data import load_sprint_tracker_dataset
-from ui.sprint_tracker import (
-    create_sprint_scope_changes_view,
-    create_sprint_summary_cards,
-)
-from visualization.sprint_charts import (
-    create_sprint_progress_bars,
-    create_sprint_summary_card,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +32,25 @@ def update_sprint_selection(selected_sprint: str, show_points_list: list):
     Returns:
         Tuple of (updated data container, dropdown value)
     """
+    # Deferred like callbacks/sprint_tracker.py: loaded with the tab, not at startup
+    from data.sprint_manager import (  # noqa: PLC0415
+        calculate_sprint_progress,
+        calculate_sprint_scope_change_points,
+        calculate_sprint_scope_changes,
+        get_sprint_dates,
+        get_sprint_scope_change_issues,
+        reconcile_active_sprint_membership,
+        select_preferred_sprint,
+    )
+    from data.sprint_tracker_data import load_sprint_tracker_dataset  # noqa: PLC0415
+    from ui.sprint_tracker import (  # noqa: PLC0415
+        create_sprint_scope_changes_view,
+        create_sprint_summary_cards,
+    )
+    from visualization.sprint_charts import (  # noqa: PLC0415
+        create_sprint_progress_bars,
+        create_sprint_summary_card,
+    )
 
     # Log which input triggered this callback
     triggered = callback_context.triggered[0] if callback_context.triggered else None
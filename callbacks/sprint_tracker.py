@@ -13,30 +13,7 @@ import dash_bootstrap_components as dbc
 from dash import Input, Output, State, callback, callback_context, html, no_update
 
 from data.persistence.factory import get_backend
-from data.sprint_manager import (
-    calculate_sprint_progress,
-    calculate_sprint_scope_change_points,
-    calculate_sprint_scope_changes,
-    get_sprint_dates,
-    get_sprint_scope_change_issues,
-    reconcile_active_sprint_membership,
-    select_preferred_sprint,
-    sort_sprint_ids_by_recency,
-)
-from data.sprint_snapshot_calculator import calculate_daily_sprint_snapshots
-from data.sprint_tracker_data import load_sprint_tracker_dataset
 from ui.empty_states import create_no_sprints_state
-from ui.sprint_tracker import (
-    create_combined_sprint_controls,
-    create_sprint_charts_section,
-    create_sprint_scope_changes_view,
-    create_sprint_summary_cards,
-)
-from visualization.sprint_burnup_chart import create_sprint_burnup_chart
-from visualization.sprint_charts import (
-    create_sprint_progress_bars,
-    create_sprint_summary_card,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +33,28 @@ def _render_sprint_tracker_content(
     Returns:
         Complete Sprint Tracker tab content (html.Div)
     """
+    # Sprint modules load on first use to keep them out of app startup
+    from data.sprint_manager import (  # noqa: PLC0415
+        calculate_sprint_progress,
+        calculate_sprint_scope_change_points,
+        calculate_sprint_scope_changes,
+        get_sprint_scope_change_issues,
+        reconcile_active_sprint_membership,
+        select_preferred_sprint,
+        sort_sprint_ids_by_recency,
+    )
+    from data.sprint_tracker_data import load_sprint_tracker_dataset  # noqa: PLC0415
+    from ui.sprint_tracker import (  # noqa: PLC0415
+        create_combined_sprint_controls,
+        create_sprint_charts_section,
+        create_sprint_scope_changes_view,
+        create_sprint_summary_cards,
+    )
+    from visualization.sprint_charts import (  # noqa: PLC0415
+        create_sprint_progress_bars,
+        create_sprint_summary_card,
+    )
+
     logger.info(
         f"Rendering Sprint Tracker content with data_points: {data_points_count}"
     )
@@ -326,6 +325,16 @@ def update_sprint_charts(selected_sprint, charts_visible, points_toggle_list):
     Returns:
         Plotly figure for burnup chart
     """
+    # Burnup chart dependencies are only needed once the charts are opened
+    from data.sprint_manager import get_sprint_dates  # noqa: PLC0415
+    from data.sprint_snapshot_calculator import (  # noqa: PLC0415
+        calculate_daily_sprint_snapshots,
+    )
+    from data.sprint_tracker_data import load_sprint_tracker_dataset  # noqa: PLC0415
+    from visualization.sprint_burnup_chart import (  # noqa: PLC0415
+        create_sprint_burnup_chart,
+    )
+
     # Log which input triggered this callback
     triggered = callback_context.triggered[0] if callback_context.triggered else None
     trigger_id = triggered["prop_id"].split(".")[0] if triggered else "unknown"
@@ -21,6 +21,7 @@ from dash import (
     callback,
     callback_context,
     html,
+    no_update,
 )
 from dash.exceptions import PreventUpdate
 
@@ -32,10 +33,16 @@ from callbacks.visualization_helpers import check_has_points_in_period
 from callbacks.visualization_helpers.burndown_tab import _render_burndown_tab
 from callbacks.visualization_helpers.dashboard_tab import _render_dashboard_tab
 from callbacks.visualization_helpers.data_checks import filter_df_by_week_labels
+from callbacks.visualization_helpers.tab_cache import (
+    cache_tab_content,
+    get_cached_tab,
+    tab_cache_key,
+)
 from callbacks.visualization_helpers.tab_content import (
     create_scope_tracking_tab_content,
 )
 from data import compute_cumulative_values
+from data.figure_cache import get_figure_cache_stats
 from data.metrics_snapshots import load_snapshots
 from data.persistence import load_unified_project_data
 from ui.cards.data_cards import create_statistics_data_card
@@ -229,7 +236,7 @@ def register(app):
         import_trigger,  # Added parameter
         settings,
         statistics,
-        chart_cache,
+        chart_cache,  # Legacy client store, unused: content is cached server-side
         ui_state,
         viewport_size,
     ):
@@ -266,7 +273,7 @@ def register(app):
         logger.debug(
             "[CTO DEBUG] render_tab_content triggered by: "
             f"{trigger_info}, active_tab='{active_tab}', "
-            f"cache_size={len(chart_cache) if chart_cache else 0}"
+            f"figure_cache={get_figure_cache_stats()}"
         )
 
         # CRITICAL DEBUG: Log statistics data to diagnose query switching issue
@@ -301,17 +308,14 @@ def register(app):
 
         if not settings or not statistics:
             ui_state = ui_state or {"loading": False, "last_tab": None}
-            chart_cache = chart_cache or {}
             error_content = create_content_placeholder(
                 type="chart",
                 text="No data available. Please load project data first.",
                 height="400px",
             )
-            return error_content, chart_cache, ui_state
+            return error_content, no_update, ui_state
 
-        # Initialize cache and UI state if None
-        if chart_cache is None:
-            chart_cache = {}
+        # Initialize UI state if None
         if ui_state is None:
             ui_state = {"loading": False, "last_tab": None}
 
@@ -329,65 +333,32 @@ def register(app):
             show_points and (show_points is True or "show" in show_points)
         )
 
-        # CTO FIX: Clear old cache entries to prevent memory bloat (keep last 5)
-        # BUT: If we're switching tabs (trigger is from chart-tabs), clear ALL cache
-        # to prevent any possibility of cross-tab contamination
-        # ALSO: Clear ALL cache when budget changes to ensure fresh render
-        # ALSO: Clear ALL cache when statistics change (table edits)
-        # to ensure immediate reactivity
-        trigger_info = ctx.triggered[0]["prop_id"] if ctx.triggered else ""
-        if "chart-tabs" in trigger_info:
-            logger.debug(
-                "[CTO DEBUG] Tab switch detected - "
-                "CLEARING ALL CACHE to prevent contamination"
-            )
-            chart_cache = {}
-        elif "budget-settings-store" in trigger_info:
-            logger.debug(
-                "[CTO DEBUG] Budget change detected - "
-                "CLEARING ALL CACHE to refresh budget cards"
-            )
-            chart_cache = {}
-        elif "metrics-refresh-trigger" in trigger_info:
-            logger.debug(
-                "[CTO DEBUG] Import/refresh detected - "
-                "CLEARING ALL CACHE to reload data"
-            )
-            chart_cache = {}
-        elif "current-statistics.modified_timestamp" in trigger_info:
-            logger.debug(
-                "[CTO DEBUG] Statistics modified (table edit) - "
-                "CLEARING ALL CACHE to show changes immediately"
-            )
-            chart_cache = {}
-        elif len(chart_cache) > 5:
-            oldest_keys = list(chart_cache.keys())[:-5]
-            for old_key in oldest_keys:
-                if old_key in chart_cache:
-                    del chart_cache[old_key]
-
-        # Create simplified cache key - only essential data for chart generation
-        data_hash = hash(
-            str(statistics)
-            + str(settings)
-            + str(show_points)
-            + str(budget_store)
-            + str(import_trigger)
-        )
-        cache_key = f"{active_tab}_{data_hash}"
+        # Server-side cache keyed by everything the content depends on, so
+        # changed data, budget or imports simply miss instead of requiring the
+        # whole cache to be cleared on every trigger
         use_cache_for_tab = active_tab != "tab-active-work-timeline"
-        logger.debug(f"[CTO DEBUG] Cache key generated: {cache_key}")
+        cache_key = tab_cache_key(
+            active_tab,
+            date_range_weeks,
+            show_points,
+            viewport_size,
+            statistics,
+            settings,
+            budget_store,
+            import_trigger,
+            calc_results,
+        )
 
         # Check if we have cached content for this exact state
-        if use_cache_for_tab and cache_key in chart_cache:
+        cached_content = get_cached_tab(cache_key) if use_cache_for_tab else None
+        if cached_content is not None:
             # Return cached content immediately for <100ms response time
             logger.debug(
-                "[CTO DEBUG] Returning CACHED content for "
-                f"active_tab='{active_tab}', cache_key={cache_key}"
+                f"[CTO DEBUG] Returning CACHED content for active_tab='{active_tab}'"
             )
             ui_state["loading"] = False
             ui_state["last_tab"] = active_tab
-            return chart_cache[cache_key], chart_cache, ui_state
+            return cached_content, no_update, ui_state
 
         # Set loading state for new tab content generation
         ui_state["loading"] = True
@@ -407,9 +378,9 @@ def register(app):
                     f"content, cache_key={cache_key}"
                 )
                 dashboard_content = _render_dashboard_tab(df, settings, show_points)
-                chart_cache[cache_key] = dashboard_content
+                cache_tab_content(cache_key, dashboard_content)
                 ui_state["loading"] = False
-                return dashboard_content, chart_cache, ui_state
+                return dashboard_content, no_update, ui_state
             elif active_tab == "tab-burndown":
                 logger.debug(
                     f"[CTO DEBUG] Creating NEW burndown content, cache_key={cache_key}"
@@ -423,9 +394,9 @@ def register(app):
                     is_mobile,
                     is_tablet,
                 )
-                chart_cache[cache_key] = burndown_tab_content
+                cache_tab_content(cache_key, burndown_tab_content)
                 ui_state["loading"] = False
-                return burndown_tab_content, chart_cache, ui_state
+                return burndown_tab_content, no_update, ui_state
 
             elif active_tab == "tab-scope-tracking":
                 logger.debug(
@@ -439,9 +410,9 @@ def register(app):
                 scope_tab_content = create_scope_tracking_tab_content(
                     df_for_scope, settings, show_points and has_points_data
                 )
-                chart_cache[cache_key] = scope_tab_content
+                cache_tab_content(cache_key, scope_tab_content)
                 ui_state["loading"] = False
-                return scope_tab_content, chart_cache, ui_state
+                return scope_tab_content, no_update, ui_state
 
             elif active_tab == "tab-bug-analysis":
                 # Generate bug analysis tab content directly (no placeholder loading)
@@ -465,9 +436,9 @@ def register(app):
                 )
 
                 # Cache the result for next time
-                chart_cache[cache_key] = bug_analysis_content
+                cache_tab_content(cache_key, bug_analysis_content)
                 ui_state["loading"] = False
-                return bug_analysis_content, chart_cache, ui_state
+                return bug_analysis_content, no_update, ui_state
 
             elif active_tab == "tab-dora-metrics":
                 # Generate DORA metrics dashboard
@@ -476,9 +447,9 @@ def register(app):
                 dora_content = create_dora_dashboard()
 
                 # Cache the result for next time
-                chart_cache[cache_key] = dora_content
+                cache_tab_content(cache_key, dora_content)
                 ui_state["loading"] = False
-                return dora_content, chart_cache, ui_state
+                return dora_content, no_update, ui_state
 
             elif active_tab == "tab-flow-metrics":
                 # Generate Flow metrics dashboard
@@ -487,9 +458,9 @@ def register(app):
                 flow_content = create_flow_dashboard()
 
                 # Cache the result for next time
-                chart_cache[cache_key] = flow_content
+                cache_tab_content(cache_key, flow_content)
                 ui_state["loading"] = False
-                return flow_content, chart_cache, ui_state
+                return flow_content, no_update, ui_state
 
             elif active_tab == "tab-statistics-data":
                 # Load statistics from DB and render table
@@ -497,9 +468,9 @@ def register(app):
                 statistics_content = create_statistics_data_card(statistics)
 
                 # Cache the result for next time
-                chart_cache[cache_key] = statistics_content
+                cache_tab_content(cache_key, statistics_content)
                 ui_state["loading"] = False
-                return statistics_content, chart_cache, ui_state
+                return statistics_content, no_update, ui_state
 
             elif active_tab == "tab-sprint-tracker":
                 # Generate Sprint Tracker content directly (no placeholder loading)
@@ -515,9 +486,9 @@ def register(app):
                 )
 
                 # Cache the result for next time
-                chart_cache[cache_key] = sprint_tracker_content
+                cache_tab_content(cache_key, sprint_tracker_content)
                 ui_state["loading"] = False
-                return sprint_tracker_content, chart_cache, ui_state
+                return sprint_tracker_content, no_update, ui_state
 
             elif active_tab == "tab-active-work-timeline":
                 # Generate Active Work Timeline content directly
@@ -531,17 +502,15 @@ def register(app):
                     show_points, data_points_count
                 )
 
-                if use_cache_for_tab:
-                    chart_cache[cache_key] = timeline_content
                 ui_state["loading"] = False
-                return timeline_content, chart_cache, ui_state
+                return timeline_content, no_update, ui_state
 
             # Default fallback (should not reach here)
             fallback_content = create_content_placeholder(
                 type="chart", text="Select a tab to view data", height="400px"
             )
             ui_state["loading"] = False
-            return fallback_content, chart_cache, ui_state
+            return fallback_content, no_update, ui_state
 
         except Exception as e:
             import traceback  # noqa: PLC0415
@@ -559,7 +528,7 @@ def register(app):
                 ]
             )
             ui_state["loading"] = False
-            return error_content, chart_cache, ui_state
+            return error_content, no_update, ui_state
 
     # Enhance the existing update_date_range callback
     # to immediately trigger chart updates
@@ -210,7 +210,7 @@ def _try_load_bugs(
         if not query_id_active or not profile_id:
             return
 
-        issues = backend.get_issues(profile_id, query_id_active)
+        issues = backend.get_issues(profile_id, query_id_active, lazy=True)
         if issues:
             settings = load_app_settings()
             issues = filter_issues_for_metrics(
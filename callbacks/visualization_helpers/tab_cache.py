@@ -0,0 +1,149 @@
+"""
+Server-side cache helpers for render_tab_content.
+
+Rendered tab content is kept in data.figure_cache instead of the client-side
+chart-cache store, so a repeat visit to a tab with unchanged inputs returns
+the stored content without recomputation or a cache round trip through the
+browser.
+
+Entries are charged their estimated JSON size. Serializing the whole
+component tree just to size it cost as much as Dash's own serialization of
+the response, so the tree is walked instead, and lists of scalars are sized
+from their first element.
+"""
+
+import logging
+from datetime import date
+from typing import Any
+
+import numpy as np
+from dash.development.base_component import Component
+from plotly.basedatatypes import BaseFigure
+
+from data.figure_cache import figure_cache, fingerprint
+from data.metrics_snapshots import get_snapshots_generation
+from data.persistence.factory import get_backend
+from data.persistence.sqlite.helpers import get_issue_data_generation
+from data.query_manager import get_active_query_id
+
+logger = logging.getLogger(__name__)
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _active_ids() -> tuple[str | None, str | None]:
+    """Return the active (profile_id, query_id), None when unavailable."""
+    try:
+        profile_id = get_backend().get_app_state("active_profile_id")
+        return profile_id, get_active_query_id()
+    except Exception as e:
+        logger.debug(f"[TabCache] Active profile/query unavailable: {e}")
+        return None, None
+
+
+def tab_cache_key(
+    active_tab: str,
+    date_range_weeks: Any,
+    show_points: bool,
+    viewport_size: str,
+    statistics: list[dict],
+    settings: dict,
+    budget_store: Any,
+    import_trigger: Any,
+    calc_results: Any,
+) -> tuple:
+    """
+    Build the cache key of one rendered tab.
+
+    Besides the callback inputs, the key carries the active profile/query,
+    the metric snapshot and issue data generations (tabs such as Bug Analysis
+    read issues and changelog rows from the database) and today's date
+    (current week, days to deadline and forecast start depend on it).
+
+    Returns:
+        Hashable key tuple
+    """
+    profile_id, query_id = _active_ids()
+    return (
+        profile_id,
+        query_id,
+        active_tab,
+        date_range_weeks,
+        show_points,
+        viewport_size,
+        fingerprint(statistics),
+        fingerprint([settings, budget_store, import_trigger, calc_results]),
+        get_snapshots_generation(),
+        get_issue_data_generation(),
+        date.today(),
+    )
+
+
+def get_cached_tab(key: tuple) -> Any | None:
+    """Return cached content for key, or None on a miss."""
+    return figure_cache.get(key)
+
+
+def _scalar_size(value: Any) -> int:
+    """JSON length of a scalar (quoted strings, numbers as printed)."""
+    if isinstance(value, str):
+        return len(value) + 2
+    return len(repr(value))
+
+
+def estimate_content_size(content: Any) -> int:
+    """
+    Estimate the JSON size of rendered content without serializing it.
+
+    Lists and tuples of scalars (figure x/y/text arrays) are charged their
+    length times the size of their first element plus a separator, numeric
+    NumPy arrays their base64 size (as plotly encodes them).
+
+    Args:
+        content: Dash component tree, figure, dict, list or scalar
+
+    Returns:
+        Approximate size in bytes
+    """
+    total = 0
+    stack = [content]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, _SCALARS):
+            total += _scalar_size(value)
+        elif isinstance(value, dict):
+            total += sum(len(str(key)) + 4 for key in value)
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            if value and isinstance(value[0], _SCALARS):
+                total += len(value) * (_scalar_size(value[0]) + 1)
+            else:
+                stack.extend(value)
+        elif isinstance(value, np.ndarray):
+            if value.dtype.kind in "biuf":
+                total += value.nbytes * 4 // 3
+            else:
+                stack.append(value.tolist())
+        elif isinstance(value, BaseFigure):
+            # to_dict() would deep-copy every trace just to be measured
+            stack.extend((value._data, value._layout))
+        elif isinstance(value, Component):
+            stack.append(value.to_plotly_json())
+        else:
+            total += len(str(value))
+    return total
+
+
+def cache_tab_content(key: tuple, content: Any) -> Any:
+    """
+    Store rendered content under key and return it unchanged.
+
+    Args:
+        key: Key from tab_cache_key()
+        content: Dash component tree returned to the tab
+
+    Returns:
+        content
+    """
+    figure_cache.put(key, content, estimate_content_size(content))
+    return content
@@ -6,6 +6,9 @@ This module provides centralized logging setup for the application with:
 - JSON formatting for structured logs
 - Sensitive data redaction (tokens, passwords, API keys)
 - Multiple log handlers (console, file, error-only file)
+- Asynchronous output: callers only enqueue records, a background
+  QueueListener thread redacts, formats and writes them
+- Per-logger rate limiting of high-frequency INFO/DEBUG messages
 - Automatic cleanup of old log files (30-day retention)
 
 Usage:
@@ -21,13 +24,17 @@ Usage:
     logger.info("Application started")
 """
 
+import copy
 import glob
 import json
 import logging
 import os
+import queue
 import re
+import threading
+import time
 from datetime import UTC, datetime, timedelta
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from data.installation_context import get_installation_context
 
@@ -35,6 +42,13 @@ from data.installation_context import get_installation_context
 _installation_context = get_installation_context()
 DEFAULT_LOG_DIR = str(_installation_context.logs_path)
 
+# Rate limiting for records below WARNING, per logger (token bucket like
+# data.jira.rate_limiter): a burst of 50 messages, then 10 per second.
+# Per-page and per-week progress messages stay readable, runaway loops do not
+# flood the log files. Warnings and errors are never rate limited.
+LOG_RATE_LIMIT_BURST = 50
+LOG_RATE_LIMIT_PER_SECOND = 10.0
+
 
 class SensitiveDataFilter(logging.Filter):
     """
@@ -104,6 +118,37 @@ class SensitiveDataFilter(logging.Filter):
         ),
     ]
 
+    # Compiled once: the filter runs for every record on every handler
+    _COMPILED_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in SENSITIVE_PATTERNS
+    ]
+
+    # All patterns combined into one alternation. Almost no message contains
+    # sensitive data, so a single search rules out redaction for most records;
+    # only on a hit are the individual patterns applied (in order).
+    _ANY_SENSITIVE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern, _ in SENSITIVE_PATTERNS),
+        re.IGNORECASE,
+    )
+
+    @classmethod
+    def redact(cls, text: str) -> str:
+        """
+        Return text with all sensitive patterns replaced.
+
+        Args:
+            text: Text to redact
+
+        Returns:
+            Redacted text (the same object when nothing matched)
+        """
+        if not cls._ANY_SENSITIVE.search(text):
+            return text
+        for pattern, replacement in cls._COMPILED_PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text
+
     def filter(self, record):
         """
         Filter log record by redacting sensitive data.
@@ -117,11 +162,7 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             bool: Always True (record is not suppressed, just modified)
         """
-        # Apply redaction to message (case-insensitive)
-        msg = str(record.msg)
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            msg = re.sub(pattern, replacement, msg, flags=re.IGNORECASE)
-        record.msg = msg
+        record.msg = self.redact(str(record.msg))
 
         # Also redact args if present
         # IMPORTANT: Preserve original types (int, float) to avoid breaking
@@ -131,20 +172,148 @@ class SensitiveDataFilter(logging.Filter):
         if record.args:
             redacted_args = []
             for arg in record.args:
+                if isinstance(arg, (int, float)):
+                    # Numbers cannot contain sensitive data
+                    redacted_args.append(arg)
+                    continue
                 arg_str = str(arg)
-                original_arg_str = arg_str
-                for pattern, replacement in self.SENSITIVE_PATTERNS:
-                    arg_str = re.sub(pattern, replacement, arg_str, flags=re.IGNORECASE)
+                redacted = self.redact(arg_str)
                 # Only use string version if redaction occurred, otherwise preserve type
-                if arg_str != original_arg_str:
-                    redacted_args.append(arg_str)
-                else:
-                    redacted_args.append(arg)
+                redacted_args.append(redacted if redacted != arg_str else arg)
             record.args = tuple(redacted_args)
 
         return True
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Drop INFO/DEBUG records from loggers that log faster than a token bucket.
+
+    Each logger name gets its own bucket of max_burst tokens, refilled at
+    refill_rate tokens per second. A record below WARNING takes one token and
+    is dropped when none is left. The next record that gets through notes how
+    many were dropped, so gaps in the log are visible.
+
+    Attached to the queue handler, so dropped records are never copied,
+    queued or formatted.
+    """
+
+    def __init__(
+        self,
+        max_burst: int = LOG_RATE_LIMIT_BURST,
+        refill_rate: float = LOG_RATE_LIMIT_PER_SECOND,
+    ) -> None:
+        super().__init__()
+        self.max_burst = max_burst
+        self.refill_rate = refill_rate
+        # logger name -> [tokens, last refill time, suppressed count]
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        """
+        Decide whether a record passes the rate limit.
+
+        Args:
+            record (logging.LogRecord): Log record to check
+
+        Returns:
+            bool: False when the record is dropped
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [self.max_burst, now, 0]
+            tokens = min(
+                self.max_burst, bucket[0] + (now - bucket[1]) * self.refill_rate
+            )
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            bucket[0] = tokens - 1
+            suppressed = int(bucket[2])
+            bucket[2] = 0
+
+        if suppressed and isinstance(record.msg, str):
+            record.msg = (
+                f"{record.msg} [{suppressed} earlier messages from this logger "
+                "suppressed by rate limit]"
+            )
+        return True
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Queue handler that hands records to a background QueueListener.
+
+    Logging on the calling thread is reduced to resolving the message and
+    putting the record on an in-memory queue. Redaction, JSON formatting and
+    file/console I/O happen on the listener thread.
+
+    Args:
+        handlers: Handlers the listener writes to (levels are respected)
+    """
+
+    def __init__(self, *handlers: logging.Handler) -> None:
+        super().__init__(queue.Queue(-1))
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self._running = False
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if not self._running:
+            self.listener.start()
+            self._running = True
+
+    def prepare(self, record):
+        """
+        Resolve the message now, as the args may change before it is written.
+
+        Unlike the base class, the exception traceback is kept in exc_text
+        instead of being folded into the message, so JSONFormatter can still
+        write it to its own "exception" field.
+        """
+        try:
+            message = record.getMessage()
+        except (TypeError, ValueError) as e:
+            # Waitress passes string args to %d (Python 3.13+)
+            message = f"{record.msg} (formatting error: {e})"
+
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def flush(self) -> None:
+        """Block until every record queued so far has been written."""
+        if self._running:
+            self.queue.join()
+        for handler in self.listener.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Drain the queue, stop the listener and close its handlers."""
+        if self._running:
+            self.listener.stop()
+            self._running = False
+        for handler in self.listener.handlers:
+            handler.close()
+        super().close()
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
 class JSONFormatter(logging.Formatter):
     """
     Format log records as JSON for structured logging.
@@ -180,7 +349,8 @@ class JSONFormatter(logging.Formatter):
             message = f"{record.msg} (formatting error: {e})"
 
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            # Time of the logging call, not of the (asynchronous) write
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "module": record.module,
             "function": record.funcName,
@@ -191,6 +361,9 @@ class JSONFormatter(logging.Formatter):
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Formatted on the calling thread by AsyncQueueHandler.prepare()
+            log_data["exception"] = record.exc_text
 
         return json.dumps(log_data)
 
@@ -209,7 +382,11 @@ def setup_logging(
     2. errors.log - Error logs only (ERROR and above) with JSON formatting
     3. Console - Plain text for development (INFO and above)
 
-    All handlers use SensitiveDataFilter to redact sensitive data.
+    All handlers use SensitiveDataFilter to redact sensitive data. They are
+    driven by a QueueListener thread; the root logger only gets an
+    AsyncQueueHandler (with RateLimitFilter), so logging calls never wait
+    for redaction, formatting or disk I/O. Use flush_logging() to wait for
+    queued records to be written.
 
     Args:
         log_dir: Directory for log files (default: from InstallationContext),
@@ -272,13 +449,18 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates. A previous queue handler
+    # is closed so its listener thread and log files do not leak.
+    for handler in root_logger.handlers:
+        if isinstance(handler, AsyncQueueHandler):
+            handler.close()
     root_logger.handlers = []
 
-    # Add our handlers
-    root_logger.addHandler(app_handler)
-    root_logger.addHandler(error_handler)
-    root_logger.addHandler(console_handler)
+    # Our handlers run on the listener thread behind a single queue handler
+    queue_handler = AsyncQueueHandler(app_handler, error_handler, console_handler)
+    queue_handler.addFilter(RateLimitFilter())
+    root_logger.addHandler(queue_handler)
+    queue_handler.start()
 
     # Configure Waitress logger to use our formatter (fixes Python 3.13 type mismatch)
     # Waitress passes string args to %d format, causing TypeError in Python 3.13
@@ -309,13 +491,30 @@ def setup_logging(
     waitress_logger.handlers = [waitress_handler]  # Replace default handlers
 
 
+def flush_logging() -> None:
+    """
+    Wait until all queued log records are written to their handlers.
+
+    Logging is asynchronous, so a record may not be in app.log yet right
+    after the logging call returns. Call this before reading log files.
+
+    Example:
+        >>> logger.info("Export finished")
+        >>> flush_logging()
+        >>> open('logs/app.log').read()  # contains "Export finished"
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def shutdown_logging() -> None:
     """
     Properly shutdown all logging handlers and close log files.
 
     This is critical for Windows environments where file handles must be
     explicitly closed before files can be deleted or moved. Closes all
-    handlers on the root logger to release file locks.
+    handlers on the root logger to release file locks. Closing the queue
+    handler first writes any queued records and stops the listener thread.
 
     Call this before cleanup operations that need to delete/move log files.
 
@@ -140,6 +140,12 @@ def switch_profile(profile_id: str) -> None:
         f"({profile_id})"
     )
 
+    # Fetch JIRA fields/projects/statuses in the background so the field
+    # mapping modal opens from cache. Lazy: pulls in the JIRA client.
+    from data.jira.metadata_cache import start_metadata_warmup  # noqa: PLC0415
+
+    start_metadata_warmup(profile.get("jira_config") or {})
+
 
 def delete_profile(profile_id: str) -> None:
     """
@@ -0,0 +1,122 @@
+"""Prefix index for autocomplete suggestions.
+
+Answers autocomplete queries against JIRA metadata (projects, fields,
+statuses) without scanning every entry per keystroke. The index is built once
+per metadata list and ranks matches in tiers:
+
+1. ID/key or name starts with the query (an exact match sorts first)
+2. A later word of the name starts with the query ("points" -> "Story Points")
+3. The name's initials start with the query ("sp" -> "Story Points")
+4. The query appears anywhere in the ID/key or name
+
+Tiers 1-3 are binary searches in sorted term lists; tier 4 is a scan that only
+runs when the earlier tiers return fewer results than requested. With 2000+
+fields a query takes well under a millisecond.
+
+The same ranking is implemented client-side in
+assets/namespace_autocomplete_data.js for the field mapping inputs.
+"""
+
+import re
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# Word boundaries within names: spaces, punctuation, underscores
+_WORD_SPLIT = re.compile(r"[^0-9a-z]+")
+
+# Sorts after every character that appears in metadata names
+_PREFIX_END = "\uffff"
+
+
+class AutocompleteIndex:
+    """
+    Ranked prefix lookup over a list of metadata entries.
+
+    Args:
+        entries: Entries to index (kept as given, returned by search())
+        get_terms: Returns (id or key, display name) for an entry
+
+    Example:
+        >>> index = AutocompleteIndex(fields, lambda f: (f["id"], f["name"]))
+        >>> [f["name"] for f in index.search("story", limit=3)]
+        ['Story Points', 'Story Type', 'User Story']
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[Any],
+        get_terms: Callable[[Any], tuple[str, str]],
+    ) -> None:
+        self.entries = list(entries)
+
+        # (term, entry position) per tier, sorted by term
+        prefix_terms: list[tuple[str, int]] = []
+        word_terms: list[tuple[str, int]] = []
+        initials_terms: list[tuple[str, int]] = []
+        self._haystacks: list[str] = []
+
+        for position, entry in enumerate(self.entries):
+            key, name = get_terms(entry)
+            key = (key or "").lower()
+            name = (name or "").lower()
+
+            prefix_terms.append((key, position))
+            if name and name != key:
+                prefix_terms.append((name, position))
+
+            words = [word for word in _WORD_SPLIT.split(name) if word]
+            word_terms.extend((word, position) for word in words[1:])
+            if len(words) > 1:
+                initials_terms.append(("".join(w[0] for w in words), position))
+
+            self._haystacks.append(f"{key}\n{name}")
+
+        self._tiers = [
+            sorted(prefix_terms),
+            sorted(word_terms),
+            sorted(initials_terms),
+        ]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int = 50) -> list[Any]:
+        """
+        Return up to limit entries matching query, best matches first.
+
+        Args:
+            query: Text typed so far (case-insensitive); empty returns the
+                first entries in their original order
+            limit: Maximum number of entries to return
+
+        Returns:
+            Matching entries ranked by tier, then alphabetically by the
+            matched term
+        """
+        query = query.strip().lower()
+        if not query:
+            return self.entries[:limit]
+
+        found: list[int] = []
+        seen: set[int] = set()
+
+        for terms in self._tiers:
+            start = bisect_left(terms, (query,))
+            end = bisect_left(terms, (query + _PREFIX_END,), lo=start)
+            for term_index in range(start, end):
+                position = terms[term_index][1]
+                if position not in seen:
+                    seen.add(position)
+                    found.append(position)
+                    if len(found) >= limit:
+                        return [self.entries[p] for p in found]
+
+        # Substring fallback, only when the prefix tiers did not fill the list
+        for position, haystack in enumerate(self._haystacks):
+            if query in haystack and position not in seen:
+                found.append(position)
+                if len(found) >= limit:
+                    break
+
+        return [self.entries[p] for p in found]
@@ -49,7 +49,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from data.exceptions import CacheError, PersistenceError
-from data.metrics_cache import invalidate_cache as invalidate_metrics_cache_file
+from data.metrics_cache import invalidate_cache as invalidate_metrics_result_cache
 from data.persistence.factory import get_backend
 
 logger = logging.getLogger(__name__)
@@ -466,7 +466,7 @@ def invalidate_metrics_cache_only() -> None:
 
     Files invalidated:
     - metrics_snapshots.json
-    - metrics_cache.json (DORA/Flow metrics cache)
+    - metrics_result_cache table (DORA/Flow metrics cache)
 
     Files preserved:
     - cache/*.json (JIRA raw issue data)
@@ -479,8 +479,8 @@ def invalidate_metrics_cache_only() -> None:
 
         # Remove DORA/Flow metrics cache
 
-        invalidate_metrics_cache_file()  # Removes metrics_cache.json
-        logger.info("[OK] Invalidated metrics_cache.json (DORA/Flow)")
+        invalidate_metrics_result_cache()
+        logger.info("[OK] Invalidated metrics result cache (DORA/Flow)")
 
         logger.info(
             "[OK] Metrics cache invalidated - JIRA data cache preserved for reuse"
@@ -507,7 +507,7 @@ def invalidate_all_cache() -> None:
     Files invalidated:
     - cache/*.json (JIRA raw issue data)
     - metrics_snapshots.json
-    - metrics_cache.json
+    - metrics_result_cache table
     - jira_cache.json (legacy)
     """
     try:
@@ -606,7 +606,9 @@ def has_jira_data_for_query(profile_id: str, query_id: str) -> bool:
     """
     try:
         backend = get_backend()
-        issues = backend.get_issues(profile_id, query_id, limit=1)
+        issues = backend.get_issues(
+            profile_id, query_id, limit=1, columns=["issue_key"]
+        )
         return len(issues) > 0
     except (
         ImportError,
@@ -14,9 +14,9 @@ Used for:
 # IMPORTS
 #######################################################################
 import logging
-from datetime import UTC, datetime
+from datetime import datetime
 
-from dateutil import parser
+from data.status_interval_index import timeline_from_issue
 
 #######################################################################
 # LOGGING
@@ -498,6 +498,9 @@ def get_status_at_point_in_time(
     2. If no changelog or no changes before target_time, uses current status
     3. Checks if issue existed at target_time (created before target_time)
 
+    Parses the whole changelog on every call. To query many issues or times,
+    build a StatusIntervalIndex (data/status_interval_index.py) once instead.
+
     Args:
         issue: JIRA issue dictionary with expanded changelog
         target_time: Point in time to check (timezone-naive UTC datetime)
@@ -512,110 +515,7 @@ def get_status_at_point_in_time(
         >>> status = get_status_at_point_in_time(issue, target)
         >>> print(f"Issue was in '{status}' on Oct 20")
     """
-    try:
-        # Check if issue existed at target time
-        # Handle both nested JIRA API format and flat database format
-        if "fields" in issue and isinstance(issue.get("fields"), dict):
-            created_str = issue["fields"].get("created")
-        else:
-            created_str = issue.get("created")
-
-        if not created_str:
-            return None
-
-        # Parse creation date
-        created_date = parser.parse(created_str)
-        # Convert to UTC and strip timezone for comparison
-
-        created_date = created_date.astimezone(UTC).replace(tzinfo=None)
-
-        # Issue didn't exist yet
-        if created_date > target_time:
-            return None
-
-        # Get current status as fallback
-        # Handle both nested JIRA API format and flat database format
-        if "fields" in issue and isinstance(issue.get("fields"), dict):
-            current_status = issue["fields"].get("status", {})
-            if isinstance(current_status, dict):
-                current_status_name = current_status.get("name", "")
-            else:
-                current_status_name = current_status or ""
-        else:
-            # Flat format: status at top level
-            current_status_name = issue.get("status", "")
-
-        # Check if issue has changelog
-        changelog = issue.get("changelog", {})
-        if not changelog:
-            # No changelog: assume current status
-            logger.debug(
-                f"Issue {issue.get('key', 'UNKNOWN')}: "
-                "No changelog, using current status "
-                f"'{current_status_name}'"
-            )
-            return current_status_name
-
-        histories = changelog.get("histories", [])
-        if not histories:
-            # No history entries: assume current status
-            logger.debug(
-                f"Issue {issue.get('key', 'UNKNOWN')}: "
-                "No history entries, using current status "
-                f"'{current_status_name}'"
-            )
-            return current_status_name
-
-        # Find LAST status change BEFORE target_time
-        last_status_before_target = None
-        last_change_time = None
-
-        for history in histories:
-            created_timestamp = history.get("created")
-            if not created_timestamp:
-                continue
-
-            # Parse changelog timestamp
-            change_time = parser.parse(created_timestamp)
-            # Convert to UTC and strip timezone
-            change_time = change_time.astimezone(UTC).replace(tzinfo=None)
-
-            # Skip changes AFTER target time
-            if change_time >= target_time:
-                continue
-
-            # Look for status field changes
-            items = history.get("items", [])
-            for item in items:
-                if item.get("field") == "status":
-                    to_status = item.get("toString", "")
-
-                    # Track the LAST status change before target_time
-                    if last_change_time is None or change_time > last_change_time:
-                        last_change_time = change_time
-                        last_status_before_target = to_status
-
-        # If we found a status change before target time, use it
-        if last_status_before_target:
-            logger.debug(
-                f"Issue {issue.get('key', 'UNKNOWN')}: "
-                f"Status at {target_time.date()} was "
-                f"'{last_status_before_target}' (from changelog)"
-            )
-            return last_status_before_target
-
-        # No status changes before target time: use current status
-        # (issue was created before target_time but never changed status)
-        logger.debug(
-            f"Issue {issue.get('key', 'UNKNOWN')}: "
-            f"No status changes before {target_time.date()}, "
-            f"using current status '{current_status_name}'"
-        )
-        return current_status_name
-
-    except Exception as e:
-        logger.error(
-            "Error determining status at point in time "
-            f"for issue {issue.get('key', 'UNKNOWN')}: {e}"
-        )
+    timeline = timeline_from_issue(issue)
+    if timeline is None:
         return None
+    return timeline.status_at(target_time)
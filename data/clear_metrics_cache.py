@@ -58,6 +58,18 @@ def clear_active_query_metrics(
     )
     deleted = cursor.rowcount
 
+    # Contribution records describe the deleted snapshots
+    cursor.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type='table' AND name='metric_week_contributions'"
+    )
+    if cursor.fetchone():
+        cursor.execute(
+            "DELETE FROM metric_week_contributions "
+            "WHERE profile_id = ? AND query_id = ?",
+            (active_profile_id, active_query_id),
+        )
+
     conn.commit()
     conn.close()
 
@@ -5,9 +5,9 @@ This module provides connection management, integrity checks, and
 database initialization utilities for the Burndown application.
 
 Architecture:
-- Connection-per-request pattern (no global connections)
-- WAL mode for concurrent access
-- Context manager for automatic cleanup
+- Thread-aware connection pool (idle connections kept open per thread)
+- Pragmas (WAL, foreign keys, synchronous, mmap, cache) set once per connection
+- Context manager for automatic cleanup (uncommitted work rolled back on release)
 - Integrity validation on startup
 
 Usage:
@@ -18,9 +18,14 @@ Usage:
 """
 
 import logging
+import os
 import sqlite3
+import threading
+import time
+import weakref
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 from data.installation_context import get_installation_context
@@ -32,15 +37,238 @@ _installation_context = get_installation_context()
 DB_PATH = _installation_context.database_path
 
 
+# Connection pool tuning
+POOL_MAX_IDLE_PER_THREAD = 4  # Idle connections kept open per thread (all paths)
+SQLITE_MMAP_SIZE = 128 * 1024 * 1024  # Memory-mapped I/O for reads (bytes)
+SQLITE_CACHE_SIZE_KIB = 16 * 1024  # Page cache per connection (KiB)
+SQLITE_CACHED_STATEMENTS = 256  # Prepared statements kept per connection
+
+# Pragmas applied once when a pooled connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+    f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}",
+)
+
+
+@dataclass
+class _PooledConnection:
+    """An open connection plus the database file identity it was opened on."""
+
+    conn: sqlite3.Connection
+    path: str
+    file_id: tuple[int, int] | None
+
+
+def _file_id(path: str) -> tuple[int, int] | None:
+    """Return (device, inode) of the database file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class ConnectionPool:
+    """
+    Thread-aware pool of SQLite connections.
+
+    Each thread keeps up to max_idle_per_thread idle connections open, so
+    repeated get_db_connection() calls reuse an open WAL connection (and its
+    prepared-statement cache) instead of reconnecting and re-running pragmas.
+    Nested acquisitions on one thread get separate connections, exactly like
+    the previous connection-per-request pattern.
+
+    A pooled connection is discarded instead of reused when the database file
+    was deleted or replaced since it was opened (restore, tests), or when the
+    caller closed it.
+    """
+
+    def __init__(self, max_idle_per_thread: int = POOL_MAX_IDLE_PER_THREAD):
+        self.max_idle_per_thread = max_idle_per_thread
+        self._lock = threading.Lock()
+        # Idle lists die with their thread (connections closed on collection)
+        self._idle: weakref.WeakKeyDictionary[
+            threading.Thread, list[_PooledConnection]
+        ] = weakref.WeakKeyDictionary()
+        self._in_use = 0
+        self._opened = 0
+        self._reused = 0
+        self._discarded = 0
+        self._acquire_count = 0
+        self._acquire_wait_total = 0.0
+        self._acquire_wait_max = 0.0
+
+    def _open(self, path: str) -> _PooledConnection:
+        """Open a new connection and apply the pragmas once."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Connect with 10 second timeout; pooled connections may be closed by
+        # close_idle() from another thread, never used by two threads at once
+        conn = sqlite3.connect(
+            path,
+            timeout=10.0,
+            check_same_thread=False,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.row_factory = sqlite3.Row
+        logger.debug(f"Database connection opened: {path}")
+        return _PooledConnection(conn=conn, path=path, file_id=_file_id(path))
+
+    @staticmethod
+    def _close(entry: _PooledConnection) -> None:
+        try:
+            entry.conn.close()
+        except sqlite3.Error:
+            pass
+        logger.debug(f"Database connection closed: {entry.path}")
+
+    def acquire(self, path: str) -> _PooledConnection:
+        """Return an idle connection for path on this thread, or open one."""
+        started = time.perf_counter()
+        thread = threading.current_thread()
+        reused = None
+        discarded = 0
+        with self._lock:
+            idle = self._idle.get(thread, [])
+            for position in range(len(idle) - 1, -1, -1):
+                if idle[position].path == path:
+                    reused = idle.pop(position)
+                    break
+
+        if reused is not None and reused.file_id != _file_id(path):
+            # Database file deleted or replaced since this connection opened
+            self._close(reused)
+            reused = None
+            discarded = 1
+
+        entry = reused if reused is not None else self._open(path)
+        waited = time.perf_counter() - started
+
+        with self._lock:
+            self._in_use += 1
+            self._acquire_count += 1
+            self._acquire_wait_total += waited
+            self._acquire_wait_max = max(self._acquire_wait_max, waited)
+            self._discarded += discarded
+            if reused is not None:
+                self._reused += 1
+            else:
+                self._opened += 1
+        return entry
+
+    def release(self, entry: _PooledConnection) -> None:
+        """Return a connection to this thread's idle list (or close it)."""
+        evicted = None
+        reusable = True
+        try:
+            if entry.conn.in_transaction:
+                # Closing used to discard uncommitted work; keep that behaviour
+                entry.conn.rollback()
+            entry.conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            # Closed by the caller or broken - never hand it out again
+            reusable = False
+
+        with self._lock:
+            self._in_use -= 1
+            if reusable:
+                idle = self._idle.setdefault(threading.current_thread(), [])
+                idle.append(entry)
+                if len(idle) > self.max_idle_per_thread:
+                    evicted = idle.pop(0)
+            if not reusable or evicted is not None:
+                self._discarded += 1
+
+        if not reusable:
+            self._close(entry)
+        if evicted is not None:
+            self._close(evicted)
+
+    def close_idle(self, path: str | None = None) -> int:
+        """
+        Close idle connections on every thread.
+
+        Args:
+            path: Only close connections to this database (default: all)
+
+        Returns:
+            Number of connections closed
+        """
+        closing = []
+        with self._lock:
+            for idle in self._idle.values():
+                keep = []
+                for entry in idle:
+                    if path is None or entry.path == path:
+                        closing.append(entry)
+                    else:
+                        keep.append(entry)
+                idle[:] = keep
+        for entry in closing:
+            self._close(entry)
+        return len(closing)
+
+    def stats(self) -> dict:
+        """Return pool size and acquire wait-time metrics."""
+        with self._lock:
+            idle = sum(len(entries) for entries in self._idle.values())
+            count = self._acquire_count
+            return {
+                "idle_connections": idle,
+                "in_use_connections": self._in_use,
+                "threads": len(self._idle),
+                "connections_opened": self._opened,
+                "connections_reused": self._reused,
+                "connections_discarded": self._discarded,
+                "acquire_count": count,
+                "acquire_wait_ms_avg": (
+                    self._acquire_wait_total / count * 1000 if count else 0.0
+                ),
+                "acquire_wait_ms_max": self._acquire_wait_max * 1000,
+            }
+
+
+_connection_pool = ConnectionPool()
+
+
+def get_connection_pool_stats() -> dict:
+    """
+    Get connection pool metrics.
+
+    Returns:
+        dict: idle/in-use connection counts, opened/reused/discarded totals and
+        average/maximum time spent acquiring a connection (ms)
+    """
+    return _connection_pool.stats()
+
+
+def close_idle_connections(db_path: Path | None = None) -> int:
+    """
+    Close pooled idle connections (e.g. before replacing the database file).
+
+    Args:
+        db_path: Only close connections to this database (default: all)
+
+    Returns:
+        int: Number of connections closed
+    """
+    return _connection_pool.close_idle(None if db_path is None else str(db_path))
+
+
 @contextmanager
 def get_db_connection(
     db_path: Path = DB_PATH,
 ) -> Generator[sqlite3.Connection]:
     """
-    Get SQLite database connection with WAL mode and automatic cleanup.
+    Get pooled SQLite database connection with WAL mode and automatic cleanup.
 
-    Connection-per-request pattern ensures no stale connections.
-    WAL mode enables concurrent reads during writes.
+    Connections are reused per thread; pragmas are applied once when a
+    connection is opened. On exit, uncommitted changes are rolled back (as
+    closing the connection did) and the connection returns to the pool.
 
     Args:
         db_path: Path to database file (default: from InstallationContext)
@@ -57,38 +285,37 @@ def get_db_connection(
         ...     cursor.execute("SELECT COUNT(*) FROM profiles")
         ...     count = cursor.fetchone()[0]
     """
-    conn = None
-    try:
-        # Ensure profiles directory exists
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Connect with 10 second timeout
-        conn = sqlite3.connect(str(db_path), timeout=10.0)
-
-        # Enable WAL mode for concurrent access (US4)
-        conn.execute("PRAGMA journal_mode=WAL")
-
-        # Enable foreign key constraints
+    path = str(db_path)
+    if path == ":memory:":
+        # Every in-memory connection is its own database - never pool it
+        conn = sqlite3.connect(path)
         conn.execute("PRAGMA foreign_keys=ON")
-
-        # Use Row factory for dict-like access
         conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
 
-        logger.debug(f"Database connection opened: {db_path}")
-
-        yield conn
-
+    try:
+        entry = _connection_pool.acquire(path)
     except sqlite3.OperationalError as e:
         logger.error(
             f"Database connection failed: {e}",
-            extra={"db_path": str(db_path), "error_type": type(e).__name__},
+            extra={"db_path": path, "error_type": type(e).__name__},
         )
         raise
 
+    try:
+        yield entry.conn
+    except sqlite3.OperationalError as e:
+        logger.error(
+            f"Database connection failed: {e}",
+            extra={"db_path": path, "error_type": type(e).__name__},
+        )
+        raise
     finally:
-        if conn:
-            conn.close()
-            logger.debug(f"Database connection closed: {db_path}")
+        _connection_pool.release(entry)
 
 
 def check_database_integrity(db_path: Path = DB_PATH) -> bool:
@@ -0,0 +1,143 @@
+"""
+Server-side cache for rendered tab content.
+
+The visualization tabs used a client-side dcc.Store as cache, so every cached
+figure travelled to the browser and back as JSON on each callback, and the
+store was cleared on every tab switch. FigureCache keeps rendered content in
+process memory instead, bounded by the (estimated) serialized size of its
+entries, and evicts least recently used entries first.
+
+Keys are fingerprints of everything the rendered content depends on (profile,
+query, tab, date range, points toggle, viewport and data fingerprints), so
+changed inputs simply miss; nothing has to be invalidated explicitly.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Total serialized size of cached entries
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Entries larger than this are not cached at all
+DEFAULT_MAX_ENTRY_BYTES = 16 * 1024 * 1024
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Return a stable short digest of a JSON-like value.
+
+    Args:
+        value: Statistics list, settings dict or other JSON-like data
+
+    Returns:
+        Hex digest that only changes when the value changes
+    """
+    payload = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class FigureCache:
+    """Byte-bounded LRU cache of rendered content with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: tuple) -> Any | None:
+        """
+        Return cached content for key and mark it most recently used.
+
+        Args:
+            key: Cache key tuple
+
+        Returns:
+            Cached content, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, content: Any, size_bytes: int) -> bool:
+        """
+        Store content, evicting least recently used entries to fit.
+
+        Args:
+            key: Cache key tuple
+            content: Rendered content to return on later hits
+            size_bytes: Serialized size of content (an estimate is fine)
+
+        Returns:
+            True if stored, False if the entry exceeds max_entry_bytes
+        """
+        if size_bytes > self.max_entry_bytes or size_bytes > self.max_bytes:
+            logger.debug(f"[FigureCache] Not caching {size_bytes:,} byte entry")
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+            self._entries[key] = (content, size_bytes)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self.max_bytes:
+                _evicted_key, (_content, evicted_size) = self._entries.popitem(
+                    last=False
+                )
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Return counters for monitoring.
+
+        Returns:
+            Dict with hits, misses, hit_rate, evictions, entries, size_bytes
+            and max_bytes
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Process-wide cache used by the tab rendering callback
+figure_cache = FigureCache()
+
+
+def get_figure_cache_stats() -> dict[str, int | float]:
+    """Return the hit/miss counters of the process-wide figure cache."""
+    return figure_cache.stats()
@@ -16,6 +16,8 @@ Matching Strategy:
 import logging
 from datetime import date, datetime
 
+from data.performance_utils import RangeIndex
+
 #######################################################################
 # LOGGING
 #######################################################################
@@ -775,12 +777,18 @@ def filter_issues_deployed_in_week(
         week_end: End of week (datetime, exclusive)
 
     Returns:
-        Filtered list of issues deployed in the week
+        Filtered list of issues deployed in the week (deployment dates whose
+        timezone awareness differs from week_start are skipped)
     """
     filtered = []
     for issue in issues:
         deployment_date = get_deployment_date_for_issue(issue, fixversion_release_map)
-        if deployment_date and week_start <= deployment_date < week_end:
+        if deployment_date is None:
+            continue
+        if (deployment_date.tzinfo is None) != (week_start.tzinfo is None):
+            # Naive and aware datetimes never compare; not deployed this week
+            continue
+        if week_start <= deployment_date < week_end:
             filtered.append(issue)
 
     logger.debug(
@@ -788,3 +796,55 @@ def filter_issues_deployed_in_week(
         f"{week_start.date()} to {week_end.date()}"
     )
     return filtered
+
+
+class DeploymentIndex:
+    """Deployment dates of a fixed issue list, sorted for weekly range reads.
+
+    Resolves every issue's deployment date once with
+    get_deployment_date_for_issue and keeps them, plus the release map's
+    release dates, in RangeIndexes. A week then costs two bisects instead of
+    a full get_deployment_date_for_issue pass over all issues.
+
+    Args:
+        issues: Issues to index (development issues, Operational Tasks or bugs)
+        fixversion_release_map: Map of fixVersion name → releaseDate
+
+    Example:
+        >>> index = DeploymentIndex(dev_issues, release_map)
+        >>> week_issues = index.issues_deployed_in(week_start, week_end)
+    """
+
+    def __init__(
+        self,
+        issues: list[dict],
+        fixversion_release_map: dict[str, datetime],
+    ) -> None:
+        self.issues = issues
+        self.deployment_dates = [
+            get_deployment_date_for_issue(issue, fixversion_release_map)
+            for issue in issues
+        ]
+        self._deployments = RangeIndex(self.deployment_dates)
+        self._release_names = list(fixversion_release_map)
+        self._releases = RangeIndex(list(fixversion_release_map.values()))
+
+    def positions_in(self, week_start: datetime, week_end: datetime) -> list[int]:
+        """Return positions of issues deployed in [week_start, week_end).
+
+        Positions are returned in original issue order.
+        """
+        return self._deployments.positions_in(week_start, week_end)
+
+    def issues_deployed_in(
+        self, week_start: datetime, week_end: datetime
+    ) -> list[dict]:
+        """Return issues deployed in [week_start, week_end), in original order.
+
+        Matches filter_issues_deployed_in_week for the indexed issues.
+        """
+        return self._deployments.select(self.issues, week_start, week_end)
+
+    def releases_in(self, week_start: datetime, week_end: datetime) -> list[str]:
+        """Return sorted fixVersion names released in [week_start, week_end)."""
+        return sorted(self._releases.select(self._release_names, week_start, week_end))
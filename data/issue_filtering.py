@@ -18,33 +18,30 @@ from data.project_filter import filter_development_issues
 logger = logging.getLogger(__name__)
 
 
-def filter_issues_for_metrics(
+def split_issues_for_metrics(
     issues: list[dict[str, Any]],
-    settings: dict[str, Any] | None = None,
+    settings: dict[str, Any],
     log_prefix: str = "METRICS",
-) -> list[dict[str, Any]]:
-    """Filter issues for metrics calculations.
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Apply the metrics filters and keep the parent-filtered intermediate.
 
     Args:
         issues: List of Jira issues (database or API format)
-        settings: App settings dict; loads from persistence if not provided
+        settings: App settings or JIRA config with field_mappings,
+            development_projects, devops_projects and parent types
         log_prefix: Prefix used by downstream filter logs
 
     Returns:
-        Filtered issues for metrics calculations
+        Tuple of (issues without parents, issues for metrics). The first
+        still holds DevOps project issues, which DORA classification needs.
     """
-    if not issues:
-        return issues
-
-    if settings is None:
-        settings = load_app_settings()
-
     # Exclude parent issues based on parent field mapping
     parent_field = (
         settings.get("field_mappings", {}).get("general", {}).get("parent_field")
     )
     if parent_field:
         issues = filter_parent_issues(issues, parent_field, log_prefix=log_prefix)
+    without_parents = issues
 
     # Filter to development projects only
     development_projects = settings.get("development_projects", [])
@@ -55,9 +52,32 @@ def filter_issues_for_metrics(
         )
 
     # Exclude configured parent issue types from calculations
-
     parent_types = extract_parent_types_from_config(settings)
     if parent_types:
         issues = filter_out_parent_types(issues, parent_types)
 
-    return issues
+    return without_parents, issues
+
+
+def filter_issues_for_metrics(
+    issues: list[dict[str, Any]],
+    settings: dict[str, Any] | None = None,
+    log_prefix: str = "METRICS",
+) -> list[dict[str, Any]]:
+    """Filter issues for metrics calculations.
+
+    Args:
+        issues: List of Jira issues (database or API format)
+        settings: App settings dict; loads from persistence if not provided
+        log_prefix: Prefix used by downstream filter logs
+
+    Returns:
+        Filtered issues for metrics calculations
+    """
+    if not issues:
+        return issues
+
+    if settings is None:
+        settings = load_app_settings()
+
+    return split_issues_for_metrics(issues, settings, log_prefix)[1]
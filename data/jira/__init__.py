@@ -66,6 +66,7 @@ from data.jira.issue_counter import check_jira_issue_count
 from data.jira.main_fetch import fetch_jira_issues
 
 # Phase 9: Metadata fetcher
+from data.jira.metadata_cache import get_metadata_cache, warm_metadata_cache
 from data.jira.metadata_fetcher import JiraMetadataFetcher, create_metadata_fetcher
 
 # Phase 9: Query profiles and rate limiting
@@ -177,6 +178,8 @@ __all__ = [
     # Phase 9: Metadata fetcher
     "JiraMetadataFetcher",
     "create_metadata_fetcher",
+    "get_metadata_cache",
+    "warm_metadata_cache",
     # Constants
     "JIRA_CACHE_FILE",
     "JIRA_CHANGELOG_CACHE_FILE",
@@ -12,6 +12,7 @@ from datetime import UTC, datetime, timedelta
 
 from data.exceptions import JiraError, PersistenceError
 from data.jira.changelog_pagination import fetch_jira_issues_with_changelog
+from data.jira.changelog_request import _build_tracked_fields
 
 logger = logging.getLogger(__name__)
 
@@ -196,6 +197,16 @@ def fetch_changelog_on_demand(
                 # Collect entries for batch database insert
                 changelog_entries_batch = []
 
+                # Filter to ONLY histories that contain tracked field changes
+                # TRACKED FIELDS: status (for Flow metrics), sprint field ID and
+                # "Sprint" display name (for Sprint Tracker)
+                tracked_fields = _build_tracked_fields(config)
+                if len(tracked_fields) > 1:
+                    logger.info(
+                        f"[JIRA] Tracking sprint field: "
+                        f"{tracked_fields[1]} and 'Sprint'"
+                    )
+
                 for issue in issues_with_changelog:
                     issue_key = issue.get("key", "")
                     if not issue_key:
@@ -203,47 +214,11 @@ def fetch_changelog_on_demand(
 
                     changelog_full = issue.get("changelog", {})
                     histories = changelog_full.get("histories", [])
-                    total_histories_before += len(histories)
-
-                    # Filter to ONLY histories that contain tracked field changes
-                    # TRACKED FIELDS: status (for Flow metrics), sprint field ID (for
-                    # Sprint Tracker)
-                    # Note: Sprint is a custom field (typically customfield_10020) that
-                    # varies by instance
-                    tracked_fields = ["status"]  # Always track status
-
-                    # Add sprint field if detected (from field mappings)
-                    # CRITICAL: JIRA uses field display name in changelog, not custom
-                    # field ID
-                    # E.g., changelog has "Sprint", not "customfield_10005"
-                    sprint_field_id = (
-                        config.get("field_mappings", {})
-                        .get("general", {})
-                        .get("sprint_field")
+                    # Histories were reduced while streaming; JIRA's total is
+                    # the issue's full history count
+                    total_histories_before += changelog_full.get(
+                        "total", len(histories)
                     )
-                    if sprint_field_id:
-                        tracked_fields.append(
-                            sprint_field_id
-                        )  # Track custom field ID (for fallback)
-                        tracked_fields.append(
-                            "Sprint"
-                        )  # Track display name (JIRA default)
-                        logger.info(
-                            f"[JIRA] Tracking sprint field: "
-                            f"{sprint_field_id} and 'Sprint'"
-                        )
-
-                    # DEBUG: Log unique field names from first issue to diagnose sprint
-                    # field mismatch
-                    if issues_processed == 0 and histories:
-                        unique_fields = set()
-                        for hist in histories[:5]:  # Check first 5 histories
-                            for item in hist.get("items", []):
-                                unique_fields.add(item.get("field"))
-                        logger.info(
-                            f"[JIRA] Sample changelog field names for {issue_key}: "
-                            f"{sorted(unique_fields)}"
-                        )
 
                     filtered_histories = []
                     for history in histories:
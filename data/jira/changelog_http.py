@@ -69,6 +69,7 @@ def _fetch_with_retry(
                 headers=headers,
                 json=body,  # Send parameters in body, not URL
                 timeout=90,  # Increased from 30s to 90s
+                stream=True,  # Body is parsed incrementally by the caller
             )
             break  # Success, exit retry loop
         except requests.exceptions.Timeout as e:
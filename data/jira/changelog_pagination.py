@@ -15,12 +15,55 @@ from data.jira.changelog_http import (
     _extract_error_details,
     _fetch_with_retry,
 )
-from data.jira.changelog_request import _build_changelog_jql, _build_fields_string
+from data.jira.changelog_request import (
+    _build_changelog_jql,
+    _build_fields_string,
+    _build_tracked_fields,
+)
+from data.jira.response_stream import read_search_page
 from data.task_progress import TaskProgress
 
 logger = logging.getLogger(__name__)
 
 
+def _reduce_issue_changelog(issue: dict, tracked_fields: list[str]) -> dict:
+    """
+    Keep only tracked-field histories in an issue's expanded changelog.
+
+    Applied to each issue as it is parsed from the response, so the full
+    history of a page is never held in memory.
+
+    Args:
+        issue: Issue with expanded changelog
+        tracked_fields: Field names/IDs to keep (see _build_tracked_fields)
+
+    Returns:
+        The same issue with changelog.histories reduced
+    """
+    changelog = issue.get("changelog")
+    if not isinstance(changelog, dict):
+        return issue
+    reduced_histories = []
+    for history in changelog.get("histories", []):
+        tracked_items = [
+            {
+                "field": item.get("field"),
+                "fieldId": item.get("fieldId"),
+                "fromString": item.get("fromString"),
+                "toString": item.get("toString"),
+            }
+            for item in history.get("items", [])
+            if item.get("field") in tracked_fields
+            or item.get("fieldId") in tracked_fields
+        ]
+        if tracked_items:
+            reduced_histories.append(
+                {"created": history.get("created"), "items": tracked_items}
+            )
+    issue["changelog"] = {**changelog, "histories": reduced_histories}
+    return issue
+
+
 def fetch_jira_issues_with_changelog(
     config: dict,
     issue_keys: list[str] | None = None,
@@ -46,7 +89,8 @@ def fetch_jira_issues_with_changelog(
         progress_callback: Optional callback function(message: str) for progress updates
 
     Returns:
-        Tuple of (success: bool, issues_with_changelog: List[Dict])
+        Tuple of (success: bool, issues_with_changelog: List[Dict]); each
+        changelog is reduced to status/sprint histories while it is parsed
     """
     try:
         # Use SMALLER page size for changelog fetching (50 instead of 100)
@@ -88,6 +132,7 @@ def fetch_jira_issues_with_changelog(
 
         # Fields to fetch (same as regular fetch + changelog)
         fields = _build_fields_string(config)
+        tracked_fields = _build_tracked_fields(config)
 
         # Pagination: Fetch ALL issues with changelog in batches
         all_issues = []
@@ -192,12 +237,15 @@ def fetch_jira_issues_with_changelog(
                 )
                 return False, []
 
-            data = response.json()
-            issues_in_page = data.get("issues", [])
+            # Stream the page and drop untracked histories issue by issue
+            issues_in_page, header = read_search_page(
+                response,
+                lambda issue: _reduce_issue_changelog(issue, tracked_fields),
+            )
 
             # Get total from first response
             if total_issues is None:
-                total_issues = data.get("total", 0)
+                total_issues = header.get("total", 0)
                 logger.info(
                     f"[JIRA] Query matched {total_issues} issues, "
                     "fetching with changelog"
@@ -142,3 +142,26 @@ def _build_fields_string(config: dict) -> str:
         fields = base_fields
 
     return fields
+
+
+def _build_tracked_fields(config: dict) -> list[str]:
+    """
+    Build the changelog fields kept when reducing fetched histories.
+
+    Status is always tracked (Flow metrics). The sprint field is tracked by
+    both its custom field ID and JIRA's display name, because changelog items
+    carry the display name in "field" and the ID in "fieldId".
+
+    Args:
+        config: Configuration dictionary with field mappings
+
+    Returns:
+        Field names/IDs whose changelog items are kept
+    """
+    tracked_fields = ["status"]
+    sprint_field_id = (
+        config.get("field_mappings", {}).get("general", {}).get("sprint_field")
+    )
+    if sprint_field_id:
+        tracked_fields.extend([sprint_field_id, "Sprint"])
+    return tracked_fields
@@ -33,6 +33,10 @@ CHANGELOG_CACHE_VERSION = "2.0"  # v2.0: Added critical fields for DORA metrics
 # Cache expiration - invalidate cache after this duration
 CACHE_EXPIRATION_HOURS = 24  # Cache expires after 24 hours
 
+# Concurrent pagination - search pages fetched in parallel once the first page
+# reports the total (each request still waits for a rate limiter token)
+PAGE_FETCH_MAX_WORKERS = 4
+
 
 #######################################################################
 # CONFIGURATION FUNCTIONS
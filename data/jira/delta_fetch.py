@@ -54,7 +54,11 @@ def get_affected_weeks_from_changed_issues(changed_keys: list[str]) -> set[str]:
             logger.warning("[Delta Calculate] No active profile/query")
             return affected_weeks
 
-        issues = backend.get_issues(active_profile_id, active_query_id)
+        issues = backend.get_issues(
+            active_profile_id,
+            active_query_id,
+            columns=["issue_key", "created", "resolved"],
+        )
         changed_keys_set = set(changed_keys)
 
         # Find changed issues and extract date-related weeks
@@ -213,7 +217,9 @@ def try_delta_fetch(
             return False, [], [], []
 
         # Get issues from database to determine last fetch time
-        cached_data = backend.get_issues(active_profile_id, active_query_id)
+        cached_data = backend.get_issues(
+            active_profile_id, active_query_id, columns=["fetched_at"]
+        )
         if not cached_data:
             logger.warning("[Delta] No cached issues - full fetch required")
             return False, [], [], []
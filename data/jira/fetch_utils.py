@@ -15,12 +15,19 @@ This module contains only the paginated fetch helper used by two-phase fetch.
 #######################################################################
 
 import logging
+from typing import Any
 
 import requests
 
-from data.jira.config import generate_config_hash
+from data.jira.config import PAGE_FETCH_MAX_WORKERS, generate_config_hash
 from data.jira.field_utils import extract_jira_field_id
+from data.jira.page_fetcher import (
+    compute_remaining_offsets,
+    create_jira_session,
+    fetch_pages_concurrently,
+)
 from data.jira.rate_limiter import get_rate_limiter, retry_with_backoff
+from data.jira.response_stream import read_search_page
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +86,7 @@ def _fetch_jira_paginated(
     Returns:
         Tuple of (success: bool, issues: List[Dict])
     """
+    session: requests.Session | None = None
 
     try:
         # Get configuration
@@ -143,71 +151,48 @@ def _fetch_jira_paginated(
             "Content-Type": "application/json",
         }
 
-        all_issues = []
-        start_at = 0
-        total_issues = None
         rate_limiter = get_rate_limiter()
+        session = create_jira_session(PAGE_FETCH_MAX_WORKERS)
+        base_params = {"jql": jql, "maxResults": page_size, "fields": fields}
+
+        # First page reports the total; remaining pages are fetched concurrently
+        rate_limiter.wait_for_token()
+        success, response = retry_with_backoff(
+            session.get,
+            api_endpoint,
+            headers=headers,
+            params={**base_params, "startAt": 0},
+            timeout=30,
+            stream=True,
+        )
+        if not success:
+            _log_fetch_error(response, jql)
+            return False, []
+        # Streamed response: release its connection on every path
+        with response:
+            if response.status_code != 200:
+                _log_fetch_error(response, jql)
+                return False, []
+
+            all_issues, header = read_search_page(response)
+        total_issues = header.get("total", 0)
+        logger.debug(f"[FETCH] Query matched {total_issues} issues")
 
-        # Pagination loop
-        while True:
-            # Rate limiting
-            rate_limiter.wait_for_token()
-
-            params = {
-                "jql": jql,
-                "startAt": start_at,
-                "maxResults": page_size,
-                "fields": fields,
-            }
-
-            # Make request with retry logic
-            success, response = retry_with_backoff(
-                requests.get,
+        if len(all_issues) >= page_size:
+            result = fetch_pages_concurrently(
+                session,
                 api_endpoint,
-                headers=headers,
-                params=params,
-                timeout=30,
+                headers,
+                base_params,
+                compute_remaining_offsets(page_size, total_issues),
+                PAGE_FETCH_MAX_WORKERS,
+                rate_limiter=rate_limiter,
             )
-
-            if not success or response.status_code != 200:
-                error_msg = (
-                    f"HTTP {response.status_code}"
-                    if hasattr(response, "status_code")
-                    else "Network error"
-                )
-                logger.error(f"[FETCH] API error: {error_msg}")
-
-                # Log JIRA error details if available
-                if hasattr(response, "text"):
-                    try:
-                        error_data = response.json()
-                        logger.error(f"[FETCH] JIRA error: {error_data}")
-                    except Exception:
-                        logger.error(f"[FETCH] Response: {response.text[:500]}")
-
-                # Log the JQL that caused the error
-                jql_preview = jql[:200] + "..." if len(jql) > 200 else jql
-                logger.error(f"[FETCH] Failed JQL: {jql_preview}")
-
+            if not result.success:
+                _log_fetch_error(result.error, jql)
                 return False, []
-
-            data = response.json()
-            issues_in_page = data.get("issues", [])
-
-            if total_issues is None:
-                total_issues = data.get("total", 0)
-                logger.debug(f"[FETCH] Query matched {total_issues} issues")
-
-            all_issues.extend(issues_in_page)
-
-            # Check if pagination complete
-            if (
-                len(issues_in_page) < page_size
-                or start_at + len(issues_in_page) >= total_issues
-            ):
-                break
-
-            start_at += page_size
+            for issues_in_page in result.pages:
+                all_issues.extend(issues_in_page)
 
         logger.debug(f"[FETCH] Fetched {len(all_issues)} issues")
         return True, all_issues
@@ -215,6 +200,31 @@ def _fetch_jira_paginated(
     except Exception as e:
         logger.error(f"[FETCH] Error: {e}", exc_info=True)
         return False, []
+    finally:
+        if session is not None:
+            session.close()
+
+
+def _log_fetch_error(response: Any, jql: str) -> None:
+    """Log a failed search request (HTTP error response or network exception)."""
+    error_msg = (
+        f"HTTP {response.status_code}"
+        if hasattr(response, "status_code")
+        else "Network error"
+    )
+    logger.error(f"[FETCH] API error: {error_msg}")
+
+    # Log JIRA error details if available
+    if hasattr(response, "text"):
+        try:
+            error_data = response.json()
+            logger.error(f"[FETCH] JIRA error: {error_data}")
+        except Exception:
+            logger.error(f"[FETCH] Response: {response.text[:500]}")
+
+    # Log the JQL that caused the error
+    jql_preview = jql[:200] + "..." if len(jql) > 200 else jql
+    logger.error(f"[FETCH] Failed JQL: {jql_preview}")
 
 
 #######################################################################
@@ -17,12 +17,18 @@ import requests
 
 from data.exceptions import JiraError, PersistenceError
 from data.jira.cache_operations import cache_jira_response
-from data.jira.config import CACHE_EXPIRATION_HOURS
+from data.jira.config import CACHE_EXPIRATION_HOURS, PAGE_FETCH_MAX_WORKERS
 from data.jira.delta_fetch import try_delta_fetch
 from data.jira.fetch_utils import fetch_jira_paginated
 from data.jira.field_utils import extract_jira_field_id
 from data.jira.issue_counter import check_jira_issue_count
+from data.jira.page_fetcher import (
+    compute_remaining_offsets,
+    create_jira_session,
+    fetch_pages_concurrently,
+)
 from data.jira.rate_limiter import get_rate_limiter, retry_with_backoff
+from data.jira.response_stream import read_search_page
 from data.jira.two_phase_fetch import (
     fetch_jira_issues_two_phase,
     should_use_two_phase_fetch,
@@ -83,6 +89,8 @@ def fetch_jira_issues(
     """
 
     start_time = time.time()
+    # Created for the API fetch below; closed in the finally clause
+    session: requests.Session | None = None
 
     try:
         # Use the JQL query directly from configuration
@@ -497,10 +505,9 @@ def fetch_jira_issues(
         if config["token"]:
             headers["Authorization"] = f"Bearer {config['token']}"
 
-        # Pagination: Fetch ALL issues in batches
+        # Pagination: first page reports the total, remaining pages are then
+        # fetched concurrently over one keep-alive session
         all_issues = []
-        start_at = 0
-        total_issues = None  # Will be set from first API response
 
         logger.debug(f"[JIRA] Fetching from: {url}")
         logger.debug(f"[JIRA] JQL: {jql}")
@@ -508,142 +515,118 @@ def fetch_jira_issues(
 
         # Get rate limiter for T052 integration
         rate_limiter = get_rate_limiter()
+        session = create_jira_session(PAGE_FETCH_MAX_WORKERS)
+        base_params = {"jql": jql, "maxResults": page_size, "fields": fields}
 
-        while True:
-            params = {
-                "jql": jql,
-                "maxResults": page_size,
-                "startAt": start_at,
-                "fields": fields,
-            }
-
-            logger.debug(
-                f"[JIRA] Page at {start_at} (fetched {len(all_issues)} so far)"
+        # Check for cancellation BEFORE making API call
+        try:
+            if TaskProgress.is_task_cancelled():
+                logger.info("[JIRA] Fetch cancelled by user before first page")
+                TaskProgress.fail_task("update_data", "Operation cancelled by user")
+                return False, []
+            TaskProgress.update_progress(
+                "update_data",
+                "fetch",
+                current=0,
+                total=0,
+                message="Connecting to JIRA...",
             )
+        except (
+            AttributeError,
+            ImportError,
+            RuntimeError,
+            TypeError,
+            ValueError,
+        ) as e:
+            logger.debug(f"Progress update/cancellation check failed: {e}")
+
+        # T052: Rate limiting - wait for token before request
+        rate_limiter.wait_for_token()
+
+        # T053: Retry with exponential backoff for resilience
+        success, response = retry_with_backoff(
+            session.get,
+            url,
+            headers=headers,
+            params={**base_params, "startAt": 0},
+            timeout=30,
+            stream=True,
+        )
 
-            # Check for cancellation BEFORE making API call
-            try:
-                # Check if task was cancelled
-                is_cancelled = TaskProgress.is_task_cancelled()
-                logger.debug(f"[JIRA] Cancellation check: is_cancelled={is_cancelled}")
-                if is_cancelled:
-                    logger.info(
-                        f"[JIRA] Fetch cancelled by user after {len(all_issues)} issues"
-                    )
-                    TaskProgress.fail_task("update_data", "Operation cancelled by user")
-                    return False, []
+        if not success:
+            logger.error("[JIRA] Fetch failed after retries")
+            return False, []
+        # Streamed response: release its connection on every path
+        with response:
+            if not response.ok:
+                _log_jira_search_error(response, jql)
+                return False, []
 
-                # Report progress
-                if total_issues:
+            # Parse issue by issue instead of materializing the whole body
+            first_page, header = read_search_page(response)
+        total_issues = header.get("total", 0)
+        logger.info(f"[JIRA] Query matched {total_issues} issues, paginating")
+
+        pages = [first_page]
+        if len(first_page) >= page_size:
+            offsets = compute_remaining_offsets(page_size, total_issues, total_limit)
+
+            def _is_cancelled() -> bool:
+                try:
+                    return TaskProgress.is_task_cancelled()
+                except (AttributeError, ImportError, RuntimeError) as e:
+                    logger.debug(f"Cancellation check failed: {e}")
+                    return False
+
+            def _report_page(fetched: int) -> None:
+                try:
                     TaskProgress.update_progress(
                         "update_data",
                         "fetch",
-                        current=len(all_issues),
+                        current=len(first_page) + fetched,
                         total=total_issues,
                         message="Fetching issues from JIRA",
                     )
-                else:
-                    # First batch or unknown total
-                    msg = (
-                        "Connecting to JIRA..."
-                        if start_at == 0
-                        else f"Fetching issues ({len(all_issues)} so far)..."
-                    )
-                    TaskProgress.update_progress(
-                        "update_data",
-                        "fetch",
-                        current=len(all_issues),
-                        total=0,
-                        message=msg,
-                    )
-            except (
-                AttributeError,
-                ImportError,
-                RuntimeError,
-                TypeError,
-                ValueError,
-            ) as e:
-                logger.debug(f"Progress update/cancellation check failed: {e}")
-
-            # T052: Rate limiting - wait for token before request
-            rate_limiter.wait_for_token()
-
-            # T053: Retry with exponential backoff for resilience
-            success, response = retry_with_backoff(
-                requests.get, url, headers=headers, params=params, timeout=30
+                except (AttributeError, RuntimeError, TypeError, ValueError) as e:
+                    logger.debug(f"Progress update failed: {e}")
+
+            result = fetch_pages_concurrently(
+                session,
+                url,
+                headers,
+                base_params,
+                offsets,
+                PAGE_FETCH_MAX_WORKERS,
+                is_cancelled=_is_cancelled,
+                on_page=_report_page,
+                rate_limiter=rate_limiter,
             )
-
-            if not success:
-                logger.error("[JIRA] Fetch failed after retries")
+            if result.cancelled:
+                logger.info("[JIRA] Fetch cancelled by user during pagination")
+                TaskProgress.fail_task("update_data", "Operation cancelled by user")
                 return False, []
-
-            # Enhanced error handling for ScriptRunner and JQL issues
-            if not response.ok:
-                error_details = ""
-                try:
-                    error_json = response.json()
-                    if "errorMessages" in error_json:
-                        error_details = "; ".join(error_json["errorMessages"])
-                    elif "errors" in error_json:
-                        error_details = "; ".join(
-                            [f"{k}: {v}" for k, v in error_json["errors"].items()]
-                        )
-                    else:
-                        error_details = str(error_json)
-                except TypeError, ValueError:
-                    error_details = response.text[:500]  # First 500 chars of response
-
-                # Check for common ScriptRunner/JQL function issues
-                if (
-                    "issueFunction" in jql.lower()
-                    or "scriptrunner" in error_details.lower()
-                ):
-                    logger.error(
-                        f"[JIRA] ScriptRunner function error in JQL: {jql[:50]}..."
-                    )
-                    logger.error("[JIRA] ScriptRunner functions may not be available")
-                    logger.error(f"[JIRA] API error details: {error_details}")
+            if not result.success:
+                if isinstance(result.error, requests.Response):
+                    _log_jira_search_error(result.error, jql)
                 else:
-                    logger.error(
-                        f"[JIRA] API error ({response.status_code}): {error_details}"
-                    )
-
+                    logger.error("[JIRA] Fetch failed after retries")
                 return False, []
+            pages.extend(result.pages)
 
-            data = response.json()
-            issues_in_page = data.get("issues", [])
-
-            # Get total from first response
-            if total_issues is None:
-                total_issues = data.get("total", 0)
-                logger.info(f"[JIRA] Query matched {total_issues} issues, paginating")
-
-            # Determine how many issues to add (respect total_limit)
+        # Reassemble in startAt order (respect total_limit). Parsed issues of
+        # every page stay resident: callers consume the whole list, so only
+        # the raw body of each page is kept out of memory.
+        for issues_in_page in pages:
             if total_limit is not None:
                 remaining_quota = total_limit - len(all_issues)
-                issues_to_add = issues_in_page[:remaining_quota]  # Truncate if needed
-            else:
-                issues_to_add = issues_in_page
-
-            # Add issues to collection
-            all_issues.extend(issues_to_add)
+                if remaining_quota <= 0:
+                    break
+                issues_in_page = issues_in_page[:remaining_quota]
+            all_issues.extend(issues_in_page)
 
-            # Check if we've fetched everything OR reached total_limit
-            if (
-                len(issues_in_page) < page_size  # Last page (partial)
-                or start_at + len(issues_in_page) >= total_issues  # All issues fetched
-                or (
-                    total_limit is not None and len(all_issues) >= total_limit
-                )  # Limit reached
-            ):
-                logger.info(
-                    "[JIRA] Pagination complete: "
-                    f"{len(all_issues)}/{total_issues} fetched"
-                )
-                break
-
-            # Move to next page
-            start_at += page_size
+        logger.info(
+            f"[JIRA] Pagination complete: {len(all_issues)}/{total_issues} fetched"
+        )
 
         elapsed_time = time.time() - start_time
         logger.info(
@@ -692,3 +675,31 @@ def fetch_jira_issues(
     ) as e:
         logger.error(f"[JIRA] Unexpected error: {e}")
         return False, []
+    finally:
+        if session is not None:
+            session.close()
+
+
+def _log_jira_search_error(response: requests.Response, jql: str) -> None:
+    """Log a non-2xx JIRA search response, flagging ScriptRunner JQL issues."""
+    error_details = ""
+    try:
+        error_json = response.json()
+        if "errorMessages" in error_json:
+            error_details = "; ".join(error_json["errorMessages"])
+        elif "errors" in error_json:
+            error_details = "; ".join(
+                [f"{k}: {v}" for k, v in error_json["errors"].items()]
+            )
+        else:
+            error_details = str(error_json)
+    except TypeError, ValueError:
+        error_details = response.text[:500]  # First 500 chars of response
+
+    # Check for common ScriptRunner/JQL function issues
+    if "issueFunction" in jql.lower() or "scriptrunner" in error_details.lower():
+        logger.error(f"[JIRA] ScriptRunner function error in JQL: {jql[:50]}...")
+        logger.error("[JIRA] ScriptRunner functions may not be available")
+        logger.error(f"[JIRA] API error details: {error_details}")
+    else:
+        logger.error(f"[JIRA] API error ({response.status_code}): {error_details}")
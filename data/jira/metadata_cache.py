@@ -0,0 +1,398 @@
+"""
+Persistent JIRA Metadata Cache
+
+Shares JIRA instance metadata (fields, projects, issue types, statuses and
+field options) between JiraMetadataFetcher instances and across app restarts.
+Callbacks create a new fetcher per request, so without a shared cache every
+open of the field mapping modal repeated the /field, /project and /status
+calls.
+
+Architecture:
+- In-memory layer in front of the jira_metadata_cache SQLite table, keyed by
+  (JIRA URL, API version, kind, resource)
+- Fresh entries (younger than METADATA_CACHE_TTL_SECONDS) are served as is
+- Stale entries are served immediately while one background refresh per key
+  updates them (stale-while-revalidate); entries older than
+  METADATA_CACHE_MAX_STALE_SECONDS are refetched synchronously
+- ETag / Last-Modified are kept so refreshes can be conditional requests
+- Payloads are shared, not copied: fetchers hand the cached list itself to
+  callers (the autocomplete index detects refreshes by its identity), so
+  callers must treat returned metadata as read-only
+- The jira_metadata_cache table is created by the schema migration
+- warm_metadata_cache() fetches all metadata endpoints concurrently, started
+  in the background when a profile is activated
+
+Without the SQLite backend (JSON persistence) only the in-memory layer is used.
+
+Usage:
+    from data.jira.metadata_cache import get_metadata_cache
+
+    cache = get_metadata_cache()
+    entry = cache.get("https://jira.example.com", "2", "fields")
+    if entry is None or not cache.is_fresh(entry):
+        ...  # fetch and cache.put(...)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from data.database import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+#######################################################################
+# CACHE CONFIGURATION
+#######################################################################
+
+# Fields, statuses and issue types change rarely (admin changes). After an hour
+# entries are still served but refreshed in the background.
+METADATA_CACHE_TTL_SECONDS = 60 * 60
+
+# Older entries are not shown while refreshing - the UI waits for fresh data
+METADATA_CACHE_MAX_STALE_SECONDS = 7 * 24 * 60 * 60
+
+# Threads for background refreshes and warm-up (one per metadata endpoint)
+METADATA_WORKERS = 4
+
+# (jira_url, api_version, kind, resource)
+CacheKey = tuple[str, str, str, str]
+
+
+@dataclass
+class CachedMetadata:
+    """
+    One cached metadata payload plus its HTTP validators.
+
+    The payload is shared by every reader of the entry; never mutate it.
+    """
+
+    payload: Any
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def age(self) -> float:
+        """Seconds since the payload was fetched (or confirmed unchanged)."""
+        return time.time() - self.fetched_at
+
+
+def _db_path() -> Path | None:
+    """Database of the active SQLite backend, None for other backends."""
+    # circular import guard
+    from data.persistence.factory import get_backend  # noqa: PLC0415
+
+    try:
+        db_path = getattr(get_backend(), "db_path", None)
+    except Exception as e:
+        logger.debug(f"[JIRA] Metadata cache without database: {e}")
+        return None
+    return Path(db_path) if db_path else None
+
+
+def _validator(value: Any) -> str | None:
+    """HTTP validator header value, or None when absent."""
+    return value if isinstance(value, str) and value else None
+
+
+class MetadataCache:
+    """
+    Two-level (memory + SQLite) cache for JIRA metadata.
+
+    Thread-safe: fetchers in Dash callback threads, background refreshes and
+    the warm-up all share one instance (see get_metadata_cache()).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = METADATA_CACHE_TTL_SECONDS,
+        max_stale_seconds: float = METADATA_CACHE_MAX_STALE_SECONDS,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self._lock = threading.Lock()
+        # Memory layer per database file, so tests and backends do not mix
+        self._memory: dict[str, dict[CacheKey, CachedMetadata]] = {}
+        self._refreshing: set[CacheKey] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def is_fresh(self, entry: CachedMetadata) -> bool:
+        """Whether the entry can be served without refreshing it."""
+        return entry.age() < self.ttl_seconds
+
+    def is_servable(self, entry: CachedMetadata) -> bool:
+        """Whether the entry may be served while it is refreshed."""
+        return entry.age() < self.max_stale_seconds
+
+    def get(
+        self, jira_url: str, api_version: str, kind: str, resource: str = ""
+    ) -> CachedMetadata | None:
+        """
+        Return the cached entry for a metadata kind, or None.
+
+        Args:
+            jira_url: JIRA instance URL (without trailing slash)
+            api_version: REST API version ("2" or "3")
+            kind: Metadata kind ("fields", "projects", "field_options", ...)
+            resource: Sub-key within the kind (field ID for field options)
+
+        Returns:
+            CachedMetadata regardless of age, None when never fetched
+        """
+        key = (jira_url, api_version, kind, resource)
+        db_path = _db_path()
+        with self._lock:
+            entry = self._memory.get(str(db_path), {}).get(key)
+        if entry is not None or db_path is None:
+            return entry
+
+        try:
+            with get_db_connection(db_path) as conn:
+                row = conn.execute(
+                    "SELECT payload, fetched_at, etag, last_modified "
+                    "FROM jira_metadata_cache "
+                    "WHERE jira_url = ? AND api_version = ? AND kind = ? "
+                    "AND resource = ?",
+                    key,
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"[JIRA] Metadata cache read failed for {kind}: {e}")
+            return None
+        if row is None:
+            return None
+
+        entry = CachedMetadata(
+            payload=json.loads(row[0]),
+            fetched_at=row[1],
+            etag=row[2],
+            last_modified=row[3],
+        )
+        with self._lock:
+            self._memory.setdefault(str(db_path), {})[key] = entry
+        return entry
+
+    def put(
+        self,
+        jira_url: str,
+        api_version: str,
+        kind: str,
+        payload: Any,
+        resource: str = "",
+        etag: Any = None,
+        last_modified: Any = None,
+    ) -> CachedMetadata:
+        """
+        Store a freshly fetched payload.
+
+        Args:
+            jira_url: JIRA instance URL (without trailing slash)
+            api_version: REST API version ("2" or "3")
+            kind: Metadata kind
+            payload: JSON-serializable (normalized) metadata
+            resource: Sub-key within the kind
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+
+        Returns:
+            The stored entry
+        """
+        entry = CachedMetadata(
+            payload=payload,
+            fetched_at=time.time(),
+            etag=_validator(etag),
+            last_modified=_validator(last_modified),
+        )
+        self._store((jira_url, api_version, kind, resource), entry)
+        return entry
+
+    def touch(
+        self, jira_url: str, api_version: str, kind: str, resource: str = ""
+    ) -> None:
+        """Mark an entry as fresh again (server answered 304 Not Modified)."""
+        entry = self.get(jira_url, api_version, kind, resource)
+        if entry is not None:
+            entry.fetched_at = time.time()
+            self._store((jira_url, api_version, kind, resource), entry)
+
+    def _store(self, key: CacheKey, entry: CachedMetadata) -> None:
+        db_path = _db_path()
+        with self._lock:
+            self._memory.setdefault(str(db_path), {})[key] = entry
+        if db_path is None:
+            return
+        try:
+            with get_db_connection(db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO jira_metadata_cache "
+                    "(jira_url, api_version, kind, resource, payload, etag, "
+                    "last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        *key,
+                        json.dumps(entry.payload),
+                        entry.etag,
+                        entry.last_modified,
+                        entry.fetched_at,
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[JIRA] Metadata cache write failed for {key[2]}: {e}")
+
+    def invalidate(self, jira_url: str) -> None:
+        """Drop all cached metadata of a JIRA instance (memory and database)."""
+        with self._lock:
+            for entries in self._memory.values():
+                for key in [key for key in entries if key[0] == jira_url]:
+                    del entries[key]
+        db_path = _db_path()
+        if db_path is None:
+            return
+        try:
+            with get_db_connection(db_path) as conn:
+                conn.execute(
+                    "DELETE FROM jira_metadata_cache WHERE jira_url = ?", (jira_url,)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[JIRA] Metadata cache invalidation failed: {e}")
+
+    def refresh_in_background(
+        self,
+        jira_url: str,
+        api_version: str,
+        kind: str,
+        refresh: Callable[[], Any],
+        resource: str = "",
+    ) -> bool:
+        """
+        Run refresh() on a worker thread unless one is already running for the key.
+
+        Args:
+            jira_url: JIRA instance URL
+            api_version: REST API version
+            kind: Metadata kind being refreshed
+            refresh: Callable that fetches and stores the metadata
+            resource: Sub-key within the kind
+
+        Returns:
+            True if a refresh was scheduled, False if one was already running
+        """
+        key = (jira_url, api_version, kind, resource)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=METADATA_WORKERS, thread_name_prefix="jira-metadata"
+                )
+            executor = self._executor
+
+        def _run() -> None:
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning(f"[JIRA] Background refresh of {kind} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(_run)
+        logger.debug(f"[JIRA] Refreshing stale {kind} metadata in background")
+        return True
+
+    def clear_memory(self) -> None:
+        """Forget the in-memory layer (database entries are kept)."""
+        with self._lock:
+            self._memory.clear()
+
+
+_metadata_cache = MetadataCache()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Return the process-wide metadata cache shared by all fetchers."""
+    return _metadata_cache
+
+
+#######################################################################
+# WARM-UP
+#######################################################################
+
+
+def warm_metadata_cache(
+    jira_url: str, jira_token: str, api_version: str = "v2"
+) -> dict[str, int]:
+    """
+    Fetch fields, projects, issue types and statuses concurrently.
+
+    Fresh entries are not refetched, so calling this repeatedly is cheap.
+
+    Args:
+        jira_url: JIRA instance URL
+        jira_token: JIRA API token
+        api_version: JIRA API version ("v2" or "v3")
+
+    Returns:
+        Number of entries per metadata kind, e.g. {"fields": 412, ...}
+    """
+    # circular import guard (metadata_fetcher uses this module)
+    from data.jira.metadata_fetcher import JiraMetadataFetcher  # noqa: PLC0415
+
+    fetcher = JiraMetadataFetcher(jira_url, jira_token, api_version)
+    fetches = {
+        "fields": fetcher.fetch_fields,
+        "projects": fetcher.fetch_projects,
+        "issue_types": fetcher.fetch_issue_types,
+        "statuses": fetcher.fetch_statuses,
+    }
+
+    start_time = time.time()
+    with ThreadPoolExecutor(
+        max_workers=METADATA_WORKERS, thread_name_prefix="jira-metadata-warmup"
+    ) as executor:
+        futures = {kind: executor.submit(fetch) for kind, fetch in fetches.items()}
+        counts = {kind: len(future.result()) for kind, future in futures.items()}
+
+    logger.info(
+        f"[JIRA] Metadata cache warmed in {time.time() - start_time:.2f}s: {counts}"
+    )
+    return counts
+
+
+def start_metadata_warmup(jira_config: dict[str, Any]) -> threading.Thread | None:
+    """
+    Warm the metadata cache for a JIRA configuration on a daemon thread.
+
+    Args:
+        jira_config: JIRA configuration with base_url, token, api_version
+
+    Returns:
+        The started thread, or None when JIRA is not configured
+    """
+    jira_url = (jira_config.get("base_url") or "").strip()
+    if not jira_url:
+        return None
+
+    def _background() -> None:
+        try:
+            warm_metadata_cache(
+                jira_url,
+                jira_config.get("token", ""),
+                jira_config.get("api_version", "v2"),
+            )
+        except Exception as e:
+            logger.warning(f"[JIRA] Metadata warm-up failed: {e}")
+
+    thread = threading.Thread(
+        target=_background, daemon=True, name="JiraMetadataWarmup"
+    )
+    thread.start()
+    return thread
@@ -9,16 +9,80 @@ Designed for the comprehensive mappings configuration UI to enable generic JIRA
 """
 
 import logging
+from collections.abc import Callable
 
 import requests
 
 from data.exceptions import JiraError
+from data.jira.metadata_cache import CachedMetadata, get_metadata_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_fields(fields: list[dict]) -> list[dict]:
+    """Keep id, name, type and custom flag of each /field entry."""
+    return [
+        {
+            "id": field.get("id", ""),
+            "name": field.get("name", ""),
+            "type": field.get("schema", {}).get("type", "string"),
+            "custom": field.get("custom", False),
+        }
+        for field in fields
+    ]
+
+
+def _normalize_projects(projects: list[dict]) -> list[dict]:
+    """Keep key, name and id of each /project entry."""
+    return [
+        {
+            "key": project.get("key", ""),
+            "name": project.get("name", ""),
+            "id": project.get("id", ""),
+        }
+        for project in projects
+    ]
+
+
+def _normalize_issue_types(issue_types: list[dict]) -> list[dict]:
+    """Keep id, name, description and subtask flag of each /issuetype entry."""
+    return [
+        {
+            "id": issue_type.get("id", ""),
+            "name": issue_type.get("name", ""),
+            "description": issue_type.get("description", ""),
+            "subtask": issue_type.get("subtask", False),
+        }
+        for issue_type in issue_types
+    ]
+
+
+def _normalize_statuses(statuses: list[dict]) -> list[dict]:
+    """Keep id, name, description and category of each /status entry."""
+    normalized = []
+    for status in statuses:
+        category = status.get("statusCategory", {})
+        normalized.append(
+            {
+                "id": status.get("id", ""),
+                "name": status.get("name", ""),
+                "description": status.get("description", ""),
+                "category_key": category.get("key", "undefined"),
+                "category_name": category.get("name", "Undefined"),
+            }
+        )
+    return normalized
+
+
 class JiraMetadataFetcher:
-    """Fetch and cache JIRA metadata for configuration UI."""
+    """
+    Fetch and cache JIRA metadata for configuration UI.
+
+    Results are kept on the instance and in the shared persistent cache
+    (data.jira.metadata_cache), so new fetchers for the same JIRA URL reuse
+    what earlier ones fetched. Returned lists are the cached objects
+    themselves: callers must not modify them.
+    """
 
     def __init__(self, jira_url: str, jira_token: str, api_version: str = "v2"):
         """
@@ -36,52 +100,120 @@ class JiraMetadataFetcher:
         if jira_token:
             self.headers["Authorization"] = f"Bearer {jira_token}"
 
-        # Session-level cache
+        # Instance-level cache (in front of the shared metadata cache)
         self._fields_cache: list[dict] | None = None
         self._projects_cache: list[dict] | None = None
         self._issue_types_cache: list[dict] | None = None
         self._statuses_cache: list[dict] | None = None
         self._field_options_cache: dict[str, list[str]] = {}
 
-    def fetch_fields(self, force_refresh: bool = False) -> list[dict]:
+    def _fetch_metadata(
+        self,
+        kind: str,
+        endpoint: str,
+        normalize: Callable[[list[dict]], list[dict]],
+        force_refresh: bool,
+    ) -> list[dict]:
         """
-        Fetch all available JIRA fields (standard and custom).
+        Serve a metadata list from the shared cache, fetching it when needed.
+
+        Fresh cache entries are returned directly. Stale ones are returned
+        while a background refresh runs; missing or expired ones (or
+        force_refresh) are fetched now, as a conditional request when the
+        cached entry has an ETag or Last-Modified validator.
 
         Args:
-            force_refresh: Force API call even if cached
+            kind: Cache kind ("fields", "projects", "issue_types", "statuses")
+            endpoint: REST resource under /rest/api/{version}/
+            normalize: Converts the raw JSON list to the cached shape
+            force_refresh: Skip the cache (validators are still sent)
 
         Returns:
-            List of field dictionaries with id, name, type, custom flag
+            Normalized metadata list ([] if the request failed and nothing
+            is cached)
         """
-        if self._fields_cache is not None and not force_refresh:
-            return self._fields_cache
+        cache = get_metadata_cache()
+        cached = cache.get(self.jira_url, self.api_version, kind)
+
+        if cached is not None and not force_refresh:
+            if cache.is_fresh(cached):
+                return cached.payload
+            if cache.is_servable(cached):
+                cache.refresh_in_background(
+                    self.jira_url,
+                    self.api_version,
+                    kind,
+                    lambda: self._request_metadata(kind, endpoint, normalize, cached),
+                )
+                return cached.payload
+
+        return self._request_metadata(kind, endpoint, normalize, cached)
+
+    def _request_metadata(
+        self,
+        kind: str,
+        endpoint: str,
+        normalize: Callable[[list[dict]], list[dict]],
+        cached: CachedMetadata | None,
+    ) -> list[dict]:
+        """Fetch one metadata list from JIRA and store it in the shared cache."""
+        cache = get_metadata_cache()
+        headers = dict(self.headers)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
 
         try:
-            url = f"{self.jira_url}/rest/api/{self.api_version}/field"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            url = f"{self.jira_url}/rest/api/{self.api_version}/{endpoint}"
+            response = requests.get(url, headers=headers, timeout=10)
 
-            fields = response.json()
-            # Normalize field data
-            normalized = []
-            for field in fields:
-                normalized.append(
-                    {
-                        "id": field.get("id", ""),
-                        "name": field.get("name", ""),
-                        "type": field.get("schema", {}).get("type", "string"),
-                        "custom": field.get("custom", False),
-                    }
-                )
+            if response.status_code == 304 and cached is not None:
+                cache.touch(self.jira_url, self.api_version, kind)
+                logger.info(f"[JIRA] {kind} unchanged (304), reusing cached copy")
+                return cached.payload
 
-            self._fields_cache = normalized
-            logger.info(f"[JIRA] Fetched {len(normalized)} fields")
+            response.raise_for_status()
+            normalized = normalize(response.json())
+            cache.put(
+                self.jira_url,
+                self.api_version,
+                kind,
+                normalized,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            logger.info(f"[JIRA] Fetched {len(normalized)} {kind.replace('_', ' ')}")
             return normalized
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"[JIRA] Failed to fetch fields: {e}")
+            logger.error(f"[JIRA] Failed to fetch {kind.replace('_', ' ')}: {e}")
+            if cached is not None:
+                logger.info(f"[JIRA] Using cached {kind} from before the failure")
+                return cached.payload
             return []
 
+    def fetch_fields(self, force_refresh: bool = False) -> list[dict]:
+        """
+        Fetch all available JIRA fields (standard and custom).
+
+        Args:
+            force_refresh: Force API call even if cached
+
+        Returns:
+            List of field dictionaries with id, name, type, custom flag
+        """
+        if self._fields_cache is not None and not force_refresh:
+            return self._fields_cache
+
+        fields = self._fetch_metadata(
+            "fields", "field", _normalize_fields, force_refresh
+        )
+        if fields:
+            self._fields_cache = fields
+        return fields
+
     def fetch_projects(self, force_refresh: bool = False) -> list[dict]:
         """
         Fetch all accessible JIRA projects.
@@ -95,30 +227,12 @@ class JiraMetadataFetcher:
         if self._projects_cache is not None and not force_refresh:
             return self._projects_cache
 
-        try:
-            url = f"{self.jira_url}/rest/api/{self.api_version}/project"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            projects = response.json()
-            # Normalize project data
-            normalized = []
-            for project in projects:
-                normalized.append(
-                    {
-                        "key": project.get("key", ""),
-                        "name": project.get("name", ""),
-                        "id": project.get("id", ""),
-                    }
-                )
-
-            self._projects_cache = normalized
-            logger.info(f"[JIRA] Fetched {len(normalized)} projects")
-            return normalized
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"[JIRA] Failed to fetch projects: {e}")
-            return []
+        projects = self._fetch_metadata(
+            "projects", "project", _normalize_projects, force_refresh
+        )
+        if projects:
+            self._projects_cache = projects
+        return projects
 
     def fetch_issue_types(self, force_refresh: bool = False) -> list[dict]:
         """
@@ -133,31 +247,12 @@ class JiraMetadataFetcher:
         if self._issue_types_cache is not None and not force_refresh:
             return self._issue_types_cache
 
-        try:
-            url = f"{self.jira_url}/rest/api/{self.api_version}/issuetype"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            issue_types = response.json()
-            # Normalize issue type data
-            normalized = []
-            for issue_type in issue_types:
-                normalized.append(
-                    {
-                        "id": issue_type.get("id", ""),
-                        "name": issue_type.get("name", ""),
-                        "description": issue_type.get("description", ""),
-                        "subtask": issue_type.get("subtask", False),
-                    }
-                )
-
-            self._issue_types_cache = normalized
-            logger.info(f"[JIRA] Fetched {len(normalized)} issue types")
-            return normalized
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"[JIRA] Failed to fetch issue types: {e}")
-            return []
+        issue_types = self._fetch_metadata(
+            "issue_types", "issuetype", _normalize_issue_types, force_refresh
+        )
+        if issue_types:
+            self._issue_types_cache = issue_types
+        return issue_types
 
     def fetch_statuses(self, force_refresh: bool = False) -> list[dict]:
         """
@@ -172,33 +267,12 @@ class JiraMetadataFetcher:
         if self._statuses_cache is not None and not force_refresh:
             return self._statuses_cache
 
-        try:
-            url = f"{self.jira_url}/rest/api/{self.api_version}/status"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            statuses = response.json()
-            # Normalize status data
-            normalized = []
-            for status in statuses:
-                category = status.get("statusCategory", {})
-                normalized.append(
-                    {
-                        "id": status.get("id", ""),
-                        "name": status.get("name", ""),
-                        "description": status.get("description", ""),
-                        "category_key": category.get("key", "undefined"),
-                        "category_name": category.get("name", "Undefined"),
-                    }
-                )
-
-            self._statuses_cache = normalized
-            logger.info(f"[JIRA] Fetched {len(normalized)} statuses")
-            return normalized
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"[JIRA] Failed to fetch statuses: {e}")
-            return []
+        statuses = self._fetch_metadata(
+            "statuses", "status", _normalize_statuses, force_refresh
+        )
+        if statuses:
+            self._statuses_cache = statuses
+        return statuses
 
     def fetch_field_options(
         self, field_id: str, force_refresh: bool = False
@@ -220,6 +294,23 @@ class JiraMetadataFetcher:
         if field_id in self._field_options_cache and not force_refresh:
             return self._field_options_cache[field_id]
 
+        if not force_refresh:
+            cache = get_metadata_cache()
+            cached = cache.get(
+                self.jira_url, self.api_version, "field_options", field_id
+            )
+            if cached is not None and cache.is_servable(cached):
+                if not cache.is_fresh(cached):
+                    cache.refresh_in_background(
+                        self.jira_url,
+                        self.api_version,
+                        "field_options",
+                        lambda: self.fetch_field_options(field_id, force_refresh=True),
+                        resource=field_id,
+                    )
+                self._field_options_cache[field_id] = cached.payload
+                return cached.payload
+
         # Try field configuration endpoints first
         # Strategy: Try multiple JIRA REST API endpoints to get ALL possible field
         # values
@@ -306,7 +397,7 @@ class JiraMetadataFetcher:
 
                 if all_options:
                     values = sorted(all_options)
-                    self._field_options_cache[field_id] = values
+                    self._remember_field_options(field_id, values)
                     logger.info(
                         f"[JIRA] Fetched {len(values)} total options "
                         f"for field {field_id} from all contexts: {values}"
@@ -343,7 +434,7 @@ class JiraMetadataFetcher:
                                 values.append(value)
 
                     if values:
-                        self._field_options_cache[field_id] = values
+                        self._remember_field_options(field_id, values)
                         logger.info(
                             f"[JIRA] Fetched {len(values)} options "
                             f"for field {field_id} from schema: {values}"
@@ -373,7 +464,7 @@ class JiraMetadataFetcher:
                     values = []
 
                 if values:
-                    self._field_options_cache[field_id] = values
+                    self._remember_field_options(field_id, values)
                     logger.info(
                         f"[JIRA] Fetched {len(values)} options for field {field_id} "
                         f"from legacy endpoint"
@@ -429,7 +520,7 @@ class JiraMetadataFetcher:
 
                 if unique_values:
                     values = sorted(unique_values)
-                    self._field_options_cache[field_id] = values
+                    self._remember_field_options(field_id, values)
                     logger.info(
                         f"[JIRA] Extracted {len(values)} unique values "
                         f"from cache: {values}"
@@ -454,7 +545,7 @@ class JiraMetadataFetcher:
             )
 
             if values:
-                self._field_options_cache[field_id] = values
+                self._remember_field_options(field_id, values)
                 logger.info(
                     f"[JIRA] Extracted {len(values)} unique values "
                     f"from issues: {values}"
@@ -468,6 +559,13 @@ class JiraMetadataFetcher:
             logger.error(f"[JIRA] Failed to fetch values for field {field_id}: {e}")
             return []
 
+    def _remember_field_options(self, field_id: str, values: list[str]) -> None:
+        """Keep found field options on the instance and in the shared cache."""
+        self._field_options_cache[field_id] = values
+        get_metadata_cache().put(
+            self.jira_url, self.api_version, "field_options", values, resource=field_id
+        )
+
     def _fetch_field_values_from_issues(
         self, field_id: str, max_results: int = 1000, scoped: bool = True
     ) -> list[str]:
@@ -776,12 +874,13 @@ class JiraMetadataFetcher:
         return production_values
 
     def clear_cache(self):
-        """Clear all cached metadata."""
+        """Clear all cached metadata, including the shared cache for this URL."""
         self._fields_cache = None
         self._projects_cache = None
         self._issue_types_cache = None
         self._statuses_cache = None
         self._field_options_cache = {}
+        get_metadata_cache().invalidate(self.jira_url)
         logger.info("[JIRA] Cleared metadata cache")
 
 
@@ -0,0 +1,202 @@
+"""
+JIRA Concurrent Page Fetcher
+
+Fetches the remaining pages of a JIRA search once the first response has
+reported ``total``. At that point every ``startAt`` offset is known, so pages
+are requested by a bounded worker pool instead of one round trip after another.
+
+Guarantees:
+- One shared keep-alive ``requests.Session`` (connection pool sized to workers)
+- Every request waits for a token from the shared TokenBucket rate limiter
+- Every request retries transient failures via retry_with_backoff
+- Cancellation is checked before each page request; the first failure or
+  cancellation stops all pages that have not started yet
+- Pages are reassembled in ``startAt`` order regardless of completion order
+- Page bodies are streamed and parsed issue by issue (see response_stream)
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data.jira.rate_limiter import TokenBucket, get_rate_limiter, retry_with_backoff
+from data.jira.response_stream import read_search_page
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PageFetchResult:
+    """Outcome of fetching a set of search pages.
+
+    Attributes:
+        success: True if every requested page was fetched
+        pages: Issue lists ordered by startAt (only complete when success)
+        error: Failed response (non-2xx) or exception from the first failure
+        cancelled: True if the fetch stopped because cancellation was requested
+    """
+
+    success: bool
+    pages: list[list[dict]] = field(default_factory=list)
+    error: Any = None
+    cancelled: bool = False
+
+
+def create_jira_session(max_workers: int) -> requests.Session:
+    """
+    Create a keep-alive session whose connection pool fits all page workers.
+
+    Args:
+        max_workers: Number of concurrent page requests
+
+    Returns:
+        requests.Session reusing TCP/TLS connections across pages
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, max_workers))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def compute_remaining_offsets(
+    page_size: int, total: int, limit: int | None = None
+) -> list[int]:
+    """
+    Return the startAt offsets still to fetch after the first page.
+
+    Args:
+        page_size: Issues per page (maxResults)
+        total: Total issues reported by the first search response
+        limit: Optional cap on total issues to fetch
+
+    Returns:
+        Ascending list of startAt offsets (empty if the first page was enough)
+    """
+    end = total if limit is None else min(total, limit)
+    return list(range(page_size, end, page_size))
+
+
+def fetch_pages_concurrently(
+    session: requests.Session,
+    url: str,
+    headers: dict,
+    base_params: dict,
+    offsets: list[int],
+    max_workers: int,
+    is_cancelled: Callable[[], bool] | None = None,
+    on_page: Callable[[int], None] | None = None,
+    rate_limiter: TokenBucket | None = None,
+    timeout: int = 30,
+    transform: Callable[[dict], dict | None] | None = None,
+) -> PageFetchResult:
+    """
+    Fetch search pages at the given offsets with a bounded worker pool.
+
+    Args:
+        session: Shared keep-alive session (see create_jira_session)
+        url: JIRA search endpoint
+        headers: Request headers (authorization etc.)
+        base_params: Query parameters shared by all pages (jql, fields, ...)
+        offsets: startAt values to fetch
+        max_workers: Maximum concurrent requests
+        is_cancelled: Optional callable checked before every page request
+        on_page: Optional callback(issues_fetched_so_far) run on the calling
+            thread after each page completes (used for progress reporting)
+        rate_limiter: Token bucket to respect (defaults to the global limiter)
+        timeout: Per-request timeout in seconds
+        transform: Optional callable applied to each issue as it is parsed
+            (returning None drops the issue)
+
+    Returns:
+        PageFetchResult with pages ordered by offset
+    """
+    if not offsets:
+        return PageFetchResult(success=True)
+
+    limiter = rate_limiter or get_rate_limiter()
+    stop_event = threading.Event()
+    cancel_flag = threading.Event()
+
+    def fetch_page(offset: int) -> tuple[bool, Any]:
+        if stop_event.is_set():
+            return False, None
+        if is_cancelled is not None and is_cancelled():
+            cancel_flag.set()
+            stop_event.set()
+            return False, None
+
+        limiter.wait_for_token()
+        params = {**base_params, "startAt": offset}
+        success, response = retry_with_backoff(
+            session.get,
+            url,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            stream=True,
+        )
+        if not success or not response.ok:
+            stop_event.set()
+            if isinstance(response, requests.Response):
+                # Keep the body for error logging, release the connection
+                _ = response.content
+                response.close()
+            return False, response
+        with response:
+            issues, _header = read_search_page(response, transform)
+        return True, issues
+
+    pages_by_offset: dict[int, list[dict]] = {}
+    first_error: Any = None
+    fetched_count = 0
+
+    workers = max(1, min(max_workers, len(offsets)))
+    logger.info(
+        f"[JIRA] Fetching {len(offsets)} remaining pages with {workers} workers"
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="jira-page"
+    ) as executor:
+        futures = {executor.submit(fetch_page, offset): offset for offset in offsets}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            offset = futures[future]
+            try:
+                ok, payload = future.result()
+            except Exception as e:
+                ok, payload = False, e
+                stop_event.set()
+
+            if not ok:
+                if payload is not None and first_error is None:
+                    first_error = payload
+                # Drop pages that have not started yet
+                for pending in futures:
+                    pending.cancel()
+                continue
+            if isinstance(payload, Exception):
+                # Raised errors always take the failure path above
+                raise payload
+
+            pages_by_offset[offset] = payload
+            fetched_count += len(payload)
+            if on_page is not None and not stop_event.is_set():
+                on_page(fetched_count)
+
+    if cancel_flag.is_set():
+        return PageFetchResult(success=False, cancelled=True)
+    if stop_event.is_set() or len(pages_by_offset) != len(offsets):
+        return PageFetchResult(success=False, error=first_error)
+
+    return PageFetchResult(
+        success=True, pages=[pages_by_offset[offset] for offset in sorted(offsets)]
+    )
@@ -23,6 +23,7 @@ Usage:
 """
 
 import logging
+import threading
 import time
 from typing import Any
 
@@ -126,6 +127,8 @@ class TokenBucket:
         self.refill_rate = refill_rate
         self.tokens = max_tokens  # Start with full bucket (allow immediate burst)
         self.last_refill_time = time.time()
+        # Guards tokens/last_refill_time: page workers share one bucket
+        self._lock = threading.Lock()
 
     def _refill(self):
         """
@@ -167,12 +170,13 @@ class TokenBucket:
         - Used by wait_for_token() internally
         - Can be used directly for non-blocking rate limit checks
         """
-        self._refill()  # Always refill before checking
+        with self._lock:
+            self._refill()  # Always refill before checking
 
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
 
     def wait_for_token(self, tokens: int = 1) -> float:
         """
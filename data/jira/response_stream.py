@@ -0,0 +1,182 @@
+"""
+Streaming parser for JIRA search responses.
+
+A search page holds up to 1000 issues (tens of MB with an expanded
+changelog). ``response.json()`` keeps the raw bytes, the decoded text and the
+parsed page in memory at the same time. This module reads a response opened
+with ``stream=True`` chunk by chunk and yields the ``issues`` array one issue
+at a time, so only the current chunk and the issue being decoded are held
+besides whatever the caller keeps. This bounds the memory of reading a page,
+not of a whole refresh: fetch_jira_issues still returns every issue as one
+list because all its callers consume it. An optional per-issue transform lets
+callers shrink each issue (e.g. drop untracked changelog histories) before
+the next one is parsed.
+
+Top-level fields other than ``issues`` (``total``, ``startAt``, ...) are
+collected into a header dict.
+"""
+
+import codecs
+import json
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bytes requested from the response per read
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonStream:
+    """Incremental reader of JSON tokens over an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, min_chars: int) -> None:
+        """Append at least min_chars decoded characters (fewer at end of body)."""
+        parts = [self._buf[self._pos :]]
+        self._pos = 0
+        added = 0
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            text = self._utf8.decode(chunk)
+            parts.append(text)
+            added += len(text)
+            if added >= min_chars:
+                break
+        else:
+            parts.append(self._utf8.decode(b"", final=True))
+            self._eof = True
+        self._buf = "".join(parts)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at end of body)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf) or self._eof:
+                return self._buf[self._pos : self._pos + 1]
+            self._read(STREAM_CHUNK_SIZE)
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Malformed JIRA search response: expected {char!r}, "
+                f"found {found or 'end of body'!r}"
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Read at least as much again as is pending so a large value
+                # is re-scanned O(log n) times rather than once per chunk
+                self._read(max(STREAM_CHUNK_SIZE, len(self._buf) - self._pos))
+                continue
+            if end == len(self._buf) and not self._eof:
+                # A number at the end of the buffer may continue in the next chunk
+                self._read(STREAM_CHUNK_SIZE)
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_search_issues(
+    response: Any,
+    header: dict | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """
+    Yield the issues of a JIRA search response one at a time.
+
+    Args:
+        response: requests.Response, ideally opened with stream=True
+        header: Optional dict that receives the other top-level fields
+            (fields after the issues array are added once iteration ends)
+        chunk_size: Bytes read from the response per chunk
+
+    Yields:
+        Issue dicts in response order
+
+    Raises:
+        ValueError: If the body is not a JSON object or is truncated
+            (issues before the error have already been yielded)
+    """
+    try:
+        stream = _JsonStream(response.iter_content(chunk_size=chunk_size))
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Malformed JIRA search response: object key {key!r}")
+            stream.expect(":")
+            if key == "issues" and stream.peek() == "[":
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield stream.value()
+                        if stream.peek() == "]":
+                            stream.expect("]")
+                            break
+                        stream.expect(",")
+            else:
+                value = stream.value()
+                if header is not None:
+                    header[key] = value
+            if stream.peek() == "}":
+                break
+            stream.expect(",")
+    finally:
+        response.close()
+
+
+def read_search_page(
+    response: Any,
+    transform: Callable[[dict], dict | None] | None = None,
+) -> tuple[list[dict], dict]:
+    """
+    Parse a JIRA search page without materializing the response body.
+
+    Args:
+        response: requests.Response, ideally opened with stream=True
+        transform: Optional callable applied to each issue as soon as it is
+            parsed; returning None drops the issue
+
+    Returns:
+        Tuple of (issues, header) where header holds the other top-level
+        fields such as total and startAt
+
+    Raises:
+        ValueError: If the body is not a JSON object or is truncated
+    """
+    header: dict = {}
+    issues = []
+    for issue in iter_search_issues(response, header):
+        if transform is not None:
+            issue = transform(issue)
+            if issue is None:
+                continue
+        issues.append(issue)
+    return issues, header
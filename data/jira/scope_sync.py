@@ -10,7 +10,6 @@ This module handles the main JIRA data synchronization and scope calculation:
 - Progress tracking and atomic database operations
 """
 
-import hashlib
 import json
 import logging
 import sqlite3
@@ -26,14 +25,11 @@ from data.jira.data_transformer import jira_to_csv_format
 from data.jira.epic_fetch import fetch_epics_for_display
 from data.jira.field_utils import extract_jira_field_id
 from data.jira.main_fetch import fetch_jira_issues
-from data.jira.parent_filter import filter_out_parent_types
 from data.jira.query_builder import (
     build_jql_with_parent_types,
     extract_parent_types_from_config,
 )
-from data.jira.scope_calculator import calculate_jira_project_scope
-from data.parent_filter import filter_parent_issues
-from data.project_filter import filter_development_issues
+from data.persistence.sqlite.helpers import mark_issue_data_changed
 from data.task_progress import TaskProgress
 
 logger = logging.getLogger(__name__)
@@ -226,6 +222,12 @@ def sync_jira_scope_and_data(
                         )
                         metrics_deleted = cursor.rowcount
 
+                        cursor.execute(
+                            "DELETE FROM metric_week_contributions "
+                            "WHERE profile_id = ? AND query_id = ?",
+                            (active_profile_id, active_query_id),
+                        )
+
                         cursor.execute(
                             "DELETE FROM project_scope "
                             "WHERE profile_id = ? AND query_id = ?",
@@ -242,6 +244,7 @@ def sync_jira_scope_and_data(
 
                         # Single commit for all deletions (atomic operation)
                         conn.commit()
+                        mark_issue_data_changed()
 
                         logger.info(
                             "[JIRA] Force refresh atomically deleted: "
@@ -357,56 +360,13 @@ def sync_jira_scope_and_data(
             if last_delta_count == "0":
                 # Check if field mappings have changed since last update
                 # If they have, we MUST recalculate metrics even with no new data
-                current_settings = load_app_settings()
+                # circular import guard: data.metrics imports data.jira
+                from data.metrics.delta_recompute import (  # noqa: PLC0415
+                    metrics_settings_fingerprint,
+                )
+
                 # Hash ALL settings that affect metrics calculation
-                # These correspond to all tabs in Configure JIRA Mappings modal:
-                # - Projects tab: development_projects, devops_projects
-                # - Fields tab: field_mappings (dora, flow, general namespaces)
-                # - Types tab: flow_type_mappings, devops_task_types,
-                #   bug_types, story_types, task_types
-                # - Status tab: flow_start_statuses, wip_statuses,
-                #   flow_end_statuses, active_statuses
-                # - Environment tab: production_environment_values,
-                #   affected_environment_values,
-                #   target_environment_values
-                relevant_settings = {
-                    # Projects tab
-                    "development_projects": current_settings.get(
-                        "development_projects", []
-                    ),
-                    "devops_projects": current_settings.get("devops_projects", []),
-                    # Fields tab
-                    "field_mappings": current_settings.get("field_mappings", {}),
-                    # Types tab
-                    "flow_type_mappings": current_settings.get(
-                        "flow_type_mappings", {}
-                    ),
-                    "devops_task_types": current_settings.get("devops_task_types", []),
-                    "bug_types": current_settings.get("bug_types", []),
-                    "story_types": current_settings.get("story_types", []),
-                    "task_types": current_settings.get("task_types", []),
-                    # Status tab
-                    "flow_start_statuses": current_settings.get(
-                        "flow_start_statuses", []
-                    ),
-                    "wip_statuses": current_settings.get("wip_statuses", []),
-                    "flow_end_statuses": current_settings.get("flow_end_statuses", []),
-                    "active_statuses": current_settings.get("active_statuses", []),
-                    # Environment tab
-                    "production_environment_values": current_settings.get(
-                        "production_environment_values", []
-                    ),
-                    "affected_environment_values": current_settings.get(
-                        "affected_environment_values", []
-                    ),
-                    "target_environment_values": current_settings.get(
-                        "target_environment_values", []
-                    ),
-                }
-                current_hash = hashlib.md5(  # nosec B324 — non-crypto cache key
-                    json.dumps(relevant_settings, sort_keys=True).encode(),
-                    usedforsecurity=False,
-                ).hexdigest()
+                current_hash = metrics_settings_fingerprint(load_app_settings())
 
                 # Check if settings hash has changed
                 settings_hash_key = (
@@ -542,74 +502,36 @@ def sync_jira_scope_and_data(
         except AttributeError, RuntimeError, TypeError, ValueError:
             pass
 
-        # CRITICAL: Filter out parent issues dynamically
-        # based on parent field mapping
-        # Parents stored for display (Active Work Timeline)
-        # but excluded from ALL calculations
-        # Don't hardcode "Epic" - use parent field to detect what keys are parents
-        parent_field = (
-            config.get("field_mappings", {}).get("general", {}).get("parent_field")
-        )
-        if parent_field:
-            issues = filter_parent_issues(issues, parent_field, log_prefix="JIRA SYNC")
+        # Parents are stored for display (Active Work Timeline) but excluded
+        # from ALL calculations, as are non-development projects and parent
+        # issue types. The refresh context applies these filters once for
+        # the scope and statistics calculations of this sync.
+        # circular import guard: data.metrics imports data.jira
+        from data.metrics.refresh_context import RefreshContext  # noqa: PLC0415
 
-        # CRITICAL: Filter to only configured development project issues
-        # for burndown/velocity/statistics
-        # DevOps issues are ONLY used for DORA metrics metadata extraction
         development_projects = config.get("development_projects", [])
         devops_projects = config.get("devops_projects", [])
-
         logger.info(
             "[JIRA] Project filtering config: "
             f"development={development_projects or 'NONE'}, "
             f"devops={devops_projects or 'NONE'}"
         )
-
-        if development_projects or devops_projects:
-            total_issues_count = len(issues)
-            issues_for_metrics = filter_development_issues(
-                issues, development_projects, devops_projects
-            )
-            filtered_count = total_issues_count - len(issues_for_metrics)
-
-            if filtered_count > 0:
-                logger.info(
-                    f"[JIRA] Filtered to {len(issues_for_metrics)} "
-                    "development project issues "
-                    f"(excluded {filtered_count})"
-                )
-            else:
-                logger.info(
-                    f"[JIRA] No issues filtered - all "
-                    f"{len(issues_for_metrics)} issues match "
-                    "development projects"
-                )
-        else:
-            # No project classification configured, use all issues
+        if not development_projects and not devops_projects:
             logger.warning(
                 "[JIRA] NO PROJECT FILTERING: "
                 f"Using all {len(issues)} issues "
                 "(configure development_projects "
                 "in JIRA Mappings -> Projects tab)"
             )
-            issues_for_metrics = issues
-
-        # Exclude parent issue types from metrics (if configured)
-        # Parent types are included in the fetch (via query_builder) to get their data
-        # but excluded from scope calculations to prevent double-counting
-        if parent_types:
-            total_before_parent_filter = len(issues_for_metrics)
-            issues_for_metrics = filter_out_parent_types(
-                issues_for_metrics, parent_types
-            )
-            parent_filtered_count = total_before_parent_filter - len(issues_for_metrics)
 
-            if parent_filtered_count > 0:
-                logger.info(
-                    f"[JIRA] Excluded {parent_filtered_count} "
-                    "parent issue(s) from metrics "
-                    f"(types: {', '.join(parent_types)})"
-                )
+        refresh_context = RefreshContext(
+            issues,
+            config,
+            profile_id=active_profile_id,
+            query_id=active_query_id,
+            log_prefix="JIRA SYNC",
+        )
+        issues_for_metrics = refresh_context.all_issues
 
         # Calculate JIRA-based project scope
         # (using ONLY development project issues, excluding parents)
@@ -635,9 +557,7 @@ def sync_jira_scope_and_data(
             # When no points field is configured, pass empty string instead
             # of defaulting to "votes"
             points_field = ""
-        scope_data = calculate_jira_project_scope(
-            issues_for_metrics, points_field, config
-        )
+        scope_data = refresh_context.project_scope(points_field, config)
         if not scope_data:
             return False, "Failed to calculate JIRA project scope", {}
 
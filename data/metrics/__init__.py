@@ -4,6 +4,7 @@ This package splits metrics calculations into focused modules:
 - helpers: Utility functions (ISO week labels)
 - forecast_calculator: Forecast and trend analysis
 - weekly_calculator: Main weekly metrics calculation
+- sweep_calculator: Single-pass multi-week engine (loads issues once)
 - historical_calculator: Multi-week calculation orchestration
 """
 
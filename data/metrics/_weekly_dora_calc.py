@@ -30,13 +30,15 @@ def _calculate_lead_time(
     week_start: datetime,
     week_end: datetime,
     week_label: str,
+    week_dev_issues: list | None = None,
 ) -> dict:
     """Calculate Lead Time for Changes snapshot for the given week."""
 
     try:
-        week_dev_issues = filter_issues_deployed_in_week(
-            development_issues, fixversion_release_map, week_start, week_end
-        )
+        if week_dev_issues is None:
+            week_dev_issues = filter_issues_deployed_in_week(
+                development_issues, fixversion_release_map, week_start, week_end
+            )
         logger.info(
             f"Week {week_label}: {len(week_dev_issues)} development issues deployed "
             f"(from {len(development_issues)} total)"
@@ -95,18 +97,25 @@ def _calculate_deployment_frequency(
     week_end: datetime,
     development_fix_versions: set,
     fixversion_release_map: dict,
+    weekly_deployments: dict | None = None,
+    week_release_names: list[str] | None = None,
 ) -> dict:
-    """Calculate Deployment Frequency snapshot for the given week."""
+    """Calculate Deployment Frequency snapshot for the given week.
+
+    week_release_names optionally supplies the sorted release-map versions
+    released in the week, so the fallback skips scanning the whole map.
+    """
 
     try:
-        weekly_deployments = count_deployments_for_week(
-            operational_tasks,
-            flow_end_statuses,
-            week_label,
-            week_start,
-            week_end,
-            valid_fix_versions=development_fix_versions,
-        )
+        if weekly_deployments is None:
+            weekly_deployments = count_deployments_for_week(
+                operational_tasks,
+                flow_end_statuses,
+                week_label,
+                week_start,
+                week_end,
+                valid_fix_versions=development_fix_versions,
+            )
         week_data = weekly_deployments.get(week_label, {})
         deployment_count = week_data.get("deployments", 0)
         release_count = week_data.get("releases", 0)
@@ -115,11 +124,13 @@ def _calculate_deployment_frequency(
         # Fallback for datasets where Operational Tasks are not loaded in the query.
         # Use release dates directly from the shared fixVersion release map.
         if deployment_count == 0 and fixversion_release_map:
-            fallback_release_names = sorted(
-                release_name
-                for release_name, release_date in fixversion_release_map.items()
-                if week_start <= release_date < week_end
-            )
+            fallback_release_names = week_release_names
+            if fallback_release_names is None:
+                fallback_release_names = sorted(
+                    release_name
+                    for release_name, release_date in fixversion_release_map.items()
+                    if week_start <= release_date < week_end
+                )
             if fallback_release_names:
                 release_count = len(fallback_release_names)
                 deployment_count = release_count
@@ -152,13 +163,15 @@ def _calculate_cfr(
     week_label: str,
     week_start: datetime,
     week_end: datetime,
+    week_operational_tasks: list | None = None,
 ) -> dict:
     """Calculate Change Failure Rate snapshot for the given week."""
 
     try:
-        week_operational_tasks = filter_issues_deployed_in_week(
-            operational_tasks, fixversion_release_map, week_start, week_end
-        )
+        if week_operational_tasks is None:
+            week_operational_tasks = filter_issues_deployed_in_week(
+                operational_tasks, fixversion_release_map, week_start, week_end
+            )
         logger.info(
             f"Week {week_label}: {len(week_operational_tasks)} operational tasks "
             f"deployed (from {len(operational_tasks)} total) for CFR calculation"
@@ -203,27 +216,37 @@ def _calculate_mttr(
     week_label: str,
     week_start: datetime,
     week_end: datetime,
+    week_bugs_by_mode: dict[str, list] | None = None,
 ) -> dict:
-    """Calculate Mean Time To Recovery snapshot for the given week."""
+    """Calculate Mean Time To Recovery snapshot for the given week.
+
+    week_bugs_by_mode optionally supplies pre-filtered bugs keyed by
+    "deployment" and "resolution" so callers can skip the per-week scans.
+    """
 
     try:
         incident_resolved_field = dora_mappings.get(
             "incident_resolved_at", "resolutiondate"
         )
         use_deployment_date = incident_resolved_field.lower() == "fixversions"
+        week_bugs_by_mode = week_bugs_by_mode or {}
 
         if use_deployment_date:
-            week_bugs = filter_issues_deployed_in_week(
-                production_bugs, fixversion_release_map, week_start, week_end
-            )
+            week_bugs = week_bugs_by_mode.get("deployment")
+            if week_bugs is None:
+                week_bugs = filter_issues_deployed_in_week(
+                    production_bugs, fixversion_release_map, week_start, week_end
+                )
             logger.info(
                 f"Week {week_label}: {len(week_bugs)} bugs deployed for MTTR "
                 f"(from {len(production_bugs)} total, using fixVersion deployment)"
             )
         else:
-            week_bugs = filter_bugs_by_resolution_week(
-                production_bugs, week_start, week_end
-            )
+            week_bugs = week_bugs_by_mode.get("resolution")
+            if week_bugs is None:
+                week_bugs = filter_bugs_by_resolution_week(
+                    production_bugs, week_start, week_end
+                )
             logger.info(
                 f"Week {week_label}: Filtered {len(week_bugs)} bugs for MTTR "
                 f"(from {len(production_bugs)} total, using resolutiondate)"
@@ -270,18 +293,30 @@ def calculate_dora_metrics(
     week_start: datetime,
     week_end: datetime,
     report_progress,
+    week_selection: dict | None = None,
 ) -> tuple[int, list[str]]:
     """Calculate and save all DORA metrics for the given week.
 
+    week_selection optionally carries the week's pre-filtered inputs
+    ("dev_issues", "operational_tasks", "deployments", "release_names",
+    "bugs_by_mode");
+    missing entries are filtered from the full issue lists as before.
+
     Returns (metrics_saved, metrics_details).
     """
+    week_selection = week_selection or {}
 
     metrics_saved = 0
     metrics_details: list[str] = []
 
     # Lead Time for Changes
     lead_time_snapshot = _calculate_lead_time(
-        development_issues, fixversion_release_map, week_start, week_end, week_label
+        development_issues,
+        fixversion_release_map,
+        week_start,
+        week_end,
+        week_label,
+        week_dev_issues=week_selection.get("dev_issues"),
     )
     save_metric_snapshot(week_label, "dora_lead_time", lead_time_snapshot)
     metrics_saved += 1
@@ -309,6 +344,8 @@ def calculate_dora_metrics(
         week_end,
         development_fix_versions,
         fixversion_release_map,
+        weekly_deployments=week_selection.get("deployments"),
+        week_release_names=week_selection.get("release_names"),
     )
     save_metric_snapshot(week_label, "dora_deployment_frequency", deployment_snapshot)
     metrics_saved += 1
@@ -332,6 +369,7 @@ def calculate_dora_metrics(
         week_label,
         week_start,
         week_end,
+        week_operational_tasks=week_selection.get("operational_tasks"),
     )
     save_metric_snapshot(week_label, "dora_change_failure_rate", cfr_snapshot)
     metrics_saved += 1
@@ -351,6 +389,7 @@ def calculate_dora_metrics(
         week_label,
         week_start,
         week_end,
+        week_bugs_by_mode=week_selection.get("bugs_by_mode"),
     )
     save_metric_snapshot(week_label, "dora_mttr", mttr_snapshot)
     metrics_saved += 1
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 
 from data.dora_metrics import is_production_environment
+from data.fixversion_matcher import build_fixversion_release_map
 
 logger = logging.getLogger(__name__)
 
@@ -220,3 +221,37 @@ def collect_development_fix_versions(all_issues: list) -> set:
         logger.info(f"[DORA] Sample development fixVersions: {sample}")
 
     return development_fix_versions
+
+
+def build_dora_release_map(
+    operational_tasks: list,
+    development_issues: list,
+    development_fix_versions: set,
+    flow_end_statuses: list[str],
+) -> dict:
+    """Build the shared fixVersion release map used by all weekly DORA metrics.
+
+    Prefers completed Operational Tasks and falls back to the development
+    issues' own fixVersion release dates when no Operational Task map exists.
+    """
+    fixversion_release_map = build_fixversion_release_map(
+        operational_tasks,
+        valid_fix_versions=development_fix_versions,
+        flow_end_statuses=flow_end_statuses,
+    )
+    if not fixversion_release_map and development_issues:
+        logger.warning(
+            "[DORA] No Operational Task release map found; "
+            "falling back to development issue fixVersion release dates"
+        )
+        fixversion_release_map = build_fixversion_release_map(
+            development_issues,
+            valid_fix_versions=development_fix_versions,
+            flow_end_statuses=None,
+        )
+    logger.info(
+        f"[DORA] Built fixVersion release map: "
+        f"{len(fixversion_release_map)} versions "
+        "(filtered to development project fixVersions)"
+    )
+    return fixversion_release_map
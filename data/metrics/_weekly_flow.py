@@ -1,6 +1,7 @@
 """Flow metrics calculation for weekly snapshots."""
 
 import logging
+from collections import Counter
 from datetime import UTC, datetime
 
 from configuration.metrics_config import get_metrics_config
@@ -9,6 +10,7 @@ from data.changelog_processor import (
     get_status_at_point_in_time,
 )
 from data.flow_metrics import calculate_flow_efficiency, calculate_flow_time
+from data.metrics.issue_table import IssueTable
 from data.metrics_snapshots import save_metric_snapshot
 
 logger = logging.getLogger(__name__)
@@ -23,13 +25,30 @@ def _compute_wip_at_week_end(
     is_current_week: bool,
     completion_cutoff: datetime,
     week_label: str,
+    issue_table: IssueTable | None = None,
 ) -> dict:
-    """Build the Flow Load result dict from historical WIP reconstruction."""
+    """Build the Flow Load result dict from historical WIP reconstruction.
+
+    For the current week, issue_table (built over all_issues) lets the live
+    status check run as one vectorized mask; for past weeks its status index
+    answers the status of every issue at week end by bisect.
+    """
+
+    if is_current_week and issue_table is not None:
+        return _current_wip_from_table(
+            issue_table, wip_statuses, flow_end_statuses, week_label
+        )
 
     issues_in_wip_at_week_end = []
     week_end_check_time = completion_cutoff
+    # Historical statuses of every issue in one batch of bisect lookups
+    statuses_at_week_end = (
+        issue_table.status_index.statuses_at(week_end_check_time)
+        if issue_table is not None and not is_current_week
+        else None
+    )
 
-    for issue in all_issues:
+    for position, issue in enumerate(all_issues):
         if is_current_week:
             if "fields" in issue and isinstance(issue.get("fields"), dict):
                 current_status = issue["fields"].get("status", {}).get("name", "")
@@ -48,7 +67,12 @@ def _compute_wip_at_week_end(
                     f"is_in_wip={is_in_wip_now}, is_completed={is_completed}"
                 )
         else:
-            status_at_week_end = get_status_at_point_in_time(issue, week_end_check_time)
+            if statuses_at_week_end is not None:
+                status_at_week_end = statuses_at_week_end[position]
+            else:
+                status_at_week_end = get_status_at_point_in_time(
+                    issue, week_end_check_time
+                )
             logger.debug(
                 f"[WIP Historical] {issue.get('key', issue.get('issue_key'))}: "
                 f"status_at_week_end='{status_at_week_end}', "
@@ -120,6 +144,40 @@ def _compute_wip_at_week_end(
     }
 
 
+def _current_wip_from_table(
+    issue_table: IssueTable,
+    wip_statuses: list[str],
+    flow_end_statuses: list[str],
+    week_label: str,
+) -> dict:
+    """Build the current-week Flow Load result from the status column."""
+    in_wip = issue_table.status_in(wip_statuses) & ~issue_table.status_in(
+        flow_end_statuses
+    )
+    by_status = dict(
+        Counter(status for status in issue_table.statuses[in_wip] if status)
+    )
+    by_issue_type = dict(Counter(issue_table.issue_types[in_wip]))
+    wip_count = int(in_wip.sum())
+
+    logger.info(
+        f"Current WIP for week {week_label}: "
+        f"{wip_count} items were in active work now (running)"
+    )
+    logger.info(f"WIP breakdown by status: {by_status}")
+    logger.info(f"WIP breakdown by issue type: {by_issue_type}")
+
+    return {
+        "metric_name": "flow_load",
+        "wip_count": wip_count,
+        "by_status": by_status,
+        "by_issue_type": by_issue_type,
+        "unit": "items",
+        "error_state": "success",
+        "error_message": None,
+    }
+
+
 def _compute_work_distribution(issues_completed: list, app_settings: dict) -> dict:
     """Compute work distribution by flow type for completed issues."""
 
@@ -204,9 +262,15 @@ def calculate_flow_metrics(
     app_settings: dict,
     week_label: str,
     report_progress,
+    load_result: dict | None = None,
+    issue_table: IssueTable | None = None,
 ) -> tuple[int, list[str]]:
     """Calculate and save all Flow metrics for the given week.
 
+    load_result may carry a Flow Load result computed elsewhere (e.g. by the
+    sweep engine); when omitted WIP is reconstructed from all_issues.
+    issue_table is an optional IssueTable over all_issues.
+
     Returns (metrics_saved, metrics_details).
     """
 
@@ -236,16 +300,18 @@ def calculate_flow_metrics(
         f"[Flow Load] Starting calculation for week {week_label}: "
         f"wip_statuses={wip_statuses}, is_current_week={is_current_week}"
     )
-    load_result = _compute_wip_at_week_end(
-        all_issues,
-        wip_statuses,
-        flow_end_statuses,
-        week_start,
-        week_end,
-        is_current_week,
-        completion_cutoff,
-        week_label,
-    )
+    if load_result is None:
+        load_result = _compute_wip_at_week_end(
+            all_issues,
+            wip_statuses,
+            flow_end_statuses,
+            week_start,
+            week_end,
+            is_current_week,
+            completion_cutoff,
+            week_label,
+            issue_table=issue_table,
+        )
 
     report_progress("[Stats] Calculating Flow Velocity...")
     velocity_count = len(issues_completed)
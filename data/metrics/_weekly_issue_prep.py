@@ -4,12 +4,9 @@ import logging
 from datetime import UTC, datetime, timedelta
 
 from data.flow_metrics import _find_first_transition_to_statuses
-from data.jira.parent_filter import filter_out_parent_types
-from data.jira.query_builder import extract_parent_types_from_config
+from data.issue_filtering import split_issues_for_metrics
 from data.metrics.helpers import get_current_iso_week
 from data.metrics_snapshots import get_metric_snapshot
-from data.parent_filter import filter_parent_issues
-from data.project_filter import filter_development_issues
 
 logger = logging.getLogger(__name__)
 
@@ -68,40 +65,14 @@ def load_and_filter_issues(
 
     logger.info(f"Loaded {len(all_issues_raw)} issues from database")
 
-    parent_field = (
-        app_settings.get("field_mappings", {}).get("general", {}).get("parent_field")
+    all_issues_raw, all_issues = split_issues_for_metrics(
+        all_issues_raw, app_settings, log_prefix="WEEKLY CALC"
+    )
+    excluded_count = len(all_issues_raw) - len(all_issues)
+    logger.info(
+        f"Filtered to {len(all_issues)} issues for metrics "
+        f"(excluded {excluded_count} other project or parent type issues)"
     )
-    if parent_field:
-        all_issues_raw = filter_parent_issues(
-            all_issues_raw, parent_field, log_prefix="WEEKLY CALC"
-        )
-
-    development_projects = app_settings.get("development_projects", [])
-    devops_projects = app_settings.get("devops_projects", [])
-
-    if development_projects or devops_projects:
-        all_issues = filter_development_issues(
-            all_issues_raw, development_projects, devops_projects
-        )
-        filtered_count = len(all_issues_raw) - len(all_issues)
-        logger.info(
-            f"Filtered to {len(all_issues)} development project issues "
-            f"(excluded {filtered_count} other issues)"
-        )
-    else:
-        all_issues = all_issues_raw
-        logger.info("No project classification configured, using all issues")
-
-    parent_types = extract_parent_types_from_config(app_settings)
-    if parent_types:
-        total_before_parent_filter = len(all_issues)
-        all_issues = filter_out_parent_types(all_issues, parent_types)
-        parent_filtered_count = total_before_parent_filter - len(all_issues)
-        if parent_filtered_count > 0:
-            logger.info(
-                f"Excluded {parent_filtered_count} parent issue(s) from metrics "
-                f"(types: {', '.join(parent_types)})"
-            )
 
     return all_issues, all_issues_raw
 
@@ -276,16 +247,7 @@ def filter_completed_in_week(
                 f"{len(status_transitions)} status transitions"
             )
 
-        if "fields" in issue and isinstance(issue.get("fields"), dict):
-            timestamp_str = issue["fields"].get("resolutiondate")
-        else:
-            timestamp_str = issue.get("resolved") or issue.get("resolutiondate")
-
-        if not timestamp_str:
-            timestamp_str = _find_first_transition_to_statuses(
-                changelog, flow_end_statuses
-            )
-
+        timestamp_str = _get_completion_timestamp_str(issue, flow_end_statuses)
         if not timestamp_str:
             extraction_stats["not_found"] += 1
             continue
@@ -293,16 +255,7 @@ def filter_completed_in_week(
         extraction_stats["found"] += 1
 
         try:
-            if timestamp_str.endswith("+0000"):
-                timestamp_str = timestamp_str[:-5] + "+00:00"
-            elif timestamp_str.endswith("Z"):
-                timestamp_str = timestamp_str[:-1] + "+00:00"
-
-            completion_timestamp = datetime.fromisoformat(timestamp_str)
-            if completion_timestamp.tzinfo is not None:
-                completion_timestamp = completion_timestamp.astimezone(UTC).replace(
-                    tzinfo=None
-                )
+            completion_timestamp = _parse_completion_timestamp(timestamp_str)
         except (ValueError, AttributeError, TypeError) as e:
             extraction_stats["parse_errors"] += 1
             logger.warning(
@@ -321,3 +274,47 @@ def filter_completed_in_week(
     )
 
     return issues_completed_this_week
+
+
+def _get_completion_timestamp_str(issue: dict, flow_end_statuses: list[str]) -> str:
+    """Return the raw completion timestamp string for an issue (may be empty)."""
+    if "fields" in issue and isinstance(issue.get("fields"), dict):
+        timestamp_str = issue["fields"].get("resolutiondate")
+    else:
+        timestamp_str = issue.get("resolved") or issue.get("resolutiondate")
+
+    if not timestamp_str:
+        changelog = issue.get("changelog", {}).get("histories", [])
+        timestamp_str = _find_first_transition_to_statuses(changelog, flow_end_statuses)
+
+    return timestamp_str or ""
+
+
+def _parse_completion_timestamp(timestamp_str: str) -> datetime:
+    """Parse a JIRA completion timestamp into a timezone-naive UTC datetime."""
+    if timestamp_str.endswith("+0000"):
+        timestamp_str = timestamp_str[:-5] + "+00:00"
+    elif timestamp_str.endswith("Z"):
+        timestamp_str = timestamp_str[:-1] + "+00:00"
+
+    completion_timestamp = datetime.fromisoformat(timestamp_str)
+    if completion_timestamp.tzinfo is not None:
+        completion_timestamp = completion_timestamp.astimezone(UTC).replace(tzinfo=None)
+    return completion_timestamp
+
+
+def get_completion_timestamp(
+    issue: dict, flow_end_statuses: list[str]
+) -> datetime | None:
+    """Return the completion timestamp used by filter_completed_in_week.
+
+    Returns None when the issue has no completion timestamp or it cannot be
+    parsed, i.e. exactly the issues filter_completed_in_week never selects.
+    """
+    timestamp_str = _get_completion_timestamp_str(issue, flow_end_statuses)
+    if not timestamp_str:
+        return None
+    try:
+        return _parse_completion_timestamp(timestamp_str)
+    except ValueError, AttributeError, TypeError:
+        return None
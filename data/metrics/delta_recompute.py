@@ -0,0 +1,247 @@
+"""Incremental weekly metrics recompute driven by delta-fetch changed keys.
+
+A full metrics run clears every snapshot and sweeps all weeks again. After a
+routine delta refresh only a handful of issues changed, so the sweep records
+which issues fed each finished week's metric families
+(metric_week_contributions) and the next run recalculates only:
+
+- weeks/families a changed issue fed before the refresh (recorded keys)
+- weeks/families a changed issue feeds now (contributions on the new data)
+- the current week (always a running total)
+- weeks/families with no record or no cached snapshot
+
+Incremental mode is only used when the last fetch was a delta fetch and the
+metric-relevant settings are unchanged since the last successful full run;
+otherwise callers fall back to clearing metrics and sweeping every week.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
+
+from data.metrics._weekly_issue_prep import compute_week_boundaries
+from data.metrics.sweep_calculator import METRIC_FAMILIES, SweepDataset
+from data.metrics_snapshots import get_metric_snapshot
+from data.persistence import load_app_settings
+from data.persistence.factory import get_backend
+
+logger = logging.getLogger(__name__)
+
+# Snapshot whose presence shows a metric family was saved for a week
+_FAMILY_SNAPSHOTS = {
+    "flow": "flow_velocity",
+    "dora": "dora_deployment_frequency",
+}
+
+
+def metrics_settings_fingerprint(app_settings: dict) -> str:
+    """
+    Hash every setting that affects metrics calculation.
+
+    These correspond to all tabs in the Configure JIRA Mappings modal:
+    - Projects tab: development_projects, devops_projects
+    - Fields tab: field_mappings (dora, flow, general namespaces)
+    - Types tab: flow_type_mappings, devops_task_types, bug_types,
+      story_types, task_types
+    - Status tab: flow_start_statuses, wip_statuses, flow_end_statuses,
+      active_statuses
+    - Environment tab: production_environment_values,
+      affected_environment_values, target_environment_values
+
+    Args:
+        app_settings: Application settings
+
+    Returns:
+        Hex digest that changes whenever a metric-relevant setting changes
+    """
+    relevant_settings = {
+        # Projects tab
+        "development_projects": app_settings.get("development_projects", []),
+        "devops_projects": app_settings.get("devops_projects", []),
+        # Fields tab
+        "field_mappings": app_settings.get("field_mappings", {}),
+        # Types tab
+        "flow_type_mappings": app_settings.get("flow_type_mappings", {}),
+        "devops_task_types": app_settings.get("devops_task_types", []),
+        "bug_types": app_settings.get("bug_types", []),
+        "story_types": app_settings.get("story_types", []),
+        "task_types": app_settings.get("task_types", []),
+        # Status tab
+        "flow_start_statuses": app_settings.get("flow_start_statuses", []),
+        "wip_statuses": app_settings.get("wip_statuses", []),
+        "flow_end_statuses": app_settings.get("flow_end_statuses", []),
+        "active_statuses": app_settings.get("active_statuses", []),
+        # Environment tab
+        "production_environment_values": app_settings.get(
+            "production_environment_values", []
+        ),
+        "affected_environment_values": app_settings.get(
+            "affected_environment_values", []
+        ),
+        "target_environment_values": app_settings.get("target_environment_values", []),
+    }
+    return hashlib.md5(  # nosec B324 — non-crypto cache key
+        json.dumps(relevant_settings, sort_keys=True).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+
+
+def _settings_hash_key(profile_id: str, query_id: str) -> str:
+    return f"metrics_settings_hash:{profile_id}:{query_id}"
+
+
+def record_metrics_settings() -> None:
+    """Remember the settings the active query's metrics were calculated with."""
+    backend = get_backend()
+    profile_id = backend.get_app_state("active_profile_id")
+    query_id = backend.get_app_state("active_query_id")
+    if not profile_id or not query_id:
+        return
+    backend.set_app_state(
+        _settings_hash_key(profile_id, query_id),
+        metrics_settings_fingerprint(load_app_settings()),
+    )
+
+
+def get_incremental_changed_keys() -> list[str] | None:
+    """
+    Return the issue keys changed by the last delta fetch, if usable.
+
+    Returns:
+        Changed issue keys (possibly empty) when metrics can be recomputed
+        incrementally, or None when a full recompute is required (last fetch
+        was a full fetch, settings changed, or no contribution records exist)
+    """
+    backend = get_backend()
+    profile_id = backend.get_app_state("active_profile_id")
+    query_id = backend.get_app_state("active_query_id")
+    if not profile_id or not query_id:
+        return None
+
+    try:
+        changed_count = int(
+            backend.get_app_state(f"last_delta_changed_count:{profile_id}:{query_id}")
+            or "-1"
+        )
+        changed_keys = json.loads(
+            backend.get_app_state(f"last_delta_changed_keys:{profile_id}:{query_id}")
+            or "null"
+        )
+    except TypeError, ValueError:
+        return None
+    if changed_count < 0 or not isinstance(changed_keys, list):
+        logger.info("[Delta Metrics] Last fetch was not a delta fetch")
+        return None
+    if changed_count and not changed_keys:
+        return None
+
+    stored_hash = backend.get_app_state(_settings_hash_key(profile_id, query_id))
+    if stored_hash != metrics_settings_fingerprint(load_app_settings()):
+        logger.info("[Delta Metrics] Metric settings changed since last full run")
+        return None
+
+    if not backend.get_metric_contributions(profile_id, query_id):
+        logger.info("[Delta Metrics] No contribution records yet")
+        return None
+
+    return [str(key) for key in changed_keys if key]
+
+
+def plan_week_recompute(
+    dataset: SweepDataset,
+    week_labels: list[str],
+    changed_keys: list[str],
+    recorded_weeks: Mapping[str, AbstractSet[str]],
+    changed_key_weeks: Mapping[str, AbstractSet[str]],
+) -> dict[str, tuple[str, ...]]:
+    """
+    Decide which metric families of which weeks must be recalculated.
+
+    Args:
+        dataset: Sweep dataset loaded from the refreshed issues
+        week_labels: Weeks in the calculation range, oldest first
+        changed_keys: Issue keys changed by the delta fetch
+        recorded_weeks: Week -> families with contribution records
+        changed_key_weeks: Week -> families the changed keys fed before
+
+    Returns:
+        Week label -> metric families to recalculate (weeks absent are current)
+    """
+    changed = set(changed_keys)
+    plan: dict[str, tuple[str, ...]] = {}
+    for week_label in week_labels:
+        try:
+            week_start, week_end, is_current_week, completion_cutoff = (
+                compute_week_boundaries(week_label)
+            )
+        except ValueError:
+            # Let the calculation report the invalid label
+            plan[week_label] = METRIC_FAMILIES
+            continue
+        if is_current_week:
+            plan[week_label] = METRIC_FAMILIES
+            continue
+
+        recorded = recorded_weeks.get(week_label, set())
+        dirty = {
+            family
+            for family in METRIC_FAMILIES
+            if family not in recorded
+            or not get_metric_snapshot(week_label, _FAMILY_SNAPSHOTS[family])
+        }
+        dirty |= changed_key_weeks.get(week_label, set())
+
+        candidates = tuple(family for family in METRIC_FAMILIES if family not in dirty)
+        if candidates and changed:
+            current = dataset.week_contributions(
+                week_start, week_end, completion_cutoff, candidates
+            )
+            dirty |= {
+                family for family, keys in current.items() if changed.intersection(keys)
+            }
+
+        if dirty:
+            plan[week_label] = tuple(
+                family for family in METRIC_FAMILIES if family in dirty
+            )
+    return plan
+
+
+def plan_delta_recompute(
+    dataset: SweepDataset, week_labels: list[str], changed_keys: list[str]
+) -> dict[str, tuple[str, ...]]:
+    """
+    Plan an incremental recompute for the dataset's profile/query.
+
+    Args:
+        dataset: Sweep dataset loaded from the refreshed issues
+        week_labels: Weeks in the calculation range, oldest first
+        changed_keys: Issue keys changed by the delta fetch
+
+    Returns:
+        Week label -> metric families to recalculate
+    """
+    if not dataset.profile_id or not dataset.query_id:
+        return {week_label: METRIC_FAMILIES for week_label in week_labels}
+
+    backend = get_backend()
+    recorded_weeks = backend.get_metric_contributions(
+        dataset.profile_id, dataset.query_id
+    )
+    changed_key_weeks = (
+        backend.get_metric_contributions(
+            dataset.profile_id, dataset.query_id, changed_keys
+        )
+        if changed_keys
+        else {}
+    )
+    plan = plan_week_recompute(
+        dataset, week_labels, changed_keys, recorded_weeks, changed_key_weeks
+    )
+    logger.info(
+        f"[Delta Metrics] {len(changed_keys)} changed issues affect "
+        f"{len(plan)}/{len(week_labels)} weeks"
+    )
+    return plan
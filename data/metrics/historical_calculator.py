@@ -3,7 +3,8 @@
 import logging
 
 from data.iso_week_bucketing import get_last_n_weeks
-from data.metrics.weekly_calculator import calculate_and_save_weekly_metrics
+from data.metrics.delta_recompute import plan_delta_recompute
+from data.metrics.sweep_calculator import WeeklyMetricsSweep
 from data.metrics_snapshots import batch_write_mode
 from data.task_progress import TaskProgress
 
@@ -11,7 +12,10 @@ logger = logging.getLogger(__name__)
 
 
 def calculate_metrics_for_last_n_weeks(
-    n_weeks: int = 12, progress_callback=None, custom_weeks=None
+    n_weeks: int = 12,
+    progress_callback=None,
+    custom_weeks=None,
+    changed_keys: list[str] | None = None,
 ) -> tuple[bool, str]:
     """
     Calculate metrics for the last N weeks (including current week).
@@ -26,6 +30,9 @@ def calculate_metrics_for_last_n_weeks(
             progress updates
         custom_weeks: Optional list of (week_label, monday, sunday) tuples
             based on actual data range
+        changed_keys: Issue keys changed by the last delta fetch. When given,
+            only the weeks and metric families those issues feed (plus the
+            current week) are recalculated; see data.metrics.delta_recompute
 
     Returns:
         Tuple of (success: bool, summary_message: str)
@@ -49,8 +56,18 @@ def calculate_metrics_for_last_n_weeks(
         failed_weeks = []
         skipped_weeks = []
 
-        # Note: Legacy delta optimization removed - database timestamps
-        # provide sufficient tracking
+        # Issues and changelog are loaded once and swept week by week instead
+        # of being reloaded from the database for every week.
+        sweep = WeeklyMetricsSweep()
+
+        # Delta refresh: recalculate only what the changed issues touch
+        recompute_plan = None
+        if changed_keys is not None:
+            dataset = sweep.load_dataset(progress_callback)
+            if dataset is not None:
+                recompute_plan = plan_delta_recompute(
+                    dataset, [week[0] for week in weeks], changed_keys
+                )
 
         # Use batch write mode to accumulate all changes and write once
         # Import TaskProgress once before loop for progress updates
@@ -116,10 +133,21 @@ def calculate_metrics_for_last_n_weeks(
                         f"({monday} to {sunday})..."
                     )
 
-                success, message = calculate_and_save_weekly_metrics(
-                    week_label=week_label,
-                    progress_callback=progress_callback,
-                )
+                if recompute_plan is None:
+                    success, message = sweep.calculate_week(
+                        week_label, progress_callback=progress_callback
+                    )
+                elif week_label in recompute_plan:
+                    success, message = sweep.calculate_week(
+                        week_label,
+                        progress_callback=progress_callback,
+                        families=recompute_plan[week_label],
+                    )
+                else:
+                    success, message = (
+                        True,
+                        f"[Delta] Week {week_label} not affected by changed issues",
+                    )
 
                 # Report calculation progress AFTER week is calculated (not before)
                 # This ensures 100% means "all work done", not "starting last week"
@@ -0,0 +1,139 @@
+"""Columnar in-memory issue table for metrics calculations.
+
+Issue dicts loaded by SQLiteBackend.get_issues are walked repeatedly by the
+weekly calculators, re-reading nested fields and re-parsing the same date
+strings for every week. IssueTable extracts the columns the week filters read
+once into NumPy arrays so they become vectorized comparisons:
+
+- key, issue_type, status: object arrays
+- completion times per flow end status list: datetime64[us] (built on use)
+- status_index: status histories parsed once for point-in-time lookups
+
+Only columns a calculator reads are extracted; Flow/DORA calculators that
+need changelog histories and fixVersions still walk the original dicts,
+available through ``rows``. Selections always return rows in their original
+order.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data.metrics._weekly_issue_prep import get_completion_timestamp
+from data.status_interval_index import StatusIntervalIndex
+
+logger = logging.getLogger(__name__)
+
+_TIME_UNIT = "datetime64[us]"
+
+
+def _issue_fields(issue: dict) -> dict | None:
+    """Return the nested JIRA API fields dict, or None for flat database rows."""
+    fields = issue.get("fields")
+    return fields if isinstance(fields, dict) else None
+
+
+def _named_value(value) -> str:
+    """Return the display name of a JIRA object field (status, issuetype, ...)."""
+    if isinstance(value, dict):
+        return value.get("name", "")
+    return value or ""
+
+
+def _to_time(value: datetime) -> np.datetime64:
+    """Convert a naive datetime bound to a datetime64 comparable with columns."""
+    return np.datetime64(value, "us")
+
+
+class IssueTable:
+    """Column arrays over a fixed list of issues (flat or nested format)."""
+
+    def __init__(self, issues: list[dict]):
+        """
+        Extract column arrays from issue dicts.
+
+        Args:
+            issues: Issues as returned by SQLiteBackend.get_issues (flat) or the
+                JIRA API (nested under "fields")
+        """
+        self.rows = issues
+
+        keys = []
+        issue_types = []
+        statuses = []
+        for issue in issues:
+            fields = _issue_fields(issue)
+            if fields is not None:
+                issue_types.append(_named_value(fields.get("issuetype")) or "Unknown")
+                statuses.append(_named_value(fields.get("status")))
+            else:
+                issue_types.append(
+                    issue.get("issue_type", issue.get("issuetype", "Unknown"))
+                )
+                statuses.append(issue.get("status", ""))
+            keys.append(issue.get("issue_key") or issue.get("key", ""))
+
+        self.keys = np.array(keys, dtype=object)
+        self.issue_types = np.array(issue_types, dtype=object)
+        self.statuses = np.array(statuses, dtype=object)
+        self._completion_cache: dict[tuple[str, ...], np.ndarray] = {}
+        self._status_index: StatusIntervalIndex | None = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def completion_times(self, flow_end_statuses: list[str]) -> np.ndarray:
+        """
+        Return completion timestamps as used by filter_completed_in_week.
+
+        Resolution date first, then the first transition into a flow end
+        status. Computed once per status list; NaT where none can be parsed.
+
+        Args:
+            flow_end_statuses: Statuses that mark work as completed
+
+        Returns:
+            datetime64[us] array aligned with rows
+        """
+        cache_key = tuple(flow_end_statuses)
+        column = self._completion_cache.get(cache_key)
+        if column is None:
+            column = np.array(
+                [get_completion_timestamp(i, flow_end_statuses) for i in self.rows],
+                dtype=_TIME_UNIT,
+            )
+            self._completion_cache[cache_key] = column
+        return column
+
+    @property
+    def status_index(self) -> StatusIntervalIndex:
+        """Status interval index over rows, built on first use."""
+        if self._status_index is None:
+            self._status_index = StatusIntervalIndex.from_issues(self.rows)
+        return self._status_index
+
+    @staticmethod
+    def between(column: np.ndarray, start: datetime, end: datetime) -> np.ndarray:
+        """Return a mask of rows with start <= column < end (NaT never matches)."""
+        return (column >= _to_time(start)) & (column < _to_time(end))
+
+    def status_in(self, statuses: Iterable[str]) -> np.ndarray:
+        """Return a mask of rows whose current status is in statuses."""
+        # pandas hashes mixed object values (None, str) where np.isin would sort
+        return pd.Series(self.statuses, dtype=object).isin(statuses).to_numpy()
+
+    def select(self, mask: np.ndarray) -> list[dict]:
+        """Return the issue dicts selected by a boolean mask, in original order."""
+        rows = self.rows
+        return [rows[position] for position in np.flatnonzero(mask)]
+
+    def completed_in(
+        self, flow_end_statuses: list[str], start: datetime, end: datetime
+    ) -> list[dict]:
+        """Return issues completed in [start, end), like filter_completed_in_week."""
+        return self.select(
+            self.between(self.completion_times(flow_end_statuses), start, end)
+        )
@@ -0,0 +1,158 @@
+"""Issues and derived subsets shared by the calculators of one refresh step.
+
+Both refresh steps filter the same way: scope sync over the fetched issues
+(project scope and CSV statistics), and the weekly Flow/DORA sweep over the
+stored issues with changelog (DORA classification, fixVersion mapping,
+parsed dates). A RefreshContext applies the parent/project/type filters once
+and caches each derived subset by name, so the calculators of one step share
+a single copy.
+
+The two steps run in separate callbacks on differently shaped issues (API
+format without changelog vs. stored issues with changelog), so each builds
+its own context. Bug analysis and the report build filter bugs on their own.
+
+It extends CalculationContext, so get_filtered_issues memoizes ad-hoc
+filters over the metrics issues as before.
+"""
+
+import logging
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from data.issue_filtering import split_issues_for_metrics
+from data.jira.scope_calculator import calculate_jira_project_scope
+from data.metrics._weekly_dora_prep import classify_dora_issues
+from data.metrics._weekly_issue_prep import load_and_merge_changelog
+from data.metrics.issue_table import IssueTable
+from data.performance_utils import CalculationContext
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshContext(CalculationContext):
+    """
+    Loaded issues of one refresh step with lazily built, cached subsets.
+
+    Attributes:
+        issues: Issues as loaded (including parents and DevOps projects)
+        all_issues_raw: Issues without parents, DevOps projects included
+        all_issues: Issues for metrics (development projects, no parent types)
+        changelog_available: Whether changelog histories were merged into
+            all_issues
+    """
+
+    def __init__(
+        self,
+        issues: list[dict[str, Any]],
+        settings: dict[str, Any],
+        profile_id: str | None = None,
+        query_id: str | None = None,
+        log_prefix: str = "REFRESH",
+    ) -> None:
+        """
+        Filter the loaded issues once.
+
+        Args:
+            issues: Issues in database or JIRA API format
+            settings: App settings or JIRA config with field mappings,
+                project classification and parent types
+            profile_id: Profile the issues belong to
+            query_id: Query the issues belong to
+            log_prefix: Prefix for filter log messages
+        """
+        all_issues_raw, all_issues = split_issues_for_metrics(
+            issues, settings, log_prefix
+        )
+        super().__init__(all_issues)
+        self.issues = issues
+        self.all_issues_raw = all_issues_raw
+        self.all_issues = all_issues
+        self.settings = settings
+        self.profile_id = profile_id
+        self.query_id = query_id
+        self.changelog_available = False
+        self._subsets: dict[Hashable, Any] = {}
+        logger.info(
+            f"[{log_prefix}] Refresh context: {len(issues)} loaded, "
+            f"{len(all_issues_raw)} without parents, {len(all_issues)} for metrics"
+        )
+
+    @classmethod
+    def from_database(
+        cls,
+        backend,
+        profile_id: str,
+        query_id: str,
+        settings: dict[str, Any],
+    ) -> RefreshContext:
+        """
+        Load a query's issues and changelog and filter them once.
+
+        Args:
+            backend: Persistence backend
+            profile_id: Profile to load
+            query_id: Query to load
+            settings: App settings
+
+        Returns:
+            RefreshContext with changelog histories merged into all_issues
+
+        Raises:
+            ValueError: If the query has no issues
+        """
+        issues = backend.get_issues(profile_id, query_id)
+        if not issues:
+            raise ValueError("No JIRA data available. Please update data first.")
+        logger.info(f"Loaded {len(issues)} issues from database")
+
+        context = cls(issues, settings, profile_id, query_id, log_prefix="WEEKLY CALC")
+        _, context.changelog_available = load_and_merge_changelog(
+            backend, context.all_issues, profile_id, query_id
+        )
+        return context
+
+    def subset(self, name: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Return a derived subset, building it on first use.
+
+        Args:
+            name: Cache key of the subset
+            build: Builds the subset from this context
+
+        Returns:
+            The cached subset
+        """
+        if name not in self._subsets:
+            self._subsets[name] = build()
+        return self._subsets[name]
+
+    @property
+    def dora_classification(self) -> tuple[list, list, list]:
+        """(operational_tasks, development_issues, production_bugs) for DORA."""
+        return self.subset(
+            "dora_classification",
+            lambda: classify_dora_issues(
+                self.all_issues, self.all_issues_raw, self.settings
+            ),
+        )
+
+    @property
+    def issue_table(self) -> IssueTable:
+        """Columnar table of the metrics issues."""
+        return self.subset("issue_table", lambda: IssueTable(self.all_issues))
+
+    def project_scope(self, points_field: str, config: dict[str, Any]) -> dict:
+        """
+        Return the JIRA project scope of the metrics issues.
+
+        Args:
+            points_field: Story points field ID ("" for issue counts only)
+            config: JIRA configuration
+
+        Returns:
+            Scope dict from calculate_jira_project_scope
+        """
+        return self.subset(
+            ("project_scope", points_field),
+            lambda: calculate_jira_project_scope(self.all_issues, points_field, config),
+        )
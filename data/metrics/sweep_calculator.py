@@ -0,0 +1,823 @@
+"""Single-pass sweep-line engine for historical weekly Flow/DORA metrics.
+
+calculate_and_save_weekly_metrics reloads every issue and rebuilds the
+changelog map for each week it is called for. This engine loads issues and
+status transitions once, sorts them into a single event stream and sweeps
+the timeline week by week:
+
+- Flow Load (WIP) is maintained incrementally while transition events are
+  replayed, so each historical week costs only the events since the last one.
+- Throughput reads completed issues from the IssueTable completion column;
+  Lead Time, CFR and MTTR read their per-week issue subsets from sorted
+  timestamp indexes by bisect instead of rescanning all issues.
+
+The per-week savers in _weekly_flow and _weekly_dora_calc are reused with the
+pre-selected inputs, so the saved snapshots match the per-week calculator.
+"""
+
+import logging
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import numpy as np
+from dateutil import parser
+
+from configuration.metrics_config import MetricsConfig
+from data.changelog_processor import get_first_status_transition_timestamp
+from data.fixversion_matcher import DeploymentIndex
+from data.metrics._weekly_dora_calc import calculate_dora_metrics
+from data.metrics._weekly_dora_prep import (
+    build_dora_release_map,
+    classify_dora_issues,
+    collect_development_fix_versions,
+)
+from data.metrics._weekly_flow import _compute_wip_at_week_end, calculate_flow_metrics
+from data.metrics._weekly_issue_prep import (
+    check_metrics_cached,
+    compute_week_boundaries,
+)
+from data.metrics.issue_table import IssueTable
+from data.metrics.refresh_context import RefreshContext
+from data.metrics.weekly_calculator import finalize_weekly_metrics
+from data.performance_utils import RangeIndex
+from data.persistence import load_app_settings
+from data.persistence.factory import get_backend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLOW_END_STATUSES = ["Done", "Resolved", "Closed"]
+DEFAULT_WIP_STATUSES = [
+    "In Progress",
+    "In Review",
+    "Testing",
+    "Ready for Testing",
+    "In Deployment",
+]
+
+# Metric families that can be recalculated independently for a week
+METRIC_FAMILIES = ("flow", "dora")
+
+# Event kinds, ordered so that creation events at time T are applied before
+# transitions at time T (an issue exists at T when created <= T, while a status
+# change only counts when it happened strictly before T).
+_EVENT_CREATED = 0
+_EVENT_STATUS = 1
+_EVENT_WIP_LABEL = 2
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Convert a datetime to timezone-naive UTC (same as the per-week path)."""
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _get_issue_field(issue: dict, field_name: str, default=None):
+    """Read a field from nested JIRA API or flat database issue format."""
+    if "fields" in issue and isinstance(issue.get("fields"), dict):
+        return issue["fields"].get(field_name, default)
+    return issue.get(field_name, default)
+
+
+def _get_issue_key(issue: dict) -> str:
+    """Return the issue key for nested or flat issue formats."""
+    return issue.get("issue_key") or issue.get("key") or ""
+
+
+def _get_current_status(issue: dict) -> str:
+    """Return the current status name for nested or flat issue formats."""
+    if "fields" in issue and isinstance(issue.get("fields"), dict):
+        status = issue["fields"].get("status", {})
+        if isinstance(status, dict):
+            return status.get("name", "")
+        return status or ""
+    return issue.get("status", "")
+
+
+class _DeploymentCountIndex:
+    """Index mirroring count_deployments_for_week without rescanning tasks.
+
+    Each completed Operational Task contributes one entry per valid fixVersion
+    release date. For a week, a task counts once and contributes the name of
+    its first fixVersion (in issue order) released inside that week.
+    """
+
+    def __init__(
+        self,
+        operational_tasks: list,
+        flow_end_statuses: list[str],
+        valid_fix_versions: set | None,
+    ) -> None:
+        entries = []
+        for task_idx, issue in enumerate(operational_tasks):
+            if _get_current_status(issue) not in flow_end_statuses:
+                continue
+            for fv_order, fv in enumerate(_get_issue_field(issue, "fixVersions") or []):
+                release_date_str = fv.get("releaseDate")
+                release_name = fv.get("name")
+                if not release_date_str or not release_name:
+                    continue
+                if valid_fix_versions and release_name not in valid_fix_versions:
+                    continue
+                try:
+                    release_date = datetime.fromisoformat(release_date_str)
+                except ValueError, TypeError:
+                    continue
+                if release_date.tzinfo is not None:
+                    # Never comparable with the naive week bounds
+                    continue
+                entries.append((release_date, task_idx, fv_order, release_name))
+        entries.sort()
+        self._times = [entry[0] for entry in entries]
+        self._entries = entries
+
+    def _entries_in(self, week_start: datetime, week_end: datetime) -> list[tuple]:
+        lo = bisect_left(self._times, week_start)
+        hi = bisect_left(self._times, week_end)
+        return self._entries[lo:hi]
+
+    def task_positions(self, week_start: datetime, week_end: datetime) -> set[int]:
+        """Return positions of the tasks deployed in [week_start, week_end)."""
+        return {entry[1] for entry in self._entries_in(week_start, week_end)}
+
+    def count(self, week_label: str, week_start: datetime, week_end: datetime) -> dict:
+        """Return the count_deployments_for_week result for one week."""
+        first_release_per_task: dict[int, tuple[int, str]] = {}
+        for _date, task_idx, fv_order, release_name in self._entries_in(
+            week_start, week_end
+        ):
+            current = first_release_per_task.get(task_idx)
+            if current is None or fv_order < current[0]:
+                first_release_per_task[task_idx] = (fv_order, release_name)
+        releases = {name for _order, name in first_release_per_task.values()}
+        return {
+            week_label: {
+                "deployments": len(first_release_per_task),
+                "releases": len(releases),
+                "release_names": sorted(releases),
+            }
+        }
+
+
+class _StatusSweep:
+    """Incremental historical WIP reconstruction over sorted status events.
+
+    Replays the same rules as get_status_at_point_in_time for every issue at
+    once: an issue exists from its created timestamp, its status is the last
+    status change strictly before the sweep time (first entry wins on ties)
+    and falls back to the current status otherwise. The Flow Load breakdown
+    label follows the latest first-entry into a WIP status before that time.
+    """
+
+    def __init__(
+        self,
+        issue_table: IssueTable,
+        wip_statuses: list[str],
+        flow_end_statuses: list[str],
+    ) -> None:
+        self._issues = issue_table.rows
+        self._wip_statuses = set(wip_statuses)
+        self._flow_end_statuses = set(flow_end_statuses)
+        self._current_status = issue_table.statuses.tolist()
+        self._issue_types = issue_table.issue_types.tolist()
+        self._events = self._build_events(self._issues, wip_statuses)
+        self.reset()
+
+    @staticmethod
+    def _build_events(all_issues: list, wip_statuses: list[str]) -> list[tuple]:
+        """Parse every issue's timeline once into a globally sorted event list."""
+        events: list[tuple] = []
+        for issue_idx, issue in enumerate(all_issues):
+            issue_events = _StatusSweep._issue_events(issue, issue_idx)
+            if issue_events is None:
+                # Unparseable timeline: the per-week lookup never yields a status
+                continue
+            events.extend(issue_events)
+            for wip_order, wip_status in enumerate(wip_statuses):
+                timestamp = get_first_status_transition_timestamp(issue, wip_status)
+                if timestamp:
+                    events.append(
+                        (
+                            _to_naive_utc(timestamp),
+                            _EVENT_WIP_LABEL,
+                            -wip_order,
+                            issue_idx,
+                            wip_status,
+                        )
+                    )
+        events.sort(key=lambda event: event[:4])
+        return events
+
+    @staticmethod
+    def _issue_events(issue: dict, issue_idx: int) -> list[tuple] | None:
+        """Return creation and status events for one issue, or None if invalid."""
+        created_str = _get_issue_field(issue, "created")
+        if not created_str:
+            return None
+        try:
+            created = _to_naive_utc(parser.parse(created_str))
+            events = [(created, _EVENT_CREATED, 0, issue_idx, None)]
+            histories = (issue.get("changelog") or {}).get("histories") or []
+            order = 0
+            for history in histories:
+                created_timestamp = history.get("created")
+                if not created_timestamp:
+                    continue
+                change_time = _to_naive_utc(parser.parse(created_timestamp))
+                for item in history.get("items", []):
+                    if item.get("field") == "status":
+                        # Later replay overwrites earlier, so negate the order
+                        # to let the first change at an equal timestamp win.
+                        events.append(
+                            (
+                                change_time,
+                                _EVENT_STATUS,
+                                -order,
+                                issue_idx,
+                                item.get("toString", ""),
+                            )
+                        )
+                        order += 1
+        except Exception as e:
+            logger.debug(
+                f"[Sweep] Skipping timeline for "
+                f"{issue.get('key', issue.get('issue_key'))}: {e}"
+            )
+            return None
+        return events
+
+    @property
+    def event_count(self) -> int:
+        """Number of timeline events replayed by a full sweep."""
+        return len(self._events)
+
+    def reset(self) -> None:
+        """Rewind the sweep to before the first event."""
+        issue_count = len(self._issues)
+        self._cursor = 0
+        self._sweep_time: datetime | None = None
+        self._exists = [False] * issue_count
+        self._status: list[str | None] = [None] * issue_count
+        self._label: list[str | None] = [None] * issue_count
+        self._wip_count = 0
+        self._in_wip: set[int] = set()
+        self._by_status: Counter = Counter()
+        self._by_issue_type: Counter = Counter()
+
+    def _contribution(self, issue_idx: int) -> tuple[bool, str | None]:
+        """Return (is_in_wip, breakdown_label) for an issue at the sweep time."""
+        if not self._exists[issue_idx]:
+            return False, None
+        status = self._status[issue_idx] or self._current_status[issue_idx]
+        in_wip = (
+            bool(status)
+            and status in self._wip_statuses
+            and status not in self._flow_end_statuses
+        )
+        return in_wip, self._label[issue_idx]
+
+    def _apply(self, kind: int, issue_idx: int, value: str | None) -> None:
+        """Apply one event, keeping the WIP counters in sync."""
+        was_in_wip, old_label = self._contribution(issue_idx)
+        if kind == _EVENT_CREATED:
+            self._exists[issue_idx] = True
+        elif kind == _EVENT_STATUS:
+            self._status[issue_idx] = value
+        else:
+            self._label[issue_idx] = value
+        is_in_wip, new_label = self._contribution(issue_idx)
+
+        if was_in_wip:
+            self._wip_count -= 1
+            self._in_wip.discard(issue_idx)
+            self._by_issue_type[self._issue_types[issue_idx]] -= 1
+            if old_label:
+                self._by_status[old_label] -= 1
+        if is_in_wip:
+            self._wip_count += 1
+            self._in_wip.add(issue_idx)
+            self._by_issue_type[self._issue_types[issue_idx]] += 1
+            if new_label:
+                self._by_status[new_label] += 1
+
+    def advance_to(self, target_time: datetime) -> None:
+        """Replay all events visible at target_time (rewinds if needed)."""
+        if self._sweep_time is not None and target_time < self._sweep_time:
+            self.reset()
+        events = self._events
+        while self._cursor < len(events):
+            event_time, kind, _order, issue_idx, value = events[self._cursor]
+            if event_time > target_time or (
+                event_time == target_time and kind != _EVENT_CREATED
+            ):
+                break
+            self._apply(kind, issue_idx, value)
+            self._cursor += 1
+        self._sweep_time = target_time
+
+    def wip_positions(self, target_time: datetime) -> list[int]:
+        """Return positions of the issues in WIP at target_time, ascending."""
+        self.advance_to(target_time)
+        return sorted(self._in_wip)
+
+    def wip_result(self, target_time: datetime, week_label: str) -> dict:
+        """Return the Flow Load result dict for a historical week end."""
+        self.advance_to(target_time)
+        by_status = {k: v for k, v in self._by_status.items() if v > 0}
+        by_issue_type = {k: v for k, v in self._by_issue_type.items() if v > 0}
+        logger.info(
+            f"Historical WIP for week {week_label}: {self._wip_count} items "
+            f"were in active work at {target_time.date()}"
+        )
+        logger.info(f"WIP breakdown by status: {by_status}")
+        logger.info(f"WIP breakdown by issue type: {by_issue_type}")
+        return {
+            "metric_name": "flow_load",
+            "wip_count": self._wip_count,
+            "by_status": by_status,
+            "by_issue_type": by_issue_type,
+            "unit": "items",
+            "error_state": "success",
+            "error_message": None,
+        }
+
+
+@dataclass
+class SweepDataset:
+    """Issues, DORA classification and sorted indexes loaded once per sweep."""
+
+    all_issues: list
+    all_issues_raw: list
+    issue_table: IssueTable
+    changelog_available: bool
+    app_settings: dict
+    flow_end_statuses: list[str]
+    wip_statuses: list[str]
+    operational_tasks: list
+    development_issues: list
+    production_bugs: list
+    development_fix_versions: set
+    fixversion_release_map: dict
+    status_sweep: _StatusSweep
+    dev_deployment_index: DeploymentIndex
+    ops_deployment_index: DeploymentIndex
+    bug_deployment_index: DeploymentIndex
+    bug_resolution_index: RangeIndex
+    deployment_count_index: _DeploymentCountIndex
+    dora_mappings: dict = field(default_factory=dict)
+    profile_id: str | None = None
+    query_id: str | None = None
+
+    def select_week(
+        self,
+        week_label: str,
+        week_start: datetime,
+        week_end: datetime,
+        completion_cutoff: datetime,
+    ) -> tuple[list, dict]:
+        """Return (issues_completed, dora_week_selection) for one week."""
+        issues_completed = self.issue_table.completed_in(
+            self.flow_end_statuses, week_start, completion_cutoff
+        )
+        week_selection = {
+            "dev_issues": self.dev_deployment_index.issues_deployed_in(
+                week_start, week_end
+            ),
+            "operational_tasks": self.ops_deployment_index.issues_deployed_in(
+                week_start, week_end
+            ),
+            "deployments": self.deployment_count_index.count(
+                week_label, week_start, week_end
+            ),
+            "release_names": self.dev_deployment_index.releases_in(
+                week_start, week_end
+            ),
+            "bugs_by_mode": {
+                "deployment": self.bug_deployment_index.issues_deployed_in(
+                    week_start, week_end
+                ),
+                "resolution": self.bug_resolution_index.select(
+                    self.production_bugs, week_start, week_end
+                ),
+            },
+        }
+        return issues_completed, week_selection
+
+    def week_contributions(
+        self,
+        week_start: datetime,
+        week_end: datetime,
+        completion_cutoff: datetime,
+        families: tuple[str, ...] = METRIC_FAMILIES,
+    ) -> dict[str, list[str]]:
+        """Return the issue keys feeding each metric family of a historical week.
+
+        Flow covers the issues completed in the week plus those in WIP at the
+        cutoff; DORA covers every issue the week's DORA selection reads.
+        """
+        contributions: dict[str, list[str]] = {}
+        if "flow" in families:
+            table = self.issue_table
+            completed = np.flatnonzero(
+                table.between(
+                    table.completion_times(self.flow_end_statuses),
+                    week_start,
+                    completion_cutoff,
+                )
+            )
+            positions = set(completed.tolist())
+            positions.update(self.status_sweep.wip_positions(completion_cutoff))
+            contributions["flow"] = sorted(
+                {table.keys[position] for position in positions} - {""}
+            )
+        if "dora" in families:
+            deployed_tasks = self.deployment_count_index.task_positions(
+                week_start, week_end
+            )
+            dora_issues = [
+                *self.dev_deployment_index.issues_deployed_in(week_start, week_end),
+                *self.ops_deployment_index.issues_deployed_in(week_start, week_end),
+                *(self.operational_tasks[position] for position in deployed_tasks),
+                *self.bug_deployment_index.issues_deployed_in(week_start, week_end),
+                *self.bug_resolution_index.select(
+                    self.production_bugs, week_start, week_end
+                ),
+            ]
+            contributions["dora"] = sorted(
+                {_get_issue_key(issue) for issue in dora_issues} - {""}
+            )
+        return contributions
+
+
+def _parse_bug_resolution(bug: dict) -> datetime | None:
+    """Parse resolutiondate exactly like filter_bugs_by_resolution_week."""
+    resolution_str = _get_issue_field(bug, "resolutiondate")
+    if not resolution_str:
+        return None
+    try:
+        resolution_date = datetime.fromisoformat(resolution_str.replace("Z", "+00:00"))
+    except ValueError, TypeError, AttributeError:
+        return None
+    # Week bounds are naive, so the per-week filter drops tzinfo without converting
+    return resolution_date.replace(tzinfo=None)
+
+
+def build_sweep_dataset(
+    all_issues: list,
+    all_issues_raw: list,
+    changelog_available: bool,
+    app_settings: dict,
+    profile_id: str | None = None,
+    query_id: str | None = None,
+    refresh_context: RefreshContext | None = None,
+) -> SweepDataset:
+    """Classify issues and build the sorted per-week indexes in one pass.
+
+    Args:
+        all_issues: Filtered development issues with changelog merged in.
+        all_issues_raw: Parent-filtered issues before project filtering.
+        changelog_available: Whether changelog data was merged into issues.
+        app_settings: Application settings (statuses, field mappings, types).
+        profile_id: Profile the issues belong to (enables contribution records).
+        query_id: Query the issues belong to (enables contribution records).
+        refresh_context: Refresh context holding these issues; its DORA
+            classification and IssueTable are reused instead of rebuilt.
+
+    Returns:
+        SweepDataset ready to answer any number of weekly queries.
+    """
+    flow_end_statuses = app_settings.get("flow_end_statuses", DEFAULT_FLOW_END_STATUSES)
+    wip_statuses = app_settings.get("wip_statuses", DEFAULT_WIP_STATUSES)
+
+    if refresh_context is not None:
+        operational_tasks, development_issues, production_bugs = (
+            refresh_context.dora_classification
+        )
+        issue_table = refresh_context.issue_table
+    else:
+        operational_tasks, development_issues, production_bugs = classify_dora_issues(
+            all_issues, all_issues_raw, app_settings
+        )
+        issue_table = IssueTable(all_issues)
+    development_fix_versions = collect_development_fix_versions(all_issues)
+    fixversion_release_map = build_dora_release_map(
+        operational_tasks,
+        development_issues,
+        development_fix_versions,
+        flow_end_statuses,
+    )
+
+    dataset = SweepDataset(
+        all_issues=all_issues,
+        all_issues_raw=all_issues_raw,
+        issue_table=issue_table,
+        changelog_available=changelog_available,
+        app_settings=app_settings,
+        flow_end_statuses=flow_end_statuses,
+        wip_statuses=wip_statuses,
+        operational_tasks=operational_tasks,
+        development_issues=development_issues,
+        production_bugs=production_bugs,
+        development_fix_versions=development_fix_versions,
+        fixversion_release_map=fixversion_release_map,
+        status_sweep=_StatusSweep(issue_table, wip_statuses, flow_end_statuses),
+        dev_deployment_index=DeploymentIndex(
+            development_issues, fixversion_release_map
+        ),
+        ops_deployment_index=DeploymentIndex(operational_tasks, fixversion_release_map),
+        bug_deployment_index=DeploymentIndex(production_bugs, fixversion_release_map),
+        bug_resolution_index=RangeIndex(
+            [_parse_bug_resolution(bug) for bug in production_bugs]
+        ),
+        deployment_count_index=_DeploymentCountIndex(
+            operational_tasks,
+            flow_end_statuses,
+            development_fix_versions,
+        ),
+        dora_mappings=app_settings.get("field_mappings", {}).get("dora", {}),
+        profile_id=profile_id,
+        query_id=query_id,
+    )
+    logger.info(
+        f"[Sweep] Prepared {len(all_issues)} issues "
+        f"({dataset.status_sweep.event_count} timeline events) for weekly sweep"
+    )
+    return dataset
+
+
+class WeeklyMetricsSweep:
+    """Calculate and save weekly Flow/DORA metrics from one loaded dataset.
+
+    Issues are loaded lazily on the first week that is not already cached, so
+    a fully cached history costs no issue load at all. Weeks are cheapest when
+    requested oldest to newest; an earlier week rewinds the WIP sweep.
+    A RefreshContext already built for this refresh is reused instead of
+    loading and filtering the issues again.
+    """
+
+    def __init__(
+        self,
+        profile_id: str | None = None,
+        refresh_context: RefreshContext | None = None,
+    ) -> None:
+        self.profile_id = profile_id
+        self._refresh_context = refresh_context
+        self._dataset: SweepDataset | None = None
+        self._load_error: str | None = None
+
+    @classmethod
+    def from_dataset(cls, dataset: SweepDataset) -> WeeklyMetricsSweep:
+        """Create a sweep over an already prepared dataset."""
+        sweep = cls()
+        sweep._dataset = dataset
+        return sweep
+
+    @property
+    def refresh_context(self) -> RefreshContext | None:
+        """Refresh context the dataset was built from, once loaded."""
+        return self._refresh_context
+
+    @property
+    def load_error(self) -> str | None:
+        """Reason the dataset could not be loaded, if loading failed."""
+        return self._load_error
+
+    def load_dataset(self, progress_callback=None) -> SweepDataset | None:
+        """Load (once) and return the sweep dataset, or None on failure."""
+
+        def report_progress(message: str):
+            logger.info(message)
+            if progress_callback:
+                progress_callback(message)
+
+        return self._ensure_loaded(report_progress)
+
+    def _ensure_loaded(self, report_progress) -> SweepDataset | None:
+        """Load issues and changelog once; remember the error on failure."""
+        if self._dataset is not None or self._load_error is not None:
+            return self._dataset
+
+        report_progress("Loading profile configuration...")
+        try:
+            metrics_config = MetricsConfig(profile_id=self.profile_id)
+            logger.info(f"Loaded profile: {metrics_config.profile_id}")
+        except Exception as e:
+            logger.error(f"Failed to load profile configuration: {e}")
+            self._load_error = (
+                f"Failed to load profile configuration: {str(e)}. "
+                "Please configure JIRA mappings in the UI."
+            )
+            return None
+
+        context = self._refresh_context
+        if context is None:
+            app_settings = load_app_settings()
+            if not app_settings:
+                self._load_error = "Failed to load app settings"
+                return None
+
+            backend = get_backend()
+            active_profile_id = backend.get_app_state("active_profile_id")
+            active_query_id = backend.get_app_state("active_query_id")
+            if not active_profile_id or not active_query_id:
+                self._load_error = "No active profile/query selected."
+                return None
+
+            try:
+                context = RefreshContext.from_database(
+                    backend, active_profile_id, active_query_id, app_settings
+                )
+            except ValueError as e:
+                self._load_error = str(e)
+                return None
+            self._refresh_context = context
+
+        self._dataset = build_sweep_dataset(
+            context.all_issues,
+            context.all_issues_raw,
+            context.changelog_available,
+            context.settings,
+            profile_id=context.profile_id,
+            query_id=context.query_id,
+            refresh_context=context,
+        )
+        return self._dataset
+
+    def calculate_week(
+        self,
+        week_label: str,
+        progress_callback=None,
+        families: tuple[str, ...] | None = None,
+    ) -> tuple[bool, str]:
+        """Calculate and save all Flow/DORA metrics for one week.
+
+        Args:
+            week_label: ISO week (e.g., "2025-W44").
+            progress_callback: Optional callback(message: str) for progress updates.
+            families: Recalculate only these metric families (see
+                METRIC_FAMILIES), ignoring cached snapshots. Default: all
+                families, skipped when the week is already cached.
+
+        Returns:
+            Tuple of (success: bool, message: str), same as
+            calculate_and_save_weekly_metrics.
+        """
+
+        def report_progress(message: str):
+            logger.info(message)
+            if progress_callback:
+                progress_callback(message)
+
+        try:
+            if families is None and check_metrics_cached(week_label):
+                report_progress(
+                    f"[OK] Week {week_label} already calculated - using cached metrics"
+                )
+                return True, f"[OK] Metrics for week {week_label} already up-to-date"
+
+            dataset = self._ensure_loaded(report_progress)
+            if dataset is None:
+                return False, self._load_error or "Failed to load issues"
+
+            try:
+                week_start, week_end, is_current_week, completion_cutoff = (
+                    compute_week_boundaries(week_label)
+                )
+            except ValueError as e:
+                logger.error(f"Failed to parse week label '{week_label}': {e}")
+                return False, str(e)
+
+            return self._calculate_loaded_week(
+                dataset,
+                week_label,
+                week_start,
+                week_end,
+                is_current_week,
+                completion_cutoff,
+                report_progress,
+                families or METRIC_FAMILIES,
+            )
+        except Exception as e:
+            error_msg = f"Error calculating metrics: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return False, error_msg
+
+    def _calculate_loaded_week(
+        self,
+        dataset: SweepDataset,
+        week_label: str,
+        week_start: datetime,
+        week_end: datetime,
+        is_current_week: bool,
+        completion_cutoff: datetime,
+        report_progress,
+        families: tuple[str, ...] = METRIC_FAMILIES,
+    ) -> tuple[bool, str]:
+        """Run the Flow and/or DORA savers for one week using the sweep indexes."""
+        issues_completed, week_selection = dataset.select_week(
+            week_label, week_start, week_end, completion_cutoff
+        )
+        logger.info(
+            f"Found {len(issues_completed)} issues completed in week {week_label}"
+            + (" (running total)" if is_current_week else " (full week)")
+        )
+
+        metrics_saved = 0
+        metrics_details: list[str] = []
+
+        if "flow" in families:
+            if is_current_week:
+                # Current week reads live statuses, which the sweep does not model
+                load_result = _compute_wip_at_week_end(
+                    dataset.all_issues,
+                    dataset.wip_statuses,
+                    dataset.flow_end_statuses,
+                    week_start,
+                    week_end,
+                    is_current_week,
+                    completion_cutoff,
+                    week_label,
+                    issue_table=dataset.issue_table,
+                )
+            else:
+                load_result = dataset.status_sweep.wip_result(
+                    completion_cutoff, week_label
+                )
+
+            metrics_saved, metrics_details = calculate_flow_metrics(
+                issues_completed,
+                dataset.all_issues,
+                dataset.changelog_available,
+                dataset.wip_statuses,
+                dataset.flow_end_statuses,
+                week_start,
+                week_end,
+                is_current_week,
+                completion_cutoff,
+                dataset.app_settings,
+                week_label,
+                report_progress,
+                load_result=load_result,
+            )
+
+        if "dora" in families:
+            report_progress(
+                "[Stats] Calculating DORA metrics (Lead Time, Deployment Frequency)..."
+            )
+            dora_saved, dora_details = calculate_dora_metrics(
+                dataset.operational_tasks,
+                dataset.development_issues,
+                dataset.production_bugs,
+                dataset.development_fix_versions,
+                dataset.fixversion_release_map,
+                dataset.flow_end_statuses,
+                dataset.dora_mappings,
+                week_label,
+                week_start,
+                week_end,
+                report_progress,
+                week_selection=week_selection,
+            )
+            metrics_saved += dora_saved
+            metrics_details.extend(dora_details)
+
+        if not is_current_week:
+            # The current week is a running total and is always recalculated,
+            # so only finished weeks get contribution records
+            self._record_contributions(
+                dataset,
+                week_label,
+                week_start,
+                week_end,
+                completion_cutoff,
+                families,
+            )
+
+        return finalize_weekly_metrics(week_label, metrics_saved, metrics_details)
+
+    @staticmethod
+    def _record_contributions(
+        dataset: SweepDataset,
+        week_label: str,
+        week_start: datetime,
+        week_end: datetime,
+        completion_cutoff: datetime,
+        families: tuple[str, ...],
+    ) -> None:
+        """Persist which issues fed the recalculated families (best effort)."""
+        if not dataset.profile_id or not dataset.query_id:
+            return
+        try:
+            get_backend().save_metric_contributions(
+                dataset.profile_id,
+                dataset.query_id,
+                week_label,
+                dataset.week_contributions(
+                    week_start, week_end, completion_cutoff, families
+                ),
+            )
+        except Exception as e:
+            # Missing records only make the next delta recompute more work
+            logger.warning(
+                f"[Sweep] Failed to record metric contributions for {week_label}: {e}"
+            )
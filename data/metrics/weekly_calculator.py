@@ -2,6 +2,7 @@
 
 Delegates to focused sub-modules:
 - _weekly_issue_prep: issue loading, filtering, changelog, week boundaries
+- issue_table: columnar view of the loaded issues for vectorized filters
 - _weekly_flow: Flow metric family (Time, Efficiency, Load, Velocity)
 - _weekly_dora_prep: DORA issue classification and filter helpers
 - _weekly_dora_calc: DORA metric family (Lead Time, Deploy Freq, CFR, MTTR)
@@ -11,9 +12,9 @@ import logging
 from datetime import UTC, datetime
 
 from configuration.metrics_config import MetricsConfig
-from data.fixversion_matcher import build_fixversion_release_map
 from data.metrics._weekly_dora_calc import calculate_dora_metrics
 from data.metrics._weekly_dora_prep import (
+    build_dora_release_map,
     classify_dora_issues,
     collect_development_fix_versions,
 )
@@ -21,11 +22,11 @@ from data.metrics._weekly_flow import calculate_flow_metrics
 from data.metrics._weekly_issue_prep import (
     check_metrics_cached,
     compute_week_boundaries,
-    filter_completed_in_week,
     load_and_filter_issues,
     load_and_merge_changelog,
 )
 from data.metrics.helpers import get_current_iso_week
+from data.metrics.issue_table import IssueTable
 from data.metrics_snapshots import save_metric_snapshot
 from data.persistence import load_app_settings
 from data.persistence.factory import get_backend
@@ -33,6 +34,42 @@ from data.persistence.factory import get_backend
 logger = logging.getLogger(__name__)
 
 
+def finalize_weekly_metrics(
+    week_label: str, metrics_saved: int, metrics_details: list[str]
+) -> tuple[bool, str]:
+    """Save trend metadata for a week and build the calculation result message.
+
+    Args:
+        week_label: ISO week the metrics were calculated for.
+        metrics_saved: Number of metric snapshots saved for the week.
+        metrics_details: Human-readable detail line per metric.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    trends = {
+        "flow_time_trend": "stable",
+        "flow_efficiency_trend": "stable",
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+    save_metric_snapshot(week_label, "trends", trends)
+
+    if metrics_saved == 0:
+        message = (
+            f"[!] No metrics calculated for week {week_label}. Details:\n"
+            + "\n".join(metrics_details)
+        )
+        logger.warning(message)
+        return False, message
+
+    message = (
+        f"[OK] Saved {metrics_saved} metrics for week {week_label}:\n"
+        + "\n".join(metrics_details)
+    )
+    logger.info(f"Successfully saved {metrics_saved} metrics for week {week_label}")
+    return True, message
+
+
 def calculate_and_save_weekly_metrics(
     week_label: str = "",
     progress_callback=None,
@@ -109,6 +146,7 @@ def calculate_and_save_weekly_metrics(
         all_issues, changelog_available = load_and_merge_changelog(
             backend, all_issues, active_profile_id, active_query_id
         )
+        issue_table = IssueTable(all_issues)
 
         # Compute week date boundaries
         try:
@@ -139,8 +177,8 @@ def calculate_and_save_weekly_metrics(
             + (" (running total)" if is_current_week else "")
             + "..."
         )
-        issues_completed = filter_completed_in_week(
-            all_issues, flow_end_statuses, week_start, completion_cutoff
+        issues_completed = issue_table.completed_in(
+            flow_end_statuses, week_start, completion_cutoff
         )
         logger.info(
             f"Found {len(issues_completed)} issues completed in week {week_label}"
@@ -161,6 +199,7 @@ def calculate_and_save_weekly_metrics(
             app_settings,
             week_label,
             report_progress,
+            issue_table=issue_table,
         )
 
         metrics_saved = flow_saved
@@ -178,25 +217,11 @@ def calculate_and_save_weekly_metrics(
 
         development_fix_versions = collect_development_fix_versions(all_issues)
 
-        fixversion_release_map = build_fixversion_release_map(
+        fixversion_release_map = build_dora_release_map(
             operational_tasks,
-            valid_fix_versions=development_fix_versions,
-            flow_end_statuses=flow_end_statuses,
-        )
-        if not fixversion_release_map and development_issues:
-            logger.warning(
-                "[DORA] No Operational Task release map found; "
-                "falling back to development issue fixVersion release dates"
-            )
-            fixversion_release_map = build_fixversion_release_map(
-                development_issues,
-                valid_fix_versions=development_fix_versions,
-                flow_end_statuses=None,
-            )
-        logger.info(
-            f"[DORA] Built fixVersion release map: "
-            f"{len(fixversion_release_map)} versions "
-            "(filtered to development project fixVersions)"
+            development_issues,
+            development_fix_versions,
+            flow_end_statuses,
         )
 
         dora_mappings = app_settings.get("field_mappings", {}).get("dora", {})
@@ -218,29 +243,7 @@ def calculate_and_save_weekly_metrics(
         metrics_saved += dora_saved
         metrics_details.extend(dora_details)
 
-        # Save trend metadata
-        trends = {
-            "flow_time_trend": "stable",
-            "flow_efficiency_trend": "stable",
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
-        save_metric_snapshot(week_label, "trends", trends)
-
-        # Build result message
-        if metrics_saved == 0:
-            message = (
-                f"[!] No metrics calculated for week {week_label}. Details:\n"
-                + "\n".join(metrics_details)
-            )
-            logger.warning(message)
-            return False, message
-
-        message = (
-            f"[OK] Saved {metrics_saved} metrics for week {week_label}:\n"
-            + "\n".join(metrics_details)
-        )
-        logger.info(f"Successfully saved {metrics_saved} metrics for week {week_label}")
-        return True, message
+        return finalize_weekly_metrics(week_label, metrics_saved, metrics_details)
 
     except Exception as e:
         error_msg = f"Error calculating metrics: {str(e)}"
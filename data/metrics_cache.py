@@ -3,29 +3,91 @@
 This module provides caching functionality for calculated DORA and Flow metrics
 to improve performance and reduce redundant calculations.
 
+Entries live in the metrics_result_cache table of the application database
+(previously one metrics_cache.json file that every read and write rewrote):
+- Reads and writes touch only their own row
+- Writes run in one IMMEDIATE transaction, so concurrent callbacks cannot
+  overwrite each other's entries
+- Every access takes the next access_seq; eviction walks its index from the
+  least recently used entry instead of sorting all entries
+- Size is bounded by entry count (MAX_ENTRIES) and serialized bytes (MAX_BYTES)
+
 Cache invalidation triggers:
 - TTL expiration (default 1 hour)
 - Field mapping hash changes
 - Manual refresh
 - Cache version mismatch
+
+Without the SQLite backend (JSON persistence) nothing is cached.
 """
 
 import json
 import logging
 import os
-from datetime import UTC, datetime, timedelta
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from data.database import get_db_connection
+from data.migration.schema import ensure_metrics_result_cache_table
 
 logger = logging.getLogger(__name__)
 
-# Cache file configuration
-CACHE_FILE = "metrics_cache.json"
+# Cache configuration
 CACHE_VERSION = "1.0"
 MAX_ENTRIES = 100
 DEFAULT_TTL_SECONDS = 3600  # 1 hour
 
+# Total serialized size of cached metrics
+MAX_BYTES = 16 * 1024 * 1024
+
+# Results larger than this are not cached at all
+MAX_ENTRY_BYTES = 4 * 1024 * 1024
+
 # Eviction policy
 EVICTION_POLICY = "LRU"  # Least Recently Used
 
+# Cache file used before the database table; removed when clearing the cache
+LEGACY_CACHE_FILE = "metrics_cache.json"
+
+# Process-wide counters reported by get_cache_stats()
+_stats_lock = threading.Lock()
+_counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+# Databases whose metrics_result_cache table is known to exist
+_tables_ready: set[str] = set()
+
+_NEXT_ACCESS_SEQ = "(SELECT COALESCE(MAX(access_seq), 0) + 1 FROM metrics_result_cache)"
+
+
+def _count(counter: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _counters[counter] += amount
+
+
+def _db_path() -> Path | None:
+    """Database of the active SQLite backend with the cache table, or None."""
+    # circular import guard
+    from data.persistence.factory import get_backend  # noqa: PLC0415
+
+    try:
+        db_path = getattr(get_backend(), "db_path", None)
+    except Exception as e:
+        logger.debug(f"Metrics cache without database: {e}")
+        return None
+    if not db_path:
+        return None
+
+    db_path = Path(db_path)
+    if str(db_path) not in _tables_ready:
+        with get_db_connection(db_path) as conn:
+            ensure_metrics_result_cache_table(conn)
+            conn.commit()
+        _tables_ready.add(str(db_path))
+    return db_path
+
 
 def generate_cache_key(
     metric_type: str, start_date: str, end_date: str, field_hash: str
@@ -58,53 +120,62 @@ def load_cached_metrics(cache_key: str) -> dict | None:
         Dictionary of metrics if cache hit and valid, None otherwise
 
     Cache miss reasons:
-    - Cache file doesn't exist
+    - No SQLite database
     - Cache key not found
     - Entry expired (past TTL)
     - Cache version mismatch
     """
-    if not os.path.exists(CACHE_FILE):
-        logger.debug(f"Cache miss: {cache_key} (file not found)")
-        return None
-
     try:
-        with open(CACHE_FILE) as f:
-            content = f.read().strip()
-            if not content:  # Empty file
-                logger.debug(f"Cache miss: {cache_key} (empty cache file)")
-                return None
-            cache = json.loads(content)
-
-        # Check cache version
-        if cache.get("cache_version") != CACHE_VERSION:
-            logger.warning(
-                f"Cache version mismatch: expected {CACHE_VERSION}, "
-                f"got {cache.get('cache_version')}"
-            )
-            return None
-
-        # Check if key exists
-        if cache_key not in cache.get("entries", {}):
-            logger.debug(f"Cache miss: {cache_key} (key not found)")
+        db_path = _db_path()
+        if db_path is None:
+            _count("misses")
+            logger.debug(f"Cache miss: {cache_key} (no database)")
             return None
 
-        entry = cache["entries"][cache_key]
-
-        # Check expiration
-        expires_at = datetime.fromisoformat(entry["expires_at"])
-        if datetime.now(UTC) > expires_at:
-            logger.debug(f"Cache miss: {cache_key} (expired)")
-            return None
-
-        # Update access time for LRU eviction
-        entry["last_accessed"] = datetime.now(UTC).isoformat()
-        with open(CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=2)
-
-        logger.info(f"Cache hit: {cache_key}")
-        return entry["metrics"]
+        now = time.time()
+        with get_db_connection(db_path) as conn:
+            row = conn.execute(
+                "SELECT cache_version, metrics, expires_at "
+                "FROM metrics_result_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+
+            if row is None:
+                miss_reason = "key not found"
+            elif row[0] != CACHE_VERSION:
+                logger.warning(
+                    f"Cache version mismatch: expected {CACHE_VERSION}, got {row[0]}"
+                )
+                miss_reason = "version mismatch"
+            elif now > row[2]:
+                miss_reason = "expired"
+            else:
+                # Mark as most recently used for LRU eviction
+                conn.execute(
+                    "UPDATE metrics_result_cache "
+                    f"SET last_accessed = ?, access_seq = {_NEXT_ACCESS_SEQ} "
+                    "WHERE cache_key = ?",
+                    (now, cache_key),
+                )
+                conn.commit()
+                _count("hits")
+                logger.info(f"Cache hit: {cache_key}")
+                return json.loads(row[1])
+
+            if row is not None:
+                # Unusable entry - drop it instead of keeping it until eviction
+                conn.execute(
+                    "DELETE FROM metrics_result_cache WHERE cache_key = ?",
+                    (cache_key,),
+                )
+                conn.commit()
+
+        _count("misses")
+        logger.debug(f"Cache miss: {cache_key} ({miss_reason})")
+        return None
 
-    except Exception as e:
+    except (sqlite3.Error, ValueError) as e:
+        _count("misses")
         logger.error(f"Error loading cache: {e}")
         return None
 
@@ -120,80 +191,93 @@ def save_cached_metrics(
         ttl_seconds: Time-to-live in seconds (default: 3600)
 
     Returns:
-        True if save successful, False otherwise
+        True if save successful, False otherwise (including results larger
+        than MAX_ENTRY_BYTES)
     """
     try:
-        # Load existing cache or create new
-        cache = None
-        if os.path.exists(CACHE_FILE):
-            try:
-                with open(CACHE_FILE) as f:
-                    content = f.read().strip()
-                    if content:  # Check if file has content
-                        cache = json.loads(content)
-            except json.JSONDecodeError, ValueError:
-                logger.warning("Cache file corrupted, recreating")
-                cache = None
-
-        if cache is None:
-            cache = {
-                "cache_version": CACHE_VERSION,
-                "entries": {},
-                "max_entries": MAX_ENTRIES,
-                "eviction_policy": EVICTION_POLICY,
-            }
-
-        # Calculate timestamps
-        calculated_at = datetime.now(UTC)
-        expires_at = calculated_at + timedelta(seconds=ttl_seconds)
-
-        # Create cache entry
-        entry = {
-            "cache_key": cache_key,
-            "metrics": metrics,
-            "calculated_at": calculated_at.isoformat(),
-            "expires_at": expires_at.isoformat(),
-            "last_accessed": calculated_at.isoformat(),
-            "ttl_seconds": ttl_seconds,
-        }
-
-        # Add entry to cache
-        cache["entries"][cache_key] = entry
-
-        # Enforce max entries with LRU eviction
-        if len(cache["entries"]) > MAX_ENTRIES:
-            _evict_lru_entries(cache)
-
-        # Save to file
-        with open(CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=2)
+        payload = json.dumps(metrics)
+        size_bytes = len(payload.encode("utf-8"))
+        if size_bytes > min(MAX_ENTRY_BYTES, MAX_BYTES):
+            logger.warning(f"Not caching {cache_key}: {size_bytes:,} bytes")
+            return False
+
+        db_path = _db_path()
+        if db_path is None:
+            logger.debug(f"Not caching {cache_key} (no database)")
+            return False
+
+        calculated_at = time.time()
+        with get_db_connection(db_path) as conn:
+            # Take the write lock up front: insert and eviction are one unit
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO metrics_result_cache "
+                "(cache_key, cache_version, metrics, size_bytes, ttl_seconds, "
+                "calculated_at, expires_at, last_accessed, access_seq) "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, {_NEXT_ACCESS_SEQ})",
+                (
+                    cache_key,
+                    CACHE_VERSION,
+                    payload,
+                    size_bytes,
+                    ttl_seconds,
+                    calculated_at,
+                    calculated_at + ttl_seconds,
+                    calculated_at,
+                ),
+            )
+            evicted = _evict_lru_entries(conn)
+            conn.commit()
 
+        if evicted:
+            _count("evictions", evicted)
         logger.info(f"Cached metrics: {cache_key} (TTL: {ttl_seconds}s)")
         return True
 
-    except Exception as e:
+    except (sqlite3.Error, TypeError, ValueError) as e:
         logger.error(f"Error saving cache: {e}")
         return False
 
 
-def _evict_lru_entries(cache: dict) -> None:
-    """Evict least recently used entries to stay under MAX_ENTRIES.
+def _evict_lru_entries(conn: sqlite3.Connection) -> int:
+    """Evict least recently used entries to stay under MAX_ENTRIES and MAX_BYTES.
 
-    Args:
-        cache: Cache dictionary (modified in-place)
-    """
-    entries = cache.get("entries", {})
+    Expired entries are dropped first. Runs inside the caller's transaction.
 
-    # Sort by last_accessed timestamp (oldest first)
-    sorted_keys = sorted(
-        entries.keys(), key=lambda k: entries[k].get("last_accessed", "")
-    )
+    Args:
+        conn: Connection with an open write transaction
 
-    # Remove oldest entries until under limit
-    while len(entries) > MAX_ENTRIES:
-        oldest_key = sorted_keys.pop(0)
-        del entries[oldest_key]
-        logger.debug(f"Evicted cache entry: {oldest_key} (LRU policy)")
+    Returns:
+        Number of evicted entries
+    """
+    count, size_bytes = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM metrics_result_cache"
+    ).fetchone()
+    if count <= MAX_ENTRIES and size_bytes <= MAX_BYTES:
+        return 0
+
+    evicted = conn.execute(
+        "DELETE FROM metrics_result_cache WHERE expires_at < ?", (time.time(),)
+    ).rowcount
+    count, size_bytes = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM metrics_result_cache"
+    ).fetchone()
+
+    # Oldest access first, read lazily through the access_seq index
+    victims = []
+    for key, entry_bytes in conn.execute(
+        "SELECT cache_key, size_bytes FROM metrics_result_cache ORDER BY access_seq"
+    ):
+        if count <= MAX_ENTRIES and size_bytes <= MAX_BYTES:
+            break
+        victims.append((key,))
+        count -= 1
+        size_bytes -= entry_bytes
+
+    conn.executemany("DELETE FROM metrics_result_cache WHERE cache_key = ?", victims)
+    for (key,) in victims:
+        logger.debug(f"Evicted cache entry: {key} (LRU policy)")
+    return evicted + len(victims)
 
 
 def invalidate_cache(cache_key: str | None = None) -> bool:
@@ -206,34 +290,33 @@ def invalidate_cache(cache_key: str | None = None) -> bool:
         True if invalidation successful, False otherwise
     """
     try:
+        db_path = _db_path()
+
         if cache_key is None:
             # Clear entire cache
-            if os.path.exists(CACHE_FILE):
-                os.remove(CACHE_FILE)
-                logger.info("Cleared entire metrics cache")
+            if db_path is not None:
+                with get_db_connection(db_path) as conn:
+                    conn.execute("DELETE FROM metrics_result_cache")
+                    conn.commit()
+            if os.path.exists(LEGACY_CACHE_FILE):
+                os.remove(LEGACY_CACHE_FILE)
+            logger.info("Cleared entire metrics cache")
             return True
 
         # Remove specific entry
-        if not os.path.exists(CACHE_FILE):
+        if db_path is None:
             return True  # Nothing to invalidate
 
-        with open(CACHE_FILE) as f:
-            content = f.read().strip()
-            if not content:  # Empty file
-                return True
-            cache = json.loads(content)
-
-        if cache_key in cache.get("entries", {}):
-            del cache["entries"][cache_key]
-
-            with open(CACHE_FILE, "w") as f:
-                json.dump(cache, f, indent=2)
-
+        with get_db_connection(db_path) as conn:
+            deleted = conn.execute(
+                "DELETE FROM metrics_result_cache WHERE cache_key = ?", (cache_key,)
+            ).rowcount
+            conn.commit()
+        if deleted:
             logger.info(f"Invalidated cache entry: {cache_key}")
-
         return True
 
-    except Exception as e:
+    except (sqlite3.Error, OSError) as e:
         logger.error(f"Error invalidating cache: {e}")
         return False
 
@@ -241,83 +324,71 @@ def invalidate_cache(cache_key: str | None = None) -> bool:
 def get_cache_stats() -> dict:
     """Get cache statistics for monitoring.
 
+    Hit, miss and eviction counters cover this process since start-up.
+
     Returns:
         Dictionary with cache statistics:
         {
             "total_entries": int,
             "valid_entries": int,
             "expired_entries": int,
-            "cache_file_size_kb": float,
+            "size_bytes": int (serialized metrics),
+            "max_bytes": int,
             "oldest_entry": str (ISO 8601),
-            "newest_entry": str (ISO 8601)
+            "newest_entry": str (ISO 8601),
+            "hits": int,
+            "misses": int,
+            "hit_rate": float (0.0 - 1.0),
+            "evictions": int
         }
     """
-    if not os.path.exists(CACHE_FILE):
-        return {
-            "total_entries": 0,
-            "valid_entries": 0,
-            "expired_entries": 0,
-            "cache_file_size_kb": 0,
-            "oldest_entry": None,
-            "newest_entry": None,
-        }
+    with _stats_lock:
+        counters = dict(_counters)
+    lookups = counters["hits"] + counters["misses"]
+
+    stats = {
+        "total_entries": 0,
+        "valid_entries": 0,
+        "expired_entries": 0,
+        "size_bytes": 0,
+        "max_bytes": MAX_BYTES,
+        "oldest_entry": None,
+        "newest_entry": None,
+        **counters,
+        "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+    }
 
     try:
-        with open(CACHE_FILE) as f:
-            content = f.read().strip()
-            if not content:  # Empty file
-                return {
-                    "total_entries": 0,
-                    "valid_entries": 0,
-                    "expired_entries": 0,
-                    "cache_file_size_kb": 0,
-                    "oldest_entry": None,
-                    "newest_entry": None,
-                }
-            cache = json.loads(content)
-
-        entries = cache.get("entries", {})
-        now = datetime.now(UTC)
-
-        # Count valid vs expired
-        valid_count = 0
-        expired_count = 0
-        for entry in entries.values():
-            expires_at = datetime.fromisoformat(entry["expires_at"])
-            if now <= expires_at:
-                valid_count += 1
-            else:
-                expired_count += 1
-
-        # Find oldest and newest
-        calculated_times = [
-            entry.get("calculated_at")
-            for entry in entries.values()
-            if entry.get("calculated_at")
-        ]
-        oldest = min(calculated_times) if calculated_times else None
-        newest = max(calculated_times) if calculated_times else None
-
-        # File size
-        file_size_bytes = os.path.getsize(CACHE_FILE)
-        file_size_kb = file_size_bytes / 1024
-
-        return {
-            "total_entries": len(entries),
-            "valid_entries": valid_count,
-            "expired_entries": expired_count,
-            "cache_file_size_kb": round(file_size_kb, 2),
-            "oldest_entry": oldest,
-            "newest_entry": newest,
-        }
-
-    except Exception as e:
+        db_path = _db_path()
+        if db_path is None:
+            return stats
+
+        with get_db_connection(db_path) as conn:
+            total, valid, size_bytes, oldest, newest = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at >= ?), 0), "
+                "COALESCE(SUM(size_bytes), 0), MIN(calculated_at), "
+                "MAX(calculated_at) FROM metrics_result_cache",
+                (time.time(),),
+            ).fetchone()
+
+    except sqlite3.Error as e:
         logger.error(f"Error getting cache stats: {e}")
-        return {
-            "total_entries": 0,
-            "valid_entries": 0,
-            "expired_entries": 0,
-            "cache_file_size_kb": 0,
-            "oldest_entry": None,
-            "newest_entry": None,
+        return stats
+
+    stats.update(
+        {
+            "total_entries": total,
+            "valid_entries": valid,
+            "expired_entries": total - valid,
+            "size_bytes": size_bytes,
+            "oldest_entry": _isoformat(oldest),
+            "newest_entry": _isoformat(newest),
         }
+    )
+    return stats
+
+
+def _isoformat(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
@@ -0,0 +1,248 @@
+"""
+Per-metric snapshot repository over metrics_data_points.
+
+load_snapshots() rebuilds every week of every metric category, while the
+dashboard sparklines and per-week lookups only need a few metric names over a
+week range. MetricSnapshotStore reads just those rows through the
+(profile_id, query_id, metric_name, snapshot_date) index and caches them per
+(profile, query, metric). A write drops only the metrics it touched.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from data.iso_week_bucketing import get_week_label
+from data.persistence.factory import get_backend
+from data.time_period_calculator import get_week_start_date, parse_year_week_label
+
+logger = logging.getLogger(__name__)
+
+
+def week_label_to_snapshot_date(week_label: str) -> str:
+    """
+    Convert a week label to the snapshot_date stored for it.
+
+    Args:
+        week_label: ISO week label ("2025-W44" or legacy "2025-44")
+
+    Returns:
+        Monday of the week as YYYY-MM-DD
+
+    Raises:
+        ValueError: If the label cannot be parsed
+    """
+    year, week_num = parse_year_week_label(week_label)
+    return get_week_start_date(year, week_num).strftime("%Y-%m-%d")
+
+
+def snapshot_date_to_week_label(snapshot_date: str) -> str:
+    """Convert a stored snapshot_date (YYYY-MM-DD) to its ISO week label."""
+    snapshot_day = datetime.fromisoformat(snapshot_date).date()
+    return get_week_label(datetime.combine(snapshot_day, datetime.min.time()))
+
+
+def row_to_metric_data(row: dict) -> dict[str, Any]:
+    """
+    Rebuild the snapshot dict of one metrics_data_points row.
+
+    Args:
+        row: Row as returned by backend.get_metric_values()
+
+    Returns:
+        Metric data dict (metric_value fields, metadata and forecast columns)
+    """
+    # Start with empty dict to allow calculation_metadata to be merged
+    metric_data = {}
+
+    # Add calculation metadata first if available (merge into top level)
+    if row.get("calculation_metadata"):
+        metric_data.update(row["calculation_metadata"])
+
+    # Parse metric_value if it's a dict (saved as JSON in database)
+    metric_value = row.get("metric_value")
+    if isinstance(metric_value, dict):
+        metric_data.update(metric_value)
+    else:
+        # Simple scalar value
+        metric_data["value"] = metric_value
+        metric_data["unit"] = row.get("metric_unit", "")
+
+    # Standard fields from row (these override if present)
+    metric_data["excluded_issue_count"] = row.get("excluded_issue_count", 0)
+
+    # Add forecast data if available
+    if row.get("forecast_value") is not None:
+        metric_data["forecast_value"] = row["forecast_value"]
+        metric_data["forecast_confidence_low"] = row.get("forecast_confidence_low")
+        metric_data["forecast_confidence_high"] = row.get("forecast_confidence_high")
+
+    return metric_data
+
+
+def _to_date_bound(week_label: str | None) -> str | None:
+    """Snapshot date of a range bound (None or unparsable means unbounded)."""
+    if week_label is None:
+        return None
+    try:
+        return week_label_to_snapshot_date(week_label)
+    except ValueError:
+        return None
+
+
+@dataclass
+class _MetricHistory:
+    """Cached weeks of one metric and the snapshot_date range they cover."""
+
+    start_date: str | None
+    end_date: str | None
+    weeks: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def covers(self, start_date: str | None, end_date: str | None) -> bool:
+        lower = self.start_date is None or (
+            start_date is not None and start_date >= self.start_date
+        )
+        upper = self.end_date is None or (
+            end_date is not None and end_date <= self.end_date
+        )
+        return lower and upper
+
+
+class MetricSnapshotStore:
+    """Read cache of metric snapshots keyed by (profile, query, metric)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str, str], _MetricHistory] = {}
+        # Bumped by every invalidation so a read racing a write is not cached
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation (i.e. every snapshot write)."""
+        with self._lock:
+            return self._generation
+
+    def get_weeks(
+        self,
+        profile_id: str,
+        query_id: str,
+        metric_names: list[str],
+        start_week: str | None = None,
+        end_week: str | None = None,
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Return weekly snapshots of the given metrics within a week range.
+
+        Args:
+            profile_id: Profile ID
+            query_id: Query ID
+            metric_names: Metrics to read
+            start_week: First week to include (None = no lower bound)
+            end_week: Last week to include (None = no upper bound)
+
+        Returns:
+            Metric name -> {week_label: metric data}, weeks oldest first
+        """
+        start_date = _to_date_bound(start_week)
+        end_date = _to_date_bound(end_week)
+        # Canonical labels of the bounds ("2025-44" becomes "2025-W44")
+        start_label = snapshot_date_to_week_label(start_date) if start_date else None
+        end_label = snapshot_date_to_week_label(end_date) if end_date else None
+        names = list(dict.fromkeys(metric_names))
+
+        histories: dict[str, _MetricHistory] = {}
+        missing = []
+        with self._lock:
+            for name in names:
+                entry = self._entries.get((profile_id, query_id, name))
+                if entry is not None and entry.covers(start_date, end_date):
+                    histories[name] = entry
+                else:
+                    missing.append(name)
+            # Load the hull of the requested and cached ranges so each entry
+            # keeps covering one contiguous range
+            load_start, load_end = start_date, end_date
+            for name in missing:
+                entry = self._entries.get((profile_id, query_id, name))
+                if entry is None:
+                    continue
+                if load_start is not None:
+                    load_start = (
+                        None
+                        if entry.start_date is None
+                        else min(load_start, entry.start_date)
+                    )
+                if load_end is not None:
+                    load_end = (
+                        None
+                        if entry.end_date is None
+                        else max(load_end, entry.end_date)
+                    )
+            generation = self._generation
+
+        if missing:
+            rows = get_backend().get_metric_values(
+                profile_id,
+                query_id,
+                start_date=load_start,
+                end_date=load_end,
+                metric_names=missing,
+            )
+            loaded = {name: _MetricHistory(load_start, load_end) for name in missing}
+            # Rows arrive newest first; store weeks oldest first
+            for row in reversed(rows):
+                history = loaded.get(row["metric_name"])
+                if history is not None:
+                    week_label = snapshot_date_to_week_label(row["snapshot_date"])
+                    history.weeks[week_label] = row_to_metric_data(row)
+            logger.debug(
+                f"[Snapshots] Loaded {len(rows)} rows for {len(missing)} metrics "
+                f"({load_start or 'start'} to {load_end or 'end'})"
+            )
+            with self._lock:
+                if generation == self._generation:
+                    for name, history in loaded.items():
+                        self._entries[(profile_id, query_id, name)] = history
+            histories.update(loaded)
+
+        return {
+            name: {
+                week_label: metric_data
+                for week_label, metric_data in histories[name].weeks.items()
+                if (start_label is None or week_label >= start_label)
+                and (end_label is None or week_label <= end_label)
+            }
+            for name in names
+        }
+
+    def invalidate(
+        self,
+        profile_id: str | None = None,
+        query_id: str | None = None,
+        metric_names: list[str] | None = None,
+    ) -> None:
+        """
+        Drop cached metrics (all of them when called without arguments).
+
+        Args:
+            profile_id: Only drop entries of this profile
+            query_id: Only drop entries of this query
+            metric_names: Only drop these metrics
+        """
+        with self._lock:
+            self._generation += 1
+            if profile_id is None and query_id is None and metric_names is None:
+                self._entries.clear()
+                return
+            names = set(metric_names) if metric_names is not None else None
+            for key in list(self._entries):
+                entry_profile, entry_query, entry_metric = key
+                if (
+                    (profile_id is None or entry_profile == profile_id)
+                    and (query_id is None or entry_query == query_id)
+                    and (names is None or entry_metric in names)
+                ):
+                    del self._entries[key]
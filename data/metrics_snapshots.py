@@ -24,6 +24,7 @@ Storage Format: JSON file with weekly snapshots
 Created: October 31, 2025
 """
 
+import json
 import logging
 import threading
 from datetime import UTC, datetime
@@ -35,10 +36,14 @@ from configuration.metrics_config import (
     HIGHER_BETTER_METRICS,
     LOWER_BETTER_METRICS,
 )
-from data.iso_week_bucketing import get_week_label
+from data.metrics_snapshot_store import (
+    MetricSnapshotStore,
+    row_to_metric_data,
+    snapshot_date_to_week_label,
+    week_label_to_snapshot_date,
+)
 from data.persistence.factory import get_backend
 from data.profile_manager import get_data_file_path
-from data.time_period_calculator import get_week_start_date, parse_year_week_label
 
 logger = logging.getLogger(__name__)
 
@@ -75,9 +80,14 @@ _snapshots_lock = threading.Lock()
 _snapshots_cache: dict[str, dict[str, Any]] | None = None
 _cache_query_id: str | None = None  # Track which query the cache is for
 
+# Per-metric cache behind get_metric_snapshot/get_metric_weekly_values
+_snapshot_store = MetricSnapshotStore()
+
 # Batch mode context - prevents writes until flush
 _batch_mode_active = False
-_batch_snapshots = None
+_batch_snapshots: dict[str, dict[str, Any]] | None = None
+# (week_label, metric_name) pairs saved since batch mode started
+_batch_touched: set[tuple[str, str]] = set()
 
 
 def _get_snapshots_file_path() -> Path:
@@ -130,51 +140,11 @@ def load_snapshots() -> dict[str, dict[str, Any]]:
             # Group by ISO week label and metric_name
             for row in snapshot_list:
                 # Convert snapshot_date (YYYY-MM-DD) to ISO week label (YYYY-Wxx)
-                snapshot_date_str = row["snapshot_date"]
-                snapshot_date = datetime.fromisoformat(snapshot_date_str).date()
-                week_label = get_week_label(
-                    datetime.combine(snapshot_date, datetime.min.time())
+                week_label = snapshot_date_to_week_label(row["snapshot_date"])
+                snapshots.setdefault(week_label, {})[row["metric_name"]] = (
+                    row_to_metric_data(row)
                 )
 
-                if week_label not in snapshots:
-                    snapshots[week_label] = {}
-
-                metric_name = row["metric_name"]
-
-                # Reconstruct metric data structure
-                # Start with empty dict to allow calculation_metadata to be merged
-                metric_data = {}
-
-                # Add calculation metadata first if available (merge into top level)
-                if row.get("calculation_metadata"):
-                    # Merge all fields from calculation_metadata into metric_data
-                    metric_data.update(row["calculation_metadata"])
-
-                # Parse metric_value if it's a dict (saved as JSON in database)
-                metric_value = row.get("metric_value")
-                if isinstance(metric_value, dict):
-                    # metric_value is a dict (parsed JSON) - merge all fields
-                    metric_data.update(metric_value)
-                else:
-                    # Simple scalar value
-                    metric_data["value"] = metric_value
-                    metric_data["unit"] = row.get("metric_unit", "")
-
-                # Standard fields from row (these override if present)
-                metric_data["excluded_issue_count"] = row.get("excluded_issue_count", 0)
-
-                # Add forecast data if available
-                if row.get("forecast_value") is not None:
-                    metric_data["forecast_value"] = row["forecast_value"]
-                    metric_data["forecast_confidence_low"] = row.get(
-                        "forecast_confidence_low"
-                    )
-                    metric_data["forecast_confidence_high"] = row.get(
-                        "forecast_confidence_high"
-                    )
-
-                snapshots[week_label][metric_name] = metric_data
-
         logger.info(f"Loaded {len(snapshots)} weeks of metric snapshots from database")
 
         # Update cache
@@ -192,9 +162,62 @@ def clear_snapshots_cache() -> None:
     global _snapshots_cache, _cache_query_id
     _snapshots_cache = None
     _cache_query_id = None
+    _snapshot_store.invalidate()
     logger.info("Cleared snapshots cache")
 
 
+def get_snapshots_generation() -> int:
+    """
+    Return a counter that changes whenever metric snapshots are written.
+
+    Lets derived caches (e.g. rendered dashboard content) key on the snapshot
+    state without reading it.
+    """
+    return _snapshot_store.generation
+
+
+def _get_active_ids() -> tuple[str | None, str | None]:
+    """Return the active (profile_id, query_id)."""
+    backend = get_backend()
+    return (
+        backend.get_app_state("active_profile_id"),
+        backend.get_app_state("active_query_id"),
+    )
+
+
+def _stored_form(metric_data: Any) -> dict[str, Any]:
+    """Return metric data as a reload from the database would return it."""
+    if isinstance(metric_data, (dict, list)):
+        metric_data = json.loads(json.dumps(metric_data))
+    return row_to_metric_data(
+        {"metric_value": metric_data, "metric_unit": "", "excluded_issue_count": 0}
+    )
+
+
+def _apply_saved_snapshots(
+    profile_id: str, query_id: str, snapshots: dict[str, dict[str, Any]]
+) -> None:
+    """
+    Update the caches after snapshots were written.
+
+    The load_snapshots() cache is updated in place and only the written
+    metrics are dropped from the per-metric store, so a write no longer
+    forces every reader to reload the whole history.
+    """
+    _snapshot_store.invalidate(
+        profile_id,
+        query_id,
+        sorted({name for metrics in snapshots.values() for name in metrics}),
+    )
+    if _snapshots_cache is None or _cache_query_id != query_id:
+        return
+    for week, metrics in snapshots.items():
+        week_label = snapshot_date_to_week_label(week_label_to_snapshot_date(week))
+        cached_week = _snapshots_cache.setdefault(week_label, {})
+        for metric_name, metric_data in metrics.items():
+            cached_week[metric_name] = _stored_form(metric_data)
+
+
 def save_snapshots(snapshots: dict[str, dict[str, Any]]) -> bool:
     """
     Save all metric snapshots to database via repository pattern.
@@ -221,9 +244,7 @@ def save_snapshots(snapshots: dict[str, dict[str, Any]]) -> bool:
             # Convert week label (e.g., "2025-44" or "2025-W44") to
             # snapshot_date (YYYY-MM-DD)
             # Use Monday of the week as the snapshot date
-            year, week_num = parse_year_week_label(week)
-            week_start = get_week_start_date(year, week_num)
-            snapshot_date = week_start.strftime("%Y-%m-%d")
+            snapshot_date = week_label_to_snapshot_date(week)
 
             # Group metrics by category (flow vs dora) and save separately
             # This ensures correct metric_category in database
@@ -265,8 +286,8 @@ def save_snapshots(snapshots: dict[str, dict[str, Any]]) -> bool:
 
         logger.info(f"Saved {len(snapshots)} weeks of metric snapshots to database")
 
-        # Clear cache after saving so next load gets fresh data
-        clear_snapshots_cache()
+        # Refresh only what was written
+        _apply_saved_snapshots(active_profile_id, active_query_id, snapshots)
 
         return True
     except Exception as e:
@@ -320,6 +341,7 @@ def save_metric_snapshot(
 
             # Store metric snapshot in memory
             _batch_snapshots[week_label][metric_name] = metric_data_with_timestamp
+            _batch_touched.add((week_label, metric_name))
             logger.debug(
                 f"[Batch] Queued snapshot for {metric_name} in week {week_label}"
             )
@@ -371,6 +393,7 @@ class batch_write_mode:
             _batch_mode_active = True
             # Load existing snapshots into memory
             _batch_snapshots = load_snapshots()
+            _batch_touched.clear()
             logger.info(
                 "[Batch] Started batch write mode - accumulating changes in memory"
             )
@@ -386,10 +409,15 @@ class batch_write_mode:
 
             try:
                 if exc_type is None and _batch_snapshots is not None:
-                    # No exception - flush to disk
-                    num_weeks = len(_batch_snapshots)
+                    # No exception - flush only the snapshots saved in batch mode
+                    touched: dict[str, dict[str, Any]] = {}
+                    for week_label, metric_name in _batch_touched:
+                        touched.setdefault(week_label, {})[metric_name] = (
+                            _batch_snapshots[week_label][metric_name]
+                        )
+                    num_weeks = len(touched)
                     logger.info(f"[Batch] Flushing {num_weeks} weeks to disk...")
-                    save_snapshots(_batch_snapshots)
+                    save_snapshots(touched)
                     logger.info(
                         f"[Batch] Batch write complete: {num_weeks} weeks "
                         "saved in single write"
@@ -404,14 +432,75 @@ class batch_write_mode:
                 # Always reset batch mode
                 _batch_mode_active = False
                 _batch_snapshots = None
+                _batch_touched.clear()
 
         return False  # Don't suppress exceptions
 
 
+def get_metric_history(
+    metric_names: list[str],
+    start_week: str | None = None,
+    end_week: str | None = None,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Get weekly snapshots of specific metrics for the active query.
+
+    Reads only the requested metrics and week range (cached per metric)
+    instead of the full snapshot history. Snapshots queued by
+    batch_write_mode() are included.
+
+    Args:
+        metric_names: Metrics to read (e.g., ["flow_load", "flow_time"])
+        start_week: First week to include (None = no lower bound)
+        end_week: Last week to include (None = no upper bound)
+
+    Returns:
+        Metric name -> {week_label: metric data}, weeks oldest first
+
+    Example:
+        >>> get_metric_history(["flow_load"], "2025-W43", "2025-W44")
+        {"flow_load": {"2025-W43": {"wip_count": 15, ...}, "2025-W44": {...}}}
+    """
+    empty: dict[str, dict[str, dict[str, Any]]] = {name: {} for name in metric_names}
+    try:
+        profile_id, query_id = _get_active_ids()
+        if not profile_id or not query_id:
+            return empty
+        history = _snapshot_store.get_weeks(
+            profile_id, query_id, metric_names, start_week, end_week
+        )
+    except Exception as e:
+        logger.error(f"Failed to load metric history from database: {e}")
+        return empty
+
+    with _snapshots_lock:
+        batch = _batch_snapshots if _batch_mode_active else None
+        if batch is not None and _batch_touched:
+            for week_label, metric_name in _batch_touched:
+                if metric_name not in history:
+                    continue
+                if (start_week and week_label < start_week) or (
+                    end_week and week_label > end_week
+                ):
+                    continue
+                history[metric_name] = dict(
+                    sorted(
+                        {
+                            **history[metric_name],
+                            week_label: batch[week_label][metric_name],
+                        }.items()
+                    )
+                )
+    return history
+
+
 def get_metric_snapshot(week_label: str, metric_name: str) -> dict[str, Any] | None:
     """
     Get a specific metric snapshot for a specific week.
 
+    The metric's history is cached on first use, so looking up many weeks of
+    the same metric costs a single query.
+
     Args:
         week_label: ISO week label (e.g., "2025-44")
         metric_name: Name of the metric (e.g., "flow_load")
@@ -419,8 +508,7 @@ def get_metric_snapshot(week_label: str, metric_name: str) -> dict[str, Any] | N
     Returns:
         Metric data dict if found, None otherwise
     """
-    snapshots = load_snapshots()
-    return snapshots.get(week_label, {}).get(metric_name)
+    return get_metric_history([metric_name])[metric_name].get(week_label)
 
 
 def get_metric_weekly_values(
@@ -441,11 +529,16 @@ def get_metric_weekly_values(
         >>> get_metric_weekly_values(["2025-43", "2025-44"], "flow_load", "wip_count")
         [15, 12]  # WIP was 15 in week 43, 12 in week 44
     """
-    snapshots = load_snapshots()
+    if not week_labels:
+        return []
+
+    weeks = get_metric_history([metric_name], min(week_labels), max(week_labels))[
+        metric_name
+    ]
     values = []
 
     for week_label in week_labels:
-        metric_data = snapshots.get(week_label, {}).get(metric_name)
+        metric_data = weeks.get(week_label)
         if metric_data and value_key in metric_data:
             values.append(metric_data[value_key])
         else:
@@ -17,7 +17,9 @@ blob)
 9. budget_settings - Profile-level budget configuration
 10. budget_revisions - Budget change event log
 11. task_progress - Runtime task progress
-12. (future tables can be added here)
+12. metric_week_contributions - Issues that fed each week's metric aggregates
+13. jira_metadata_cache - JIRA fields/projects/statuses per instance URL
+14. (future tables can be added here)
 
 Usage:
     from data.migration.schema import create_schema
@@ -31,6 +33,13 @@ import sqlite3
 
 logger = logging.getLogger(__name__)
 
+# Natural key of a changelog entry; bulk upserts use it as ON CONFLICT target
+CHANGELOG_NATURAL_KEY_INDEX_SQL = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_changelog_natural_key "
+    "ON jira_changelog_entries"
+    "(profile_id, query_id, issue_key, change_date, field_name)"
+)
+
 
 def create_schema(conn: sqlite3.Connection) -> None:
     """
@@ -52,7 +61,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
     """
     cursor = conn.cursor()
 
-    logger.info("Creating database schema (12 normalized tables)")
+    logger.info("Creating database schema (13 normalized tables)")
 
     # Table 1: app_state (key-value for application settings)
     cursor.execute("""
@@ -199,7 +208,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
         )
     """)
 
-    # Indexes for jira_changelog_entries (6 indexes per data-model.md)
+    # Indexes for jira_changelog_entries (6 per data-model.md + natural key)
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_changelog_query "
         "ON jira_changelog_entries(profile_id, query_id)"
@@ -225,6 +234,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS idx_changelog_expiry "
         "ON jira_changelog_entries(expires_at)"
     )
+    cursor.execute(CHANGELOG_NATURAL_KEY_INDEX_SQL)
 
     # Table 6: project_statistics (normalized - replaces
     # project_data.statistics array)
@@ -397,9 +407,18 @@ def create_schema(conn: sqlite3.Connection) -> None:
         )
     """)
 
+    # Table 12: metric_week_contributions (incremental metrics recompute)
+    ensure_metric_contributions_table(conn)
+
+    # Table 13: jira_metadata_cache (shared JIRA metadata, not profile data)
+    ensure_jira_metadata_cache_table(conn)
+
+    # Table 14: metrics_result_cache (DORA/Flow calculation results)
+    ensure_metrics_result_cache_table(conn)
+
     conn.commit()
 
-    logger.info("Database schema created successfully (12 tables, 35+ indexes)")
+    logger.info("Database schema created successfully (14 tables, 35+ indexes)")
 
 
 def get_schema_version(conn: sqlite3.Connection) -> str:
@@ -516,3 +535,127 @@ def ensure_budget_velocity_columns(conn: sqlite3.Connection) -> None:
 
     conn.commit()
     logger.info("Budget velocity columns migration completed")
+
+
+def ensure_changelog_natural_key(conn: sqlite3.Connection) -> None:
+    """
+    Ensure jira_changelog_entries has a UNIQUE index on its natural key.
+
+    The natural key is (profile_id, query_id, issue_key, change_date,
+    field_name). Databases created before the index existed may contain
+    duplicates, so those are removed first (keeping the newest row).
+    Safe to call multiple times (idempotent).
+
+    Args:
+        conn: Active database connection
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type='index' AND name='idx_changelog_natural_key'"
+    )
+    if cursor.fetchone():
+        return
+
+    cursor.execute(
+        """
+        DELETE FROM jira_changelog_entries
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM jira_changelog_entries
+            GROUP BY profile_id, query_id, issue_key, change_date, field_name
+        )
+        """
+    )
+    if cursor.rowcount:
+        logger.info(f"Removed {cursor.rowcount} duplicate changelog entries")
+    cursor.execute(CHANGELOG_NATURAL_KEY_INDEX_SQL)
+    conn.commit()
+    logger.info("Changelog natural key index created")
+
+
+def ensure_metric_contributions_table(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the metric_week_contributions table and its issue index exist.
+
+    Each row records that an issue fed one metric family ("flow" or "dora")
+    of a historical week, so a delta refresh can recompute only the weeks its
+    changed issues touch. Safe to call multiple times (idempotent).
+
+    Args:
+        conn: Active database connection
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS metric_week_contributions (
+            profile_id TEXT NOT NULL,
+            query_id TEXT NOT NULL,
+            week_label TEXT NOT NULL,
+            metric_family TEXT NOT NULL,
+            issue_key TEXT NOT NULL,
+            PRIMARY KEY (profile_id, query_id, week_label, metric_family, issue_key),
+            FOREIGN KEY (profile_id, query_id) REFERENCES queries(profile_id, id) ON
+            DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_metric_contributions_issue "
+        "ON metric_week_contributions(profile_id, query_id, issue_key)"
+    )
+
+
+def ensure_jira_metadata_cache_table(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the jira_metadata_cache table exists.
+
+    Holds JIRA instance metadata (fields, projects, issue types, statuses,
+    field options) keyed by JIRA URL, so every JiraMetadataFetcher and every
+    app start can reuse it. Not tied to a profile: profiles pointing at the
+    same JIRA share entries. Safe to call multiple times (idempotent).
+
+    Args:
+        conn: Active database connection
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jira_metadata_cache (
+            jira_url TEXT NOT NULL,
+            api_version TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            resource TEXT NOT NULL DEFAULT '',
+            payload TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (jira_url, api_version, kind, resource)
+        ) WITHOUT ROWID
+    """)
+
+
+def ensure_metrics_result_cache_table(conn: sqlite3.Connection) -> None:
+    """
+    Ensure the metrics_result_cache table and its LRU index exist.
+
+    Holds calculated DORA/Flow metrics keyed by cache key (metric type, date
+    range, field mapping hash). access_seq increases on every read and write;
+    its index lets eviction pick the least recently used rows without sorting
+    the table. Safe to call multiple times (idempotent).
+
+    Args:
+        conn: Active database connection
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS metrics_result_cache (
+            cache_key TEXT PRIMARY KEY,
+            cache_version TEXT NOT NULL,
+            metrics TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            ttl_seconds INTEGER NOT NULL,
+            calculated_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            last_accessed REAL NOT NULL,
+            access_seq INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_metrics_result_cache_lru "
+        "ON metrics_result_cache(access_seq)"
+    )
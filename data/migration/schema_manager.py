@@ -23,13 +23,19 @@ from data.migration.schema import (
     create_schema,
     drop_jira_cache_table,
     ensure_budget_velocity_columns,
+    ensure_changelog_natural_key,
+    ensure_jira_metadata_cache_table,
+    ensure_metric_contributions_table,
+    ensure_metrics_result_cache_table,
     get_schema_version,
     set_schema_version,
 )
 
 logger = logging.getLogger(__name__)
 
-CURRENT_SCHEMA_VERSION = "1.0"
+# 1.1: changelog natural key, metric_week_contributions, jira_metadata_cache,
+#      metrics_result_cache (applied once by the migration branch below)
+CURRENT_SCHEMA_VERSION = "1.1"
 DEFAULT_DB_PATH = Path("profiles/burndown.db")
 
 
@@ -96,6 +102,11 @@ def initialize_schema(db_path: Path = DEFAULT_DB_PATH, force: bool = False) -> b
                 logger.info("Running schema migrations")
                 ensure_budget_velocity_columns(conn)
                 drop_jira_cache_table(conn)
+                ensure_changelog_natural_key(conn)
+                ensure_metric_contributions_table(conn)
+                ensure_jira_metadata_cache_table(conn)
+                ensure_metrics_result_cache_table(conn)
+                conn.commit()
                 set_schema_version(conn, CURRENT_SCHEMA_VERSION)
                 logger.info("Schema migrations completed")
                 return True
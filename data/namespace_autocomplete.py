@@ -1,29 +1,105 @@
 """Autocomplete provider for namespace syntax.
 
 This module provides context-aware autocomplete suggestions for namespace paths
-using JIRA metadata fetched from the configured JIRA instance.
+using JIRA metadata fetched from the configured JIRA instance. Projects, fields
+and statuses are looked up through a ranked prefix index (AutocompleteIndex)
+built once per metadata refresh and shared by all providers.
 
 Reference: specs/namespace-syntax-analysis.md - Intellisense/Autocomplete Support
 """
 
 import logging
+import threading
+from collections.abc import Callable
+from typing import Protocol
 
+from data.autocomplete_index import AutocompleteIndex
 from data.jira.metadata_fetcher import JiraMetadataFetcher
 
 logger = logging.getLogger(__name__)
 
+# Indexes per (JIRA URL, metadata kind) with the list each was built from.
+# Fetchers return the same cached list until the metadata is refreshed, so
+# an identity check decides when to rebuild. Shared by all providers.
+_indexes: dict[tuple[str, str], tuple[list[dict], AutocompleteIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_metadata_index(
+    jira_url: str,
+    kind: str,
+    items: list[dict],
+    get_terms: Callable[[dict], tuple[str, str]],
+) -> AutocompleteIndex:
+    """Return the index for a metadata list, building it once per refresh.
+
+    Args:
+        jira_url: JIRA instance the metadata belongs to
+        kind: Metadata kind ("projects", "fields", "statuses")
+        items: Metadata list as returned by JiraMetadataFetcher
+        get_terms: Returns (id or key, name) for an item
+
+    Returns:
+        AutocompleteIndex over items
+    """
+    key = (jira_url, kind)
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached is not None and cached[0] is items:
+            return cached[1]
+
+    index = AutocompleteIndex(items, get_terms)
+    with _indexes_lock:
+        _indexes[key] = (items, index)
+    logger.debug(f"[Autocomplete] Indexed {len(index)} {kind} for {jira_url}")
+    return index
+
+
+def _project_terms(project: dict) -> tuple[str, str]:
+    return project.get("key", ""), project.get("name", "")
+
+
+def _field_terms(field: dict) -> tuple[str, str]:
+    return field.get("id", ""), field.get("name", "")
+
+
+def _status_terms(status: dict) -> tuple[str, str]:
+    return status.get("name", ""), status.get("name", "")
+
+
+class MetadataSource(Protocol):
+    """JIRA metadata the provider reads (implemented by JiraMetadataFetcher)."""
+
+    jira_url: str
+
+    def fetch_projects(self) -> list[dict]: ...
+
+    def fetch_fields(self) -> list[dict]: ...
+
+    def fetch_statuses(self) -> list[dict]: ...
+
 
 class NamespaceAutocompleteProvider:
     """Provides autocomplete suggestions for namespace syntax based on JIRA metadata."""
 
-    def __init__(self, metadata_fetcher: JiraMetadataFetcher):
+    def __init__(self, metadata_fetcher: MetadataSource):
         """Initialize autocomplete provider.
 
         Args:
-            metadata_fetcher: JiraMetadataFetcher instance for retrieving JIRA metadata
+            metadata_fetcher: Source of JIRA metadata, usually a JiraMetadataFetcher
         """
         self.metadata = metadata_fetcher
 
+    def _index(
+        self,
+        kind: str,
+        items: list[dict],
+        get_terms: Callable[[dict], tuple[str, str]],
+    ) -> AutocompleteIndex:
+        """Shared index for a metadata list of this provider's JIRA instance."""
+        jira_url = getattr(self.metadata, "jira_url", "")
+        return get_metadata_index(jira_url, kind, items, get_terms)
+
     def get_suggestions(
         self, partial_path: str, cursor_position: int | None = None
     ) -> list[dict[str, str]]:
@@ -105,20 +181,19 @@ class NamespaceAutocompleteProvider:
         # Fetch projects from JIRA
         try:
             projects = self.metadata.fetch_projects()
+            index = self._index("projects", projects, _project_terms)
 
-            # Add matching projects
-            for project in projects:
+            # Add matching projects, best matches first
+            for project in index.search(prefix, limit=50):
                 key = project.get("key", "")
                 name = project.get("name", key)
-
-                if key.upper().startswith(prefix.upper()):
-                    suggestions.append(
-                        {
-                            "label": f"{key} - {name}",
-                            "value": f"{key}.",
-                            "description": name,
-                        }
-                    )
+                suggestions.append(
+                    {
+                        "label": f"{key} - {name}",
+                        "value": f"{key}.",
+                        "description": name,
+                    }
+                )
 
             # Limit to 50 results
             return suggestions[:50]
@@ -144,27 +219,28 @@ class NamespaceAutocompleteProvider:
 
         try:
             fields = self.metadata.fetch_fields()
+            index = self._index("fields", fields, _field_terms)
 
-            for field in fields:
+            # Match on field ID or field name, best matches first
+            for field in index.search(field_prefix, limit=50):
                 field_id = field.get("id", "")
                 field_name = field.get("name", field_id)
-                field_type = field.get("schema", {}).get("type", "unknown")
+                # Fetched fields are normalized to "type"; raw ones have a schema
+                field_type = field.get("type") or field.get("schema", {}).get(
+                    "type", "unknown"
+                )
 
-                # Match on field ID or field name
-                if field_id.lower().startswith(field_prefix.lower()) or (
-                    field_name and field_name.lower().startswith(field_prefix.lower())
-                ):
-                    label = field_id
-                    if field_name and field_name != field_id:
-                        label = f"{field_id} ({field_name})"
+                label = field_id
+                if field_name and field_name != field_id:
+                    label = f"{field_id} ({field_name})"
 
-                    suggestions.append(
-                        {
-                            "label": label,
-                            "value": f"{project_filter}.{field_id}",
-                            "description": f"Type: {field_type}",
-                        }
-                    )
+                suggestions.append(
+                    {
+                        "label": label,
+                        "value": f"{project_filter}.{field_id}",
+                        "description": f"Type: {field_type}",
+                    }
+                )
 
             # Limit to 50 results
             return suggestions[:50]
@@ -199,17 +275,17 @@ class NamespaceAutocompleteProvider:
             # Status field - fetch all statuses
             if field_name in ("status", "status.name"):
                 statuses = self.metadata.fetch_statuses()
+                index = self._index("statuses", statuses, _status_terms)
 
-                for status in statuses:
+                for status in index.search(value_prefix, limit=50):
                     status_name = status.get("name", "")
-                    if status_name.lower().startswith(value_prefix.lower()):
-                        suggestions.append(
-                            {
-                                "label": f"{field_path}:{status_name}.DateTime",
-                                "value": f"{field_path}:{status_name}",
-                                "description": f"When status changed to {status_name}",
-                            }
-                        )
+                    suggestions.append(
+                        {
+                            "label": f"{field_path}:{status_name}.DateTime",
+                            "value": f"{field_path}:{status_name}",
+                            "description": f"When status changed to {status_name}",
+                        }
+                    )
 
                 return suggestions[:50]
 
@@ -6,6 +6,7 @@ This module provides tools to improve performance of DORA and Flow metric calcul
 - PerformanceTimer: Context manager for manual timing operations
 - parse_jira_date: Cached date parsing with @lru_cache
 - FieldMappingIndex: O(1) bidirectional field mapping lookups
+- RangeIndex: Sorted timestamps answering weekly [start, end) queries by bisect
 - CalculationContext: Shared filtering with memoization to avoid repeated filtering
 
 Success Criteria:
@@ -17,6 +18,7 @@ Success Criteria:
 
 import logging
 import time
+from bisect import bisect_left
 from collections.abc import Callable
 from datetime import datetime
 from functools import lru_cache, wraps
@@ -277,6 +279,51 @@ class FieldMappingIndex:
         return self._reverse_index.get(jira_field)
 
 
+# ============================================================================
+# Class: RangeIndex
+# ============================================================================
+
+
+class RangeIndex:
+    """
+    Sorted (timestamp, position) index answering half-open range queries.
+
+    Weekly calculations select the items whose timestamp falls in
+    [week_start, week_end) once per week. Sorting the timestamps once turns
+    each week into two bisects instead of a scan over every item.
+
+    Timestamps are compared with naive week bounds, so None and
+    timezone-aware timestamps are never indexed - a per-item
+    ``week_start <= timestamp < week_end`` check could not match them either.
+
+    Args:
+        timestamps: One timestamp (or None) per item, aligned with the items
+
+    Example:
+        >>> index = RangeIndex([issue_date(issue) for issue in issues])
+        >>> week_issues = index.select(issues, week_start, week_end)
+    """
+
+    def __init__(self, timestamps: list[datetime | None]):
+        pairs = sorted(
+            (timestamp, position)
+            for position, timestamp in enumerate(timestamps)
+            if timestamp is not None and timestamp.tzinfo is None
+        )
+        self._times = [pair[0] for pair in pairs]
+        self._positions = [pair[1] for pair in pairs]
+
+    def positions_in(self, start: datetime, end: datetime) -> list[int]:
+        """Return positions with start <= timestamp < end, in original order."""
+        lo = bisect_left(self._times, start)
+        hi = bisect_left(self._times, end)
+        return sorted(self._positions[lo:hi])
+
+    def select(self, items: list, start: datetime, end: datetime) -> list:
+        """Return items whose timestamp falls in [start, end), in original order."""
+        return [items[position] for position in self.positions_in(start, end)]
+
+
 # ============================================================================
 # Class: CalculationContext
 # ============================================================================
@@ -227,6 +227,8 @@ class PersistenceBackend(ABC):
         issue_type: str | None = None,
         project_key: str | None = None,
         limit: int | None = None,
+        columns: list[str] | None = None,
+        lazy: bool = False,
     ) -> list[dict]:
         """
         Query normalized JIRA issues with optional filters.
@@ -239,6 +241,10 @@ class PersistenceBackend(ABC):
             issue_type: Filter by issue type (e.g., "Bug", "Story")
             project_key: Filter by project key (e.g., "KAFKA")
             limit: Maximum number of results
+            columns: Optional jira_issues columns to return (default: all).
+                JSON columns that are not selected are not decoded.
+            lazy: If True, decode JSON columns on first access instead of
+                up front
 
         Returns:
             List of issue dicts with indexed fields + JSON columns
@@ -624,6 +630,7 @@ class PersistenceBackend(ABC):
         start_date: str | None = None,
         end_date: str | None = None,
         limit: int | None = None,
+        metric_names: list[str] | None = None,
     ) -> list[dict]:
         """
         Query normalized metric data points.
@@ -637,6 +644,7 @@ class PersistenceBackend(ABC):
             start_date: ISO week - metrics after this date (e.g., "2025-W48")
             end_date: ISO week - metrics before this date
             limit: Maximum number of data points
+            metric_names: Filter by any of several metrics
 
         Returns:
             List of metric value dicts
@@ -707,6 +715,54 @@ class PersistenceBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_metric_contributions(
+        self,
+        profile_id: str,
+        query_id: str,
+        week_label: str,
+        contributions: dict[str, list[str]],
+    ) -> None:
+        """
+        Replace the issue keys that fed a week's metric families.
+
+        Args:
+            profile_id: Profile ID
+            query_id: Query ID
+            week_label: ISO week label (e.g., "2025-W48")
+            contributions: Metric family ("flow", "dora") -> issue keys
+
+        Example:
+            >>> backend.save_metric_contributions(
+            ...     "kafka", "12w", "2025-W48", {"flow": ["KAFKA-1", "KAFKA-7"]}
+            ... )
+        """
+        pass
+
+    @abstractmethod
+    def get_metric_contributions(
+        self,
+        profile_id: str,
+        query_id: str,
+        issue_keys: list[str] | None = None,
+    ) -> dict[str, set[str]]:
+        """
+        Look up which weeks and metric families issues contributed to.
+
+        Args:
+            profile_id: Profile ID
+            query_id: Query ID
+            issue_keys: Restrict to these issues (default: every recorded week)
+
+        Returns:
+            Week label -> set of metric families
+
+        Example:
+            >>> backend.get_metric_contributions("kafka", "12w", ["KAFKA-7"])
+            {'2025-W48': {'flow'}}
+        """
+        pass
+
     @abstractmethod
     def get_metrics_snapshots(
         self, profile_id: str, query_id: str, metric_type: str, limit: int = 52
@@ -148,6 +148,8 @@ class JSONBackend(PersistenceBackend):
         issue_type: str | None = None,
         project_key: str | None = None,
         limit: int | None = None,
+        columns: list[str] | None = None,
+        lazy: bool = False,
     ) -> list[dict]:
         """NOT SUPPORTED: JSON backend cannot filter issues efficiently."""
         raise NotImplementedError(
@@ -317,6 +319,7 @@ class JSONBackend(PersistenceBackend):
         start_date: str | None = None,
         end_date: str | None = None,
         limit: int | None = None,
+        metric_names: list[str] | None = None,
     ) -> list[dict]:
         """NOT SUPPORTED: JSON backend stores metrics as snapshots array."""
         raise NotImplementedError(
@@ -344,6 +347,29 @@ class JSONBackend(PersistenceBackend):
             "JSONBackend.save_metrics_batch - Not supported, use SQLiteBackend"
         )
 
+    def save_metric_contributions(
+        self,
+        profile_id: str,
+        query_id: str,
+        week_label: str,
+        contributions: dict[str, list[str]],
+    ) -> None:
+        """NOT SUPPORTED: JSON backend has no incremental metrics recompute."""
+        raise NotImplementedError(
+            "JSONBackend.save_metric_contributions - Not supported, use SQLiteBackend"
+        )
+
+    def get_metric_contributions(
+        self,
+        profile_id: str,
+        query_id: str,
+        issue_keys: list[str] | None = None,
+    ) -> dict[str, set[str]]:
+        """NOT SUPPORTED: JSON backend has no incremental metrics recompute."""
+        raise NotImplementedError(
+            "JSONBackend.get_metric_contributions - Not supported, use SQLiteBackend"
+        )
+
     def get_metrics_snapshots(
         self, profile_id: str, query_id: str, metric_type: str, limit: int = 52
     ) -> list[dict]:
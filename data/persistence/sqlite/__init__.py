@@ -1,6 +1,6 @@
 """SQLite backend package - modular mixin-based architecture."""
 
-from data.persistence.sqlite.app_state import AppStateMixin
+from data.persistence.sqlite.app_state import AppStateMixin, app_state_overrides
 from data.persistence.sqlite.backend import SQLiteBackend
 from data.persistence.sqlite.budget import BudgetMixin
 from data.persistence.sqlite.changelog import ChangelogMixin
@@ -22,4 +22,5 @@ __all__ = [
     "StatisticsMixin",
     "MetricsMixin",
     "SQLiteBackend",
+    "app_state_overrides",
 ]
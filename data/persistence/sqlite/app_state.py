@@ -1,9 +1,25 @@
-"""App state operations mixin for SQLiteBackend."""
+"""App state operations mixin for SQLiteBackend.
+
+Reads are served from an in-memory snapshot of the (small) app_state table.
+The snapshot is validated on every read with ``PRAGMA data_version`` on a
+dedicated connection, which changes whenever any other connection - in this
+process or another one - commits to the database. Writes through
+set_app_state update the snapshot directly.
+
+app_state_overrides() pins keys (e.g. active_profile_id) to explicit values
+for the current context only, so batch jobs can work on another profile or
+query without switching the one the UI has active.
+"""
 
 from __future__ import annotations
 
 import logging
+import os
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
 from data.database import get_db_connection
@@ -12,20 +28,120 @@ from data.persistence.sqlite.helpers import retry_on_db_lock
 
 logger = logging.getLogger(__name__)
 
+# app_state keys served from memory in the current context (thread/task)
+_overrides: ContextVar[dict[str, str | None] | None] = ContextVar(
+    "app_state_overrides", default=None
+)
+
+
+@contextmanager
+def app_state_overrides(values: dict[str, str | None]) -> Iterator[None]:
+    """
+    Pin app_state keys to explicit values for the current context.
+
+    Inside the block get_app_state returns these values and set_app_state on
+    one of these keys only changes the pinned value; the app_state table and
+    other threads are untouched. Blocks can be nested.
+
+    Args:
+        values: Keys to pin and their values (None reads as unset)
+    """
+    token = _overrides.set({**(_overrides.get() or {}), **values})
+    try:
+        yield
+    finally:
+        _overrides.reset(token)
+
+
+class AppStateCache:
+    """Snapshot of the app_state table, revalidated by PRAGMA data_version."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._file_id: tuple[int, int] | None = None
+        self._data_version: int | None = None
+        self._values: dict[str, str] | None = None
+
+    def _current_file_id(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def _monitor(self) -> sqlite3.Connection:
+        """Return the version-check connection, reopening it if the file changed."""
+        file_id = self._current_file_id()
+        if self._conn is not None and file_id != self._file_id:
+            self._close_connection()
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                str(self.db_path), timeout=10.0, check_same_thread=False
+            )
+            self._file_id = self._current_file_id()
+        return self._conn
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+        self._conn = None
+        self._file_id = None
+        self._data_version = None
+        self._values = None
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, reloading the snapshot if stale."""
+        with self._lock:
+            conn = self._monitor()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._values is None or data_version != self._data_version:
+                # Version read first: a commit racing the reload bumps it again
+                rows = conn.execute("SELECT key, value FROM app_state").fetchall()
+                self._values = {row[0]: row[1] for row in rows}
+                self._data_version = data_version
+            return self._values.get(key)
+
+    def store(self, key: str, value: str | None) -> None:
+        """Apply a committed write to the snapshot (write-through)."""
+        with self._lock:
+            if self._values is None:
+                return
+            if value is None:
+                self._values.pop(key, None)
+            else:
+                self._values[key] = value
+
+    def close(self) -> None:
+        """Close the version-check connection and drop the snapshot."""
+        with self._lock:
+            self._close_connection()
+
 
 class AppStateMixin:
     """Mixin for application state operations."""
 
     db_path: Path  # Set by composition class (SQLiteBackend)
 
+    def _get_app_state_cache(self) -> AppStateCache:
+        """Return this backend's app_state snapshot (created on first use)."""
+        cache = self.__dict__.get("_app_state_cache")
+        if cache is None or cache.db_path != self.db_path:
+            cache = AppStateCache(self.db_path)
+            self.__dict__["_app_state_cache"] = cache
+        return cache
+
     def get_app_state(self, key: str) -> str | None:
         """Get application state value from app_state table."""
+        overrides = _overrides.get()
+        if overrides is not None and key in overrides:
+            return overrides[key]
         try:
-            with get_db_connection(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM app_state WHERE key = ?", (key,))
-                result = cursor.fetchone()
-                return result["value"] if result else None
+            return self._get_app_state_cache().get(key)
         except (
             sqlite3.Error,
             OSError,
@@ -49,6 +165,11 @@ class AppStateMixin:
             key: State key to set
             value: State value (if None, deletes the key)
         """
+        overrides = _overrides.get()
+        if overrides is not None and key in overrides:
+            overrides[key] = value
+            logger.debug(f"Set app_state override: {key}")
+            return
         try:
             with get_db_connection(self.db_path) as conn:
                 cursor = conn.cursor()
@@ -64,6 +185,7 @@ class AppStateMixin:
                     )
                     logger.debug(f"Set app_state: {key} = {value}")
                 conn.commit()
+            self._get_app_state_cache().store(key, value)
         except (
             sqlite3.Error,
             OSError,
@@ -2,7 +2,7 @@
 SQLite persistence backend implementation using mixin-based architecture.
 
 This module implements PersistenceBackend interface for SQLite storage.
-Provides normalized database operations with connection-per-request pattern.
+Provides normalized database operations over pooled per-thread connections.
 
 Architecture:
 - Uses context managers from data.database module
@@ -11,7 +11,7 @@ Architecture:
   and legacy JSON blob methods (get_jira_cache, get_project_data) for migration
 
 Performance:
-- Connection pooling via get_db_connection()
+- Connection pooling via get_db_connection() (per-thread, pragmas set once)
 - WAL mode for concurrent reads during writes
 - Batch operations with ON CONFLICT DO UPDATE
 - Indexed queries for <50ms response times
@@ -32,6 +32,7 @@ Usage:
 import logging
 from pathlib import Path
 
+from data.database import close_idle_connections
 from data.persistence import PersistenceBackend
 from data.persistence.sqlite.app_state import AppStateMixin
 from data.persistence.sqlite.budget import BudgetMixin
@@ -89,7 +90,7 @@ class SQLiteBackend(
 
         Context managers automatically:
         - Handle transactions (BEGIN/COMMIT/ROLLBACK)
-        - Close connections
+        - Return connections to the pool
         - Ensure proper resource cleanup
 
         Example:
@@ -128,12 +129,15 @@ class SQLiteBackend(
 
     def close(self) -> None:
         """
-        Close database connection (no-op in connection-per-request pattern).
+        Close pooled idle connections to this backend's database.
 
-        NOTE: This is a no-op because SQLiteBackend uses
-        connection-per-request pattern.
-        Each operation opens and closes its own connection via context managers.
-        This prevents connection state issues and enables concurrent access
-        via WAL mode.
+        Each operation borrows a connection from the per-thread pool in
+        data.database via context managers; this releases the idle ones and
+        the app_state cache connection (e.g. before the database file is
+        replaced or removed).
         """
-        logger.debug("close() called but no-op in connection-per-request pattern")
+        closed = close_idle_connections(self.db_path)
+        app_state_cache = self.__dict__.get("_app_state_cache")
+        if app_state_cache is not None:
+            app_state_cache.close()
+        logger.debug(f"close() released {closed} pooled connection(s)")
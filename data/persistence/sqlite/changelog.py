@@ -4,15 +4,34 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from data.database import get_db_connection
 from data.exceptions import PersistenceError
+from data.persistence.sqlite.helpers import (
+    format_throughput,
+    iter_chunks,
+    mark_issue_data_changed,
+)
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_CHANGELOG_SQL = """
+    INSERT INTO jira_changelog_entries (
+        profile_id, query_id, issue_key, change_date, author,
+        field_name, field_type, old_value, new_value, expires_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(profile_id, query_id, issue_key, change_date, field_name)
+    DO UPDATE SET
+        author = excluded.author,
+        old_value = excluded.old_value,
+        new_value = excluded.new_value,
+        expires_at = excluded.expires_at
+"""
+
 
 class ChangelogMixin:
     """Mixin for JIRA changelog operations."""
@@ -78,72 +97,48 @@ class ChangelogMixin:
         entries: list[dict],
         expires_at: datetime,
     ) -> None:
-        """Batch insert normalized changelog entries."""
+        """Batch UPSERT normalized changelog entries.
+
+        Rows are streamed through one executemany() per chunk and resolved
+        against the natural key (issue_key, change_date, field_name) with
+        ON CONFLICT, all inside a single transaction.
+        """
         if not entries:
             return
 
+        expires_iso = expires_at.isoformat()
+        rows = (
+            (
+                profile_id,
+                query_id,
+                entry.get("issue_key"),
+                entry.get("change_date"),
+                entry.get("author"),
+                entry.get("field_name"),
+                entry.get("field_type", "jira"),
+                entry.get("old_value"),
+                entry.get("new_value"),
+                expires_iso,
+            )
+            for entry in entries
+        )
+
         try:
+            started_at = time.perf_counter()
             with get_db_connection(self.db_path) as conn:
+                # ON CONFLICT targets idx_changelog_natural_key, added to older
+                # databases by the schema 1.1 migration
                 cursor = conn.cursor()
 
-                for entry in entries:
-                    cursor.execute(
-                        """
-                        SELECT id FROM jira_changelog_entries
-                        WHERE profile_id = ? AND query_id = ? AND issue_key = ?
-                          AND change_date = ? AND field_name = ?
-                        """,
-                        (
-                            profile_id,
-                            query_id,
-                            entry.get("issue_key"),
-                            entry.get("change_date"),
-                            entry.get("field_name"),
-                        ),
-                    )
-                    existing = cursor.fetchone()
-
-                    if existing:
-                        cursor.execute(
-                            """
-                            UPDATE jira_changelog_entries
-                            SET author = ?, old_value = ?, new_value = ?, expires_at = ?
-                            WHERE id = ?
-                            """,
-                            (
-                                entry.get("author"),
-                                entry.get("old_value"),
-                                entry.get("new_value"),
-                                expires_at.isoformat(),
-                                existing["id"],
-                            ),
-                        )
-                    else:
-                        cursor.execute(
-                            """
-                            INSERT INTO jira_changelog_entries (
-                                profile_id, query_id, issue_key, change_date, author,
-                                field_name, field_type, old_value, new_value, expires_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                profile_id,
-                                query_id,
-                                entry.get("issue_key"),
-                                entry.get("change_date"),
-                                entry.get("author"),
-                                entry.get("field_name"),
-                                entry.get("field_type", "jira"),
-                                entry.get("old_value"),
-                                entry.get("new_value"),
-                                expires_at.isoformat(),
-                            ),
-                        )
+                for chunk in iter_chunks(rows):
+                    cursor.executemany(_UPSERT_CHANGELOG_SQL, chunk)
 
                 conn.commit()
+                mark_issue_data_changed()
                 logger.info(
                     f"Saved {len(entries)} changelog entries "
-                    f"for {profile_id}/{query_id}"
+                    f"for {profile_id}/{query_id} "
+                    f"{format_throughput(len(entries), started_at)}"
                 )
 
         except (
@@ -6,13 +6,40 @@ This module provides utility functions used across multiple SQLite backend opera
 
 import logging
 import sqlite3
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from functools import wraps
+from itertools import islice
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Rows bound per executemany() call by the bulk upsert paths
+BULK_UPSERT_CHUNK_SIZE = 1000
+
+# Bumped after every committed write to jira_issues or jira_changelog_entries
+_issue_data_lock = threading.Lock()
+_issue_data_generation = 0
+
+
+def mark_issue_data_changed() -> None:
+    """Record a committed write to issues or changelog entries."""
+    global _issue_data_generation
+    with _issue_data_lock:
+        _issue_data_generation += 1
+
+
+def get_issue_data_generation() -> int:
+    """
+    Return a counter that changes whenever issues or changelog rows are written.
+
+    Lets derived caches (e.g. rendered tab content built from jira_issues)
+    key on the issue data state without reading it.
+    """
+    with _issue_data_lock:
+        return _issue_data_generation
+
 
 def extract_nested_field(fields_dict: dict, field_path: str) -> Any:
     """Extract value from nested field path (e.g., 'resolved.resolutiondate').
@@ -42,6 +69,39 @@ def extract_nested_field(fields_dict: dict, field_path: str) -> Any:
         return fields_dict.get(field_path)
 
 
+def iter_chunks(
+    rows: Iterable[tuple], size: int | None = None
+) -> Iterator[list[tuple]]:
+    """Yield lists of at most size rows without materializing the whole input.
+
+    Args:
+        rows: Parameter tuples, typically produced by a generator
+        size: Maximum rows per chunk (default: BULK_UPSERT_CHUNK_SIZE)
+
+    Yields:
+        Consecutive chunks of rows
+    """
+    size = size or BULK_UPSERT_CHUNK_SIZE
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def format_throughput(row_count: int, started_at: float) -> str:
+    """Describe elapsed time and rows/sec since a time.perf_counter() mark.
+
+    Args:
+        row_count: Rows written
+        started_at: time.perf_counter() value taken before the write
+
+    Returns:
+        Text such as "in 0.42s (11905 rows/sec)"
+    """
+    elapsed = time.perf_counter() - started_at
+    rate = row_count / elapsed if elapsed > 0 else float(row_count)
+    return f"in {elapsed:.2f}s ({rate:.0f} rows/sec)"
+
+
 def retry_on_db_lock(max_retries: int = 3, base_delay: float = 0.1):
     """
     Decorator to retry database operations when database is locked.
@@ -0,0 +1,205 @@
+"""Row decoding for jira_issues queries.
+
+jira_issues stores fix_versions, labels, components and custom_fields as JSON
+text. Decoding them (especially the custom_fields blob) dominates the cost of
+get_issues for callers that only read status and dates, so get_issues can:
+
+- project a subset of columns (only selected JSON columns are decoded)
+- return LazyIssueRow objects that decode a JSON column on first access
+
+Rows keep the flat database format, including the "fixVersions" alias of
+"fix_versions" expected by the metrics code.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+# Columns of jira_issues in schema order (see data/migration/schema.py)
+ISSUE_COLUMNS = (
+    "id",
+    "profile_id",
+    "query_id",
+    "cache_key",
+    "issue_key",
+    "summary",
+    "status",
+    "assignee",
+    "issue_type",
+    "priority",
+    "resolution",
+    "created",
+    "updated",
+    "resolved",
+    "points",
+    "project_key",
+    "project_name",
+    "fix_versions",
+    "labels",
+    "components",
+    "custom_fields",
+    "expires_at",
+    "fetched_at",
+)
+
+ISSUE_JSON_COLUMNS = ("fix_versions", "labels", "components", "custom_fields")
+
+# Result keys that are decoded from a differently named column
+_JSON_ALIASES = {"fixVersions": "fix_versions"}
+
+
+def validate_issue_columns(columns: Iterable[str]) -> list[str]:
+    """
+    Validate a column projection for jira_issues.
+
+    Column names are interpolated into SQL, so only known names are accepted.
+
+    Args:
+        columns: Requested column names (duplicates are ignored)
+
+    Returns:
+        Column names in request order
+
+    Raises:
+        ValueError: If a column is unknown or none are requested
+    """
+    selected = list(dict.fromkeys(columns))
+    unknown = [column for column in selected if column not in ISSUE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown jira_issues columns: {unknown}")
+    if not selected:
+        raise ValueError("At least one jira_issues column must be selected")
+    return selected
+
+
+def _decode_json(raw: Any) -> Any:
+    """Decode a stored JSON column (NULL and empty text decode to None)."""
+    return json.loads(raw or "null")
+
+
+def decode_issue_row(row: dict) -> dict:
+    """
+    Decode the JSON columns of a jira_issues row in place.
+
+    Args:
+        row: Row as returned by sqlite3 (converted to dict)
+
+    Returns:
+        The same dict with JSON columns decoded
+    """
+    for column in ISSUE_JSON_COLUMNS:
+        if column in row:
+            row[column] = _decode_json(row[column])
+    if "fix_versions" in row:
+        # Code expects camelCase, database uses snake_case
+        row["fixVersions"] = row["fix_versions"]
+    return row
+
+
+class LazyIssueRow(dict):
+    """
+    Issue row dict that decodes JSON columns on first access.
+
+    Pending columns hold the raw JSON text internally. Every dict API that
+    exposes values (indexing, get, items, values, copy, equality, repr,
+    pickling, json.dumps) decodes first, so callers see the same values as
+    with decode_issue_row. Copies and pickles are plain dicts.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self, row: dict):
+        super().__init__(row)
+        pending = {column for column in ISSUE_JSON_COLUMNS if column in row}
+        if "fix_versions" in pending:
+            dict.__setitem__(self, "fixVersions", row["fix_versions"])
+            pending.add("fixVersions")
+        self._pending = pending
+
+    def _decode(self, key: str) -> None:
+        source = _JSON_ALIASES.get(key, key)
+        value = _decode_json(dict.__getitem__(self, source))
+        if source == "fix_versions":
+            dict.__setitem__(self, "fixVersions", value)
+            self._pending.discard("fixVersions")
+        dict.__setitem__(self, source, value)
+        self._pending.discard(source)
+
+    def _decode_all(self) -> None:
+        while self._pending:
+            self._decode(next(iter(self._pending)))
+
+    def __getitem__(self, key: Any) -> Any:
+        if key in self._pending:
+            self._decode(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self._pending:
+            self._decode(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if key in self._pending:
+            self._decode(key)
+        super().__delitem__(key)
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(row) and {**row} go through
+        # keys() and __getitem__ instead of copying the raw storage
+        return super().__iter__()
+
+    def __eq__(self, other: object) -> bool:
+        self._decode_all()
+        if isinstance(other, LazyIssueRow):
+            other._decode_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self._decode_all()
+        return super().__repr__()
+
+    def __or__(self, other: Any) -> dict:
+        return dict(self) | other
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self),))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        self._decode_all()
+        return super().items()
+
+    def values(self):
+        self._decode_all()
+        return super().values()
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self._pending:
+            self._decode(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple:
+        self._decode_all()
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self._pending:
+            self._decode(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._decode_all()
+        super().update(*args, **kwargs)
@@ -8,7 +8,10 @@ from pathlib import Path
 from typing import Protocol, cast
 
 from data.database import get_db_connection
-from data.persistence.sqlite.helpers import retry_on_db_lock
+from data.persistence.sqlite.helpers import (
+    mark_issue_data_changed,
+    retry_on_db_lock,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,8 @@ class IssuesCacheMixin:
         issue_type: str | None = None,
         project_key: str | None = None,
         limit: int | None = None,
+        columns: list[str] | None = None,
+        lazy: bool = False,
     ) -> list[dict]: ...  # type: ignore[empty-body]
     def save_issues_batch(
         self,
@@ -193,6 +198,8 @@ class IssuesCacheMixin:
                 )
                 changelog_deleted = cursor.rowcount
                 conn.commit()
+            if changelog_deleted:
+                mark_issue_data_changed()
 
             total = issues_deleted + changelog_deleted
             logger.info(
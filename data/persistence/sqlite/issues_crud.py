@@ -5,16 +5,212 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from data.database import get_db_connection
 from data.exceptions import PersistenceError
-from data.persistence.sqlite.helpers import extract_nested_field, retry_on_db_lock
+from data.persistence.sqlite.helpers import (
+    extract_nested_field,
+    format_throughput,
+    iter_chunks,
+    mark_issue_data_changed,
+    retry_on_db_lock,
+)
+from data.persistence.sqlite.issue_rows import (
+    LazyIssueRow,
+    decode_issue_row,
+    validate_issue_columns,
+)
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_ISSUE_SQL = """
+    INSERT INTO jira_issues (
+        profile_id, query_id, cache_key, issue_key, summary,
+        status, assignee, issue_type, priority, resolution,
+        created, updated, resolved, points, project_key,
+        project_name, fix_versions, labels, components,
+        custom_fields, expires_at, fetched_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?
+    )
+    ON CONFLICT(profile_id, query_id, issue_key) DO UPDATE SET
+        summary = excluded.summary,
+        status = excluded.status,
+        assignee = excluded.assignee,
+        issue_type = excluded.issue_type,
+        priority = excluded.priority,
+        resolution = excluded.resolution,
+        updated = excluded.updated,
+        resolved = excluded.resolved,
+        points = excluded.points,
+        fix_versions = excluded.fix_versions,
+        labels = excluded.labels,
+        components = excluded.components,
+        custom_fields = excluded.custom_fields,
+        expires_at = excluded.expires_at,
+        fetched_at = excluded.fetched_at
+"""
+
+
+def _build_issue_row(
+    issue: dict,
+    points_field: str,
+    created_date_field: str,
+    updated_date_field: str,
+    completed_date_field: str,
+) -> tuple:
+    """Extract the per-issue jira_issues columns from API or flat format.
+
+    Returns:
+        (issue_key, summary, status, assignee, issue_type, priority,
+        resolution, created, updated, resolved, points, project_key,
+        project_name, fix_versions, labels, components, custom_fields)
+    """
+    fields_raw = issue.get("fields", {})
+    fields = fields_raw if isinstance(fields_raw, dict) else {}
+    is_flat_issue = not fields
+
+    # RAW LAYER: Save ALL custom fields (immutable)
+    if is_flat_issue:
+        if isinstance(issue.get("custom_fields"), dict):
+            custom_fields_raw = issue.get("custom_fields", {})
+        else:
+            custom_fields_raw = {
+                k: v
+                for k, v in issue.items()
+                if isinstance(k, str) and k.startswith("customfield_")
+            }
+    else:
+        custom_fields_raw = {
+            k: v for k, v in fields.items() if k.startswith("customfield_")
+        }
+    custom_fields_json = json.dumps(custom_fields_raw)
+
+    issue_key = issue.get("key") or issue.get("issue_key")
+    status_value = fields.get("status") if not is_flat_issue else None
+    issue_type_value = fields.get("issuetype") if not is_flat_issue else None
+    priority_value = fields.get("priority") if not is_flat_issue else None
+    resolution_value = fields.get("resolution") if not is_flat_issue else None
+    assignee_value = fields.get("assignee") if not is_flat_issue else None
+    project_value = fields.get("project") if not is_flat_issue else None
+
+    summary = (
+        fields.get("summary", "") if not is_flat_issue else issue.get("summary", "")
+    )
+    status_name = (
+        status_value.get("name", "")
+        if isinstance(status_value, dict)
+        else issue.get("status", "")
+    )
+    assignee_name = (
+        assignee_value.get("displayName")
+        if isinstance(assignee_value, dict)
+        else issue.get("assignee")
+    )
+    issue_type_name = (
+        issue_type_value.get("name", "")
+        if isinstance(issue_type_value, dict)
+        else issue.get("issue_type", "")
+    )
+    priority_name = (
+        priority_value.get("name")
+        if isinstance(priority_value, dict)
+        else issue.get("priority")
+    )
+    resolution_name = (
+        resolution_value.get("name")
+        if isinstance(resolution_value, dict)
+        else issue.get("resolution")
+    )
+    created_value = (
+        extract_nested_field(fields, created_date_field)
+        if not is_flat_issue
+        else issue.get("created")
+    )
+    updated_value = (
+        extract_nested_field(fields, updated_date_field)
+        if not is_flat_issue
+        else issue.get("updated")
+    )
+    resolved_value = (
+        extract_nested_field(fields, completed_date_field)
+        if not is_flat_issue
+        else issue.get("resolved")
+    )
+    project_key = (
+        project_value.get("key", "")
+        if isinstance(project_value, dict)
+        else issue.get("project_key", "")
+    )
+    project_name = (
+        project_value.get("name", "")
+        if isinstance(project_value, dict)
+        else issue.get("project_name", "")
+    )
+
+    fix_versions_value = (
+        fields.get("fixVersions")
+        if not is_flat_issue
+        else issue.get("fix_versions", issue.get("fixVersions"))
+    )
+    labels_value = fields.get("labels") if not is_flat_issue else issue.get("labels")
+    components_value = (
+        fields.get("components") if not is_flat_issue else issue.get("components")
+    )
+
+    # NORMALIZED LAYER: Extract points via configured mapping
+    points = None
+    if points_field and not is_flat_issue:
+        points_raw = fields.get(points_field)
+
+        if points_raw is not None:
+            if isinstance(points_raw, dict):
+                points_raw = points_raw.get("value")
+
+            if points_raw is not None:
+                try:
+                    points = float(points_raw)
+                except ValueError, TypeError:
+                    logger.warning(
+                        "Cannot convert points to float for "
+                        f"{issue.get('key')}: {points_raw}"
+                    )
+                    points = None
+            else:
+                points = None
+    elif is_flat_issue:
+        points_raw = issue.get("points")
+        if points_raw is not None:
+            try:
+                points = float(points_raw)
+            except ValueError, TypeError:
+                points = None
+
+    return (
+        issue_key,
+        summary,
+        status_name,
+        assignee_name,
+        issue_type_name,
+        priority_name,
+        resolution_name,
+        created_value,
+        updated_value,
+        resolved_value,
+        points,
+        project_key,
+        project_name,
+        json.dumps(fix_versions_value),
+        json.dumps(labels_value),
+        json.dumps(components_value),
+        custom_fields_json,
+    )
+
 
 class IssuesCRUDMixin:
     """Mixin for JIRA issues CRUD operations (Create, Read, Update, Delete)."""
@@ -33,15 +229,25 @@ class IssuesCRUDMixin:
         issue_type: str | None = None,
         project_key: str | None = None,
         limit: int | None = None,
+        columns: list[str] | None = None,
+        lazy: bool = False,
     ) -> list[dict]:
-        """Query normalized JIRA issues with optional filters."""
+        """Query normalized JIRA issues with optional filters.
+
+        columns projects the result to those jira_issues columns; JSON columns
+        that are not selected are never decoded. lazy returns LazyIssueRow
+        objects that decode JSON columns on first access.
+        """
+        select_list = ", ".join(validate_issue_columns(columns)) if columns else "*"
+        make_row = LazyIssueRow if lazy else decode_issue_row
         try:
             with get_db_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 # Build dynamic query with filters
                 query = (
-                    "SELECT * FROM jira_issues WHERE profile_id = ? AND query_id = ?"
+                    f"SELECT {select_list} FROM jira_issues "
+                    "WHERE profile_id = ? AND query_id = ?"
                 )
                 params: list[Any] = [profile_id, query_id]
 
@@ -67,29 +273,8 @@ class IssuesCRUDMixin:
                 cursor.execute(query, params)
                 results = cursor.fetchall()
 
-                # Parse JSON fields - return database format (flat structure)
-                issues = []
-                for row in results:
-                    issue = dict(row)
-
-                    # Parse JSON fields
-                    fix_versions_data = json.loads(
-                        issue.get("fix_versions", "null") or "null"
-                    )
-
-                    # Store as both fix_versions AND fixVersions for compatibility
-                    # (code expects camelCase, database uses snake_case)
-                    issue["fix_versions"] = fix_versions_data
-                    issue["fixVersions"] = fix_versions_data
-
-                    issue["labels"] = json.loads(issue.get("labels", "null") or "null")
-                    issue["components"] = json.loads(
-                        issue.get("components", "null") or "null"
-                    )
-                    issue["custom_fields"] = json.loads(
-                        issue.get("custom_fields", "null") or "null"
-                    )
-                    issues.append(issue)
+                # Return database format (flat structure)
+                issues = [make_row(dict(row)) for row in results]
 
                 return issues
 
@@ -115,7 +300,11 @@ class IssuesCRUDMixin:
         issues: list[dict],
         expires_at: datetime,
     ) -> None:
-        """Batch UPSERT normalized issues with two-layer storage."""
+        """Batch UPSERT normalized issues with two-layer storage.
+
+        Rows are built lazily and streamed through one executemany() per
+        chunk inside a single transaction.
+        """
         if not issues:
             return
 
@@ -157,205 +346,36 @@ class IssuesCRUDMixin:
         created_date_field = general_mappings.get("created_date", "created")
         updated_date_field = general_mappings.get("updated_date", "updated")
 
+        expires_iso = expires_at.isoformat()
+        fetched_at = datetime.now(UTC).isoformat()
+        rows = (
+            (
+                profile_id,
+                query_id,
+                cache_key,
+                *_build_issue_row(
+                    issue,
+                    points_field,
+                    created_date_field,
+                    updated_date_field,
+                    completed_date_field,
+                ),
+                expires_iso,
+                fetched_at,
+            )
+            for issue in issues
+        )
+
         try:
+            started_at = time.perf_counter()
             with get_db_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
-                for issue in issues:
-                    fields_raw = issue.get("fields", {})
-                    fields = fields_raw if isinstance(fields_raw, dict) else {}
-                    is_flat_issue = not fields
-
-                    # RAW LAYER: Save ALL custom fields (immutable)
-                    if is_flat_issue:
-                        if isinstance(issue.get("custom_fields"), dict):
-                            custom_fields_raw = issue.get("custom_fields", {})
-                        else:
-                            custom_fields_raw = {
-                                k: v
-                                for k, v in issue.items()
-                                if isinstance(k, str) and k.startswith("customfield_")
-                            }
-                    else:
-                        custom_fields_raw = {
-                            k: v
-                            for k, v in fields.items()
-                            if k.startswith("customfield_")
-                        }
-                    custom_fields_json = json.dumps(custom_fields_raw)
-
-                    issue_key = issue.get("key") or issue.get("issue_key")
-                    status_value = fields.get("status") if not is_flat_issue else None
-                    issue_type_value = (
-                        fields.get("issuetype") if not is_flat_issue else None
-                    )
-                    priority_value = (
-                        fields.get("priority") if not is_flat_issue else None
-                    )
-                    resolution_value = (
-                        fields.get("resolution") if not is_flat_issue else None
-                    )
-                    assignee_value = (
-                        fields.get("assignee") if not is_flat_issue else None
-                    )
-                    project_value = fields.get("project") if not is_flat_issue else None
-
-                    summary = (
-                        fields.get("summary", "")
-                        if not is_flat_issue
-                        else issue.get("summary", "")
-                    )
-                    status_name = (
-                        status_value.get("name", "")
-                        if isinstance(status_value, dict)
-                        else issue.get("status", "")
-                    )
-                    assignee_name = (
-                        assignee_value.get("displayName")
-                        if isinstance(assignee_value, dict)
-                        else issue.get("assignee")
-                    )
-                    issue_type_name = (
-                        issue_type_value.get("name", "")
-                        if isinstance(issue_type_value, dict)
-                        else issue.get("issue_type", "")
-                    )
-                    priority_name = (
-                        priority_value.get("name")
-                        if isinstance(priority_value, dict)
-                        else issue.get("priority")
-                    )
-                    resolution_name = (
-                        resolution_value.get("name")
-                        if isinstance(resolution_value, dict)
-                        else issue.get("resolution")
-                    )
-                    created_value = (
-                        extract_nested_field(fields, created_date_field)
-                        if not is_flat_issue
-                        else issue.get("created")
-                    )
-                    updated_value = (
-                        extract_nested_field(fields, updated_date_field)
-                        if not is_flat_issue
-                        else issue.get("updated")
-                    )
-                    resolved_value = (
-                        extract_nested_field(fields, completed_date_field)
-                        if not is_flat_issue
-                        else issue.get("resolved")
-                    )
-                    project_key = (
-                        project_value.get("key", "")
-                        if isinstance(project_value, dict)
-                        else issue.get("project_key", "")
-                    )
-                    project_name = (
-                        project_value.get("name", "")
-                        if isinstance(project_value, dict)
-                        else issue.get("project_name", "")
-                    )
-
-                    fix_versions_value = (
-                        fields.get("fixVersions")
-                        if not is_flat_issue
-                        else issue.get("fix_versions", issue.get("fixVersions"))
-                    )
-                    labels_value = (
-                        fields.get("labels")
-                        if not is_flat_issue
-                        else issue.get("labels")
-                    )
-                    components_value = (
-                        fields.get("components")
-                        if not is_flat_issue
-                        else issue.get("components")
-                    )
-
-                    # NORMALIZED LAYER: Extract points via configured mapping
-                    points = None
-                    if points_field and not is_flat_issue:
-                        points_raw = fields.get(points_field)
-
-                        if points_raw is not None:
-                            if isinstance(points_raw, dict):
-                                points_raw = points_raw.get("value")
-
-                            if points_raw is not None:
-                                try:
-                                    points = float(points_raw)
-                                except ValueError, TypeError:
-                                    logger.warning(
-                                        "Cannot convert points to float for "
-                                        f"{issue.get('key')}: {points_raw}"
-                                    )
-                                    points = None
-                            else:
-                                points = None
-                    elif is_flat_issue:
-                        points_raw = issue.get("points")
-                        if points_raw is not None:
-                            try:
-                                points = float(points_raw)
-                            except ValueError, TypeError:
-                                points = None
-
-                    cursor.execute(
-                        """
-                        INSERT INTO jira_issues (
-                            profile_id, query_id, cache_key, issue_key, summary,
-                            status, assignee, issue_type, priority, resolution,
-                            created, updated, resolved, points, project_key,
-                            project_name, fix_versions, labels, components,
-                            custom_fields, expires_at, fetched_at
-                        ) VALUES (
-                            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                            ?, ?, ?, ?, ?, ?
-                        )
-                        ON CONFLICT(profile_id, query_id, issue_key) DO UPDATE SET
-                            summary = excluded.summary,
-                            status = excluded.status,
-                            assignee = excluded.assignee,
-                            issue_type = excluded.issue_type,
-                            priority = excluded.priority,
-                            resolution = excluded.resolution,
-                            updated = excluded.updated,
-                            resolved = excluded.resolved,
-                            points = excluded.points,
-                            fix_versions = excluded.fix_versions,
-                            labels = excluded.labels,
-                            components = excluded.components,
-                            custom_fields = excluded.custom_fields,
-                            expires_at = excluded.expires_at,
-                            fetched_at = excluded.fetched_at
-                    """,
-                        (
-                            profile_id,
-                            query_id,
-                            cache_key,
-                            issue_key,
-                            summary,
-                            status_name,
-                            assignee_name,
-                            issue_type_name,
-                            priority_name,
-                            resolution_name,
-                            created_value,
-                            updated_value,
-                            resolved_value,
-                            points,
-                            project_key,
-                            project_name,
-                            json.dumps(fix_versions_value),
-                            json.dumps(labels_value),
-                            json.dumps(components_value),
-                            custom_fields_json,
-                            expires_at.isoformat(),
-                            datetime.now(UTC).isoformat(),
-                        ),
-                    )
+                for chunk in iter_chunks(rows):
+                    cursor.executemany(_UPSERT_ISSUE_SQL, chunk)
 
                 conn.commit()
+                mark_issue_data_changed()
 
                 points_configured = (
                     f" (points_field: {points_field})"
@@ -363,7 +383,8 @@ class IssuesCRUDMixin:
                     else " (no points mapping)"
                 )
                 logger.info(
-                    f"Saved {len(issues)} issues for {profile_id}/{query_id}"
+                    f"Saved {len(issues)} issues for {profile_id}/{query_id} "
+                    f"{format_throughput(len(issues), started_at)}"
                     f"{points_configured}"
                 )
 
@@ -391,6 +412,8 @@ class IssuesCRUDMixin:
                 )
                 deleted_count = cursor.rowcount
                 conn.commit()
+                if deleted_count:
+                    mark_issue_data_changed()
                 logger.info(f"Deleted {deleted_count} expired issues")
                 return deleted_count
         except (
@@ -507,6 +530,7 @@ class IssuesCRUDMixin:
                     updated_count += 1
 
                 conn.commit()
+                mark_issue_data_changed()
 
                 query_info = f" for query {query_id}" if query_id else ""
                 logger.info(
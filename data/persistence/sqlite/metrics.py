@@ -12,6 +12,9 @@ from data.database import get_db_connection
 
 logger = logging.getLogger(__name__)
 
+# Issue keys bound per IN (...) lookup of metric_week_contributions
+_KEY_BATCH_SIZE = 500
+
 
 class MetricsMixin:
     """Mixin for metrics data operations."""
@@ -27,6 +30,7 @@ class MetricsMixin:
         start_date: str | None = None,
         end_date: str | None = None,
         limit: int | None = None,
+        metric_names: list[str] | None = None,
     ) -> list[dict]:
         """Query normalized metric data points."""
         try:
@@ -42,6 +46,10 @@ class MetricsMixin:
                 if metric_name:
                     query += " AND metric_name = ?"
                     params.append(metric_name)
+                if metric_names:
+                    placeholders = ",".join("?" for _ in metric_names)
+                    query += f" AND metric_name IN ({placeholders})"
+                    params.extend(metric_names)
                 if metric_category:
                     query += " AND metric_category = ?"
                     params.append(metric_category)
@@ -102,6 +110,12 @@ class MetricsMixin:
                     (profile_id, query_id),
                 )
                 deleted_count = cursor.rowcount
+                # Contribution records describe the deleted snapshots
+                cursor.execute(
+                    "DELETE FROM metric_week_contributions "
+                    "WHERE profile_id = ? AND query_id = ?",
+                    (profile_id, query_id),
+                )
                 conn.commit()
                 logger.info(
                     f"Deleted {deleted_count} metrics for {profile_id}/{query_id}"
@@ -187,6 +201,85 @@ class MetricsMixin:
             )
             raise
 
+    def save_metric_contributions(
+        self,
+        profile_id: str,
+        query_id: str,
+        week_label: str,
+        contributions: dict[str, list[str]],
+    ) -> None:
+        """Replace the issue keys recorded for a week's metric families."""
+        try:
+            with get_db_connection(self.db_path) as conn:
+                cursor = conn.cursor()
+                for metric_family, issue_keys in contributions.items():
+                    cursor.execute(
+                        "DELETE FROM metric_week_contributions "
+                        "WHERE profile_id = ? AND query_id = ? "
+                        "AND week_label = ? AND metric_family = ?",
+                        (profile_id, query_id, week_label, metric_family),
+                    )
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO metric_week_contributions "
+                        "(profile_id, query_id, week_label, metric_family, issue_key) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (profile_id, query_id, week_label, metric_family, key)
+                            for key in issue_keys
+                        ],
+                    )
+                conn.commit()
+
+        except Exception as e:
+            logger.error(
+                f"Failed to save metric contributions for {profile_id}/{query_id} "
+                f"week {week_label}: {e}",
+                extra={"error_type": type(e).__name__},
+            )
+            raise
+
+    def get_metric_contributions(
+        self,
+        profile_id: str,
+        query_id: str,
+        issue_keys: list[str] | None = None,
+    ) -> dict[str, set[str]]:
+        """Return week_label -> metric families recorded (optionally for keys)."""
+        try:
+            with get_db_connection(self.db_path) as conn:
+                cursor = conn.cursor()
+                query = (
+                    "SELECT DISTINCT week_label, metric_family "
+                    "FROM metric_week_contributions "
+                    "WHERE profile_id = ? AND query_id = ?"
+                )
+                if issue_keys is None:
+                    cursor.execute(query, (profile_id, query_id))
+                    rows = cursor.fetchall()
+                else:
+                    rows = []
+                    unique_keys = list(dict.fromkeys(issue_keys))
+                    for start in range(0, len(unique_keys), _KEY_BATCH_SIZE):
+                        batch = unique_keys[start : start + _KEY_BATCH_SIZE]
+                        placeholders = ", ".join("?" for _ in batch)
+                        cursor.execute(
+                            f"{query} AND issue_key IN ({placeholders})",
+                            (profile_id, query_id, *batch),
+                        )
+                        rows.extend(cursor.fetchall())
+
+                weeks: dict[str, set[str]] = {}
+                for week_label, metric_family in rows:
+                    weeks.setdefault(week_label, set()).add(metric_family)
+                return weeks
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get metric contributions for {profile_id}/{query_id}: {e}",
+                extra={"error_type": type(e).__name__},
+            )
+            raise
+
     def get_metrics_snapshots(
         self, profile_id: str, query_id: str, metric_type: str, limit: int = 52
     ) -> list[dict]:
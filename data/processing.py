@@ -13,6 +13,7 @@ aggregation point for the data.processing domain.
 Canonical modules (for single-symbol imports within the domain itself):
   data.processing_core            — basic transformations and velocity
   data.processing_rates           — PERT rate calculation
+  data.processing_monte_carlo     — Monte Carlo completion forecast
   data.processing_daily_forecast  — daily burndown / burnup forecasting
   data.processing_averages        — weekly averages and medians
   data.processing_weekly_forecast — weekly PERT forecast
@@ -38,6 +39,7 @@ from data.processing_dashboard import (  # noqa: F401
     calculate_dashboard_metrics,
     calculate_pert_timeline,
 )
+from data.processing_monte_carlo import calculate_monte_carlo_forecast  # noqa: F401
 from data.processing_rates import calculate_rates  # noqa: F401
 from data.processing_statistics import (  # noqa: F401
     calculate_performance_trend,
@@ -48,6 +50,7 @@ from data.processing_weekly_forecast import generate_weekly_forecast  # noqa: F4
 
 __all__ = [
     "calculate_dashboard_metrics",
+    "calculate_monte_carlo_forecast",
     "calculate_performance_trend",
     "calculate_pert_timeline",
     "calculate_rates",
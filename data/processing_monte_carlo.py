@@ -0,0 +1,223 @@
+"""Monte Carlo completion forecasting for the Burndown application.
+
+Complements the PERT forecast in data.processing_rates. Instead of three
+scenario rates, it replays historical weekly throughput many times to build
+a distribution of completion times, from which completion-date percentiles
+and the probability of meeting a deadline are read.
+"""
+
+import math
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from data.schema import DEFAULT_SETTINGS
+from data.types import MonteCarloForecast, MonteCarloSummary, MonteCarloTrackForecast
+from utils.caching import memoize
+
+# 100k trials keep the P95 stable to within a day for typical histories and
+# run in well under a second, so the forecast can be computed inside a callback
+DEFAULT_TRIALS = 100_000
+
+# Fixed seed: the dashboard and the report must show the same percentiles
+MONTE_CARLO_SEED = 42
+
+PERCENTILES = (50, 85, 95)
+
+# Simulated weeks drawn per vectorized step. Most trials finish within a few
+# steps; only still-running trials are carried into the next one.
+_WEEKS_PER_STEP = 13
+
+
+def simulate_completion_weeks(
+    weekly_throughput: np.ndarray | Sequence[float],
+    remaining: float,
+    trials: int = DEFAULT_TRIALS,
+    max_weeks: int = 105,
+    seed: int = MONTE_CARLO_SEED,
+) -> np.ndarray:
+    """
+    Simulate how many weeks the remaining work takes.
+
+    Each trial draws weeks with replacement from the historical throughput
+    until the remaining work is done. The finishing week is interpolated, so
+    results are fractional weeks rather than whole ones.
+
+    Zero weeks are ignored, like in calculate_rates(): they mostly come from
+    filling gaps in the statistics and would otherwise stretch the forecast.
+
+    Args:
+        weekly_throughput: Completed items or points per historical week
+        remaining: Work left to complete (same unit as weekly_throughput)
+        trials: Number of simulated futures
+        max_weeks: Simulation horizon; trials still running after it get inf
+        seed: Random seed for reproducible results
+
+    Returns:
+        Array of length trials with weeks to completion (np.inf past horizon)
+
+    Example:
+        >>> weeks = simulate_completion_weeks([5, 7, 4, 6], remaining=30)
+        >>> float(np.median(weeks))  # about 5.5 weeks
+    """
+    if remaining <= 0:
+        return np.zeros(trials)
+
+    samples = np.asarray(weekly_throughput, dtype=float)
+    samples = samples[np.isfinite(samples) & (samples > 0)]
+    result = np.full(trials, np.inf)
+    if samples.size == 0:
+        return result
+
+    rng = np.random.default_rng(seed)
+    done = np.zeros(trials)
+    active = np.arange(trials)
+
+    for step_start in range(0, max_weeks, _WEEKS_PER_STEP):
+        width = min(_WEEKS_PER_STEP, max_weeks - step_start)
+        draws = rng.choice(samples, size=(active.size, width))
+        cumulative = done[active, None] + np.cumsum(draws, axis=1)
+
+        reached = cumulative >= remaining
+        finished = reached.any(axis=1)
+        rows = np.flatnonzero(finished)
+        week = reached[rows].argmax(axis=1)
+
+        finishing_week = draws[rows, week]
+        before = cumulative[rows, week] - finishing_week
+        result[active[rows]] = step_start + week + (remaining - before) / finishing_week
+
+        done[active] = cumulative[:, -1]
+        active = active[~finished]
+        if active.size == 0:
+            break
+
+    return result
+
+
+def summarize_completion_weeks(
+    weeks: np.ndarray,
+    days_to_deadline: float | None = None,
+    max_days: float = 730,
+) -> MonteCarloSummary:
+    """
+    Reduce simulated completion weeks to percentiles and deadline odds.
+
+    Args:
+        weeks: Output of simulate_completion_weeks()
+        days_to_deadline: Days from forecast start to deadline (None = no deadline)
+        max_days: Forecast cap in days (trials past the horizon count as this)
+
+    Returns:
+        Dictionary with p50_days, p85_days, p95_days, deadline_probability
+        (0-100, None without deadline), and beyond_horizon_pct (share of trials
+        that did not finish within max_days)
+    """
+    days = np.minimum(weeks * 7.0, max_days)
+    p50, p85, p95 = np.percentile(days, PERCENTILES)
+
+    deadline_probability = None
+    if days_to_deadline is not None:
+        # Unclipped: trials past the horizon (inf) never meet a deadline, even
+        # one beyond max_days
+        deadline_probability = float(np.mean(weeks * 7.0 <= days_to_deadline) * 100)
+
+    return {
+        "p50_days": float(p50),
+        "p85_days": float(p85),
+        "p95_days": float(p95),
+        "deadline_probability": deadline_probability,
+        "beyond_horizon_pct": float(np.mean(~np.isfinite(weeks)) * 100),
+    }
+
+
+@memoize(max_age_seconds=300)
+def calculate_monte_carlo_forecast(
+    grouped: pd.DataFrame,
+    remaining_items: float,
+    remaining_points: float,
+    days_to_deadline: float | None = None,
+    trials: int = DEFAULT_TRIALS,
+    performance_settings: dict | None = None,
+) -> MonteCarloForecast:
+    """
+    Monte Carlo completion forecast for items and points.
+
+    Uses the same weekly throughput input as calculate_rates(), so it can be
+    shown next to the PERT forecast.
+
+    Args:
+        grouped: DataFrame with weekly aggregated data
+            (completed_items, completed_points)
+        remaining_items: Items left to complete
+        remaining_points: Points left to complete
+        days_to_deadline: Days from the last statistics date to the deadline
+            (None when no deadline is set)
+        trials: Number of simulated futures
+        performance_settings: Dictionary with performance optimization settings
+            - forecast_max_days: Maximum forecast horizon (default: 730 days)
+
+    Returns:
+        Dictionary with "items" and "points" results (see
+        summarize_completion_weeks(), plus weeks_sampled), each None when there
+        is no throughput history for it, and the number of "trials"
+
+    Example:
+        >>> forecast = calculate_monte_carlo_forecast(grouped, 50, 250, 90)
+        >>> forecast["items"]["p85_days"], forecast["items"]["deadline_probability"]
+    """
+    if performance_settings is None:
+        performance_settings = {
+            "forecast_max_days": DEFAULT_SETTINGS.get("forecast_max_days", 730),
+        }
+    max_days = performance_settings.get("forecast_max_days", 730)
+    max_weeks = math.ceil(max_days / 7)
+
+    forecast: MonteCarloForecast = {"items": None, "points": None, "trials": trials}
+    if grouped is None or len(grouped) == 0:
+        return forecast
+
+    for track, column, remaining in (
+        ("items", "completed_items", remaining_items),
+        ("points", "completed_points", remaining_points),
+    ):
+        if column not in grouped.columns:
+            continue
+        throughput = grouped[column].to_numpy(dtype=float)
+        weeks_sampled = int(np.count_nonzero(throughput > 0))
+        if weeks_sampled == 0:
+            continue
+
+        weeks = simulate_completion_weeks(
+            throughput, remaining or 0, trials=trials, max_weeks=max_weeks
+        )
+        track_forecast: MonteCarloTrackForecast = {
+            **summarize_completion_weeks(weeks, days_to_deadline, max_days),
+            "weeks_sampled": weeks_sampled,
+        }
+        forecast[track] = track_forecast
+
+    return forecast
+
+
+def get_percentile_dates(
+    track_forecast: MonteCarloTrackForecast, start_date: datetime
+) -> dict[str, str]:
+    """
+    Convert a track's percentile days into completion dates.
+
+    Args:
+        track_forecast: forecast["items"] or forecast["points"]
+        start_date: Forecast starting point (last statistics date)
+
+    Returns:
+        Dictionary like {"p50": "2025-03-10", "p85": ..., "p95": ...}
+    """
+    return {
+        f"p{percentile}": (
+            start_date + timedelta(days=track_forecast[f"p{percentile}_days"])
+        ).strftime("%Y-%m-%d")
+        for percentile in PERCENTILES
+    }
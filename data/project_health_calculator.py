@@ -35,6 +35,7 @@ def prepare_dashboard_metrics_for_health(
     recent_velocity_change: float = 0,
     schedule_variance_days: float = 0,
     completion_confidence: float = 50,
+    deadline_probability: float | None = None,
 ) -> dict[str, Any]:
     """Prepare dashboard metrics dictionary for comprehensive health calculation.
 
@@ -49,11 +50,13 @@ def prepare_dashboard_metrics_for_health(
         recent_velocity_change: Recent velocity change percentage
         schedule_variance_days: Days ahead/behind schedule (negative = ahead)
         completion_confidence: Forecast confidence percentage (0-100)
+        deadline_probability: Monte Carlo probability (0-100) of finishing by
+            the deadline; replaces completion_confidence when provided
 
     Returns:
         Dictionary with standardized keys for health calculator
     """
-    return {
+    metrics = {
         "completion_percentage": completion_percentage,
         "current_velocity_items": current_velocity_items,
         "velocity_cv": velocity_cv,
@@ -62,6 +65,9 @@ def prepare_dashboard_metrics_for_health(
         "schedule_variance_days": schedule_variance_days,
         "completion_confidence": completion_confidence,
     }
+    if deadline_probability is not None:
+        metrics["deadline_probability"] = deadline_probability
+    return metrics
 
 
 def calculate_comprehensive_project_health(
@@ -354,7 +360,8 @@ def _calculate_predictability_dimension(
     Signals:
     - Velocity consistency/CV (50 points)
     - Schedule adherence (30 points)
-    - Forecast confidence (20 points)
+    - Forecast confidence (20 points): Monte Carlo deadline probability when
+      available, otherwise the schedule buffer confidence tier
     """
     score = 0
     weight = 0
@@ -386,8 +393,11 @@ def _calculate_predictability_dimension(
         logger.debug(f"[Predictability] Schedule: {schedule_score:.1f}/30 pts")
 
     # Signal 3: Forecast Confidence (20 points)
+    # Simulated deadline probability is preferred over the schedule buffer tiers
     if dashboard_metrics:
-        confidence = dashboard_metrics.get("completion_confidence", 50)
+        confidence = dashboard_metrics.get("deadline_probability")
+        if confidence is None:
+            confidence = dashboard_metrics.get("completion_confidence", 50)
         confidence_score = (confidence / 100) * 20
         score += confidence_score
         weight += 3  # 3% weight contribution
@@ -8,8 +8,18 @@ from data.report.generator import (
     generate_html_report,
     generate_html_report_with_progress,
 )
+from data.report.generator_batch import (
+    ReportJob,
+    ReportJobResult,
+    build_report_filename,
+    generate_reports,
+)
 
 __all__ = [
+    "ReportJob",
+    "ReportJobResult",
+    "build_report_filename",
     "generate_html_report",
     "generate_html_report_with_progress",
+    "generate_reports",
 ]
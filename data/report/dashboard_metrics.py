@@ -12,10 +12,12 @@ from typing import Any
 import pandas as pd
 
 from data.processing import (
+    calculate_monte_carlo_forecast,
     calculate_rates,
     calculate_velocity_from_dataframe,
     compute_weekly_throughput,
 )
+from data.processing_monte_carlo import get_percentile_dates
 from data.project_health_calculator import (
     calculate_comprehensive_project_health,
     prepare_dashboard_metrics_for_health,
@@ -100,7 +102,7 @@ def calculate_dashboard_metrics(
         int(df_windowed["completed_items"].sum()) if not df_windowed.empty else 0
     )
     completed_points = (
-        df_windowed["completed_points"].sum() if not df_windowed.empty else 0
+        float(df_windowed["completed_points"].sum()) if not df_windowed.empty else 0.0
     )
 
     # Get CURRENT remaining from project_scope (same as app)
@@ -484,6 +486,22 @@ def calculate_dashboard_metrics(
         except ValueError:
             pass
 
+    # Monte Carlo forecast from the same weekly throughput as PERT (same as app)
+    monte_carlo = calculate_monte_carlo_forecast(
+        grouped, remaining_items, remaining_points, days_to_deadline
+    )
+    monte_carlo_forecast = (
+        monte_carlo["points"] if pert_time_points else None
+    ) or monte_carlo["items"]
+    deadline_probability = (
+        monte_carlo_forecast["deadline_probability"] if monte_carlo_forecast else None
+    )
+    forecast_confidence_dates = (
+        get_percentile_dates(monte_carlo_forecast, last_date)
+        if monte_carlo_forecast
+        else None
+    )
+
     # Recalculate schedule variance now that forecast is complete
     if pert_days and days_to_deadline:
         # CRITICAL: Preserve sign for health calculation
@@ -526,6 +544,7 @@ def calculate_dashboard_metrics(
             recent_velocity_change=recent_velocity_change,
             schedule_variance_days=schedule_variance_days,  # Updated value
             completion_confidence=completion_confidence,  # Updated value
+            deadline_probability=deadline_probability,
         )
 
         logger.info(
@@ -534,6 +553,7 @@ def calculate_dashboard_metrics(
             f"trend={trend_direction}, recent_change={recent_velocity_change:.2f}, "
             f"schedule_var={schedule_variance_days:.2f}, "
             f"confidence={completion_confidence}, "
+            f"deadline_probability={deadline_probability}, "
             f"scope_change_rate={scope_change_rate:.2f}"
         )
 
@@ -633,4 +653,8 @@ def calculate_dashboard_metrics(
         "forecast_weeks_items": (pert_time_items / 7.0)
         if pert_time_items
         else 0,  # Pass forecast weeks for budget alignment
+        # Monte Carlo percentiles ({"p50", "p85", "p95"} dates) and deadline odds
+        "forecast_confidence_dates": forecast_confidence_dates,
+        "deadline_probability": deadline_probability,
+        "monte_carlo": monte_carlo,
     }
@@ -5,6 +5,7 @@ Part of data/report/generator.py split.
 """
 
 import logging
+from collections.abc import Callable
 
 from data.profile_manager import get_active_profile_and_query_display_names
 from data.query_manager import get_active_profile_id
@@ -20,6 +21,7 @@ def generate_html_report(
     sections: list[str],
     time_period_weeks: int = 12,
     profile_id: str | None = None,
+    progress_callback: Callable[[str], None] | None = None,
 ) -> tuple[str, dict[str, str]]:
     """
     Generate a self-contained HTML report with project metrics snapshot.
@@ -28,6 +30,8 @@ def generate_html_report(
         sections: List of section identifiers to include in report
         time_period_weeks: Number of weeks to analyze (4, 12, 26, or 52)
         profile_id: Profile ID to generate report for (defaults to active profile)
+        progress_callback: Optional callable receiving per-section progress
+            messages with timings
 
     Returns:
         Tuple of (HTML string, metadata dict) where metadata contains:
@@ -62,7 +66,9 @@ def generate_html_report(
     report_data["profile_id"] = profile_id  # Add for DORA metrics
 
     # Calculate all metrics for requested sections
-    metrics = calculate_all_metrics(report_data, sections, time_period_weeks)
+    metrics = calculate_all_metrics(
+        report_data, sections, time_period_weeks, progress_callback
+    )
 
     # Add statistics to metrics for chart generation
     metrics["statistics"] = report_data["statistics"]
@@ -113,7 +119,12 @@ def generate_html_report_with_progress(
 
     try:
         update_report_progress(10, "Loading data...")
-        html, metadata = generate_html_report(sections, time_period_weeks, profile_id)
+        html, metadata = generate_html_report(
+            sections,
+            time_period_weeks,
+            profile_id,
+            progress_callback=lambda message: update_report_progress(50, message),
+        )
         update_report_progress(100, "Report complete")
         return html, metadata
     except Exception as e:
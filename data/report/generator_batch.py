@@ -0,0 +1,273 @@
+"""Batch HTML report generation across profiles and queries.
+
+generate_html_report works on the active profile/query read from app_state.
+Batch jobs pin that state per job with app_state_overrides, so many reports
+can be rendered in a process pool without switching the profile the UI has
+active. Each report is written to an output directory.
+
+CLI:
+    python -m data.report.generator_batch --output-dir reports \\
+        --job kafka:q_a1b2c3d4e5f6 --job default:main --weeks 12 \\
+        --sections burndown flow
+
+    python -m data.report.generator_batch --output-dir reports --jobs jobs.json
+
+where jobs.json holds a list of {"profile_id", "query_id", "weeks",
+"sections"} objects (weeks and sections are optional).
+"""
+
+import argparse
+import json
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from data.metrics_snapshots import clear_snapshots_cache
+from data.persistence.factory import get_backend
+from data.persistence.sqlite import app_state_overrides
+from data.report.generator_assembly import generate_html_report
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SECTIONS = ("burndown",)
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    """One report to generate for an explicit profile and query."""
+
+    profile_id: str
+    query_id: str
+    time_period_weeks: int = 12
+    sections: tuple[str, ...] = DEFAULT_SECTIONS
+
+
+@dataclass(frozen=True)
+class ReportJobResult:
+    """Outcome of a ReportJob: the written file or the error message."""
+
+    job: ReportJob
+    path: Path | None = None
+    size_bytes: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def build_report_filename(
+    metadata: dict,
+    time_period_weeks: int,
+    generated_at: datetime | None = None,
+    job_number: int | None = None,
+) -> str:
+    """
+    Build the download filename of a report.
+
+    The timestamp has one-second resolution and the sections are not part of
+    the name, so batch jobs pass job_number to keep their files apart.
+
+    Args:
+        metadata: Metadata returned by generate_html_report
+        time_period_weeks: Number of weeks in the report
+        generated_at: Timestamp for the name (default: now)
+        job_number: Position of the job in its batch (None outside batches)
+
+    Returns:
+        Filename like "20250106_093000_Kafka_Main_12w.html", or
+        "20250106_093000_Kafka_Main_12w_003.html" with job_number=3
+    """
+    timestamp = (generated_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
+    profile_name = str(metadata["profile_name"]).replace(" ", "_").replace("/", "_")
+    query_name = str(metadata["query_name"]).replace(" ", "_").replace("/", "_")
+    suffix = f"_{job_number:03d}" if job_number is not None else ""
+    return f"{timestamp}_{profile_name}_{query_name}_{time_period_weeks}w{suffix}.html"
+
+
+def generate_report_for_query(
+    profile_id: str,
+    query_id: str,
+    sections: list[str],
+    time_period_weeks: int = 12,
+) -> tuple[str, dict]:
+    """
+    Generate a report for an explicit profile and query.
+
+    The active profile/query in app_state is neither read nor changed.
+
+    Args:
+        profile_id: Profile to report on
+        query_id: Query of that profile
+        sections: Section identifiers to include
+        time_period_weeks: Number of weeks to analyze
+
+    Returns:
+        Tuple of (HTML string, metadata dict) as from generate_html_report
+
+    Raises:
+        ValueError: If the query does not exist or no sections are selected
+    """
+    if not get_backend().get_query(profile_id, query_id):
+        raise ValueError(f"Query '{query_id}' not found in profile '{profile_id}'")
+
+    with app_state_overrides(
+        {"active_profile_id": profile_id, "active_query_id": query_id}
+    ):
+        # Module caches are keyed by the active query; start each job clean
+        clear_snapshots_cache()
+        try:
+            return generate_html_report(sections, time_period_weeks, profile_id)
+        finally:
+            clear_snapshots_cache()
+
+
+def run_report_job(
+    job: ReportJob, output_dir: Path, job_number: int | None = None
+) -> ReportJobResult:
+    """
+    Generate one report and write it to output_dir.
+
+    Top-level so it can be sent to pool workers. Errors are returned in the
+    result instead of raised so one failing job does not stop the batch.
+
+    Args:
+        job: Report to generate
+        output_dir: Directory the HTML file is written to
+        job_number: Position of the job in its batch, added to the filename
+
+    Returns:
+        ReportJobResult with the written path or the error message
+    """
+    try:
+        html, metadata = generate_report_for_query(
+            job.profile_id, job.query_id, list(job.sections), job.time_period_weeks
+        )
+        path = output_dir / build_report_filename(
+            metadata, job.time_period_weeks, job_number=job_number
+        )
+        path.write_text(html, encoding="utf-8")
+    except Exception as e:
+        logger.error(
+            f"[Batch Report] {job.profile_id}/{job.query_id} failed: {e}",
+            exc_info=True,
+        )
+        return ReportJobResult(job=job, error=str(e))
+
+    logger.info(f"[Batch Report] Wrote {path.name} ({len(html):,} bytes)")
+    return ReportJobResult(job=job, path=path, size_bytes=len(html))
+
+
+def generate_reports(
+    jobs: Sequence[ReportJob],
+    output_dir: str | Path,
+    max_workers: int | None = None,
+) -> list[ReportJobResult]:
+    """
+    Generate many reports, in parallel worker processes when useful.
+
+    Args:
+        jobs: Reports to generate
+        output_dir: Directory for the HTML files (created if missing)
+        max_workers: Worker processes (default: CPU count, capped at the
+            number of jobs); 1 runs the jobs in this process
+
+    Returns:
+        One ReportJobResult per job, in job order
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if not jobs:
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    logger.info(f"[Batch Report] Generating {len(jobs)} reports with {workers} workers")
+
+    # Numbered from 1 so jobs finishing in the same second get distinct files
+    job_numbers = range(1, len(jobs) + 1)
+    if workers == 1:
+        return [
+            run_report_job(job, output_path, number)
+            for job, number in zip(jobs, job_numbers, strict=True)
+        ]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(run_report_job, jobs, [output_path] * len(jobs), job_numbers)
+        )
+
+
+def _load_jobs_file(path: str, weeks: int, sections: list[str]) -> list[ReportJob]:
+    """Read jobs from a JSON list of {"profile_id", "query_id", ...} objects."""
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    return [
+        ReportJob(
+            profile_id=entry["profile_id"],
+            query_id=entry["query_id"],
+            time_period_weeks=int(entry.get("weeks", weeks)),
+            sections=tuple(entry.get("sections") or sections),
+        )
+        for entry in entries
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point for batch report generation.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code (0 if every report was written)
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate HTML reports for several profiles and queries"
+    )
+    parser.add_argument("--output-dir", required=True, help="Directory for reports")
+    parser.add_argument(
+        "--job",
+        action="append",
+        default=[],
+        metavar="PROFILE_ID:QUERY_ID",
+        help="Report to generate (repeatable)",
+    )
+    parser.add_argument("--jobs", help="JSON file with a list of jobs")
+    parser.add_argument("--weeks", type=int, default=12, help="Default weeks")
+    parser.add_argument(
+        "--sections",
+        nargs="+",
+        default=list(DEFAULT_SECTIONS),
+        help="Default report sections",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    jobs = []
+    for spec in args.job:
+        profile_id, separator, query_id = spec.partition(":")
+        if not separator or not profile_id or not query_id:
+            parser.error(f"--job expects PROFILE_ID:QUERY_ID, got '{spec}'")
+        jobs.append(ReportJob(profile_id, query_id, args.weeks, tuple(args.sections)))
+    if args.jobs:
+        jobs.extend(_load_jobs_file(args.jobs, args.weeks, args.sections))
+    if not jobs:
+        parser.error("no jobs given (use --job or --jobs)")
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    results = generate_reports(jobs, args.output_dir, args.workers)
+
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        print(f"FAILED {result.job.profile_id}:{result.job.query_id}: {result.error}")
+    print(f"{len(results) - len(failed)} of {len(results)} reports written")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,7 +3,12 @@
 Part of data/report/generator.py split.
 """
 
+import contextvars
 import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -27,51 +32,139 @@ from data.types import MetricsResult
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on concurrently computed report sections
+MAX_SECTION_WORKERS = 5
+
+
+class _SectionRunner:
+    """Runs independent section calculators on a thread pool with timings.
+
+    The calculators only read the shared report_data, so they run
+    concurrently. Each task runs in a copy of the caller's context so
+    explicit profile/query overrides (see app_state_overrides) apply in the
+    worker threads too.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        progress_callback: Callable[[str], None] | None,
+    ) -> None:
+        self._executor = executor
+        self._progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self.timings: dict[str, float] = {}
+
+    def submit(self, name: str, calculator: Callable[..., Any], *args: Any) -> Future:
+        """Schedule calculator(*args) as the section called name."""
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, self._timed, name, calculator, args)
+
+    def _timed(self, name: str, calculator: Callable[..., Any], args: tuple) -> Any:
+        started = time.perf_counter()
+        result = calculator(*args)
+        self.record(name, time.perf_counter() - started)
+        return result
+
+    def record(self, name: str, elapsed: float) -> None:
+        """Record a section timing and report it to the progress callback."""
+        with self._lock:
+            self.timings[name] = elapsed
+            logger.info(f"[Report] {name} metrics calculated in {elapsed:.2f}s")
+            if self._progress_callback is not None:
+                self._progress_callback(f"Calculated {name} metrics ({elapsed:.2f}s)")
+
+
 def calculate_all_metrics(
-    report_data: dict[str, Any], sections: list[str], time_period_weeks: int
+    report_data: dict[str, Any],
+    sections: list[str],
+    time_period_weeks: int,
+    progress_callback: Callable[[str], None] | None = None,
 ) -> dict[str, Any]:
     """
     Calculate all metrics for requested report sections.
 
+    Section calculators that only depend on report_data (bugs, flow, DORA,
+    burndown, scope) run concurrently; the dashboard, budget and summary
+    steps that combine their results run once those are available.
+
     Args:
         report_data: Loaded and filtered report data
         sections: List of section identifiers
         time_period_weeks: Number of weeks in the analysis period
+        progress_callback: Optional callable receiving one message per
+            finished section, including its duration
 
     Returns:
         Dictionary with metrics for each section
     """
-
+    with ThreadPoolExecutor(
+        max_workers=MAX_SECTION_WORKERS, thread_name_prefix="report-section"
+    ) as executor:
+        runner = _SectionRunner(executor, progress_callback)
+        return _calculate_all_metrics(report_data, sections, time_period_weeks, runner)
+
+
+def _calculate_all_metrics(
+    report_data: dict[str, Any],
+    sections: list[str],
+    time_period_weeks: int,
+    runner: _SectionRunner,
+) -> dict[str, Any]:
+    """Body of calculate_all_metrics with independent sections on runner."""
     metrics = {}
 
     # Extract show_points from settings (whether to use points or items for forecasting)
     show_points = report_data["settings"].get("show_points", False)
 
-    # Calculate extended metrics first (needed for comprehensive health calculation)
-    extended_metrics: dict[str, Any] = {}
-
-    # Bug Analysis metrics
+    # Independent sections start right away; burndown and scope are only
+    # collected at the end so they overlap with the dashboard and budget
+    pending: dict[str, Future] = {}
     if "burndown" in sections:
-        extended_metrics["bug_analysis"] = calculate_bug_metrics(
+        pending["bug_analysis"] = runner.submit(
+            "bug analysis",
+            calculate_bug_metrics,
             report_data["jira_issues"],
             report_data["statistics"],
             report_data["settings"],
             report_data["weeks_count"],
         )
-
-    # Flow metrics
     if "flow" in sections:
-        extended_metrics["flow"] = calculate_flow_metrics(
+        pending["flow"] = runner.submit(
+            "flow",
+            calculate_flow_metrics,
             report_data["snapshots"],
             report_data["weeks_count"],
             report_data["week_labels"],  # Pass week labels for consistent filtering
         )
-
-    # DORA metrics
     if "dora" in sections:
-        extended_metrics["dora"] = calculate_dora_metrics(
-            report_data["profile_id"], report_data["weeks_count"]
+        pending["dora"] = runner.submit(
+            "DORA",
+            calculate_dora_metrics,
+            report_data["profile_id"],
+            report_data["weeks_count"],
         )
+    if "burndown" in sections:
+        pending["burndown"] = runner.submit(
+            "burndown",
+            calculate_burndown_metrics,
+            report_data["statistics"],
+            report_data["project_scope"],
+            report_data["weeks_count"],
+        )
+        pending["scope"] = runner.submit(
+            "scope",
+            calculate_scope_metrics,
+            report_data["statistics"],
+            report_data["project_scope"],
+            report_data["weeks_count"],
+        )
+
+    # Extended metrics are needed for the comprehensive health calculation
+    extended_metrics: dict[str, Any] = {}
+    for name in ("bug_analysis", "flow", "dora"):
+        if name in pending:
+            extended_metrics[name] = pending[name].result()
 
     # Budget metrics (always calculated for health score)
 
@@ -81,6 +174,7 @@ def calculate_all_metrics(
 
     # Dashboard metrics (always calculated, shows summary)
     # Pass extended metrics for comprehensive health calculation
+    started = time.perf_counter()
     metrics["dashboard"] = calculate_dashboard_metrics(
         report_data["all_statistics"],  # Use ALL stats for lifetime metrics
         report_data["statistics"],  # Windowed stats for velocity
@@ -90,6 +184,7 @@ def calculate_all_metrics(
         show_points,
         extended_metrics,  # Pass extended metrics for health calculation
     )
+    runner.record("dashboard", time.perf_counter() - started)
 
     # Now calculate budget with velocity from dashboard
     if extended_metrics.get("budget_needed"):
@@ -166,22 +261,14 @@ def calculate_all_metrics(
 
     # Burndown metrics
     if "burndown" in sections:
-        metrics["burndown"] = calculate_burndown_metrics(
-            report_data["statistics"],
-            report_data["project_scope"],
-            report_data["weeks_count"],
-        )
+        metrics["burndown"] = pending["burndown"].result()
 
         # Bug Analysis (already calculated above for health)
         metrics["bug_analysis"] = extended_metrics.get("bug_analysis", {})
 
     # Scope metrics
     if "burndown" in sections:
-        scope_metrics = calculate_scope_metrics(
-            report_data["statistics"],
-            report_data["project_scope"],
-            report_data["weeks_count"],
-        )
+        scope_metrics = pending["scope"].result()
         metrics["scope"] = scope_metrics
         # Add to extended_metrics for health score
         # Include scope_change_rate from dashboard
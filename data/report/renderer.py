@@ -7,6 +7,7 @@ and progress tracking for report generation.
 import json
 import logging
 import sys
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,58 @@ from data.time_period_calculator import format_year_week, get_iso_week
 logger = logging.getLogger(__name__)
 
 
+# Compiled Jinja2 environment per template directory. FileSystemLoader keeps
+# compiled templates and re-checks each file's mtime on get_template, so a
+# cached environment still picks up edited templates.
+_environments: dict[Path, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def _format_int(value: Any) -> str:
+    """Format as integer (no decimals)."""
+    if value is None or isinstance(value, Undefined):
+        return "0"
+    return f"{int(round(value)):,}"
+
+
+def _format_decimal1(value: Any) -> str:
+    """Format with 1 decimal place."""
+    if value is None or isinstance(value, Undefined):
+        return "0.0"
+    return f"{value:.1f}"
+
+
+def _format_decimal2(value: Any) -> str:
+    """Format with 2 decimal places."""
+    if value is None or isinstance(value, Undefined):
+        return "0.00"
+    return f"{value:.2f}"
+
+
+def _get_report_environment() -> Environment:
+    """Return the process-wide Jinja2 environment for report templates."""
+    # Handle PyInstaller frozen executable path
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        template_dir = Path(sys._MEIPASS) / "report_assets"  # type: ignore[attr-defined]
+    else:
+        template_dir = Path(__file__).parent.parent.parent / "report_assets"
+
+    with _environments_lock:
+        env = _environments.get(template_dir)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                # Prevent XSS when rendering JIRA data into HTML reports
+                autoescape=True,
+            )
+            # Add number formatting filters
+            env.filters["int"] = _format_int
+            env.filters["dec1"] = _format_decimal1
+            env.filters["dec2"] = _format_decimal2
+            _environments[template_dir] = env
+    return env
+
+
 def render_template(
     profile_name: str,
     query_name: str,
@@ -43,41 +96,7 @@ def render_template(
     Returns:
         Rendered HTML string
     """
-    # Setup Jinja2 environment with custom filters
-    # Handle PyInstaller frozen executable path
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        template_dir = Path(sys._MEIPASS) / "report_assets"  # type: ignore[attr-defined]
-    else:
-        template_dir = Path(__file__).parent.parent.parent / "report_assets"
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=True,  # Prevent XSS when rendering JIRA data into HTML reports
-    )
-
-    # Add number formatting filters
-    def format_int(value):
-        """Format as integer (no decimals)."""
-        if value is None or isinstance(value, Undefined):
-            return "0"
-        return f"{int(round(value)):,}"
-
-    def format_decimal1(value):
-        """Format with 1 decimal place."""
-        if value is None or isinstance(value, Undefined):
-            return "0.0"
-        return f"{value:.1f}"
-
-    def format_decimal2(value):
-        """Format with 2 decimal places."""
-        if value is None or isinstance(value, Undefined):
-            return "0.00"
-        return f"{value:.2f}"
-
-    env.filters["int"] = format_int
-    env.filters["dec1"] = format_decimal1
-    env.filters["dec2"] = format_decimal2
-
-    template = env.get_template("report_template.html")
+    template = _get_report_environment().get_template("report_template.html")
 
     # Generate timestamp with day of week
     generated_at = datetime.now().strftime("%A, %Y-%m-%d %H:%M:%S")
@@ -1,25 +1,103 @@
 """Utility to embed external CSS/JS dependencies into HTML reports for offline use."""
 
 import base64
+import logging
 import re
 import sys
+import threading
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+_ASSET_FILES = (
+    "bootstrap.min.css",
+    "font-awesome.min.css",
+    "chart.umd.min.js",
+    "chartjs-plugin-annotation.min.js",
+)
+
+# Built bundle per assets directory with the fingerprint it was built from.
+# Reports are generated many times per process (one per profile), and the
+# assets only change with an app update, so the bundle is rebuilt only when a
+# file's mtime or size changes.
+_bundle_cache: dict[Path, tuple[tuple, dict[str, str]]] = {}
+_bundle_lock = threading.Lock()
+
+
+def _get_assets_dir() -> Path:
+    """Return the report_assets directory (PyInstaller aware)."""
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        return Path(sys._MEIPASS) / "report_assets"  # type: ignore[attr-defined]
+    return Path(__file__).parent.parent / "report_assets"
+
+
+def _asset_fingerprint(assets_dir: Path) -> tuple:
+    """
+    Return (name, mtime_ns, size) of every file the bundle is built from.
+
+    Args:
+        assets_dir: report_assets directory
+
+    Returns:
+        Hashable fingerprint; missing files are recorded as None
+    """
+    paths = [assets_dir / name for name in _ASSET_FILES]
+    fonts_dir = assets_dir / "webfonts"
+    if fonts_dir.is_dir():
+        paths.extend(sorted(fonts_dir.iterdir()))
+
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprint.append((path.name, None))
+        else:
+            fingerprint.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
 
 def embed_report_dependencies() -> dict:
     """
-    Read and prepare CSS/JS dependencies for embedding in HTML reports.
+    Return CSS/JS dependencies prepared for embedding in HTML reports.
+
+    The bundle is built once per process and reused until an asset file
+    changes on disk.
 
     Returns:
         dict with keys: 'bootstrap_css', 'chartjs', 'chartjs_annotation',
         'fontawesome_css'
     """
-    # Handle PyInstaller frozen executable path
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        assets_dir = Path(sys._MEIPASS) / "report_assets"  # type: ignore[attr-defined]
-    else:
-        assets_dir = Path(__file__).parent.parent / "report_assets"
+    assets_dir = _get_assets_dir()
+    fingerprint = _asset_fingerprint(assets_dir)
+    with _bundle_lock:
+        cached = _bundle_cache.get(assets_dir)
+        if cached is not None and cached[0] == fingerprint:
+            return dict(cached[1])
+
+        bundle = _build_bundle(assets_dir)
+        _bundle_cache[assets_dir] = (fingerprint, bundle)
+    logger.debug(f"[Report] Built embedded asset bundle from {assets_dir}")
+    return dict(bundle)
+
 
+def clear_report_asset_cache() -> None:
+    """Drop the cached asset bundle (rebuilt on next use)."""
+    with _bundle_lock:
+        _bundle_cache.clear()
+
+
+def _build_bundle(assets_dir: Path) -> dict[str, str]:
+    """
+    Read and prepare CSS/JS dependencies for embedding in HTML reports.
+
+    Args:
+        assets_dir: report_assets directory
+
+    Returns:
+        dict with keys: 'bootstrap_css', 'chartjs', 'chartjs_annotation',
+        'fontawesome_css'
+    """
     # Read CSS files, stripping source map comments (map files not included)
     bootstrap_css = _strip_source_map_comments(
         (assets_dir / "bootstrap.min.css").read_text(encoding="utf-8")
@@ -8,13 +8,21 @@ For each day in sprint:
 - Track current sprint scope (total points including adds/removes)
 - Status distribution (count/points per status)
 
-Reuses existing changelog_processor functions for state transitions.
+Scope membership and status are computed as issue x day NumPy matrices from
+the scope change events and the parsed status transitions, so the daily
+series come from a few array reductions instead of a per-day issue loop.
 """
 
 import logging
-from collections import defaultdict
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+
+from data.status_interval_index import (
+    _parse_entry_epoch,
+    timeline_from_changelog_entries,
+)
 from data.types import SprintSnapshot
 
 logger = logging.getLogger(__name__)
@@ -80,18 +88,14 @@ def calculate_daily_sprint_snapshots(
         return []
 
     # Build issue lookup (handle both 'key' and 'issue_key' formats)
+    sprint_keys = set(current_issues)
     issue_map = {}
     for issue in issues:
         issue_key = issue.get("key") or issue.get("issue_key")
-        if issue_key and issue_key in current_issues:
+        if issue_key and issue_key in sprint_keys:
             issue_map[issue_key] = issue
 
-    # Build changelog lookup by issue key
-    changelog_by_issue = defaultdict(list)
-    for entry in changelog_entries:
-        issue_key = entry.get("issue_key")
-        if issue_key in current_issues:
-            changelog_by_issue[issue_key].append(entry)
+    sprint_issues = list(issue_map.values())
 
     # Track sprint scope changes (issues added/removed during sprint)
     added_issues = sprint_data.get("added_issues", [])
@@ -124,109 +128,176 @@ def calculate_daily_sprint_snapshots(
     # Sort scope timeline by timestamp
     scope_timeline.sort(key=lambda x: x["timestamp"])
 
-    # Generate daily snapshots
-    snapshots = []
+    # Snapshot at midnight of every sprint day
+    days = []
     current_date = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
     end_date = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+    while current_date <= end_date:
+        days.append(current_date)
+        current_date += timedelta(days=1)
 
-    # Track which issues are in scope on each day
-    issues_in_scope = set(current_issues)
-
-    # Apply scope changes before sprint start
-    for change in scope_timeline:
-        if change["timestamp"] < start_dt:
-            if change["action"] == "add":
-                issues_in_scope.add(change["issue_key"])
-            elif change["action"] == "remove":
-                issues_in_scope.discard(change["issue_key"])
+    day_epochs = np.array([day.timestamp() for day in days], dtype=np.float64)
+    day_end_epochs = np.array(
+        [(day + timedelta(days=1)).timestamp() for day in days], dtype=np.float64
+    )
 
-    scope_change_idx = 0
+    # Issue x day matrices of scope membership and status codes
+    in_scope = _scope_matrix(list(issue_map), scope_timeline, day_end_epochs)
+    status_codes, status_labels = _status_matrix(
+        sprint_issues, list(issue_map), changelog_entries, day_epochs
+    )
+    points, as_number = _points_vector(sprint_issues)
+
+    # Count and sum points per (day, status) over in-scope issues
+    n_days, n_statuses = len(days), len(status_labels)
+    rows, day_positions = np.nonzero(in_scope)
+    cells = day_positions * n_statuses + status_codes[rows, day_positions]
+    counts = np.bincount(cells, minlength=n_days * n_statuses).reshape(
+        n_days, n_statuses
+    )
+    point_sums = np.bincount(
+        cells, weights=points[rows], minlength=n_days * n_statuses
+    ).reshape(n_days, n_statuses)
 
-    while current_date <= end_date:
-        # Apply scope changes for this day
-        day_end = current_date + timedelta(days=1)
-        while scope_change_idx < len(scope_timeline):
-            change = scope_timeline[scope_change_idx]
-            if change["timestamp"] >= day_end:
-                break
-
-            if change["action"] == "add":
-                issues_in_scope.add(change["issue_key"])
-            elif change["action"] == "remove":
-                issues_in_scope.discard(change["issue_key"])
-
-            scope_change_idx += 1
-
-        # Calculate metrics for this day
-        completed_points = 0
-        completed_count = 0
-        total_points = 0
-        total_count = 0
-        status_breakdown = defaultdict(lambda: {"count": 0, "points": 0})
-
-        for issue_key in issues_in_scope:
-            issue = issue_map.get(issue_key)
-            if not issue:
-                continue
-
-            # Get issue status at this timestamp
-            issue_changelog = changelog_by_issue.get(issue_key, [])
-            status_at_time = get_status_at_timestamp(
-                issue, current_date, issue_changelog
-            )
+    completed = np.array(
+        [label in flow_end_statuses for label in status_labels], dtype=bool
+    )
+    total_counts = counts.sum(axis=1)
+    total_points = point_sums.sum(axis=1)
+    completed_counts = counts[:, completed].sum(axis=1)
+    completed_points = point_sums[:, completed].sum(axis=1)
 
-            if not status_at_time:
-                # Use current status if no changelog
-                status_at_time = issue.get("status", "Unknown")
-
-            # Get story points from database (normalized column, not custom field)
-            points = issue.get("points", 0) or 0
-
-            # Log issue structure for first issue to debug
-            if total_count == 0:
-                logger.info(f"Sample issue structure - Keys: {list(issue.keys())[:15]}")
-                logger.info(
-                    "Issue has 'points' column: "
-                    f"{'points' in issue}, value: {issue.get('points')}"
-                )
-                if "custom_fields" in issue:
-                    cf = issue.get("custom_fields", {})
-                    sample_cf_keys = (
-                        list(cf.keys())[:5] if isinstance(cf, dict) else "not a dict"
-                    )
-                    logger.info(f"Sample custom_fields keys: {sample_cf_keys}")
-
-            # Update totals
-            total_count += 1
-            total_points += points
-
-            # Update status breakdown
-            status_breakdown[status_at_time]["count"] += 1
-            status_breakdown[status_at_time]["points"] += points
-
-            # Check if completed
-            if status_at_time in flow_end_statuses:
-                completed_count += 1
-                completed_points += points
-
-        # Create snapshot
-        snapshot = {
-            "date": current_date.date().isoformat(),
-            "completed_points": completed_points,
-            "total_scope": total_points,
-            "status_breakdown": dict(status_breakdown),
-            "completed_count": completed_count,
-            "total_count": total_count,
+    snapshots = []
+    for position, day in enumerate(days):
+        status_breakdown = {
+            status_labels[code]: {
+                "count": int(counts[position, code]),
+                "points": as_number(point_sums[position, code]),
+            }
+            for code in np.flatnonzero(counts[position])
         }
-        snapshots.append(snapshot)
-
-        # Move to next day
-        current_date += timedelta(days=1)
+        snapshots.append(
+            {
+                "date": day.date().isoformat(),
+                "completed_points": as_number(completed_points[position]),
+                "total_scope": as_number(total_points[position]),
+                "status_breakdown": status_breakdown,
+                "completed_count": int(completed_counts[position]),
+                "total_count": int(total_counts[position]),
+            }
+        )
 
     logger.info(f"Generated {len(snapshots)} daily snapshots for sprint")
     return snapshots
 
 
+def _scope_matrix(
+    issue_keys: list[str], scope_timeline: list[dict], day_end_epochs: np.ndarray
+) -> np.ndarray:
+    """Return an issue x day bool matrix of sprint membership.
+
+    Every issue starts in scope. A scope change applies from the first day
+    ending after it, and later changes of the same issue override it.
+    """
+    in_scope = np.ones((len(issue_keys), len(day_end_epochs)), dtype=bool)
+    rows = {key: row for row, key in enumerate(issue_keys)}
+    for change in scope_timeline:
+        row = rows.get(change["issue_key"])
+        if row is None:
+            continue
+        first_day = np.searchsorted(
+            day_end_epochs, change["timestamp"].timestamp(), side="right"
+        )
+        in_scope[row, first_day:] = change["action"] == "add"
+    return in_scope
+
+
+def _status_matrix(
+    issues: list[dict],
+    issue_keys: list[str],
+    changelog_entries: list[dict],
+    day_epochs: np.ndarray,
+) -> tuple[np.ndarray, list[str | None]]:
+    """Return an issue x day matrix of status codes and the code labels.
+
+    Follows timeline_from_changelog_entries: the status at midnight is the
+    last non-empty new_value at or before it (the last entry wins on equal
+    timestamps), else the old_value of the earliest entry, else the current
+    status, else "Unknown".
+    """
+    n_issues, n_days = len(issues), len(day_epochs)
+    codes: dict[str | None, int] = {}
+    # Keyed by str | None so entries without issue_key simply miss
+    rows: dict[str | None, int] = {key: row for row, key in enumerate(issue_keys)}
+
+    # Flatten the status changes into event arrays
+    change_rows: list[int] = []
+    change_epochs: list[float] = []
+    change_codes: list[int] = []
+    earliest: dict[int, tuple[float, str | None]] = {}
+    for entry in changelog_entries:
+        row = rows.get(entry.get("issue_key"))
+        if row is None:
+            continue
+        try:
+            change_time = _parse_entry_epoch(entry.get("change_date", ""))
+        except ValueError, AttributeError:
+            # Undated rows still count as the earliest entry
+            change_time = float("-inf")
+        else:
+            to_status = entry.get("new_value")
+            if to_status:
+                change_rows.append(row)
+                change_epochs.append(change_time)
+                change_codes.append(codes.setdefault(to_status, len(codes)))
+        if row not in earliest or change_time < earliest[row][0]:
+            earliest[row] = (change_time, entry.get("old_value"))
+
+    initial_codes = np.empty(n_issues, dtype=np.intp)
+    for row, issue in enumerate(issues):
+        initial = earliest[row][1] if row in earliest else None
+        # An empty current status is kept as is when the key exists
+        status = initial or issue.get("status") or issue.get("status", "Unknown")
+        initial_codes[row] = codes.setdefault(status, len(codes))
+    if not change_rows:
+        return np.repeat(initial_codes[:, None], n_days, axis=1), list(codes)
+
+    # Rank changes by (issue, time, entry order); a change applies from the
+    # first midnight at or after it, and the highest rank per day wins
+    event_rows = np.array(change_rows, dtype=np.intp)
+    event_epochs = np.array(change_epochs, dtype=np.float64)
+    order = np.lexsort((np.arange(len(event_rows)), event_epochs, event_rows))
+    event_rows = event_rows[order]
+    event_codes = np.array(change_codes, dtype=np.intp)[order]
+    first_days = np.searchsorted(day_epochs, event_epochs[order], side="left")
+    applies = first_days < n_days
+
+    latest = np.full(n_issues * n_days, -1, dtype=np.intp)
+    np.maximum.at(
+        latest,
+        event_rows[applies] * n_days + first_days[applies],
+        np.flatnonzero(applies),
+    )
+    latest = np.maximum.accumulate(latest.reshape(n_issues, n_days), axis=1)
+
+    status_codes = np.where(
+        latest >= 0, event_codes[np.maximum(latest, 0)], initial_codes[:, None]
+    )
+    return status_codes, list(codes)
+
+
+def _points_vector(issues: list[dict]) -> tuple[np.ndarray, Callable]:
+    """Return story points per issue and the converter for summed values.
+
+    Sums are returned as int when every issue has integer points, so the
+    snapshots keep the types the point values had.
+    """
+    values = [issue.get("points", 0) or 0 for issue in issues]
+    integral = all(isinstance(value, int) for value in values)
+    as_number = (lambda value: int(round(value))) if integral else float
+    return np.array(values, dtype=np.float64), as_number
+
+
 def get_status_at_timestamp(
     issue: dict, timestamp: datetime, changelog: list[dict]
 ) -> str | None:
@@ -235,59 +306,13 @@ def get_status_at_timestamp(
     Args:
         issue: JIRA issue dictionary
         timestamp: Datetime to check status at
-        changelog: Issue's changelog entries (sorted chronologically)
+        changelog: Issue's status changelog entries (any order)
 
     Returns:
         Status name at the given timestamp,
             or current status if timestamp is after all changes
     """
-    if not changelog:
-        # No changelog, return current status
-        return issue.get("status")
-
-    # Sort changelog by change_date (database field name)
-    sorted_changelog = sorted(
-        changelog,
-        key=lambda x: datetime.fromisoformat(
-            x.get("change_date", "1970-01-01").replace("Z", "+00:00")
-        ),
-    )
-
-    # Find the last status change before or at the target timestamp
-    last_status = None
-
-    for entry in sorted_changelog:
-        try:
-            entry_time = datetime.fromisoformat(
-                entry.get("change_date", "").replace("Z", "+00:00")
-            )
-            if entry_time.tzinfo is None:
-                entry_time = entry_time.replace(tzinfo=UTC)
-
-            if entry_time > timestamp:
-                # This change happened after our target time
-                break
-
-            # Get the status AFTER this change (database uses 'new_value')
-            to_status = entry.get("new_value")
-            if to_status:
-                last_status = to_status
-        except ValueError, AttributeError:
-            continue
-
-    # If we found a status change before the timestamp, return it
-    if last_status:
-        return last_status
-
-    # Otherwise, check if there's a "from" status in the first entry
-    # (this would be the status before any changes) - database uses 'old_value'
-    if sorted_changelog:
-        first_from = sorted_changelog[0].get("old_value")
-        if first_from:
-            return first_from
-
-    # Fallback to current status
-    return issue.get("status")
+    return timeline_from_changelog_entries(issue, changelog).status_at(timestamp)
 
 
 def filter_sprint_data(
@@ -0,0 +1,302 @@
+"""
+Status interval index for point-in-time status queries.
+
+Historical WIP and sprint snapshots ask "what status was this issue in at
+time T" for every issue at every week or day. Scanning and re-parsing the
+changelog on each question costs O(histories) per lookup. A StatusTimeline
+parses an issue's status transitions once into sorted epoch seconds with the
+status of each interval, so a lookup is a bisect. StatusIntervalIndex holds
+the timelines of a list of issues and answers the status of all of them at
+one point in time.
+
+Two changelog sources are supported, each with the rules of the lookup it
+replaces:
+- Expanded JIRA changelogs (issue["changelog"]["histories"]), matching
+  changelog_processor.get_status_at_point_in_time: an issue does not exist
+  before its created timestamp, the status is the last change strictly
+  before T (first change wins on equal timestamps) and falls back to the
+  current status.
+- Normalized jira_changelog_entries rows, matching
+  sprint_snapshot_calculator.get_status_at_timestamp: the status is the last
+  non-empty new_value at or before T, else the old_value of the earliest
+  entry, else the current status.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from dateutil import parser
+
+logger = logging.getLogger(__name__)
+
+
+def _to_epoch(value: datetime) -> float:
+    """Epoch seconds of a lookup time (naive datetimes are taken as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _parse_jira_epoch(value: str) -> float:
+    """
+    Epoch seconds of a JIRA timestamp string.
+
+    Naive values are interpreted like datetime.astimezone() does, which is
+    what get_status_at_point_in_time always did.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = parser.parse(value)
+    return parsed.timestamp()
+
+
+def _parse_entry_epoch(value: str) -> float:
+    """Epoch seconds of a jira_changelog_entries change_date (naive is UTC)."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def _current_status(issue: dict) -> str | None:
+    """Current status name of a nested JIRA API or flat database issue."""
+    if "fields" in issue and isinstance(issue.get("fields"), dict):
+        status = issue["fields"].get("status", {})
+        if isinstance(status, dict):
+            return status.get("name", "")
+        return status or ""
+    return issue.get("status", "")
+
+
+@dataclass(slots=True)
+class StatusTimeline:
+    """
+    Sorted status transitions of one issue.
+
+    statuses[i] holds from epochs[i] until epochs[i + 1]. An empty status
+    (and any time before the first transition without an initial status)
+    resolves to the current status.
+    """
+
+    epochs: list[float] = field(default_factory=list)
+    statuses: list[str] = field(default_factory=list)
+    initial: str | None = None
+    current: str | None = None
+    # Epoch the issue was created at (None = existed at every lookup time)
+    created: float | None = None
+    # Whether a transition at exactly the lookup time already applies
+    inclusive: bool = False
+
+    def status_at_epoch(self, epoch: float) -> str | None:
+        """Return the status at a time given in epoch seconds."""
+        if self.created is not None and self.created > epoch:
+            return None
+        if self.inclusive:
+            position = bisect_right(self.epochs, epoch) - 1
+        else:
+            position = bisect_left(self.epochs, epoch) - 1
+        status = self.statuses[position] if position >= 0 else self.initial
+        return status or self.current
+
+    def status_at(self, when: datetime) -> str | None:
+        """
+        Return the status at a point in time.
+
+        Args:
+            when: Lookup time (naive datetimes are taken as UTC)
+
+        Returns:
+            Status name, or None if the issue did not exist yet
+        """
+        return self.status_at_epoch(_to_epoch(when))
+
+
+def timeline_from_issue(issue: dict) -> StatusTimeline | None:
+    """
+    Build the timeline of an issue with an expanded JIRA changelog.
+
+    Args:
+        issue: JIRA issue (nested API or flat database format)
+
+    Returns:
+        StatusTimeline, or None if the issue has no parseable created
+        timestamp or changelog (it never has a status)
+    """
+    fields = issue.get("fields")
+    if "fields" in issue and isinstance(fields, dict):
+        created_str = fields.get("created")
+    else:
+        created_str = issue.get("created")
+    if not created_str:
+        return None
+
+    try:
+        created = _parse_jira_epoch(created_str)
+        changes: list[tuple[float, int, str]] = []
+        histories = (issue.get("changelog") or {}).get("histories") or []
+        for history in histories:
+            created_timestamp = history.get("created")
+            if not created_timestamp:
+                continue
+            change_time = _parse_jira_epoch(created_timestamp)
+            for item in history.get("items", []):
+                if item.get("field") == "status":
+                    changes.append(
+                        (change_time, len(changes), item.get("toString", ""))
+                    )
+    except Exception as e:
+        logger.error(
+            "Error determining status at point in time "
+            f"for issue {issue.get('key', 'UNKNOWN')}: {e}"
+        )
+        return None
+
+    timeline = StatusTimeline(
+        current=_current_status(issue), created=created, inclusive=False
+    )
+    # Keep the first change of every timestamp
+    for change_time, _order, to_status in sorted(changes):
+        if timeline.epochs and timeline.epochs[-1] == change_time:
+            continue
+        timeline.epochs.append(change_time)
+        timeline.statuses.append(to_status)
+    return timeline
+
+
+def timeline_from_changelog_entries(
+    issue: dict, changelog_entries: list[dict]
+) -> StatusTimeline:
+    """
+    Build the timeline of an issue from jira_changelog_entries rows.
+
+    Args:
+        issue: Issue dict (its "status" is the current status)
+        changelog_entries: Status changelog rows of this issue, any order
+
+    Returns:
+        StatusTimeline with inclusive lookups
+    """
+    timeline = StatusTimeline(current=issue.get("status"), inclusive=True)
+    changes: list[tuple[float, str]] = []
+    earliest: tuple[float, str | None] | None = None
+    for entry in changelog_entries:
+        try:
+            change_time = _parse_entry_epoch(entry.get("change_date", ""))
+        except ValueError, AttributeError:
+            # Undated rows still count as the earliest entry
+            change_time = float("-inf")
+        else:
+            to_status = entry.get("new_value")
+            if to_status:
+                changes.append((change_time, to_status))
+        if earliest is None or change_time < earliest[0]:
+            earliest = (change_time, entry.get("old_value"))
+
+    if earliest is not None:
+        timeline.initial = earliest[1]
+    # Stable sort by time; the last change of every timestamp wins
+    changes.sort(key=lambda change: change[0])
+    for change_time, to_status in changes:
+        if timeline.epochs and timeline.epochs[-1] == change_time:
+            timeline.statuses[-1] = to_status
+            continue
+        timeline.epochs.append(change_time)
+        timeline.statuses.append(to_status)
+    return timeline
+
+
+class StatusIntervalIndex:
+    """Status timelines of a list of issues for batch point-in-time lookups."""
+
+    def __init__(self, keys: list[str], timelines: list[StatusTimeline | None]):
+        """
+        Args:
+            keys: Issue keys in issue order
+            timelines: Timeline per issue (None = never has a status)
+        """
+        self.keys = keys
+        self._timelines = timelines
+        self._positions = {key: position for position, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self._timelines)
+
+    @classmethod
+    def from_issues(cls, issues: list[dict]) -> StatusIntervalIndex:
+        """
+        Index issues carrying expanded JIRA changelogs.
+
+        Args:
+            issues: Issues in nested API or flat database format
+
+        Returns:
+            Index in issue order with get_status_at_point_in_time semantics
+        """
+        return cls(
+            [issue.get("key") or issue.get("issue_key") or "" for issue in issues],
+            [timeline_from_issue(issue) for issue in issues],
+        )
+
+    @classmethod
+    def from_changelog_entries(
+        cls, issues: list[dict], changelog_entries: list[dict]
+    ) -> StatusIntervalIndex:
+        """
+        Index issues from normalized status changelog rows.
+
+        Args:
+            issues: Issues with "key" or "issue_key" and current "status"
+            changelog_entries: jira_changelog_entries rows for any issues
+
+        Returns:
+            Index in issue order with get_status_at_timestamp semantics
+        """
+        entries_by_issue: dict[str, list[dict]] = defaultdict(list)
+        for entry in changelog_entries:
+            issue_key = entry.get("issue_key")
+            if issue_key:
+                entries_by_issue[issue_key].append(entry)
+
+        keys = [issue.get("key") or issue.get("issue_key") or "" for issue in issues]
+        timelines: list[StatusTimeline | None] = [
+            timeline_from_changelog_entries(issue, entries_by_issue.get(key, []))
+            for key, issue in zip(keys, issues, strict=True)
+        ]
+        return cls(keys, timelines)
+
+    def status_of(self, issue_key: str, when: datetime) -> str | None:
+        """
+        Return one issue's status at a point in time.
+
+        Args:
+            issue_key: Issue key
+            when: Lookup time (naive datetimes are taken as UTC)
+
+        Returns:
+            Status name, or None if the issue is unknown or did not exist yet
+        """
+        position = self._positions.get(issue_key)
+        if position is None:
+            return None
+        timeline = self._timelines[position]
+        return timeline.status_at(when) if timeline is not None else None
+
+    def statuses_at(self, when: datetime) -> list[str | None]:
+        """
+        Return the status of every issue at a point in time.
+
+        Args:
+            when: Lookup time (naive datetimes are taken as UTC)
+
+        Returns:
+            Status per issue in index order (None = did not exist yet)
+        """
+        epoch = _to_epoch(when)
+        return [
+            timeline.status_at_epoch(epoch) if timeline is not None else None
+            for timeline in self._timelines
+        ]
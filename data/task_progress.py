@@ -4,11 +4,23 @@ This module provides functionality to track and persist progress of long-running
 tasks (like Calculate Metrics) so that progress indicators can be restored
 after page refresh or app restart.
 
-Now uses SQLite database for persistence instead of task_progress.json file.
+The state of a task started in this process lives in memory: workers update
+it and check a threading.Event for cancellation, and the progress bar reads it
+without touching the database. The task_state row only mirrors it, right
+away on state transitions (start, cancel, postprocess, complete, fail) and at
+most every PROGRESS_MIRROR_INTERVAL_SECONDS for progress updates, so progress
+survives a page refresh and orphaned tasks are detected after a restart.
+Without a task started in this process, the database row is read directly.
 """
 
+import copy
+import functools
 import logging
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from typing import Any
 
 from data.persistence.factory import get_backend
 
@@ -17,6 +29,15 @@ logger = logging.getLogger(__name__)
 # Task timeout (if task takes longer than this, assume it failed)
 TASK_TIMEOUT_MINUTES = 30
 
+# Minimum seconds between database mirrors of progress updates
+PROGRESS_MIRROR_INTERVAL_SECONDS = 2.0
+
+# In-memory channel shared by worker threads and UI callbacks
+_state_lock = threading.RLock()
+_cancel_event = threading.Event()
+_live_state: dict | None = None
+_last_mirror = 0.0
+
 
 def _get_backend():
     """Get persistence backend instance."""
@@ -24,6 +45,56 @@ def _get_backend():
     return get_backend()
 
 
+def _locked(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a read-modify-write of the task state under _state_lock."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _state_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _read_state() -> dict | None:
+    """Return the task state: in-memory if live, else the database row.
+
+    The live state is returned as a copy, so writers holding _state_lock can
+    modify it before passing it to _write_state.
+    """
+    if _live_state is not None:
+        return copy.deepcopy(_live_state)
+    return _get_backend().get_task_state()
+
+
+def _write_state(state: dict, mirror: bool = True) -> None:
+    """Make state the live task state and mirror it to the database.
+
+    Args:
+        state: Complete task state
+        mirror: False to skip the database write unless
+            PROGRESS_MIRROR_INTERVAL_SECONDS passed since the last one
+    """
+    global _live_state, _last_mirror
+
+    now = time.monotonic()
+    if mirror or now - _last_mirror >= PROGRESS_MIRROR_INTERVAL_SECONDS:
+        _get_backend().save_task_state(state)
+        _last_mirror = now
+    _live_state = state
+    if state.get("cancelled"):
+        _cancel_event.set()
+
+
+def _clear_state() -> None:
+    """Drop the live task state and its database row."""
+    global _live_state
+
+    _live_state = None
+    _cancel_event.clear()
+    _get_backend().clear_task_state()
+
+
 class TaskProgress:
     """Track progress of long-running background tasks."""
 
@@ -37,8 +108,7 @@ class TaskProgress:
             - Returns False if task is stale/orphaned
         """
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 return False, None
@@ -69,6 +139,24 @@ class TaskProgress:
             logger.error(f"Failed to check task status: {e}")
             return False, None
 
+    @staticmethod
+    def get_task_state() -> dict | None:
+        """Get the current task state for display.
+
+        Served from memory while a task started in this process is live,
+        so progress polling does not hit the database.
+
+        Returns:
+            Copy of the task state dict, or None if there is no task
+        """
+        return _read_state()
+
+    @staticmethod
+    @_locked
+    def clear_task_state() -> None:
+        """Clear the task state from memory and the database."""
+        _clear_state()
+
     @staticmethod
     def is_task_cancelled() -> bool:
         """Check if current task has been cancelled.
@@ -76,9 +164,11 @@ class TaskProgress:
         Returns:
             True if cancel flag is set in task state
         """
+        if _live_state is not None:
+            return _cancel_event.is_set()
+
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 logger.debug("[TaskProgress] is_task_cancelled: state not found")
@@ -95,6 +185,7 @@ class TaskProgress:
             return False
 
     @staticmethod
+    @_locked
     def cancel_task() -> bool:
         """Request cancellation of the running task.
 
@@ -102,8 +193,7 @@ class TaskProgress:
             True if cancellation flag was set successfully
         """
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 return False
@@ -117,7 +207,7 @@ class TaskProgress:
             )
             logger.debug(f"[TaskProgress] State before write: {state}")
 
-            backend.save_task_state(state)
+            _write_state(state)
 
             logger.info(
                 "[TaskProgress] Cancellation flag written to database for task: "
@@ -129,6 +219,7 @@ class TaskProgress:
             return False
 
     @staticmethod
+    @_locked
     def fail_task(task_id: str, error_message: str) -> None:
         """Mark a task as failed (used for cancellations and errors).
 
@@ -137,8 +228,7 @@ class TaskProgress:
             error_message: Error description
         """
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 state = {"task_id": task_id}
@@ -151,7 +241,7 @@ class TaskProgress:
                 "operation_in_progress": False,
             }
 
-            backend.save_task_state(state)
+            _write_state(state)
 
             logger.error(f"Task failed: {error_message}")
         except Exception as e:
@@ -163,6 +253,7 @@ class TaskProgress:
         TaskProgress.fail_task(task_id, error_message)
 
     @staticmethod
+    @_locked
     def start_task(task_id: str, task_name: str, **metadata) -> bool:
         """Mark a task as started and save state.
 
@@ -185,8 +276,7 @@ class TaskProgress:
 
         # Clear any existing state
         try:
-            backend = _get_backend()
-            backend.clear_task_state()
+            _clear_state()
             logger.debug("Cleared previous task progress")
         except Exception as e:
             logger.warning(f"Failed to clear previous progress: {e}")
@@ -227,8 +317,7 @@ class TaskProgress:
             }
 
         try:
-            backend = _get_backend()
-            backend.save_task_state(state)
+            _write_state(state)
             logger.info(f"Task started: {task_name} (ID: {task_id})")
             return True
         except Exception as e:
@@ -236,6 +325,7 @@ class TaskProgress:
             return False
 
     @staticmethod
+    @_locked
     def complete_task(
         task_id: str, message: str = "Task completed", **metadata
     ) -> None:
@@ -248,8 +338,7 @@ class TaskProgress:
                 (e.g., report_file for report generation)
         """
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 logger.warning(f"Task state not found for {task_id}")
@@ -304,7 +393,7 @@ class TaskProgress:
                 "operation_in_progress": False,
             }
 
-            backend.save_task_state(state)
+            _write_state(state)
 
             logger.info(
                 f"Task completed: {task_id} "
@@ -314,6 +403,7 @@ class TaskProgress:
             logger.error(f"Failed to mark task complete: {e}")
 
     @staticmethod
+    @_locked
     def get_active_task() -> dict | None:
         """Get currently active task if any.
 
@@ -321,8 +411,7 @@ class TaskProgress:
             Task state dict if task is in_progress, None otherwise
         """
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 return None
@@ -341,7 +430,7 @@ class TaskProgress:
                     f"{state['task_id']} timed out after {elapsed.total_seconds():.0f}s"
                 )
                 # Clear stale state
-                backend.clear_task_state()
+                _clear_state()
                 return None
 
             return state
@@ -368,6 +457,7 @@ class TaskProgress:
         return None
 
     @staticmethod
+    @_locked
     def update_progress(
         task_id: str,
         phase: str,
@@ -386,8 +476,7 @@ class TaskProgress:
         """
         try:
             # Read current state
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 logger.warning(
@@ -407,6 +496,7 @@ class TaskProgress:
             percent = (current / total * 100) if total > 0 else 0
 
             # Update phase-specific progress
+            phase_changed = state.get("phase") != phase
             progress_key = f"{phase}_progress"
             state[progress_key] = {
                 "current": current,
@@ -422,13 +512,14 @@ class TaskProgress:
             if "ui_state" not in state:
                 state["ui_state"] = {"operation_in_progress": True}
 
-            # Write updated state
-            backend.save_task_state(state)
+            # Mirror to the database on phase changes, else throttled
+            _write_state(state, mirror=phase_changed)
 
         except Exception as e:
             logger.error(f"Failed to update task progress: {e}")
 
     @staticmethod
+    @_locked
     def start_postprocess(task_id: str, message: str) -> None:
         """Start postprocess phase to finalize UI after metrics calculation.
 
@@ -437,8 +528,7 @@ class TaskProgress:
             message: Completion message to show after finalization
         """
         try:
-            backend = _get_backend()
-            state = backend.get_task_state()
+            state = _read_state()
 
             if state is None:
                 logger.warning(
@@ -469,7 +559,7 @@ class TaskProgress:
             if "ui_state" not in state:
                 state["ui_state"] = {"operation_in_progress": True}
 
-            backend.save_task_state(state)
+            _write_state(state)
             logger.info(f"Task {task_id} entering postprocess phase: {message}")
         except Exception as e:
             logger.error(f"Failed to start postprocess phase: {e}")
@@ -62,6 +62,30 @@ class JiraConfig(TypedDict, total=False):
     last_test_success: bool | None
 
 
+class MonteCarloSummary(TypedDict):
+    """Completion-day percentiles and deadline odds from simulated weeks."""
+
+    p50_days: float
+    p85_days: float
+    p95_days: float
+    deadline_probability: float | None
+    beyond_horizon_pct: float
+
+
+class MonteCarloTrackForecast(MonteCarloSummary):
+    """Monte Carlo forecast for one track (items or points)."""
+
+    weeks_sampled: int
+
+
+class MonteCarloForecast(TypedDict):
+    """Monte Carlo completion forecast for items and points."""
+
+    items: MonteCarloTrackForecast | None
+    points: MonteCarloTrackForecast | None
+    trials: int
+
+
 class MetricsResult(TypedDict, total=False):
     """Dashboard/report metrics produced by report calculations."""
 
@@ -76,8 +100,6 @@ class MetricsResult(TypedDict, total=False):
     total_points: float
     items_completion_pct: float
     points_completion_pct: float
-    health_score: int
-    health_status: str
     deadline: str | None
     deadline_months: int | None
     milestone: str | None
@@ -104,6 +126,9 @@ class MetricsResult(TypedDict, total=False):
     completion_confidence: int
     scope_change_rate: float
     forecast_weeks_items: float
+    forecast_confidence_dates: dict[str, str] | None
+    deadline_probability: float | None
+    monte_carlo: MonteCarloForecast
 
 
 class StatusBreakdownEntry(TypedDict):
@@ -28,6 +28,26 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 
+def pytest_addoption(parser):
+    """Add --run-benchmarks for timing comparisons that vary with machine load."""
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="run tests marked benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark-marked tests unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(scope="function")
 def temp_database():
     """
@@ -0,0 +1,71 @@
+"""Tests for the rendered tab cache key and entry sizing."""
+
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from dash import dcc, html
+from plotly.io.json import to_json_plotly
+
+from callbacks.visualization_helpers import tab_cache
+from callbacks.visualization_helpers.tab_cache import (
+    cache_tab_content,
+    estimate_content_size,
+    get_cached_tab,
+    tab_cache_key,
+)
+from data.figure_cache import figure_cache
+from data.persistence.sqlite.helpers import mark_issue_data_changed
+
+
+def _key() -> tuple:
+    return tab_cache_key(
+        "tab-dashboard", 12, False, "desktop", [{"week": 1}], {}, None, None, None
+    )
+
+
+@pytest.fixture(autouse=True)
+def active_ids():
+    figure_cache.clear()
+    with patch.object(tab_cache, "_active_ids", return_value=("p1", "q1")):
+        yield
+    figure_cache.clear()
+
+
+def test_same_inputs_hit() -> None:
+    cache_tab_content(_key(), "content")
+    assert get_cached_tab(_key()) == "content"
+
+
+def test_changed_date_misses() -> None:
+    with patch.object(tab_cache, "date") as mock_date:
+        mock_date.today.return_value = date(2025, 3, 10)
+        cache_tab_content(_key(), "monday")
+        mock_date.today.return_value = date(2025, 3, 11)
+        assert get_cached_tab(_key()) is None
+
+
+def test_issue_data_write_misses() -> None:
+    cache_tab_content(_key(), "before")
+    mark_issue_data_changed()
+    assert get_cached_tab(_key()) is None
+
+
+def test_size_estimate_tracks_serialized_size() -> None:
+    weeks = [f"2025-W{week:02d}" for week in range(1, 53)]
+    figure = go.Figure(
+        [
+            go.Scatter(x=weeks, y=[week * 1.5 for week in range(52)], name="Done"),
+            go.Bar(x=weeks, y=np.arange(52, dtype=np.float64), text=weeks),
+        ]
+    )
+    figure.update_layout(title="Weekly throughput", height=400)
+    content = html.Div(
+        [html.H4("Dashboard"), dcc.Graph(figure=figure), html.P("Forecast " * 20)]
+    )
+
+    serialized = to_json_plotly(content)
+    assert serialized is not None
+    assert 0.5 < estimate_content_size(content) / len(serialized) < 2
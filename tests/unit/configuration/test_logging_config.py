@@ -62,7 +62,11 @@ def test_setup_logging_creates_log_files(temp_log_dir):
 
 def test_rotating_file_handler_rotation(temp_log_dir):
     """Test that log files rotate when they exceed max size."""
-    from configuration.logging_config import setup_logging, shutdown_logging
+    from configuration.logging_config import (
+        flush_logging,
+        setup_logging,
+        shutdown_logging,
+    )
 
     # Set small max_bytes for testing
     max_bytes = 1024  # 1KB
@@ -75,6 +79,9 @@ def test_rotating_file_handler_rotation(temp_log_dir):
     for i in range(20):
         logger.info(f"Test message {i} with some extra padding to increase size" * 5)
 
+    # Records are written asynchronously
+    flush_logging()
+
     # Check if rotation occurred (.log.1 backup file should exist)
     app_log_backup = os.path.join(temp_log_dir, "app.log.1")
 
@@ -92,7 +99,11 @@ def test_rotating_file_handler_rotation(temp_log_dir):
 
 def test_json_formatter_output(temp_log_dir):
     """Test that log entries are formatted as JSON."""
-    from configuration.logging_config import setup_logging, shutdown_logging
+    from configuration.logging_config import (
+        flush_logging,
+        setup_logging,
+        shutdown_logging,
+    )
 
     setup_logging(log_dir=temp_log_dir)
 
@@ -100,6 +111,9 @@ def test_json_formatter_output(temp_log_dir):
     test_message = "Test JSON formatting"
     logger.info(test_message)
 
+    # Records are written asynchronously
+    flush_logging()
+
     # Read the log file
     app_log = os.path.join(temp_log_dir, "app.log")
     with open(app_log) as f:
@@ -124,7 +138,11 @@ def test_json_formatter_output(temp_log_dir):
 
 def test_sensitive_data_filter_redacts_tokens(temp_log_dir):
     """Test that Bearer tokens are automatically redacted."""
-    from configuration.logging_config import setup_logging, shutdown_logging
+    from configuration.logging_config import (
+        flush_logging,
+        setup_logging,
+        shutdown_logging,
+    )
 
     setup_logging(log_dir=temp_log_dir)
 
@@ -132,6 +150,9 @@ def test_sensitive_data_filter_redacts_tokens(temp_log_dir):
     sensitive_message = "Authorization: Bearer abc123def456"
     logger.info(sensitive_message)
 
+    # Records are written asynchronously
+    flush_logging()
+
     # Read the log file
     app_log = os.path.join(temp_log_dir, "app.log")
     with open(app_log) as f:
@@ -147,7 +168,11 @@ def test_sensitive_data_filter_redacts_tokens(temp_log_dir):
 
 def test_sensitive_data_filter_redacts_passwords(temp_log_dir):
     """Test that passwords in JSON are automatically redacted."""
-    from configuration.logging_config import setup_logging, shutdown_logging
+    from configuration.logging_config import (
+        flush_logging,
+        setup_logging,
+        shutdown_logging,
+    )
 
     setup_logging(log_dir=temp_log_dir)
 
@@ -155,6 +180,9 @@ def test_sensitive_data_filter_redacts_passwords(temp_log_dir):
     sensitive_message = '{"username": "admin", "password": "secret123"}'
     logger.info(sensitive_message)
 
+    # Records are written asynchronously
+    flush_logging()
+
     # Read the log file
     app_log = os.path.join(temp_log_dir, "app.log")
     with open(app_log) as f:
@@ -170,7 +198,11 @@ def test_sensitive_data_filter_redacts_passwords(temp_log_dir):
 
 def test_sensitive_data_filter_redacts_api_keys(temp_log_dir):
     """Test that API keys are automatically redacted."""
-    from configuration.logging_config import setup_logging, shutdown_logging
+    from configuration.logging_config import (
+        flush_logging,
+        setup_logging,
+        shutdown_logging,
+    )
 
     setup_logging(log_dir=temp_log_dir)
 
@@ -178,6 +210,9 @@ def test_sensitive_data_filter_redacts_api_keys(temp_log_dir):
     sensitive_message = '{"api_key": "sk-1234567890abcdef", "data": "test"}'
     logger.info(sensitive_message)
 
+    # Records are written asynchronously
+    flush_logging()
+
     # Read the log file
     app_log = os.path.join(temp_log_dir, "app.log")
     with open(app_log) as f:
@@ -297,3 +332,87 @@ def test_sensitive_data_filter_converts_to_string_when_redacting():
     args_tuple = cast(tuple[str], record.args)
     assert "[REDACTED]" in str(args_tuple[0])
     assert "sk-secret123" not in str(args_tuple[0])
+
+
+def test_exception_traceback_survives_queue(temp_log_dir):
+    """Test that exceptions logged through the queue keep their traceback."""
+    from configuration.logging_config import (
+        flush_logging,
+        setup_logging,
+        shutdown_logging,
+    )
+
+    setup_logging(log_dir=temp_log_dir)
+
+    logger = logging.getLogger("test_queue_exception")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.error("Refresh failed for %s", "PROJ", exc_info=True)
+
+    flush_logging()
+    with open(os.path.join(temp_log_dir, "errors.log")) as f:
+        log_entry = json.loads(f.read().strip())
+
+    assert log_entry["message"] == "Refresh failed for PROJ"
+    assert "RuntimeError: boom" in log_entry["exception"]
+    assert log_entry["module"] == "test_logging_config"
+
+    shutdown_logging()
+
+
+def test_setup_logging_twice_replaces_queue_handler(temp_log_dir):
+    """Test that calling setup_logging again leaves one queue handler."""
+    from configuration.logging_config import (
+        AsyncQueueHandler,
+        setup_logging,
+        shutdown_logging,
+    )
+
+    setup_logging(log_dir=temp_log_dir)
+    first = logging.getLogger().handlers[0]
+    assert isinstance(first, AsyncQueueHandler)
+    setup_logging(log_dir=temp_log_dir)
+
+    handlers = logging.getLogger().handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], AsyncQueueHandler)
+    assert handlers[0] is not first
+    assert first.listener is not None
+    assert first.listener._thread is None, "Old listener should be stopped"
+
+    shutdown_logging()
+
+
+def test_rate_limit_filter_drops_bursts_per_logger():
+    """Test that INFO bursts are limited per logger and warnings always pass."""
+    from configuration.logging_config import RateLimitFilter
+
+    rate_filter = RateLimitFilter(max_burst=3, refill_rate=0)
+
+    def record(name, level=logging.INFO, msg="Fetched page"):
+        return logging.LogRecord(name, level, "x.py", 1, msg, None, None)
+
+    passed = [rate_filter.filter(record("data.jira")) for _ in range(5)]
+    assert passed == [True, True, True, False, False]
+
+    # Other loggers and warnings are not affected
+    assert rate_filter.filter(record("ui.dashboard")) is True
+    assert rate_filter.filter(record("data.jira", logging.WARNING)) is True
+
+    # The next passing record reports what was dropped
+    rate_filter.refill_rate = 1000
+    time.sleep(0.01)
+    note = record("data.jira", msg="Fetched page %d")
+    assert rate_filter.filter(note) is True
+    assert "2 earlier messages" in note.getMessage()
+    assert note.getMessage().startswith("Fetched page")
+
+
+def test_sensitive_data_filter_fast_path_keeps_message():
+    """Test that messages without sensitive data are left untouched."""
+    from configuration.logging_config import SensitiveDataFilter
+
+    message = "Calculated 52 weekly snapshots in 0.12s"
+    assert SensitiveDataFilter.redact(message) is message
+    assert SensitiveDataFilter.redact("user john.doe@corp.com") == "user ***@corp.com"
@@ -0,0 +1,229 @@
+"""Tests for the shared JIRA metadata cache against a local stub server."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from data.jira.metadata_cache import (
+    MetadataCache,
+    get_metadata_cache,
+    warm_metadata_cache,
+)
+from data.jira.metadata_fetcher import JiraMetadataFetcher
+from data.namespace_autocomplete import NamespaceAutocompleteProvider
+
+ETAG = '"fields-v1"'
+
+RESPONSES = {
+    "/rest/api/2/field": [
+        {"id": "summary", "name": "Summary", "schema": {"type": "string"}},
+        {"id": "customfield_10002", "name": "Story Points", "custom": True},
+    ],
+    "/rest/api/2/project": [{"key": "DEV", "name": "Development", "id": "1"}],
+    "/rest/api/2/issuetype": [{"id": "1", "name": "Story"}],
+    "/rest/api/2/status": [
+        {"id": "3", "name": "Done", "statusCategory": {"key": "done", "name": "Done"}}
+    ],
+}
+
+
+class _StubJira:
+    """Serves metadata endpoints, with an ETag on /field."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str | None]] = []
+        self.fail = False
+        self._lock = threading.Lock()
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        if_none_match = handler.headers.get("If-None-Match")
+        with self._lock:
+            self.requests.append((handler.path, if_none_match))
+
+        if self.fail or handler.path not in RESPONSES:
+            handler.send_response(500)
+            handler.end_headers()
+            return
+        if handler.path.endswith("/field") and if_none_match == ETAG:
+            handler.send_response(304)
+            handler.end_headers()
+            return
+
+        body = json.dumps(RESPONSES[handler.path]).encode()
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        if handler.path.endswith("/field"):
+            handler.send_header("ETag", ETAG)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def count(self, path: str) -> int:
+        return sum(1 for requested, _ in self.requests if requested == path)
+
+
+@pytest.fixture
+def stub_jira() -> Iterator[tuple[str, _StubJira]]:
+    stub = _StubJira()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            stub.handle(self)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", stub
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def metadata_db(temp_database):
+    """Temporary database behind the shared cache, empty memory layer."""
+    get_metadata_cache().clear_memory()
+    yield temp_database
+    get_metadata_cache().clear_memory()
+
+
+def _cached_payload(jira_url: str, kind: str) -> Any:
+    entry = get_metadata_cache().get(jira_url, "2", kind)
+    assert entry is not None
+    return entry.payload
+
+
+def _age_entry(jira_url: str, kind: str, seconds: float) -> None:
+    entry = get_metadata_cache().get(jira_url, "2", kind)
+    assert entry is not None
+    entry.fetched_at -= seconds
+
+
+class TestSharedMetadataCache:
+    def test_new_fetchers_reuse_cached_metadata(self, stub_jira) -> None:
+        url, stub = stub_jira
+        first = JiraMetadataFetcher(url, "token").fetch_fields()
+        second = JiraMetadataFetcher(url, "token").fetch_fields()
+
+        assert second == first
+        assert first[1] == {
+            "id": "customfield_10002",
+            "name": "Story Points",
+            "type": "string",
+            "custom": True,
+        }
+        assert stub.count("/rest/api/2/field") == 1
+
+    def test_cache_survives_restart(self, stub_jira) -> None:
+        url, stub = stub_jira
+        JiraMetadataFetcher(url, "token").fetch_statuses()
+
+        # New process: memory is empty, the database still has the entry
+        get_metadata_cache().clear_memory()
+        statuses = JiraMetadataFetcher(url, "token").fetch_statuses()
+
+        assert statuses[0]["category_key"] == "done"
+        assert stub.count("/rest/api/2/status") == 1
+
+    def test_refresh_sends_etag_and_keeps_payload_on_304(self, stub_jira) -> None:
+        url, stub = stub_jira
+        fields = JiraMetadataFetcher(url, "token").fetch_fields()
+        _age_entry(url, "fields", 10_000)
+
+        refreshed = JiraMetadataFetcher(url, "token").fetch_fields(force_refresh=True)
+
+        assert refreshed == fields
+        assert stub.requests[-1] == ("/rest/api/2/field", ETAG)
+        entry = get_metadata_cache().get(url, "2", "fields")
+        assert entry is not None
+        assert entry.age() < 60
+
+    def test_stale_entry_served_while_refreshing(self, stub_jira) -> None:
+        url, stub = stub_jira
+        JiraMetadataFetcher(url, "token").fetch_projects()
+        _age_entry(url, "projects", 2 * 60 * 60)
+
+        projects = JiraMetadataFetcher(url, "token").fetch_projects()
+        assert projects == [{"key": "DEV", "name": "Development", "id": "1"}]
+
+        deadline = time.time() + 5
+        while stub.count("/rest/api/2/project") < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert stub.count("/rest/api/2/project") == 2
+
+    def test_request_failure_falls_back_to_cache(self, stub_jira) -> None:
+        url, stub = stub_jira
+        issue_types = JiraMetadataFetcher(url, "token").fetch_issue_types()
+        stub.fail = True
+
+        fetcher = JiraMetadataFetcher(url, "token")
+        assert fetcher.fetch_issue_types(force_refresh=True) == issue_types
+
+    def test_field_options_shared(self, stub_jira) -> None:
+        url, _ = stub_jira
+        get_metadata_cache().put(
+            url, "2", "field_options", ["PROD", "STAGE"], resource="customfield_1"
+        )
+        fetcher = JiraMetadataFetcher(url, "token")
+        assert fetcher.fetch_field_options("customfield_1") == ["PROD", "STAGE"]
+
+    def test_clear_cache_invalidates_shared_entries(self, stub_jira) -> None:
+        url, stub = stub_jira
+        fetcher = JiraMetadataFetcher(url, "token")
+        fetcher.fetch_projects()
+        fetcher.clear_cache()
+
+        assert get_metadata_cache().get(url, "2", "projects") is None
+        JiraMetadataFetcher(url, "token").fetch_projects()
+        assert stub.count("/rest/api/2/project") == 2
+
+    def test_warm_up_fetches_all_endpoints(self, stub_jira) -> None:
+        url, stub = stub_jira
+        counts = warm_metadata_cache(url, "token")
+
+        assert counts == {"fields": 2, "projects": 1, "issue_types": 1, "statuses": 1}
+        assert {path for path, _ in stub.requests} == set(RESPONSES)
+
+        # Fresh after warm-up: a second warm-up makes no requests
+        warm_metadata_cache(url, "token")
+        assert len(stub.requests) == 4
+
+
+def test_memory_only_without_database(monkeypatch) -> None:
+    monkeypatch.setattr("data.jira.metadata_cache._db_path", lambda: None)
+    cache = MetadataCache(ttl_seconds=60)
+
+    entry = cache.put("https://jira.example.com", "2", "fields", [{"id": "x"}])
+
+    assert cache.is_fresh(entry)
+    assert cache.get("https://jira.example.com", "2", "fields") is entry
+
+
+def test_readers_leave_shared_payload_unchanged(stub_jira) -> None:
+    """Fetchers hand out the cached list itself; consumers must not mutate it."""
+    url, _ = stub_jira
+    fetcher = JiraMetadataFetcher(url, "token")
+    fields = fetcher.fetch_fields()
+    statuses = fetcher.fetch_statuses()
+    assert _cached_payload(url, "fields") is fields
+
+    provider = NamespaceAutocompleteProvider(JiraMetadataFetcher(url, "token"))
+    provider.get_suggestions("DEV.story")
+    provider.get_suggestions("DEV.Status:")
+    fetcher.auto_detect_statuses(statuses)
+
+    # The database holds what was fetched; the shared copy must still match
+    in_memory = [_cached_payload(url, kind) for kind in ("fields", "statuses")]
+    get_metadata_cache().clear_memory()
+    assert in_memory == [_cached_payload(url, kind) for kind in ("fields", "statuses")]
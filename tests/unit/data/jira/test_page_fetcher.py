@@ -0,0 +1,230 @@
+"""Tests for concurrent JIRA search pagination against a local stub server."""
+
+import json
+import random
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from data.jira.fetch_utils import fetch_jira_paginated
+from data.jira.page_fetcher import (
+    compute_remaining_offsets,
+    create_jira_session,
+    fetch_pages_concurrently,
+)
+from data.jira.rate_limiter import TokenBucket
+
+TOTAL = 53
+PAGE_SIZE = 5
+
+
+class _StubJira:
+    """Serves a fixed issue list as paginated search results with jitter."""
+
+    def __init__(self, total: int) -> None:
+        self.issues = [{"key": f"DEV-{i}"} for i in range(total)]
+        self.fail_offsets: set[int] = set()
+        self.requested_offsets: list[int] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        query = parse_qs(urlparse(handler.path).query)
+        start_at = int(query["startAt"][0])
+        max_results = int(query["maxResults"][0])
+        with self._lock:
+            self.requested_offsets.append(start_at)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(random.uniform(0.0, 0.03))
+            if start_at in self.fail_offsets:
+                body = {"errorMessages": ["boom"]}
+                status = 400
+            else:
+                body = {
+                    "startAt": start_at,
+                    "maxResults": max_results,
+                    "total": len(self.issues),
+                    "issues": self.issues[start_at : start_at + max_results],
+                }
+                status = 200
+            payload = json.dumps(body).encode()
+            handler.send_response(status)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(payload)))
+            handler.end_headers()
+            handler.wfile.write(payload)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+@pytest.fixture
+def stub_jira() -> Iterator[tuple[_StubJira, str]]:
+    stub = _StubJira(TOTAL)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            stub.handle(self)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stub, f"http://127.0.0.1:{server.server_address[1]}/rest/api/2/search"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _fast_limiter() -> TokenBucket:
+    return TokenBucket(max_tokens=1000, refill_rate=1000.0)
+
+
+def test_compute_remaining_offsets_respects_limit() -> None:
+    assert compute_remaining_offsets(5, 12) == [5, 10]
+    assert compute_remaining_offsets(5, 12, limit=8) == [5]
+    assert compute_remaining_offsets(5, 5) == []
+
+
+def test_pages_are_reassembled_in_offset_order(stub_jira) -> None:
+    stub, url = stub_jira
+    offsets = compute_remaining_offsets(PAGE_SIZE, TOTAL)
+    progress: list[int] = []
+
+    result = fetch_pages_concurrently(
+        create_jira_session(4),
+        url,
+        {},
+        {"jql": "project = DEV", "maxResults": PAGE_SIZE},
+        offsets,
+        max_workers=4,
+        on_page=progress.append,
+        rate_limiter=_fast_limiter(),
+    )
+
+    assert result.success
+    keys = [issue["key"] for page in result.pages for issue in page]
+    assert keys == [f"DEV-{i}" for i in range(PAGE_SIZE, TOTAL)]
+    assert sorted(stub.requested_offsets) == offsets
+    assert 1 < stub.max_in_flight <= 4
+    assert progress[-1] == TOTAL - PAGE_SIZE
+    assert progress == sorted(progress)
+
+
+def test_every_page_consumes_a_rate_limiter_token(stub_jira) -> None:
+    _, url = stub_jira
+    offsets = compute_remaining_offsets(PAGE_SIZE, TOTAL)
+    limiter = TokenBucket(max_tokens=100, refill_rate=0.001)
+
+    fetch_pages_concurrently(
+        create_jira_session(4),
+        url,
+        {},
+        {"maxResults": PAGE_SIZE},
+        offsets,
+        max_workers=4,
+        rate_limiter=limiter,
+    )
+
+    assert limiter.tokens < 100 - len(offsets) + 1
+
+
+def test_http_error_stops_fetch_and_returns_response(stub_jira) -> None:
+    stub, url = stub_jira
+    stub.fail_offsets = {20}
+
+    result = fetch_pages_concurrently(
+        create_jira_session(2),
+        url,
+        {},
+        {"maxResults": PAGE_SIZE},
+        compute_remaining_offsets(PAGE_SIZE, TOTAL),
+        max_workers=2,
+        rate_limiter=_fast_limiter(),
+    )
+
+    assert not result.success
+    assert not result.cancelled
+    assert result.error.status_code == 400
+    assert result.pages == []
+    # Connection released, body still available for error logging
+    assert result.error.raw.closed
+    assert result.error.json() == {"errorMessages": ["boom"]}
+
+
+def test_cancellation_stops_remaining_pages(stub_jira) -> None:
+    stub, url = stub_jira
+    checks = {"count": 0}
+    lock = threading.Lock()
+
+    def is_cancelled() -> bool:
+        with lock:
+            checks["count"] += 1
+            return checks["count"] > 3
+
+    result = fetch_pages_concurrently(
+        create_jira_session(2),
+        url,
+        {},
+        {"maxResults": PAGE_SIZE},
+        compute_remaining_offsets(PAGE_SIZE, TOTAL),
+        max_workers=2,
+        is_cancelled=is_cancelled,
+        rate_limiter=_fast_limiter(),
+    )
+
+    assert result.cancelled
+    assert not result.success
+    assert len(stub.requested_offsets) <= 3
+
+
+def test_fetch_jira_paginated_returns_all_issues_in_order(stub_jira) -> None:
+    stub, url = stub_jira
+    config = {
+        "jql_query": "project = DEV",
+        "api_endpoint": url,
+        "token": "",
+        "fields": "key",
+    }
+
+    success, issues = fetch_jira_paginated(config, max_results=PAGE_SIZE)
+
+    assert success
+    assert [issue["key"] for issue in issues] == [f"DEV-{i}" for i in range(TOTAL)]
+    assert sorted(stub.requested_offsets) == list(range(0, TOTAL, PAGE_SIZE))
+
+
+@pytest.mark.parametrize("fail_offsets", [set(), {0}, {20}])
+def test_fetch_jira_paginated_closes_session(
+    stub_jira, monkeypatch, fail_offsets
+) -> None:
+    stub, url = stub_jira
+    stub.fail_offsets = fail_offsets
+    sessions = []
+
+    def tracking_session(max_workers: int):
+        session = create_jira_session(max_workers)
+        session.close = Mock(wraps=session.close)
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr("data.jira.fetch_utils.create_jira_session", tracking_session)
+    config = {"jql_query": "x", "api_endpoint": url, "token": "", "fields": "key"}
+
+    success, _issues = fetch_jira_paginated(config, max_results=PAGE_SIZE)
+
+    assert success == (not fail_offsets)
+    sessions[0].close.assert_called_once()
@@ -0,0 +1,158 @@
+"""Tests for streaming JIRA search response parsing."""
+
+import json
+
+import pytest
+
+from data.jira.changelog_pagination import _reduce_issue_changelog
+from data.jira.response_stream import iter_search_issues, read_search_page
+
+
+class _ChunkedResponse:
+    """Minimal stand-in for a streamed requests.Response."""
+
+    def __init__(self, body: bytes, chunk: int) -> None:
+        self._body = body
+        self._chunk = chunk
+        self.closed = False
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self._body), self._chunk):
+            yield self._body[start : start + self._chunk]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+PAGE = {
+    "expand": "schema,names",
+    "startAt": 0,
+    "maxResults": 50,
+    "total": 1234567,
+    "issues": [
+        {
+            "key": f"DEV-{idx}",
+            "fields": {"summary": "Änderung ✓ 日本", "points": 12345.678},
+        }
+        for idx in range(20)
+    ],
+    "warningMessages": [],
+}
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 7, 4096])
+def test_stream_matches_json_loads_for_any_chunking(chunk: int) -> None:
+    body = json.dumps(PAGE, ensure_ascii=False, indent=1).encode()
+    response = _ChunkedResponse(body, chunk)
+
+    issues, header = read_search_page(response)
+
+    assert issues == PAGE["issues"]
+    assert header == {key: value for key, value in PAGE.items() if key != "issues"}
+    assert response.closed
+
+
+def test_issues_are_yielded_before_body_is_consumed() -> None:
+    body = json.dumps(PAGE).encode()
+    response = _ChunkedResponse(body, 64)
+    header: dict = {}
+
+    first = next(iter_search_issues(response, header))
+
+    assert first["key"] == "DEV-0"
+    assert header["total"] == 1234567
+    assert "warningMessages" not in header
+
+
+def test_transform_runs_per_issue_and_can_drop() -> None:
+    response = _ChunkedResponse(json.dumps(PAGE).encode(), 16)
+
+    issues, _header = read_search_page(
+        response, lambda issue: None if issue["key"] == "DEV-3" else issue["key"]
+    )
+
+    assert len(issues) == 19
+    assert "DEV-3" not in issues
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"   ",
+        b"[1, 2]",
+        b'{"issues": [{"key": "A"}',
+        b"<html>Gateway</html>",
+        b'{"total": 1 "issues": []}',
+        b'{"issues": [{"key": "A"} {"key": "B"}]}',
+        b'{"issues": [{"key": "A",}]}',
+        b'{total: 1, "issues": []}',
+        b'{1: 2, "issues": []}',
+        b'{"total": 1, "issues": [], }',
+        b'{"issues": [{"key": "\xff\xfe"}]}',
+    ],
+)
+def test_malformed_body_raises_value_error(body: bytes) -> None:
+    response = _ChunkedResponse(body, 5)
+
+    with pytest.raises(ValueError):
+        read_search_page(response)
+    assert response.closed
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4096])
+def test_truncated_body_raises_value_error(chunk: int) -> None:
+    body = json.dumps(PAGE, ensure_ascii=False).encode()
+
+    # Every cut - inside a key, string, number, multi-byte character or
+    # between tokens - must fail rather than return a partial page
+    for cut in range(len(body)):
+        response = _ChunkedResponse(body[:cut], chunk)
+        with pytest.raises(ValueError):
+            read_search_page(response)
+        assert response.closed
+
+
+def test_issues_before_truncation_are_yielded_then_error() -> None:
+    body = json.dumps(PAGE).encode()
+    cut = body.index(b'"DEV-5"')
+    keys = []
+
+    with pytest.raises(ValueError):
+        for issue in iter_search_issues(_ChunkedResponse(body[:cut], 16)):
+            keys.append(issue["key"])
+
+    assert keys == [f"DEV-{idx}" for idx in range(5)]
+
+
+def test_reduce_issue_changelog_keeps_tracked_histories() -> None:
+    issue = {
+        "key": "DEV-1",
+        "changelog": {
+            "total": 3,
+            "histories": [
+                {
+                    "created": "2025-01-01",
+                    "items": [
+                        {"field": "status", "fromString": "A", "toString": "B"},
+                        {"field": "summary", "fromString": "x", "toString": "y"},
+                    ],
+                },
+                {"created": "2025-01-02", "items": [{"field": "labels"}]},
+                {
+                    "created": "2025-01-03",
+                    "items": [{"field": "Iteration", "fieldId": "customfield_7"}],
+                },
+            ],
+        },
+    }
+
+    reduced = _reduce_issue_changelog(issue, ["status", "customfield_7", "Sprint"])
+
+    histories = reduced["changelog"]["histories"]
+    assert reduced["changelog"]["total"] == 3
+    assert [history["created"] for history in histories] == [
+        "2025-01-01",
+        "2025-01-03",
+    ]
+    assert [item["field"] for item in histories[0]["items"]] == ["status"]
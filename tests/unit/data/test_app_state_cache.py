@@ -0,0 +1,60 @@
+"""Tests for the cached app_state lookups in SQLiteBackend."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from data.persistence.sqlite_backend import SQLiteBackend
+
+
+@pytest.fixture
+def backend(temp_database) -> SQLiteBackend:
+    return SQLiteBackend(str(temp_database))
+
+
+def test_set_then_get_round_trip(backend) -> None:
+    backend.set_app_state("active_profile_id", "p1")
+    assert backend.get_app_state("active_profile_id") == "p1"
+
+    backend.set_app_state("active_profile_id", None)
+    assert backend.get_app_state("active_profile_id") is None
+
+
+def test_repeated_reads_do_not_requery_table(backend) -> None:
+    backend.set_app_state("active_query_id", "q1")
+    assert backend.get_app_state("active_query_id") == "q1"
+
+    with patch(
+        "data.persistence.sqlite.app_state.get_db_connection",
+        side_effect=AssertionError("no connection expected"),
+    ):
+        for _ in range(5):
+            assert backend.get_app_state("active_query_id") == "q1"
+
+
+def test_write_from_other_connection_is_detected(backend, temp_database) -> None:
+    backend.set_app_state("active_profile_id", "p1")
+    assert backend.get_app_state("active_profile_id") == "p1"
+
+    # Simulates another process (or module) writing directly to the table
+    conn = sqlite3.connect(str(temp_database))
+    conn.execute(
+        "INSERT OR REPLACE INTO app_state (key, value) VALUES (?, ?)",
+        ("active_profile_id", "p2"),
+    )
+    conn.commit()
+    conn.close()
+
+    assert backend.get_app_state("active_profile_id") == "p2"
+
+
+def test_separate_backends_see_each_others_writes(backend, temp_database) -> None:
+    other = SQLiteBackend(str(temp_database))
+    assert backend.get_app_state("shared") is None
+
+    other.set_app_state("shared", "value")
+
+    assert backend.get_app_state("shared") == "value"
+    backend.close()
+    assert backend.get_app_state("shared") == "value"
@@ -0,0 +1,114 @@
+"""Tests for the ranked autocomplete prefix index and its use by the provider."""
+
+import time
+
+from data.autocomplete_index import AutocompleteIndex
+from data.namespace_autocomplete import (
+    NamespaceAutocompleteProvider,
+    get_metadata_index,
+)
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "type": "string"},
+    {"id": "customfield_10002", "name": "Story Points", "type": "number"},
+    {"id": "customfield_10010", "name": "User Story", "type": "string"},
+    {"id": "customfield_10020", "name": "Sprint", "type": "array"},
+    {"id": "status", "name": "Status", "type": "status"},
+]
+
+
+def _names(entries: list[dict]) -> list[str]:
+    return [entry["name"] for entry in entries]
+
+
+def _field_index(fields: list[dict] = FIELDS) -> AutocompleteIndex:
+    return AutocompleteIndex(fields, lambda f: (f["id"], f["name"]))
+
+
+class TestAutocompleteIndex:
+    def test_prefix_matches_rank_before_word_matches(self) -> None:
+        assert _names(_field_index().search("story")) == ["Story Points", "User Story"]
+
+    def test_exact_match_first(self) -> None:
+        assert _names(_field_index().search("status"))[0] == "Status"
+
+    def test_matches_id_and_is_case_insensitive(self) -> None:
+        assert _names(_field_index().search("CUSTOMFIELD_100")) == [
+            "Story Points",
+            "User Story",
+            "Sprint",
+        ]
+
+    def test_initials_match(self) -> None:
+        assert _names(_field_index().search("sp")) == ["Sprint", "Story Points"]
+
+    def test_substring_fallback_comes_last(self) -> None:
+        assert _names(_field_index().search("int")) == ["Story Points", "Sprint"]
+
+    def test_limit_and_empty_query(self) -> None:
+        index = _field_index()
+        assert len(index.search("s", limit=2)) == 2
+        assert index.search("", limit=3) == FIELDS[:3]
+        assert index.search("nothing") == []
+
+    def test_large_field_list_is_fast(self) -> None:
+        fields = [
+            {"id": f"customfield_{i}", "name": f"Field {i} Value"} for i in range(5000)
+        ]
+        index = _field_index(fields)
+
+        start = time.perf_counter()
+        for query in ("field 42", "customfield_49", "value", "f1v", "9"):
+            assert index.search(query)
+        elapsed = (time.perf_counter() - start) / 5
+
+        assert elapsed < 0.01
+
+
+class _StubFetcher:
+    jira_url = "https://jira.example.com"
+
+    def __init__(self) -> None:
+        self.fields = list(FIELDS)
+        self.statuses = [{"name": "In Progress"}, {"name": "Done"}]
+
+    def fetch_fields(self) -> list[dict]:
+        return self.fields
+
+    def fetch_projects(self) -> list[dict]:
+        return [{"key": "DEV", "name": "Development"}]
+
+    def fetch_statuses(self) -> list[dict]:
+        return self.statuses
+
+
+class TestMetadataIndex:
+    def test_index_reused_until_metadata_changes(self) -> None:
+        fields = list(FIELDS)
+
+        def get_terms(field: dict) -> tuple[str, str]:
+            return field["id"], field["name"]
+
+        first = get_metadata_index("https://a", "fields", fields, get_terms)
+
+        assert get_metadata_index("https://a", "fields", fields, get_terms) is first
+        refreshed = get_metadata_index("https://a", "fields", list(FIELDS), get_terms)
+        assert refreshed is not first
+
+    def test_provider_ranks_field_suggestions(self) -> None:
+        provider = NamespaceAutocompleteProvider(_StubFetcher())
+
+        suggestions = provider.get_suggestions("*.story")
+
+        assert [s["value"] for s in suggestions] == [
+            "*.customfield_10002",
+            "*.customfield_10010",
+        ]
+        assert suggestions[0]["description"] == "Type: number"
+
+    def test_provider_status_suggestions(self) -> None:
+        provider = NamespaceAutocompleteProvider(_StubFetcher())
+
+        suggestions = provider.get_suggestions("*.changelog.Status:prog")
+
+        assert [s["value"] for s in suggestions] == ["*.changelog.Status:In Progress"]
@@ -0,0 +1,132 @@
+"""Tests for the executemany upsert paths of the SQLite issue/changelog saves."""
+
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from data.migration.schema_manager import initialize_schema
+from data.persistence.sqlite_backend import SQLiteBackend
+
+PROFILE = "p1"
+QUERY = "q1"
+
+
+@pytest.fixture
+def backend(temp_database) -> SQLiteBackend:
+    backend = SQLiteBackend(str(temp_database))
+    now = datetime.now().isoformat()
+    backend.save_profile(
+        {"id": PROFILE, "name": "Profile", "created_at": now, "last_used": now}
+    )
+    backend.save_query(
+        PROFILE,
+        {
+            "id": QUERY,
+            "name": "Query",
+            "jql": "project = TEST",
+            "created_at": now,
+            "last_used": now,
+        },
+    )
+    return backend
+
+
+def _issue(key: str, status: str) -> dict:
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"Summary {key}",
+            "status": {"name": status},
+            "issuetype": {"name": "Story"},
+            "project": {"key": "TEST", "name": "Test"},
+            "created": "2025-01-01T10:00:00.000+0000",
+            "updated": "2025-01-02T10:00:00.000+0000",
+            "resolutiondate": None,
+            "labels": ["backend"],
+            "customfield_10002": 3,
+        },
+    }
+
+
+def _entry(key: str, day: int, new_value: str) -> dict:
+    return {
+        "issue_key": key,
+        "change_date": f"2025-01-{day:02d}T10:00:00.000+0000",
+        "author": "someone",
+        "field_name": "status",
+        "old_value": "To Do",
+        "new_value": new_value,
+    }
+
+
+def test_issue_upsert_spans_chunks_and_updates(backend) -> None:
+    expires = datetime.now() + timedelta(hours=1)
+    issues = [_issue(f"TEST-{idx}", "To Do") for idx in range(25)]
+
+    with patch("data.persistence.sqlite.helpers.BULK_UPSERT_CHUNK_SIZE", 10):
+        backend.save_issues_batch(PROFILE, QUERY, "cache", issues, expires)
+    backend.save_issues_batch(
+        PROFILE, QUERY, "cache", [_issue("TEST-3", "Done")], expires
+    )
+
+    stored = {row["issue_key"]: row for row in backend.get_issues(PROFILE, QUERY)}
+    assert len(stored) == 25
+    assert stored["TEST-3"]["status"] == "Done"
+    assert stored["TEST-4"]["labels"] == ["backend"]
+
+
+def test_changelog_upsert_is_idempotent_and_updates(backend) -> None:
+    expires = datetime.now() + timedelta(hours=1)
+    backend.save_issues_batch(
+        PROFILE, QUERY, "cache", [_issue("TEST-1", "Done")], expires
+    )
+    entries = [_entry("TEST-1", day, "In Progress") for day in range(1, 6)]
+
+    backend.save_changelog_batch(PROFILE, QUERY, entries, expires)
+    backend.save_changelog_batch(PROFILE, QUERY, entries, expires)
+    backend.save_changelog_batch(PROFILE, QUERY, [_entry("TEST-1", 5, "Done")], expires)
+
+    stored = backend.get_changelog_entries(PROFILE, QUERY, issue_key="TEST-1")
+    assert len(stored) == 5
+    assert stored[0]["new_value"] == "Done"  # newest first
+
+
+def test_existing_duplicates_removed_before_natural_key(backend, temp_database) -> None:
+    expires = datetime.now() + timedelta(hours=1)
+    backend.save_issues_batch(
+        PROFILE, QUERY, "cache", [_issue("TEST-1", "Done")], expires
+    )
+
+    # Simulates a schema 1.0 database created before the natural key index
+    conn = sqlite3.connect(str(temp_database))
+    conn.execute("DROP INDEX idx_changelog_natural_key")
+    conn.execute("UPDATE app_state SET value = '1.0' WHERE key = 'schema_version'")
+    entry = _entry("TEST-1", 1, "In Progress")
+    for new_value in ("In Progress", "Done"):
+        conn.execute(
+            "INSERT INTO jira_changelog_entries (profile_id, query_id, issue_key, "
+            "change_date, author, field_name, new_value, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                PROFILE,
+                QUERY,
+                entry["issue_key"],
+                entry["change_date"],
+                entry["author"],
+                entry["field_name"],
+                new_value,
+                expires.isoformat(),
+            ),
+        )
+    conn.commit()
+    conn.close()
+
+    # Startup migration deduplicates and adds the index once
+    initialize_schema(temp_database)
+    backend.save_changelog_batch(PROFILE, QUERY, [_entry("TEST-1", 1, "Done")], expires)
+    backend.save_changelog_batch(PROFILE, QUERY, [_entry("TEST-1", 2, "Done")], expires)
+
+    stored = backend.get_changelog_entries(PROFILE, QUERY, issue_key="TEST-1")
+    assert [row["new_value"] for row in stored] == ["Done", "Done"]
@@ -0,0 +1,111 @@
+"""Tests for the per-thread SQLite connection pool in data/database.py."""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from data.database import ConnectionPool, get_db_connection
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "pool.db"
+        with get_db_connection(path) as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.commit()
+        yield path
+
+
+def _acquire_and_release(pool: ConnectionPool, path: Path):
+    entry = pool.acquire(str(path))
+    pool.release(entry)
+    return entry.conn
+
+
+def test_connection_reused_on_same_thread_with_pragmas(db_path) -> None:
+    pool = ConnectionPool()
+    first = _acquire_and_release(pool, db_path)
+    second = _acquire_and_release(pool, db_path)
+
+    assert first is second
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert first.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    stats = pool.stats()
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 1
+    assert stats["idle_connections"] == 1
+    assert stats["in_use_connections"] == 0
+
+
+def test_nested_acquire_gets_separate_connection(db_path) -> None:
+    pool = ConnectionPool()
+    outer = pool.acquire(str(db_path))
+    inner = pool.acquire(str(db_path))
+
+    assert outer.conn is not inner.conn
+    assert pool.stats()["in_use_connections"] == 2
+
+    pool.release(inner)
+    pool.release(outer)
+    assert pool.stats()["idle_connections"] == 2
+
+
+def test_threads_do_not_share_connections(db_path) -> None:
+    pool = ConnectionPool()
+    main_conn = _acquire_and_release(pool, db_path)
+    seen = []
+
+    def worker() -> None:
+        seen.append(_acquire_and_release(pool, db_path))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not main_conn
+
+
+def test_uncommitted_changes_rolled_back_on_release(db_path) -> None:
+    with get_db_connection(db_path) as conn:
+        conn.execute("INSERT INTO items (name) VALUES (?)", ("lost",))
+    with get_db_connection(db_path) as conn:
+        conn.execute("INSERT INTO items (name) VALUES (?)", ("kept",))
+        conn.commit()
+    with get_db_connection(db_path) as conn:
+        names = [row["name"] for row in conn.execute("SELECT name FROM items")]
+
+    assert names == ["kept"]
+
+
+def test_replaced_database_file_is_not_reused(db_path) -> None:
+    pool = ConnectionPool()
+    first = _acquire_and_release(pool, db_path)
+
+    os.remove(db_path)
+    for suffix in ("-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    second = _acquire_and_release(pool, db_path)
+
+    assert second is not first
+    assert pool.stats()["connections_discarded"] == 1
+
+
+def test_closed_by_caller_and_idle_limit(db_path) -> None:
+    pool = ConnectionPool(max_idle_per_thread=2)
+    entry = pool.acquire(str(db_path))
+    entry.conn.close()
+    pool.release(entry)
+    assert pool.stats()["idle_connections"] == 0
+
+    entries = [pool.acquire(str(db_path)) for _ in range(3)]
+    for entry in entries:
+        pool.release(entry)
+    assert pool.stats()["idle_connections"] == 2
+
+    assert pool.close_idle() == 2
+    assert pool.stats()["idle_connections"] == 0
@@ -0,0 +1,119 @@
+"""Tests for incremental weekly metrics recompute (data/metrics/delta_recompute.py)."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from data.metrics.delta_recompute import (
+    metrics_settings_fingerprint,
+    plan_week_recompute,
+)
+from data.metrics.sweep_calculator import METRIC_FAMILIES, build_sweep_dataset
+from data.persistence.sqlite_backend import SQLiteBackend
+
+APP_SETTINGS = {
+    "flow_end_statuses": ["Done"],
+    "wip_statuses": ["In Progress"],
+    "devops_task_types": ["Operational Task"],
+    "bug_types": ["Bug"],
+    "production_environment_values": [],
+    "field_mappings": {},
+}
+
+
+@pytest.fixture
+def backend(temp_database) -> SQLiteBackend:
+    backend = SQLiteBackend(str(temp_database))
+    now = datetime.now().isoformat()
+    backend.save_profile({"id": "p1", "name": "P", "created_at": now, "last_used": now})
+    backend.save_query(
+        "p1",
+        {"id": "q1", "name": "Q", "jql": "x", "created_at": now, "last_used": now},
+    )
+    return backend
+
+
+def _done_issue(key: str, resolved: str) -> dict:
+    return {
+        "issue_key": key,
+        "key": key,
+        "issue_type": "Story",
+        "status": "Done",
+        "created": "2024-12-30T09:00:00.000+0000",
+        "resolved": resolved,
+        "fixVersions": [],
+        "custom_fields": {},
+        "changelog": {
+            "histories": [
+                {
+                    "created": resolved,
+                    "items": [
+                        {"field": "status", "fromString": "To Do", "toString": "Done"}
+                    ],
+                }
+            ]
+        },
+    }
+
+
+def test_contributions_round_trip_and_cleared_with_metrics(backend) -> None:
+    backend.save_metric_contributions(
+        "p1", "q1", "2025-W02", {"flow": ["DEV-1", "DEV-2"], "dora": ["DEV-2"]}
+    )
+    backend.save_metric_contributions("p1", "q1", "2025-W03", {"flow": ["DEV-3"]})
+    # Re-saving a family replaces its previous keys
+    backend.save_metric_contributions("p1", "q1", "2025-W03", {"flow": ["DEV-4"]})
+
+    assert backend.get_metric_contributions("p1", "q1") == {
+        "2025-W02": {"flow", "dora"},
+        "2025-W03": {"flow"},
+    }
+    assert backend.get_metric_contributions("p1", "q1", ["DEV-2", "DEV-3"]) == {
+        "2025-W02": {"flow", "dora"}
+    }
+
+    backend.delete_metrics("p1", "q1")
+    assert backend.get_metric_contributions("p1", "q1") == {}
+
+
+def test_plan_marks_only_weeks_touched_by_changed_keys() -> None:
+    issues = [
+        _done_issue("DEV-1", "2025-01-07T10:00:00.000+0000"),  # 2025-W02
+        _done_issue("DEV-2", "2025-01-21T10:00:00.000+0000"),  # 2025-W04
+    ]
+    dataset = build_sweep_dataset(issues, issues, True, APP_SETTINGS)
+    weeks = ["2025-W02", "2025-W03", "2025-W04"]
+    recorded = {week: set(METRIC_FAMILIES) for week in weeks}
+
+    with patch(
+        "data.metrics.delta_recompute.get_metric_snapshot", return_value={"x": 1}
+    ):
+        assert plan_week_recompute(dataset, weeks, [], recorded, {}) == {}
+        assert plan_week_recompute(dataset, weeks, ["DEV-1"], recorded, {}) == {
+            "2025-W02": ("flow",)
+        }
+        # An issue that used to feed W03 must clear that week too
+        assert plan_week_recompute(
+            dataset, weeks, ["DEV-2"], recorded, {"2025-W03": {"flow"}}
+        ) == {"2025-W03": ("flow",), "2025-W04": ("flow",)}
+        # Weeks without contribution records are always recalculated
+        del recorded["2025-W03"]
+        assert plan_week_recompute(dataset, weeks, [], recorded, {}) == {
+            "2025-W03": METRIC_FAMILIES
+        }
+
+
+def test_settings_fingerprint_tracks_metric_settings_only() -> None:
+    settings = {"wip_statuses": ["In Progress"], "bug_types": ["Bug"]}
+    reordered = {"bug_types": ["Bug"], "wip_statuses": ["In Progress"]}
+
+    assert metrics_settings_fingerprint(settings) == metrics_settings_fingerprint(
+        reordered
+    )
+    assert metrics_settings_fingerprint(settings) == metrics_settings_fingerprint(
+        {**settings, "theme": "dark"}
+    )
+    assert metrics_settings_fingerprint(settings) != metrics_settings_fingerprint(
+        {**settings, "wip_statuses": ["In Review"]}
+    )
@@ -0,0 +1,74 @@
+"""Tests for the server-side figure cache."""
+
+from data.figure_cache import FigureCache, fingerprint
+
+
+def test_hit_and_miss_counters() -> None:
+    cache = FigureCache(max_bytes=100)
+
+    assert cache.get(("a",)) is None
+    assert cache.put(("a",), "content", 10)
+    assert cache.get(("a",)) == "content"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+    assert stats["size_bytes"] == 10
+
+
+def test_evicts_least_recently_used_by_size() -> None:
+    cache = FigureCache(max_bytes=100)
+    cache.put(("a",), "A", 40)
+    cache.put(("b",), "B", 40)
+    cache.get(("a",))
+
+    cache.put(("c",), "C", 40)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == "A"
+    assert cache.get(("c",)) == "C"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] == 80
+
+
+def test_replacing_a_key_updates_size() -> None:
+    cache = FigureCache(max_bytes=100)
+    cache.put(("a",), "old", 60)
+    cache.put(("a",), "new", 30)
+
+    assert cache.get(("a",)) == "new"
+    assert cache.stats()["size_bytes"] == 30
+    assert cache.stats()["evictions"] == 0
+
+
+def test_oversized_entries_are_not_cached() -> None:
+    cache = FigureCache(max_bytes=100, max_entry_bytes=50)
+    cache.put(("small",), "S", 20)
+
+    assert not cache.put(("big",), "B", 51)
+    assert cache.get(("big",)) is None
+    assert cache.get(("small",)) == "S"
+
+
+def test_clear_drops_entries_and_keeps_counters() -> None:
+    cache = FigureCache(max_bytes=100)
+    cache.put(("a",), "A", 10)
+    cache.get(("a",))
+
+    cache.clear()
+
+    assert cache.get(("a",)) is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["size_bytes"] == 0
+    assert cache.stats()["hits"] == 1
+
+
+def test_fingerprint_ignores_key_order_and_tracks_values() -> None:
+    first = fingerprint({"pert_factor": 3, "deadline": "2025-06-30"})
+    reordered = fingerprint({"deadline": "2025-06-30", "pert_factor": 3})
+    changed = fingerprint({"deadline": "2025-07-31", "pert_factor": 3})
+
+    assert first == reordered
+    assert first != changed
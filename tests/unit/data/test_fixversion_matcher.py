@@ -4,11 +4,13 @@ Unit tests for data/fixversion_matcher.py
 These tests cover pure logic paths only — no I/O, no database, no network.
 """
 
-from datetime import date
+from datetime import UTC, date, datetime, timedelta
 
 from data.fixversion_matcher import (
+    DeploymentIndex,
     extract_fixversion_ids,
     extract_fixversion_names,
+    filter_issues_deployed_in_week,
     find_matching_operational_tasks,
     get_earliest_release_date,
     get_fallback_release_date,
@@ -302,3 +304,79 @@ class TestFindMatchingOperationalTasks:
         results = find_matching_operational_tasks(dev, [op], match_by="auto")
         _, method = results[0]
         assert method == "id"
+
+
+###############################################################################
+# DeploymentIndex
+###############################################################################
+
+
+class TestDeploymentIndex:
+    _RELEASE_MAP = {
+        "Release 2025-01": datetime(2025, 1, 15),
+        "Release-2025-02": datetime(2025, 2, 20),
+        "Hotfix 2025-01": datetime(2025, 1, 13),
+    }
+
+    def _issues(self) -> list[dict]:
+        return [
+            _nested_issue([_FV_B], key="DEV-1"),
+            _flat_issue([_FV_A, _FV_B], key="DEV-2"),
+            _nested_issue([], key="DEV-3"),
+            _flat_issue([{"name": "Hotfix 2025-01"}], key="DEV-4"),
+            _nested_issue([_FV_NO_DATE], key="DEV-5"),
+        ]
+
+    def test_weeks_match_filter_issues_deployed_in_week(self) -> None:
+        issues = self._issues()
+        index = DeploymentIndex(issues, self._RELEASE_MAP)
+        for week in range(10):
+            week_start = datetime(2025, 1, 6) + timedelta(weeks=week)
+            week_end = week_start + timedelta(days=7)
+            assert index.issues_deployed_in(
+                week_start, week_end
+            ) == filter_issues_deployed_in_week(
+                issues, self._RELEASE_MAP, week_start, week_end
+            )
+
+    def test_keeps_original_issue_order(self) -> None:
+        issues = self._issues()
+        index = DeploymentIndex(issues, self._RELEASE_MAP)
+        week = index.issues_deployed_in(datetime(2025, 1, 13), datetime(2025, 1, 20))
+        assert [issue["key"] for issue in week] == ["DEV-2", "DEV-4"]
+
+    def test_resolves_earliest_deployment_date_per_issue(self) -> None:
+        index = DeploymentIndex(self._issues(), self._RELEASE_MAP)
+        assert index.deployment_dates == [
+            datetime(2025, 2, 20),
+            datetime(2025, 1, 15),
+            None,
+            datetime(2025, 1, 13),
+            None,
+        ]
+
+    def test_releases_in_week_sorted_by_name(self) -> None:
+        index = DeploymentIndex([], self._RELEASE_MAP)
+        assert index.releases_in(datetime(2025, 1, 13), datetime(2025, 1, 20)) == [
+            "Hotfix 2025-01",
+            "Release 2025-01",
+        ]
+        assert index.releases_in(datetime(2025, 3, 3), datetime(2025, 3, 10)) == []
+
+    def test_timezone_aware_release_dates_match_filter(self) -> None:
+        release_map = {
+            **self._RELEASE_MAP,
+            # Same week as Release 2025-01, but never comparable with it
+            "Hotfix 2025-01": datetime(2025, 1, 13, tzinfo=UTC),
+        }
+        issues = self._issues()
+        index = DeploymentIndex(issues, release_map)
+        week_start, week_end = datetime(2025, 1, 13), datetime(2025, 1, 20)
+
+        deployed = index.issues_deployed_in(week_start, week_end)
+
+        assert deployed == filter_issues_deployed_in_week(
+            issues, release_map, week_start, week_end
+        )
+        assert [issue["key"] for issue in deployed] == ["DEV-2"]
+        assert index.releases_in(week_start, week_end) == ["Release 2025-01"]
@@ -0,0 +1,92 @@
+"""Tests for column projection and lazy JSON decoding in get_issues."""
+
+import json
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+
+from data.persistence.sqlite.issue_rows import LazyIssueRow, decode_issue_row
+from data.persistence.sqlite_backend import SQLiteBackend
+
+RAW_ROW = {
+    "issue_key": "TEST-1",
+    "status": "Done",
+    "fix_versions": '[{"name": "1.0"}]',
+    "labels": '["backend"]',
+    "components": None,
+    "custom_fields": '{"customfield_10001": {"value": "PROD"}}',
+}
+
+
+@pytest.fixture
+def backend(temp_database) -> SQLiteBackend:
+    backend = SQLiteBackend(str(temp_database))
+    now = datetime.now().isoformat()
+    backend.save_profile({"id": "p1", "name": "P", "created_at": now, "last_used": now})
+    backend.save_query(
+        "p1",
+        {"id": "q1", "name": "Q", "jql": "x", "created_at": now, "last_used": now},
+    )
+    issues = [
+        {
+            "key": f"TEST-{idx}",
+            "fields": {
+                "status": {"name": "Done"},
+                "created": "2025-01-01T10:00:00.000+0000",
+                "fixVersions": [{"name": "1.0"}],
+                "customfield_10001": {"value": "PROD"},
+            },
+        }
+        for idx in range(3)
+    ]
+    backend.save_issues_batch(
+        "p1", "q1", "cache", issues, datetime.now() + timedelta(hours=1)
+    )
+    return backend
+
+
+def test_lazy_row_decodes_on_access_only() -> None:
+    row = LazyIssueRow(dict(RAW_ROW))
+
+    assert row["status"] == "Done"
+    assert dict.__getitem__(row, "custom_fields") == RAW_ROW["custom_fields"]
+
+    assert row.get("labels") == ["backend"]
+    assert row["fixVersions"] is row["fix_versions"]
+    assert dict.__getitem__(row, "custom_fields") == RAW_ROW["custom_fields"]
+
+
+def test_lazy_row_matches_eager_through_dict_apis() -> None:
+    eager = decode_issue_row(dict(RAW_ROW))
+
+    assert LazyIssueRow(dict(RAW_ROW)) == eager
+    assert dict(LazyIssueRow(dict(RAW_ROW))) == eager
+    assert {**LazyIssueRow(dict(RAW_ROW))} == eager
+    assert LazyIssueRow(dict(RAW_ROW)).copy() == eager
+    assert json.loads(json.dumps(LazyIssueRow(dict(RAW_ROW)))) == eager
+    assert pickle.loads(pickle.dumps(LazyIssueRow(dict(RAW_ROW)))) == eager
+    assert sorted(LazyIssueRow(dict(RAW_ROW)).items()) == sorted(eager.items())
+
+
+def test_get_issues_projection_and_lazy(backend) -> None:
+    projected = backend.get_issues("p1", "q1", columns=["issue_key", "status"])
+    assert sorted(row["issue_key"] for row in projected) == [
+        "TEST-0",
+        "TEST-1",
+        "TEST-2",
+    ]
+    assert set(projected[0]) == {"issue_key", "status"}
+
+    with_json = backend.get_issues("p1", "q1", columns=["issue_key", "fix_versions"])
+    assert with_json[0]["fixVersions"] == [{"name": "1.0"}]
+
+    lazy = backend.get_issues("p1", "q1", lazy=True)
+    eager = backend.get_issues("p1", "q1")
+    assert lazy == eager
+    assert lazy[0]["custom_fields"] == {"customfield_10001": {"value": "PROD"}}
+
+
+def test_get_issues_rejects_unknown_columns(backend) -> None:
+    with pytest.raises(ValueError, match="Unknown jira_issues columns"):
+        backend.get_issues("p1", "q1", columns=["status; DROP TABLE jira_issues"])
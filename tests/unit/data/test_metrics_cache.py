@@ -1,12 +1,11 @@
 """Unit tests for metrics_cache module.
 
 Tests caching functionality with TTL, LRU eviction, and cache invalidation
-with proper test isolation using temporary files.
+with proper test isolation using a temporary database.
 """
 
-import json
-import os
-import tempfile
+import sqlite3
+import threading
 import time
 from datetime import datetime
 from unittest.mock import patch
@@ -24,16 +23,20 @@ from data.metrics_cache import (
 
 
 @pytest.fixture
-def temp_cache_file():
-    """Create isolated temporary cache file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        temp_file = f.name
+def temp_cache_db(temp_database):
+    """Temporary database holding the metrics_result_cache table."""
+    return temp_database
 
-    yield temp_file
 
-    # Cleanup
-    if os.path.exists(temp_file):
-        os.unlink(temp_file)
+def _cache_rows(db_path) -> dict[str, sqlite3.Row]:
+    """Read the cache table directly, bypassing the module."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM metrics_result_cache").fetchall()
+    finally:
+        conn.close()
+    return {row["cache_key"]: row for row in rows}
 
 
 @pytest.fixture
@@ -82,101 +85,111 @@ class TestGenerateCacheKey:
 class TestSaveAndLoadCachedMetrics:
     """Test saving and loading metrics from cache."""
 
-    def test_save_and_load_metrics(self, temp_cache_file, sample_metrics):
+    def test_save_and_load_metrics(self, temp_cache_db, sample_metrics):
         """Test saving metrics and loading them back."""
         cache_key = "dora_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Save metrics
-            result = save_cached_metrics(cache_key, sample_metrics, ttl_seconds=3600)
-            assert result is True
+        # Save metrics
+        result = save_cached_metrics(cache_key, sample_metrics, ttl_seconds=3600)
+        assert result is True
 
-            # Load metrics
-            loaded_metrics = load_cached_metrics(cache_key)
-            assert loaded_metrics is not None
-            assert loaded_metrics["deployment_frequency"]["value"] == 45.2
-            assert loaded_metrics["lead_time_for_changes"]["value"] == 3.5
+        # Load metrics
+        loaded_metrics = load_cached_metrics(cache_key)
+        assert loaded_metrics is not None
+        assert loaded_metrics["deployment_frequency"]["value"] == 45.2
+        assert loaded_metrics["lead_time_for_changes"]["value"] == 3.5
 
-    def test_load_nonexistent_key_returns_none(self, temp_cache_file):
+    def test_load_nonexistent_key_returns_none(self, temp_cache_db):
         """Test loading non-existent cache key returns None."""
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            loaded_metrics = load_cached_metrics("nonexistent_key")
-            assert loaded_metrics is None
+        loaded_metrics = load_cached_metrics("nonexistent_key")
+        assert loaded_metrics is None
 
-    def test_load_expired_entry_returns_none(self, temp_cache_file, sample_metrics):
+    def test_load_expired_entry_returns_none(self, temp_cache_db, sample_metrics):
         """Test loading expired cache entry returns None."""
         cache_key = "dora_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Save with very short TTL
-            save_cached_metrics(cache_key, sample_metrics, ttl_seconds=1)
+        # Save with very short TTL
+        save_cached_metrics(cache_key, sample_metrics, ttl_seconds=1)
 
-            # Wait for expiration
-            time.sleep(1.1)
+        # Wait for expiration
+        time.sleep(1.1)
 
-            # Should return None (expired)
-            loaded_metrics = load_cached_metrics(cache_key)
-            assert loaded_metrics is None
+        # Should return None (expired) and drop the entry
+        loaded_metrics = load_cached_metrics(cache_key)
+        assert loaded_metrics is None
+        assert cache_key not in _cache_rows(temp_cache_db)
 
-    def test_cache_version_mismatch_returns_none(self, temp_cache_file, sample_metrics):
+    def test_cache_version_mismatch_returns_none(self, temp_cache_db, sample_metrics):
         """Test cache version mismatch returns None."""
         cache_key = "dora_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Save metrics
-            save_cached_metrics(cache_key, sample_metrics)
+        # Save metrics
+        save_cached_metrics(cache_key, sample_metrics)
 
-            # Modify cache version
-            with open(temp_cache_file) as f:
-                cache = json.load(f)
-            cache["cache_version"] = "0.9"
-            with open(temp_cache_file, "w") as f:
-                json.dump(cache, f)
+        # Modify cache version
+        conn = sqlite3.connect(temp_cache_db)
+        conn.execute("UPDATE metrics_result_cache SET cache_version = '0.9'")
+        conn.commit()
+        conn.close()
 
-            # Should return None (version mismatch)
-            loaded_metrics = load_cached_metrics(cache_key)
-            assert loaded_metrics is None
+        # Should return None (version mismatch)
+        loaded_metrics = load_cached_metrics(cache_key)
+        assert loaded_metrics is None
 
-    def test_multiple_entries_in_cache(self, temp_cache_file, sample_metrics):
+    def test_multiple_entries_in_cache(self, temp_cache_db, sample_metrics):
         """Test multiple cache entries can coexist."""
         key1 = "dora_2025-01-01_2025-01-31_test123"
         key2 = "flow_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Save two different entries
-            save_cached_metrics(key1, sample_metrics, ttl_seconds=3600)
-            save_cached_metrics(
-                key2, {"flow_velocity": {"value": 30}}, ttl_seconds=3600
-            )
+        # Save two different entries
+        save_cached_metrics(key1, sample_metrics, ttl_seconds=3600)
+        save_cached_metrics(key2, {"flow_velocity": {"value": 30}}, ttl_seconds=3600)
 
-            # Both should be retrievable
-            metrics1 = load_cached_metrics(key1)
-            metrics2 = load_cached_metrics(key2)
+        # Both should be retrievable
+        metrics1 = load_cached_metrics(key1)
+        metrics2 = load_cached_metrics(key2)
 
-            assert metrics1 is not None
-            assert metrics2 is not None
-            assert "deployment_frequency" in metrics1
-            assert "flow_velocity" in metrics2
+        assert metrics1 is not None
+        assert metrics2 is not None
+        assert "deployment_frequency" in metrics1
+        assert "flow_velocity" in metrics2
+
+    def test_concurrent_saves_keep_all_entries(self, temp_cache_db):
+        """Test concurrent saves do not overwrite each other's entries."""
+
+        def save_range(start: int) -> None:
+            for i in range(start, start + 10):
+                save_cached_metrics(f"key_{i}", {"value": i})
+
+        threads = [threading.Thread(target=save_range, args=(n,)) for n in (0, 10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(_cache_rows(temp_cache_db)) == 20
+        assert load_cached_metrics("key_15") == {"value": 15}
+
+    def test_oversized_entry_not_cached(self, temp_cache_db):
+        """Test results larger than MAX_ENTRY_BYTES are not stored."""
+        with patch("data.metrics_cache.MAX_ENTRY_BYTES", 100):
+            assert save_cached_metrics("big", {"data": "x" * 200}) is False
+
+        assert load_cached_metrics("big") is None
 
 
 class TestCacheEviction:
     """Test LRU eviction policy."""
 
-    def test_lru_eviction_when_exceeding_max_entries(self, temp_cache_file):
+    def test_lru_eviction_when_exceeding_max_entries(self, temp_cache_db):
         """Test LRU eviction when cache exceeds MAX_ENTRIES."""
-        with (
-            patch("data.metrics_cache.CACHE_FILE", temp_cache_file),
-            patch("data.metrics_cache.MAX_ENTRIES", 5),
-        ):  # Set low limit for testing
+        with patch("data.metrics_cache.MAX_ENTRIES", 5):  # Low limit for testing
             # Add 6 entries (exceeds limit of 5)
             for i in range(6):
                 cache_key = f"test_key_{i}"
                 metrics = {"test_metric": {"value": i}}
                 save_cached_metrics(cache_key, metrics)
 
-                # Small delay to ensure different timestamps
-                time.sleep(0.01)
-
             # First entry should be evicted
             oldest_entry = load_cached_metrics("test_key_0")
             assert oldest_entry is None
@@ -185,156 +198,177 @@ class TestCacheEviction:
             newest_entry = load_cached_metrics("test_key_5")
             assert newest_entry is not None
 
+    def test_reads_protect_entries_from_eviction(self, temp_cache_db):
+        """Test a recently read entry outlives newer but unread ones."""
+        with patch("data.metrics_cache.MAX_ENTRIES", 3):
+            for i in range(3):
+                save_cached_metrics(f"test_key_{i}", {"value": i})
+
+            # Reading key 0 makes key 1 the least recently used
+            assert load_cached_metrics("test_key_0") is not None
+            save_cached_metrics("test_key_3", {"value": 3})
+
+            assert set(_cache_rows(temp_cache_db)) == {
+                "test_key_0",
+                "test_key_2",
+                "test_key_3",
+            }
+
+    def test_eviction_by_total_bytes(self, temp_cache_db):
+        """Test entries are evicted to stay under MAX_BYTES."""
+        metrics = {"data": "x" * 1000}  # about 1 KB serialized
+        with patch("data.metrics_cache.MAX_BYTES", 2500):
+            for i in range(4):
+                save_cached_metrics(f"test_key_{i}", metrics)
+
+        rows = _cache_rows(temp_cache_db)
+        assert set(rows) == {"test_key_2", "test_key_3"}
+        assert sum(row["size_bytes"] for row in rows.values()) <= 2500
+
 
 class TestCacheInvalidation:
     """Test cache invalidation."""
 
-    def test_invalidate_specific_key(self, temp_cache_file, sample_metrics):
+    def test_invalidate_specific_key(self, temp_cache_db, sample_metrics):
         """Test invalidating specific cache key."""
         key1 = "dora_2025-01-01_2025-01-31_test123"
         key2 = "flow_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Save two entries
-            save_cached_metrics(key1, sample_metrics)
-            save_cached_metrics(key2, {"flow_velocity": {"value": 30}})
+        # Save two entries
+        save_cached_metrics(key1, sample_metrics)
+        save_cached_metrics(key2, {"flow_velocity": {"value": 30}})
 
-            # Invalidate one key
-            result = invalidate_cache(key1)
-            assert result is True
+        # Invalidate one key
+        result = invalidate_cache(key1)
+        assert result is True
 
-            # First should be gone
-            metrics1 = load_cached_metrics(key1)
-            assert metrics1 is None
+        # First should be gone
+        metrics1 = load_cached_metrics(key1)
+        assert metrics1 is None
 
-            # Second should still exist
-            metrics2 = load_cached_metrics(key2)
-            assert metrics2 is not None
+        # Second should still exist
+        metrics2 = load_cached_metrics(key2)
+        assert metrics2 is not None
 
-    def test_invalidate_all_cache(self, temp_cache_file, sample_metrics):
+    def test_invalidate_all_cache(self, temp_cache_db, sample_metrics, tmp_path):
         """Test clearing entire cache."""
         key1 = "dora_2025-01-01_2025-01-31_test123"
         key2 = "flow_2025-01-01_2025-01-31_test123"
+        legacy_file = tmp_path / "metrics_cache.json"
+        legacy_file.write_text("{}")
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Save two entries
-            save_cached_metrics(key1, sample_metrics)
-            save_cached_metrics(key2, {"flow_velocity": {"value": 30}})
+        # Save two entries
+        save_cached_metrics(key1, sample_metrics)
+        save_cached_metrics(key2, {"flow_velocity": {"value": 30}})
 
-            # Invalidate all
+        # Invalidate all
+        with patch("data.metrics_cache.LEGACY_CACHE_FILE", str(legacy_file)):
             result = invalidate_cache(None)
-            assert result is True
+        assert result is True
 
-            # Cache file should be deleted
-            assert not os.path.exists(temp_cache_file)
+        # Table should be empty, legacy cache file removed
+        assert _cache_rows(temp_cache_db) == {}
+        assert not legacy_file.exists()
 
-            # Both should return None
-            metrics1 = load_cached_metrics(key1)
-            metrics2 = load_cached_metrics(key2)
-            assert metrics1 is None
-            assert metrics2 is None
+        # Both should return None
+        metrics1 = load_cached_metrics(key1)
+        metrics2 = load_cached_metrics(key2)
+        assert metrics1 is None
+        assert metrics2 is None
 
-    def test_invalidate_nonexistent_cache_succeeds(self):
-        """Test invalidating non-existent cache file succeeds."""
-        # Use non-existent file path
-        fake_path = "/tmp/nonexistent_cache_xyz123.json"
-
-        with patch("data.metrics_cache.CACHE_FILE", fake_path):
-            result = invalidate_cache(None)
-            assert result is True  # Should not raise error
+    def test_invalidate_without_database_succeeds(self):
+        """Test invalidating without a SQLite database succeeds."""
+        with patch("data.metrics_cache._db_path", return_value=None):
+            assert invalidate_cache(None) is True
+            assert invalidate_cache("some_key") is True  # Should not raise error
 
 
 class TestCacheStats:
     """Test cache statistics."""
 
-    def test_stats_for_empty_cache(self):
-        """Test stats when cache doesn't exist."""
-        with patch("data.metrics_cache.CACHE_FILE", "/tmp/nonexistent.json"):
-            stats = get_cache_stats()
+    def test_stats_for_empty_cache(self, temp_cache_db):
+        """Test stats when cache is empty."""
+        stats = get_cache_stats()
 
-            assert stats["total_entries"] == 0
-            assert stats["valid_entries"] == 0
-            assert stats["expired_entries"] == 0
-            assert stats["cache_file_size_kb"] == 0
-            assert stats["oldest_entry"] is None
-            assert stats["newest_entry"] is None
+        assert stats["total_entries"] == 0
+        assert stats["valid_entries"] == 0
+        assert stats["expired_entries"] == 0
+        assert stats["size_bytes"] == 0
+        assert stats["oldest_entry"] is None
+        assert stats["newest_entry"] is None
 
-    def test_stats_with_entries(self, temp_cache_file, sample_metrics):
+    def test_stats_with_entries(self, temp_cache_db, sample_metrics):
         """Test stats with cache entries."""
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Add entries
-            save_cached_metrics("key1", sample_metrics, ttl_seconds=3600)
-            time.sleep(0.01)
-            save_cached_metrics("key2", sample_metrics, ttl_seconds=3600)
-
-            stats = get_cache_stats()
-
-            assert stats["total_entries"] == 2
-            assert stats["valid_entries"] == 2
-            assert stats["expired_entries"] == 0
-            assert stats["cache_file_size_kb"] > 0
-            assert stats["oldest_entry"] is not None
-            assert stats["newest_entry"] is not None
-
-    def test_stats_with_expired_entries(self, temp_cache_file, sample_metrics):
+        # Add entries
+        save_cached_metrics("key1", sample_metrics, ttl_seconds=3600)
+        time.sleep(0.01)
+        save_cached_metrics("key2", sample_metrics, ttl_seconds=3600)
+
+        stats = get_cache_stats()
+
+        assert stats["total_entries"] == 2
+        assert stats["valid_entries"] == 2
+        assert stats["expired_entries"] == 0
+        assert 0 < stats["size_bytes"] <= stats["max_bytes"]
+        assert stats["oldest_entry"] is not None
+        assert stats["newest_entry"] is not None
+        assert stats["oldest_entry"] < stats["newest_entry"]
+
+    def test_stats_with_expired_entries(self, temp_cache_db, sample_metrics):
         """Test stats correctly count expired entries."""
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            # Add expired entry
-            save_cached_metrics("expired_key", sample_metrics, ttl_seconds=1)
+        # Add expired entry
+        save_cached_metrics("expired_key", sample_metrics, ttl_seconds=1)
 
-            # Add valid entry
-            time.sleep(1.1)
-            save_cached_metrics("valid_key", sample_metrics, ttl_seconds=3600)
+        # Add valid entry
+        time.sleep(1.1)
+        save_cached_metrics("valid_key", sample_metrics, ttl_seconds=3600)
 
-            stats = get_cache_stats()
+        stats = get_cache_stats()
 
-            assert stats["total_entries"] == 2
-            assert stats["valid_entries"] == 1
-            assert stats["expired_entries"] == 1
+        assert stats["total_entries"] == 2
+        assert stats["valid_entries"] == 1
+        assert stats["expired_entries"] == 1
 
+    def test_stats_hit_rate_and_evictions(self, temp_cache_db, sample_metrics):
+        """Test hit, miss and eviction counters."""
+        before = get_cache_stats()
 
-class TestCacheFileStructure:
-    """Test cache file structure and format."""
+        with patch("data.metrics_cache.MAX_ENTRIES", 1):
+            save_cached_metrics("key1", sample_metrics)
+            save_cached_metrics("key2", sample_metrics)  # evicts key1
+        load_cached_metrics("key2")
+        load_cached_metrics("key2")
+        load_cached_metrics("key1")
+
+        stats = get_cache_stats()
+        assert stats["hits"] - before["hits"] == 2
+        assert stats["misses"] - before["misses"] == 1
+        assert stats["evictions"] - before["evictions"] == 1
+        assert 0.0 < stats["hit_rate"] <= 1.0
 
-    def test_cache_file_structure(self, temp_cache_file, sample_metrics):
-        """Test cache file has correct structure."""
-        cache_key = "dora_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            save_cached_metrics(cache_key, sample_metrics)
-
-            # Read and verify structure
-            with open(temp_cache_file) as f:
-                cache = json.load(f)
-
-            assert "cache_version" in cache
-            assert cache["cache_version"] == CACHE_VERSION
-            assert "entries" in cache
-            assert "max_entries" in cache
-            assert "eviction_policy" in cache
-
-            # Check entry structure
-            entry = cache["entries"][cache_key]
-            assert "cache_key" in entry
-            assert "metrics" in entry
-            assert "calculated_at" in entry
-            assert "expires_at" in entry
-            assert "last_accessed" in entry
-            assert "ttl_seconds" in entry
-
-    def test_timestamps_are_iso_format(self, temp_cache_file, sample_metrics):
-        """Test all timestamps are in ISO 8601 format."""
+class TestCacheTableStructure:
+    """Test cache table structure and format."""
+
+    def test_cache_row_structure(self, temp_cache_db, sample_metrics):
+        """Test cache rows have the expected columns."""
         cache_key = "dora_2025-01-01_2025-01-31_test123"
 
-        with patch("data.metrics_cache.CACHE_FILE", temp_cache_file):
-            save_cached_metrics(cache_key, sample_metrics)
+        save_cached_metrics(cache_key, sample_metrics, ttl_seconds=600)
+
+        row = _cache_rows(temp_cache_db)[cache_key]
+        assert row["cache_version"] == CACHE_VERSION
+        assert row["ttl_seconds"] == 600
+        assert row["expires_at"] == pytest.approx(row["calculated_at"] + 600)
+        assert row["size_bytes"] == len(row["metrics"].encode("utf-8"))
+        assert row["access_seq"] >= 1
 
-            with open(temp_cache_file) as f:
-                cache = json.load(f)
+    def test_stats_timestamps_are_iso_format(self, temp_cache_db, sample_metrics):
+        """Test reported timestamps are in ISO 8601 format."""
+        save_cached_metrics("dora_2025-01-01_2025-01-31_test123", sample_metrics)
 
-            entry = cache["entries"][cache_key]
+        stats = get_cache_stats()
 
-            # All timestamps should parse as ISO 8601
-            datetime.fromisoformat(entry["calculated_at"])
-            datetime.fromisoformat(entry["expires_at"])
-            datetime.fromisoformat(entry["last_accessed"])
+        # All timestamps should parse as ISO 8601
+        datetime.fromisoformat(stats["oldest_entry"])
+        datetime.fromisoformat(stats["newest_entry"])
@@ -0,0 +1,129 @@
+"""
+Tests for data/metrics/issue_table.py
+
+The columnar filters must select exactly the issues the per-dict loops in
+_weekly_issue_prep and _weekly_flow select. Pure logic only - no database.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from data.metrics._weekly_flow import _compute_wip_at_week_end
+from data.metrics._weekly_issue_prep import filter_completed_in_week
+from data.metrics.issue_table import IssueTable
+
+FLOW_END = ["Done", "Closed"]
+WIP = ["In Progress", "In Review"]
+STATUSES = ["To Do", *WIP, *FLOW_END]
+BASE = datetime(2025, 3, 3)
+
+
+def _ts(moment: datetime, suffix: str = "+0000") -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000") + suffix
+
+
+@pytest.fixture
+def flat_issues() -> list[dict]:
+    rng = random.Random(7)
+    issues = []
+    for idx in range(200):
+        created = BASE + timedelta(hours=rng.randint(0, 24 * 40))
+        done_at = created + timedelta(hours=rng.randint(1, 24 * 20))
+        status = rng.choice(STATUSES)
+        issue = {
+            "issue_key": f"DEV-{idx}",
+            "issue_type": rng.choice(["Story", "Bug", None]),
+            "status": status,
+            "created": _ts(created, rng.choice(["+0000", "+0200", "Z"])),
+            "updated": _ts(done_at),
+            "resolved": None,
+            "points": rng.choice([None, 1, 3.0, "5", "n/a"]),
+            "custom_fields": {"customfield_10001": rng.choice(["PROD", None])},
+        }
+        if status in FLOW_END:
+            if rng.random() < 0.5:
+                issue["resolved"] = _ts(done_at)
+            else:
+                issue["changelog"] = {
+                    "histories": [
+                        {
+                            "created": _ts(done_at),
+                            "items": [
+                                {
+                                    "field": "status",
+                                    "fromString": "In Progress",
+                                    "toString": status,
+                                }
+                            ],
+                        }
+                    ]
+                }
+        issues.append(issue)
+    return issues
+
+
+def test_completed_in_matches_filter_completed_in_week(flat_issues) -> None:
+    table = IssueTable(flat_issues)
+    for week in range(10):
+        week_start = BASE + timedelta(weeks=week)
+        week_end = week_start + timedelta(days=7)
+        expected = filter_completed_in_week(flat_issues, FLOW_END, week_start, week_end)
+        assert table.completed_in(FLOW_END, week_start, week_end) == expected
+
+
+def test_current_week_wip_matches_dict_loop(flat_issues) -> None:
+    table = IssueTable(flat_issues)
+    week_start = BASE
+    week_end = BASE + timedelta(days=7)
+    args = (flat_issues, WIP, FLOW_END, week_start, week_end, True, week_end, "w")
+
+    expected = _compute_wip_at_week_end(*args)
+    actual = _compute_wip_at_week_end(*args, issue_table=table)
+
+    assert actual == expected
+
+
+def test_historical_wip_matches_dict_loop(flat_issues) -> None:
+    table = IssueTable(flat_issues)
+    for week in range(1, 9):
+        week_start = BASE + timedelta(weeks=week)
+        week_end = week_start + timedelta(days=7)
+        args = (flat_issues, WIP, FLOW_END, week_start, week_end, False, week_end, "w")
+
+        expected = _compute_wip_at_week_end(*args)
+        actual = _compute_wip_at_week_end(*args, issue_table=table)
+
+        assert actual == expected
+
+
+def test_columns_from_flat_rows(flat_issues) -> None:
+    table = IssueTable(flat_issues)
+
+    assert len(table) == len(flat_issues)
+    assert table.keys.tolist() == [issue["issue_key"] for issue in flat_issues]
+    assert table.issue_types.tolist() == [i["issue_type"] for i in flat_issues]
+    assert table.statuses.tolist() == [issue["status"] for issue in flat_issues]
+    assert table.completion_times(FLOW_END).dtype == np.dtype("datetime64[us]")
+
+
+def test_columns_from_nested_api_format() -> None:
+    issue = {
+        "key": "OPS-1",
+        "fields": {
+            "issuetype": {"name": "Task"},
+            "status": {"name": "In Review"},
+            "project": {"key": "OPS"},
+            "created": "2025-03-03T10:00:00.000+0200",
+            "resolutiondate": None,
+        },
+    }
+
+    table = IssueTable([issue])
+
+    assert table.keys.tolist() == ["OPS-1"]
+    assert table.issue_types.tolist() == ["Task"]
+    assert table.statuses.tolist() == ["In Review"]
+    assert table.select(table.status_in(WIP)) == [issue]
@@ -0,0 +1,94 @@
+"""Tests for per-metric snapshot reads and targeted cache invalidation."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from data.metrics_snapshots import (
+    batch_write_mode,
+    clear_snapshots_cache,
+    get_metric_history,
+    get_metric_snapshot,
+    get_metric_weekly_values,
+    load_snapshots,
+    save_metric_snapshot,
+    save_snapshots,
+)
+from data.persistence.factory import get_backend
+
+
+def _snapshot(week_label: str, metric_name: str) -> dict:
+    snapshot = get_metric_snapshot(week_label, metric_name)
+    assert snapshot is not None
+    return snapshot
+
+
+@pytest.fixture
+def backend(temp_database):
+    backend = get_backend()
+    now = datetime.now().isoformat()
+    backend.save_profile({"id": "p1", "name": "P", "created_at": now, "last_used": now})
+    backend.save_query(
+        "p1",
+        {"id": "q1", "name": "Q", "jql": "x", "created_at": now, "last_used": now},
+    )
+    backend.set_app_state("active_profile_id", "p1")
+    backend.set_app_state("active_query_id", "q1")
+    clear_snapshots_cache()
+    save_snapshots(
+        {
+            f"2025-W{week:02d}": {
+                "flow_velocity": {"completed_count": week},
+                "flow_load": {"wip_count": week * 10},
+            }
+            for week in range(2, 6)
+        }
+    )
+    yield backend
+    clear_snapshots_cache()
+
+
+def test_reads_only_requested_metric_and_range(backend) -> None:
+    with patch.object(
+        backend, "get_metric_values", wraps=backend.get_metric_values
+    ) as spy:
+        history = get_metric_history(["flow_velocity"], "2025-W03", "2025-W04")
+
+    assert list(history["flow_velocity"]) == ["2025-W03", "2025-W04"]
+    assert history["flow_velocity"]["2025-W03"]["completed_count"] == 3
+    assert spy.call_args.kwargs["metric_names"] == ["flow_velocity"]
+    assert get_metric_weekly_values(
+        ["2025-W02", "2025-W05", "2025-W09"], "flow_load", "wip_count"
+    ) == [20, 50, 0]
+
+
+def test_write_invalidates_only_touched_metrics(backend) -> None:
+    get_metric_history(["flow_velocity", "flow_load"])
+    full_history = load_snapshots()
+
+    save_snapshots({"2025-W05": {"flow_load": {"wip_count": 7}}})
+
+    with patch.object(
+        backend, "get_metric_values", wraps=backend.get_metric_values
+    ) as spy:
+        assert _snapshot("2025-W04", "flow_velocity")["completed_count"] == 4
+        assert spy.call_count == 0
+        assert _snapshot("2025-W05", "flow_load")["wip_count"] == 7
+        assert spy.call_count == 1
+
+    # The full-history cache is updated in place instead of being dropped
+    assert load_snapshots() is full_history
+    assert full_history["2025-W05"]["flow_load"]["wip_count"] == 7
+
+
+def test_batch_writes_visible_before_flush(backend) -> None:
+    with batch_write_mode():
+        save_metric_snapshot("2025-W06", "flow_velocity", {"completed_count": 6})
+        assert _snapshot("2025-W06", "flow_velocity")["completed_count"] == 6
+        assert get_metric_weekly_values(
+            ["2025-W05", "2025-W06"], "flow_velocity", "completed_count"
+        ) == [5, 6]
+
+    clear_snapshots_cache()
+    assert _snapshot("2025-W06", "flow_velocity")["completed_count"] == 6
@@ -0,0 +1,250 @@
+"""
+Parity tests for data/metrics/sweep_calculator.py
+
+The sweep engine must produce exactly what the per-week functions in
+_weekly_issue_prep, _weekly_flow, _weekly_dora_prep and fixversion_matcher
+produce when called once per week. Pure logic only - no database access.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data.fixversion_matcher import filter_issues_deployed_in_week
+from data.metrics._weekly_dora_calc import calculate_dora_metrics
+from data.metrics._weekly_dora_prep import (
+    count_deployments_for_week,
+    filter_bugs_by_resolution_week,
+)
+from data.metrics._weekly_flow import _compute_wip_at_week_end, calculate_flow_metrics
+from data.metrics._weekly_issue_prep import filter_completed_in_week
+from data.metrics.sweep_calculator import WeeklyMetricsSweep, build_sweep_dataset
+
+###############################################################################
+# Helpers
+###############################################################################
+
+FLOW_END = ["Done", "Closed"]
+WIP = ["In Progress", "In Review", "Testing"]
+ALL_STATUSES = ["To Do", *WIP, *FLOW_END]
+BASE = datetime(2025, 1, 6)  # Monday of ISO week 2025-W02
+WEEKS = [
+    (f"2025-W{week:02d}", BASE + timedelta(weeks=week - 2)) for week in range(2, 14)
+]
+RELEASES = [
+    {
+        "id": str(10000 + i),
+        "name": f"R{i}",
+        "releaseDate": (BASE + timedelta(days=9 * i)).strftime("%Y-%m-%d"),
+    }
+    for i in range(10)
+]
+
+
+def _ts(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def _make_issue(rng: random.Random, idx: int, issue_type: str) -> dict:
+    created = BASE - timedelta(days=7) + timedelta(hours=rng.randint(0, 24 * 70))
+    histories = []
+    moment = created
+    status = "To Do"
+    for _ in range(rng.randint(0, 6)):
+        moment += timedelta(hours=rng.choice([0, 5, 30, 60]))
+        new_status = rng.choice(ALL_STATUSES)
+        histories.append(
+            {
+                "created": _ts(moment),
+                "items": [
+                    {"field": "status", "fromString": status, "toString": new_status}
+                ],
+            }
+        )
+        status = new_status
+    resolved = _ts(moment) if status in FLOW_END and rng.random() < 0.7 else None
+    issue = {
+        "issue_key": f"DEV-{idx}",
+        "key": f"DEV-{idx}",
+        "issue_type": issue_type,
+        "status": status,
+        "created": _ts(created),
+        "resolved": resolved,
+        "fixVersions": rng.sample(RELEASES, rng.randint(0, 2)),
+        "custom_fields": {},
+    }
+    if histories:
+        issue["changelog"] = {"histories": histories}
+    return issue
+
+
+@pytest.fixture
+def dataset_inputs():
+    rng = random.Random(42)
+    issue_types = ["Story", "Story", "Task", "Bug", "Operational Task"]
+    issues = [_make_issue(rng, i, rng.choice(issue_types)) for i in range(150)]
+    app_settings = {
+        "flow_end_statuses": FLOW_END,
+        "wip_statuses": WIP,
+        "devops_task_types": ["Operational Task"],
+        "bug_types": ["Bug"],
+        "production_environment_values": [],
+        "field_mappings": {},
+    }
+    return issues, app_settings
+
+
+###############################################################################
+# Index parity
+###############################################################################
+
+
+class TestSweepParity:
+    def test_completed_issues_match_weekly_filter(self, dataset_inputs) -> None:
+        issues, app_settings = dataset_inputs
+        dataset = build_sweep_dataset(issues, issues, True, app_settings)
+        for week_label, week_start in WEEKS:
+            week_end = week_start + timedelta(days=7)
+            expected = filter_completed_in_week(issues, FLOW_END, week_start, week_end)
+            actual, _ = dataset.select_week(week_label, week_start, week_end, week_end)
+            assert actual == expected, week_label
+
+    def test_wip_matches_point_in_time_reconstruction(self, dataset_inputs) -> None:
+        issues, app_settings = dataset_inputs
+        dataset = build_sweep_dataset(issues, issues, True, app_settings)
+        # Second pass in reverse order exercises the rewind path
+        for week_label, week_start in [*WEEKS, *reversed(WEEKS)]:
+            week_end = week_start + timedelta(days=7)
+            expected = _compute_wip_at_week_end(
+                issues, WIP, FLOW_END, week_start, week_end, False, week_end, "x"
+            )
+            actual = dataset.status_sweep.wip_result(week_end, week_label)
+            assert actual["wip_count"] == expected["wip_count"], week_label
+            assert actual["by_status"] == expected["by_status"], week_label
+            assert actual["by_issue_type"] == expected["by_issue_type"], week_label
+
+    def test_dora_selections_match_weekly_filters(self, dataset_inputs) -> None:
+        issues, app_settings = dataset_inputs
+        dataset = build_sweep_dataset(issues, issues, True, app_settings)
+        release_map = dataset.fixversion_release_map
+        assert release_map
+        for week_label, week_start in WEEKS:
+            week_end = week_start + timedelta(days=7)
+            _, selection = dataset.select_week(
+                week_label, week_start, week_end, week_end
+            )
+            assert selection["dev_issues"] == filter_issues_deployed_in_week(
+                dataset.development_issues, release_map, week_start, week_end
+            )
+            assert selection["operational_tasks"] == filter_issues_deployed_in_week(
+                dataset.operational_tasks, release_map, week_start, week_end
+            )
+            assert selection["deployments"] == count_deployments_for_week(
+                dataset.operational_tasks,
+                FLOW_END,
+                week_label,
+                week_start,
+                week_end,
+                valid_fix_versions=dataset.development_fix_versions,
+            )
+            bugs = selection["bugs_by_mode"]
+            assert bugs["resolution"] == filter_bugs_by_resolution_week(
+                dataset.production_bugs, week_start, week_end
+            )
+            assert bugs["deployment"] == filter_issues_deployed_in_week(
+                dataset.production_bugs, release_map, week_start, week_end
+            )
+            assert selection["release_names"] == sorted(
+                name
+                for name, release_date in release_map.items()
+                if week_start <= release_date < week_end
+            )
+
+
+###############################################################################
+# Saved snapshot parity
+###############################################################################
+
+
+def _capture_snapshots(run) -> dict:
+    saved: dict = {}
+
+    def _save(week_label, metric_name, value):
+        saved[(week_label, metric_name)] = value
+
+    metrics_config = MagicMock()
+    metrics_config.get_flow_type_for_issue.side_effect = lambda issue_type, _effort: (
+        "Defect" if issue_type == "Bug" else "Feature"
+    )
+
+    with (
+        patch(
+            "data.metrics._weekly_flow.get_metrics_config",
+            return_value=metrics_config,
+        ),
+        patch("data.metrics._weekly_flow.save_metric_snapshot", side_effect=_save),
+        patch("data.metrics._weekly_dora_calc.save_metric_snapshot", side_effect=_save),
+        patch("data.metrics.weekly_calculator.save_metric_snapshot", side_effect=_save),
+    ):
+        run()
+    saved = {key: value for key, value in saved.items() if key[1] != "trends"}
+    return saved
+
+
+def test_sweep_saves_same_snapshots_as_per_week_path(dataset_inputs) -> None:
+    issues, app_settings = dataset_inputs
+    dataset = build_sweep_dataset(issues, issues, True, app_settings)
+    sweep = WeeklyMetricsSweep.from_dataset(dataset)
+
+    def per_week() -> None:
+        for week_label, week_start in WEEKS:
+            week_end = week_start + timedelta(days=7)
+            completed = filter_completed_in_week(issues, FLOW_END, week_start, week_end)
+            calculate_flow_metrics(
+                completed,
+                issues,
+                True,
+                WIP,
+                FLOW_END,
+                week_start,
+                week_end,
+                False,
+                week_end,
+                app_settings,
+                week_label,
+                lambda _msg: None,
+            )
+            calculate_dora_metrics(
+                dataset.operational_tasks,
+                dataset.development_issues,
+                dataset.production_bugs,
+                dataset.development_fix_versions,
+                dataset.fixversion_release_map,
+                FLOW_END,
+                {},
+                week_label,
+                week_start,
+                week_end,
+                lambda _msg: None,
+            )
+
+    def swept() -> None:
+        for week_label, week_start in WEEKS:
+            week_end = week_start + timedelta(days=7)
+            sweep._calculate_loaded_week(
+                dataset,
+                week_label,
+                week_start,
+                week_end,
+                False,
+                week_end,
+                lambda _msg: None,
+            )
+
+    expected = _capture_snapshots(per_week)
+    actual = _capture_snapshots(swept)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert actual[key] == value, key
@@ -6,13 +6,24 @@ These tests verify that metric calculations meet strict performance targets:
 - Medium datasets (500-1500 issues): < 5s
 - Date parsing cache: 80% speedup
 - Field lookup index: 95% speedup
+
+Relative timing comparisons are marked ``benchmark`` and only run with
+--run-benchmarks.
 """
 
+import json
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import pytest
 
+# Daily snapshots of _sprint_dataset() from calculate_daily_sprint_snapshots
+# as it was before vectorization (per-day issue loop)
+SPRINT_SNAPSHOT_BASELINE = (
+    Path(__file__).parents[2] / "fixtures" / "sprint_snapshots_baseline.json"
+)
+
 
 class TestDORAMetricsPerformance:
     """Performance benchmarks for DORA metrics calculations."""
@@ -389,3 +400,201 @@ class TestFieldLookupPerformance:
         assert speedup_percent >= 60.0, (
             f"Field lookup speedup: {speedup_percent:.1f}%, expected >= 60%"
         )
+
+
+def _loop_daily_sprint_snapshots(
+    sprint_data: dict,
+    issues: list[dict],
+    changelog_entries: list[dict],
+    sprint_start_date: str,
+    sprint_end_date: str,
+    flow_end_statuses: list[str],
+) -> list[dict]:
+    """Per-day issue loop the vectorized sprint snapshot engine replaced.
+
+    Timing reference only; correctness is checked against
+    SPRINT_SNAPSHOT_BASELINE, captured from the original implementation.
+    """
+    from collections import defaultdict
+    from datetime import UTC
+
+    from data.status_interval_index import StatusIntervalIndex
+
+    start_dt = datetime.fromisoformat(sprint_start_date).replace(tzinfo=UTC)
+    end_dt = datetime.fromisoformat(sprint_end_date).replace(tzinfo=UTC)
+    current_issues = sprint_data["current_issues"]
+    issue_map = {
+        issue["issue_key"]: issue
+        for issue in issues
+        if issue["issue_key"] in current_issues
+    }
+    status_index = StatusIntervalIndex.from_changelog_entries(
+        list(issue_map.values()), changelog_entries
+    )
+    scope_timeline = [
+        (datetime.fromisoformat(item["timestamp"]), item["issue_key"], action)
+        for action, items in (
+            ("add", sprint_data["added_issues"]),
+            ("remove", sprint_data["removed_issues"]),
+        )
+        for item in items
+    ]
+    scope_timeline.sort(key=lambda change: change[0])
+
+    issues_in_scope = set(current_issues)
+    for timestamp, issue_key, action in scope_timeline:
+        if timestamp < start_dt:
+            if action == "add":
+                issues_in_scope.add(issue_key)
+            else:
+                issues_in_scope.discard(issue_key)
+
+    snapshots = []
+    scope_change_idx = 0
+    current_date = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+    while current_date <= end_date:
+        day_end = current_date + timedelta(days=1)
+        while scope_change_idx < len(scope_timeline):
+            timestamp, issue_key, action = scope_timeline[scope_change_idx]
+            if timestamp >= day_end:
+                break
+            if action == "add":
+                issues_in_scope.add(issue_key)
+            else:
+                issues_in_scope.discard(issue_key)
+            scope_change_idx += 1
+
+        completed_points = completed_count = total_points = total_count = 0
+        status_breakdown = defaultdict(lambda: {"count": 0, "points": 0})
+        statuses_today = dict(
+            zip(status_index.keys, status_index.statuses_at(current_date), strict=True)
+        )
+        for issue_key in issues_in_scope:
+            issue = issue_map.get(issue_key)
+            if not issue:
+                continue
+            status = statuses_today.get(issue_key) or issue.get("status", "Unknown")
+            points = issue.get("points", 0) or 0
+            total_count += 1
+            total_points += points
+            status_breakdown[status]["count"] += 1
+            status_breakdown[status]["points"] += points
+            if status in flow_end_statuses:
+                completed_count += 1
+                completed_points += points
+
+        snapshots.append(
+            {
+                "date": current_date.date().isoformat(),
+                "completed_points": completed_points,
+                "total_scope": total_points,
+                "status_breakdown": dict(status_breakdown),
+                "completed_count": completed_count,
+                "total_count": total_count,
+            }
+        )
+        current_date += timedelta(days=1)
+    return snapshots
+
+
+def _sprint_dataset():
+    """30-day sprint with 500 issues, status transitions and scope changes."""
+    import random
+
+    rng = random.Random(17)
+    start = datetime(2025, 3, 3, 9, 0)
+    workflow = ["To Do", "In Progress", "In Review", "Done"]
+    issues = []
+    changelog_entries = []
+    for i in range(500):
+        key = f"SPR-{i}"
+        status = "To Do"
+        change_time = start - timedelta(days=rng.randint(0, 5))
+        for next_status in workflow[1 : rng.randint(1, 4) + 1]:
+            change_time += timedelta(hours=rng.randint(1, 120))
+            changelog_entries.append(
+                {
+                    "issue_key": key,
+                    "field_name": "status",
+                    "old_value": status,
+                    "new_value": next_status,
+                    "change_date": change_time.isoformat(),
+                }
+            )
+            status = next_status
+        issues.append(
+            {
+                "issue_key": key,
+                "status": status,
+                "points": rng.choice([None, 1, 2, 3, 5, 8]),
+            }
+        )
+
+    scope_changes = [
+        {
+            "issue_key": f"SPR-{rng.randrange(600)}",
+            "timestamp": (
+                start + timedelta(hours=rng.randint(-48, 30 * 24))
+            ).isoformat()
+            + "+00:00",
+        }
+        for _ in range(120)
+    ]
+    sprint_data = {
+        "current_issues": [issue["issue_key"] for issue in issues[:450]],
+        "added_issues": scope_changes[:80],
+        "removed_issues": scope_changes[80:],
+    }
+    return sprint_data, issues, changelog_entries, start
+
+
+def _sprint_snapshot_args():
+    sprint_data, issues, changelog_entries, start = _sprint_dataset()
+    return (
+        sprint_data,
+        issues,
+        changelog_entries,
+        start.isoformat(),
+        (start + timedelta(days=29)).isoformat(),
+        ["Done"],
+    )
+
+
+class TestSprintSnapshotPerformance:
+    """Vectorized daily sprint snapshot engine against the per-day loop."""
+
+    def test_sprint_snapshots_match_baseline(self):
+        """Results equal those of the per-day loop, captured before vectorizing."""
+        from data.sprint_snapshot_calculator import calculate_daily_sprint_snapshots
+
+        expected = json.loads(SPRINT_SNAPSHOT_BASELINE.read_text(encoding="utf-8"))
+
+        snapshots = calculate_daily_sprint_snapshots(*_sprint_snapshot_args())
+
+        assert len(snapshots) == 30
+        assert snapshots == expected
+        # Integer point sums stay ints
+        assert all(type(s["total_scope"]) is int for s in snapshots)
+
+    @pytest.mark.benchmark
+    def test_benchmark_vectorized_sprint_snapshots(self):
+        """Vectorized snapshots are faster than the per-day loop they replaced."""
+        from data.sprint_snapshot_calculator import calculate_daily_sprint_snapshots
+
+        args = _sprint_snapshot_args()
+
+        start_time = time.perf_counter()
+        for _ in range(5):
+            _loop_daily_sprint_snapshots(*args)
+        baseline_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(5):
+            calculate_daily_sprint_snapshots(*args)
+        vectorized_time = time.perf_counter() - start_time
+
+        speedup_percent = ((baseline_time - vectorized_time) / baseline_time) * 100
+        assert speedup_percent >= 30.0, (
+            f"Sprint snapshot speedup: {speedup_percent:.1f}%, expected >= 30%"
+        )
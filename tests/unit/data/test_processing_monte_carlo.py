@@ -0,0 +1,120 @@
+"""
+Unit tests for data/processing_monte_carlo.py
+
+Checks the vectorized simulation against cases with known answers and the
+shape of the forecast consumed by the dashboard, report and health score.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.processing_monte_carlo import (
+    calculate_monte_carlo_forecast,
+    get_percentile_dates,
+    simulate_completion_weeks,
+    summarize_completion_weeks,
+)
+from data.types import MonteCarloTrackForecast
+
+
+class TestSimulateCompletionWeeks:
+    def test_constant_throughput_is_exact(self) -> None:
+        weeks = simulate_completion_weeks([5], remaining=30, trials=100)
+        assert np.allclose(weeks, 6.0)
+
+    def test_finishing_week_is_interpolated(self) -> None:
+        # 4 per week: 28 done after 7 weeks, last 2 items take half a week
+        weeks = simulate_completion_weeks([4], remaining=30, trials=100)
+        assert np.allclose(weeks, 7.5)
+
+    def test_zero_weeks_are_ignored(self) -> None:
+        weeks = simulate_completion_weeks([0, 5, 0], remaining=30, trials=100)
+        assert np.allclose(weeks, 6.0)
+
+    def test_no_remaining_work_finishes_immediately(self) -> None:
+        weeks = simulate_completion_weeks([5, 7], remaining=0, trials=10)
+        assert np.all(weeks == 0)
+
+    def test_trials_past_horizon_are_inf(self) -> None:
+        weeks = simulate_completion_weeks([1], remaining=100, trials=10, max_weeks=52)
+        assert np.all(np.isinf(weeks))
+
+    def test_no_history_is_inf(self) -> None:
+        weeks = simulate_completion_weeks([0, 0], remaining=10, trials=10)
+        assert np.all(np.isinf(weeks))
+
+    def test_mean_matches_throughput_and_is_reproducible(self) -> None:
+        history = [2, 4, 6, 8, 10]  # mean 6 per week
+        weeks = simulate_completion_weeks(history, remaining=300, trials=20_000)
+        assert np.mean(weeks) == pytest.approx(50, rel=0.02)
+        assert np.array_equal(
+            weeks, simulate_completion_weeks(history, remaining=300, trials=20_000)
+        )
+
+
+class TestSummarizeCompletionWeeks:
+    def test_percentiles_and_deadline_probability(self) -> None:
+        weeks = np.array([1.0, 2.0, 3.0, 4.0])
+        summary = summarize_completion_weeks(weeks, days_to_deadline=14)
+        assert summary["p50_days"] == pytest.approx(17.5)
+        assert summary["p50_days"] <= summary["p85_days"] <= summary["p95_days"]
+        assert summary["deadline_probability"] == 50.0
+        assert summary["beyond_horizon_pct"] == 0.0
+
+    def test_without_deadline_probability_is_none(self) -> None:
+        summary = summarize_completion_weeks(np.array([1.0]), days_to_deadline=None)
+        assert summary["deadline_probability"] is None
+
+    def test_unfinished_trials_are_capped(self) -> None:
+        weeks = np.array([1.0, np.inf])
+        summary = summarize_completion_weeks(weeks, days_to_deadline=700, max_days=730)
+        assert summary["p95_days"] <= 730
+        assert summary["deadline_probability"] == 50.0
+        assert summary["beyond_horizon_pct"] == 50.0
+
+    def test_deadline_past_horizon_does_not_count_unfinished(self) -> None:
+        weeks = simulate_completion_weeks([1, 0.5], remaining=10_000, trials=100)
+        summary = summarize_completion_weeks(weeks, days_to_deadline=800, max_days=730)
+        assert summary["beyond_horizon_pct"] == 100.0
+        assert summary["deadline_probability"] == 0.0
+
+
+class TestCalculateMonteCarloForecast:
+    def test_items_and_points_tracks(self) -> None:
+        grouped = pd.DataFrame(
+            {"completed_items": [5, 5, 5, 5], "completed_points": [20, 20, 20, 20]}
+        )
+        forecast = calculate_monte_carlo_forecast(grouped, 20, 40, 30, trials=1000)
+
+        items, points = forecast["items"], forecast["points"]
+        assert items is not None and points is not None
+        assert forecast["trials"] == 1000
+        assert items["p50_days"] == pytest.approx(28)
+        assert items["deadline_probability"] == 100.0
+        assert items["weeks_sampled"] == 4
+        assert points["p95_days"] == pytest.approx(14)
+
+    def test_track_without_history_is_none(self) -> None:
+        grouped = pd.DataFrame({"completed_items": [3, 4], "completed_points": [0, 0]})
+        forecast = calculate_monte_carlo_forecast(grouped, 10, 10, trials=1000)
+        assert forecast["items"] is not None
+        assert forecast["points"] is None
+
+    def test_empty_history(self) -> None:
+        forecast = calculate_monte_carlo_forecast(pd.DataFrame(), 10, 10)
+        assert forecast["items"] is None and forecast["points"] is None
+
+    def test_percentile_dates(self) -> None:
+        track: MonteCarloTrackForecast = {
+            "p50_days": 7.0,
+            "p85_days": 14.0,
+            "p95_days": 21.4,
+            "deadline_probability": None,
+            "beyond_horizon_pct": 0.0,
+            "weeks_sampled": 4,
+        }
+        dates = get_percentile_dates(track, datetime(2025, 1, 6))
+        assert dates == {"p50": "2025-01-13", "p85": "2025-01-20", "p95": "2025-01-27"}
@@ -7,7 +7,10 @@ with various metric availability scenarios and validates dynamic weighting.
 
 import pytest
 
-from data.project_health_calculator import calculate_comprehensive_project_health
+from data.project_health_calculator import (
+    calculate_comprehensive_project_health,
+    prepare_dashboard_metrics_for_health,
+)
 
 
 class TestProjectHealthCalculator:
@@ -397,3 +400,23 @@ class TestProjectHealthCalculator:
         assert improving["overall_score"] > declining["overall_score"], (
             "Improving trend should score higher than declining"
         )
+
+    def test_deadline_probability_replaces_completion_confidence(self):
+        """Monte Carlo deadline odds drive the forecast confidence signal."""
+        metrics = prepare_dashboard_metrics_for_health(completion_confidence=75)
+        assert "deadline_probability" not in metrics
+
+        likely = prepare_dashboard_metrics_for_health(
+            completion_confidence=75, deadline_probability=95.0
+        )
+        unlikely = prepare_dashboard_metrics_for_health(
+            completion_confidence=75, deadline_probability=5.0
+        )
+
+        likely_score = calculate_comprehensive_project_health(likely)["dimensions"][
+            "predictability"
+        ]["score"]
+        unlikely_score = calculate_comprehensive_project_health(unlikely)["dimensions"][
+            "predictability"
+        ]["score"]
+        assert likely_score > unlikely_score
@@ -0,0 +1,126 @@
+"""
+Tests for data/metrics/refresh_context.py
+
+The refresh context must filter exactly like the per-calculator code paths it
+replaces and build each derived subset only once. Pure logic only - the
+backend is mocked.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data.issue_filtering import filter_issues_for_metrics
+from data.metrics._weekly_dora_prep import classify_dora_issues
+from data.metrics.refresh_context import RefreshContext
+from data.metrics.sweep_calculator import WeeklyMetricsSweep
+
+
+def _issue(key: str, project: str, issue_type: str, parent: str | None = None):
+    return {
+        "issue_key": key,
+        "key": key,
+        "project_key": project,
+        "issue_type": issue_type,
+        "status": "Done",
+        "created": "2025-01-06T10:00:00.000+0000",
+        "resolved": "2025-01-08T10:00:00.000+0000",
+        "fixVersions": [],
+        "custom_fields": {},
+        "parent": {"key": parent} if parent else None,
+    }
+
+
+@pytest.fixture
+def issues():
+    return [
+        _issue("DEV-1", "DEV", "Epic"),
+        _issue("DEV-2", "DEV", "Story", parent="DEV-1"),
+        _issue("DEV-3", "DEV", "Bug", parent="DEV-1"),
+        _issue("DEV-4", "DEV", "Feature"),
+        _issue("OPS-1", "OPS", "Operational Task"),
+        _issue("OTHER-1", "OTHER", "Story"),
+    ]
+
+
+@pytest.fixture
+def settings():
+    return {
+        "field_mappings": {
+            "general": {"parent_field": "parent", "parent_issue_types": ["Feature"]}
+        },
+        "development_projects": ["DEV"],
+        "devops_projects": ["OPS"],
+        "devops_task_types": ["Operational Task"],
+        "flow_end_statuses": ["Done"],
+        "wip_statuses": ["In Progress"],
+        "bug_types": ["Bug"],
+        "production_environment_values": [],
+    }
+
+
+class TestRefreshContext:
+    def test_metrics_issues_match_issue_filtering(self, issues, settings) -> None:
+        context = RefreshContext(issues, settings)
+        expected = filter_issues_for_metrics(issues, settings)
+        assert [i["issue_key"] for i in context.all_issues] == [
+            i["issue_key"] for i in expected
+        ]
+        # get_filtered_issues from CalculationContext works on metrics issues
+        stories = context.get_filtered_issues(lambda i: i["issue_type"] == "Story")
+        assert [i["issue_key"] for i in stories] == ["DEV-2"]
+
+    def test_dora_classification_matches_and_is_cached(self, issues, settings) -> None:
+        context = RefreshContext(issues, settings)
+        expected = classify_dora_issues(
+            context.all_issues, context.all_issues_raw, settings
+        )
+        assert context.dora_classification == expected
+
+        with patch(
+            "data.metrics.refresh_context.classify_dora_issues"
+        ) as mock_classify:
+            assert context.dora_classification == expected
+        mock_classify.assert_not_called()
+
+    def test_from_database_merges_changelog(self, issues, settings) -> None:
+        backend = MagicMock()
+        backend.get_issues.return_value = issues
+        backend.get_changelog_entries.return_value = [
+            {
+                "issue_key": "DEV-2",
+                "change_date": "2025-01-07T10:00:00.000+0000",
+                "field_name": "status",
+                "old_value": "To Do",
+                "new_value": "Done",
+            }
+        ]
+
+        context = RefreshContext.from_database(backend, "p1", "q1", settings)
+
+        assert context.changelog_available is True
+        assert context.profile_id == "p1" and context.query_id == "q1"
+        merged = next(i for i in context.all_issues if i["issue_key"] == "DEV-2")
+        assert len(merged["changelog"]["histories"]) == 1
+
+    def test_from_database_without_issues_raises(self, settings) -> None:
+        backend = MagicMock()
+        backend.get_issues.return_value = []
+        with pytest.raises(ValueError, match="No JIRA data available"):
+            RefreshContext.from_database(backend, "p1", "q1", settings)
+
+    def test_sweep_reuses_context(self, issues, settings) -> None:
+        context = RefreshContext(issues, settings, profile_id="p1", query_id="q1")
+        sweep = WeeklyMetricsSweep(refresh_context=context)
+
+        with (
+            patch("data.metrics.sweep_calculator.MetricsConfig"),
+            patch("data.metrics.sweep_calculator.get_backend") as mock_backend,
+        ):
+            dataset = sweep.load_dataset()
+
+        mock_backend.assert_not_called()
+        assert dataset is not None
+        assert dataset.issue_table is context.issue_table
+        assert dataset.operational_tasks is context.dora_classification[0]
+        assert dataset.profile_id == "p1"
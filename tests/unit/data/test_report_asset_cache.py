@@ -0,0 +1,73 @@
+"""Tests for the process-level report asset bundle and template cache."""
+
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from data import report_assets_embedder
+from data.report.renderer import _get_report_environment
+from data.report_assets_embedder import (
+    clear_report_asset_cache,
+    embed_report_dependencies,
+)
+
+
+@pytest.fixture
+def assets_dir() -> Iterator[Path]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assets = Path(temp_dir)
+        (assets / "bootstrap.min.css").write_text(
+            "body{}/*# sourceMappingURL=bootstrap.css.map */", encoding="utf-8"
+        )
+        (assets / "font-awesome.min.css").write_text(
+            "@font-face{src:url(../webfonts/fa-solid-900.woff2)}", encoding="utf-8"
+        )
+        (assets / "chart.umd.min.js").write_text("var c;", encoding="utf-8")
+        (assets / "chartjs-plugin-annotation.min.js").write_text(
+            "var a;", encoding="utf-8"
+        )
+        (assets / "webfonts").mkdir()
+        (assets / "webfonts" / "fa-solid-900.woff2").write_bytes(b"font")
+        clear_report_asset_cache()
+        with patch.object(
+            report_assets_embedder, "_get_assets_dir", return_value=assets
+        ):
+            yield assets
+        clear_report_asset_cache()
+
+
+def test_bundle_built_once_and_rebuilt_when_asset_changes(assets_dir) -> None:
+    with patch.object(
+        report_assets_embedder,
+        "_build_bundle",
+        wraps=report_assets_embedder._build_bundle,
+    ) as build:
+        first = embed_report_dependencies()
+        first["chartjs"] = "mutated by caller"
+        second = embed_report_dependencies()
+
+        assert build.call_count == 1
+        assert second["chartjs"] == "var c;"
+        assert "sourceMappingURL" not in second["bootstrap_css"]
+        assert "data:font/woff2;base64,Zm9udA==" in second["fontawesome_css"]
+
+        font = assets_dir / "webfonts" / "fa-solid-900.woff2"
+        font.write_bytes(b"new font")
+        stat = font.stat()
+        os.utime(font, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        third = embed_report_dependencies()
+
+    assert build.call_count == 2
+    assert "data:font/woff2;base64,bmV3IGZvbnQ=" in third["fontawesome_css"]
+
+
+def test_report_environment_is_reused() -> None:
+    env = _get_report_environment()
+
+    assert _get_report_environment() is env
+    assert env.autoescape is True
+    assert {"int", "dec1", "dec2"} <= set(env.filters)
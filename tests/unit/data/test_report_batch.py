@@ -0,0 +1,81 @@
+"""Tests for batch report generation with explicit profile/query context."""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from data.persistence.factory import get_backend
+from data.query_manager import get_active_profile_id, get_active_query_id
+from data.report import generator_batch
+from data.report.generator_batch import ReportJob, generate_reports, main
+
+
+@pytest.fixture
+def backend(temp_database):
+    backend = get_backend()
+    now = datetime.now().isoformat()
+    for profile_id in ("p1", "p2"):
+        backend.save_profile(
+            {"id": profile_id, "name": profile_id, "created_at": now, "last_used": now}
+        )
+        backend.save_query(
+            profile_id,
+            {"id": "q1", "name": "Q", "jql": "x", "created_at": now, "last_used": now},
+        )
+    backend.set_app_state("active_profile_id", "p1")
+    backend.set_app_state("active_query_id", "q1")
+    return backend
+
+
+def _fake_report(sections: list[str], weeks: int, profile_id: str) -> tuple:
+    # Simulate code deep in the report stack touching the active state
+    active = f"{get_active_profile_id()}/{get_active_query_id()}"
+    get_backend().set_app_state("active_query_id", "changed")
+    metadata = {"profile_name": profile_id, "query_name": get_active_query_id()}
+    return f"<html>{active} {','.join(sections)} {weeks}</html>", metadata
+
+
+def test_jobs_use_explicit_context_without_switching_ui(backend, monkeypatch) -> None:
+    monkeypatch.setattr(generator_batch, "generate_html_report", _fake_report)
+    jobs = [
+        ReportJob("p2", "q1", 4, ("flow",)),
+        ReportJob("p2", "missing"),
+        ReportJob("p1", "q1"),
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = generate_reports(jobs, Path(temp_dir) / "out", max_workers=1)
+
+        assert [result.ok for result in results] == [True, False, True]
+        path, error = results[0].path, results[1].error
+        assert path is not None and error is not None
+        assert path.name.endswith("_p2_changed_4w_001.html")
+        assert path.read_text(encoding="utf-8") == "<html>p2/q1 flow 4</html>"
+        assert "missing" in error
+
+
+def test_identical_jobs_write_separate_files(backend, monkeypatch) -> None:
+    monkeypatch.setattr(generator_batch, "generate_html_report", _fake_report)
+    jobs = [ReportJob("p2", "q1", 4, ("flow",)), ReportJob("p2", "q1", 4, ("dora",))]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = generate_reports(jobs, temp_dir, max_workers=1)
+
+        assert all(result.ok for result in results)
+        assert len(list(Path(temp_dir).glob("*.html"))) == 2
+
+    assert backend.get_app_state("active_profile_id") == "p1"
+    assert backend.get_app_state("active_query_id") == "q1"
+
+
+def test_cli_parses_jobs_and_reports_failures(backend, monkeypatch) -> None:
+    monkeypatch.setattr(generator_batch, "generate_html_report", _fake_report)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert main(["--output-dir", temp_dir, "--job", "p2:q1", "--workers", "1"]) == 0
+        assert len(list(Path(temp_dir).glob("*.html"))) == 1
+        assert main(["--output-dir", temp_dir, "--job", "p2:nope"]) == 1
+        with pytest.raises(SystemExit):
+            main(["--output-dir", temp_dir, "--job", "p2"])
@@ -0,0 +1,58 @@
+"""Tests for concurrent section calculation in calculate_all_metrics."""
+
+import threading
+
+from data.persistence.sqlite import app_state_overrides
+from data.query_manager import get_active_query_id
+from data.report import generator_metrics
+from data.report.generator_metrics import calculate_all_metrics
+
+REPORT_DATA = {
+    "profile_id": "p1",
+    "all_statistics": [],
+    "statistics": [],
+    "project_scope": {"remaining_items": 100, "remaining_total_points": 500},
+    "settings": {"show_points": False},
+    "weeks_count": 12,
+    "week_labels": [],
+    "snapshots": [],
+    "jira_issues": [],
+}
+
+
+def test_sections_run_concurrently_in_caller_context(
+    temp_database, monkeypatch
+) -> None:
+    # Every section waits for all others: sequential execution would time out
+    barrier = threading.Barrier(5, timeout=10)
+    seen_queries = []
+
+    def section(name: str):
+        def calculate(*_args) -> dict:
+            barrier.wait()
+            seen_queries.append(get_active_query_id())
+            return {"has_data": False, "section": name}
+
+        return calculate
+
+    for name in ("bug", "flow", "dora", "burndown", "scope"):
+        monkeypatch.setattr(
+            generator_metrics, f"calculate_{name}_metrics", section(name)
+        )
+    messages: list[str] = []
+
+    with app_state_overrides({"active_profile_id": "p1", "active_query_id": "q7"}):
+        metrics = calculate_all_metrics(
+            REPORT_DATA, ["burndown", "flow", "dora"], 12, messages.append
+        )
+
+    assert metrics["flow"]["section"] == "flow"
+    assert metrics["dora"]["section"] == "dora"
+    assert metrics["burndown"]["section"] == "burndown"
+    assert metrics["bug_analysis"]["section"] == "bug"
+    assert metrics["scope"]["section"] == "scope"
+    assert seen_queries == ["q7"] * 5
+    assert len(messages) == 6
+    assert any(
+        message.startswith("Calculated dashboard metrics (") for message in messages
+    )
@@ -0,0 +1,102 @@
+"""Tests for point-in-time status lookups (data/status_interval_index.py)."""
+
+from datetime import UTC, datetime
+
+from data.changelog_processor import get_status_at_point_in_time
+from data.status_interval_index import StatusIntervalIndex
+
+
+def _history(created: str, *transitions: tuple[str, str]) -> dict:
+    return {
+        "created": created,
+        "items": [
+            {"field": "status", "fromString": old, "toString": new}
+            for old, new in transitions
+        ],
+    }
+
+
+ISSUES = [
+    {
+        "key": "DEV-1",
+        "created": "2025-01-01T09:00:00.000+0000",
+        "status": "Done",
+        "changelog": {
+            # Deliberately out of order, with two changes at one timestamp
+            "histories": [
+                _history("2025-01-10T09:00:00.000+0000", ("In Progress", "Done")),
+                _history(
+                    "2025-01-05T09:00:00.000+0000",
+                    ("To Do", "In Progress"),
+                    ("In Progress", "Blocked"),
+                ),
+                _history("2025-01-07T09:00:00.000+0000", ("Blocked", "")),
+            ]
+        },
+    },
+    {"key": "DEV-2", "created": "2025-01-06T00:00:00Z", "status": "To Do"},
+    {"key": "DEV-3", "status": "To Do"},
+    {
+        "key": "DEV-4",
+        "fields": {"created": "2025-01-01T00:00:00Z", "status": {"name": "Open"}},
+        "changelog": {"histories": [_history("not a date", ("Open", "Closed"))]},
+    },
+]
+
+
+def test_issue_changelog_lookups_follow_point_in_time_rules() -> None:
+    index = StatusIntervalIndex.from_issues(ISSUES)
+
+    def statuses(day: int, hour: int = 12) -> list[str | None]:
+        return index.statuses_at(datetime(2025, 1, day, hour))
+
+    assert statuses(2) == ["Done", None, None, None]
+    # A change exactly at the lookup time does not apply yet
+    assert index.status_of("DEV-1", datetime(2025, 1, 5, 9)) == "Done"
+    # First change wins on equal timestamps
+    assert statuses(6) == ["In Progress", "To Do", None, None]
+    # An empty target status falls back to the current status
+    assert statuses(8)[0] == "Done"
+    assert index.status_of("DEV-1", datetime(2025, 1, 6, tzinfo=UTC)) == ("In Progress")
+    assert index.status_of("UNKNOWN", datetime(2025, 1, 6)) is None
+
+    for day in range(1, 12):
+        for issue, status in zip(ISSUES, statuses(day), strict=True):
+            assert get_status_at_point_in_time(issue, datetime(2025, 1, day, 12)) == (
+                status
+            )
+
+
+def test_changelog_entry_lookups_follow_sprint_rules() -> None:
+    issues = [{"key": "DEV-1", "status": "Done"}, {"key": "DEV-2", "status": "New"}]
+    entries = [
+        {
+            "issue_key": "DEV-1",
+            "change_date": "2026-02-02T14:00:00",
+            "old_value": "In Progress",
+            "new_value": "Done",
+        },
+        {
+            "issue_key": "DEV-1",
+            "change_date": "2026-02-02T10:00:00Z",
+            "old_value": "To Do",
+            "new_value": "In Progress",
+        },
+        {
+            "issue_key": "DEV-1",
+            "change_date": "2026-02-02T10:00:00Z",
+            "old_value": "In Progress",
+            "new_value": "In Review",
+        },
+        {"issue_key": "DEV-9", "change_date": "2026-02-01T00:00:00Z"},
+    ]
+    index = StatusIntervalIndex.from_changelog_entries(issues, entries)
+
+    def statuses(hour: int) -> list[str | None]:
+        return index.statuses_at(datetime(2026, 2, 2, hour, tzinfo=UTC))
+
+    assert index.keys == ["DEV-1", "DEV-2"]
+    assert statuses(9) == ["To Do", "New"]
+    # Changes at the lookup time apply and the last one of a timestamp wins
+    assert statuses(10) == ["In Review", "New"]
+    assert statuses(14) == ["Done", "New"]
@@ -0,0 +1,92 @@
+"""Tests for the in-memory task progress and cancellation channel."""
+
+import pytest
+
+from data import task_progress
+from data.persistence.factory import get_backend
+from data.task_progress import TaskProgress
+
+
+@pytest.fixture
+def live_channel(temp_database, monkeypatch):
+    """Start every test without a live task and with a long mirror interval."""
+    monkeypatch.setattr(task_progress, "_live_state", None)
+    monkeypatch.setattr(task_progress, "_last_mirror", 0.0)
+    monkeypatch.setattr(task_progress, "PROGRESS_MIRROR_INTERVAL_SECONDS", 3600.0)
+    task_progress._cancel_event.clear()
+    yield
+    task_progress._cancel_event.clear()
+
+
+def test_progress_is_served_from_memory_and_mirrored_throttled(live_channel):
+    assert TaskProgress.start_task("update_data", "Updating data from JIRA")
+
+    TaskProgress.update_progress("update_data", "fetch", 10, 40, "Page 1")
+    TaskProgress.update_progress("update_data", "fetch", 20, 40, "Page 2")
+
+    live = TaskProgress.get_task_state()
+    mirrored = get_backend().get_task_state()
+    assert live is not None and mirrored is not None
+    assert live["fetch_progress"]["current"] == 20
+    assert live["fetch_progress"]["percent"] == 50
+    assert mirrored["fetch_progress"]["current"] == 0
+
+
+def test_phase_change_and_completion_are_mirrored(live_channel):
+    TaskProgress.start_task("update_data", "Updating data from JIRA")
+    TaskProgress.update_progress("update_data", "fetch", 40, 40, "Done")
+
+    TaskProgress.update_progress("update_data", "calculate", 1, 10, "Week 1")
+    mirrored = get_backend().get_task_state()
+    assert mirrored is not None
+    assert mirrored["phase"] == "calculate"
+    assert mirrored["fetch_progress"]["percent"] == 100
+
+    TaskProgress.complete_task("update_data", "Updated")
+    mirrored = get_backend().get_task_state()
+    assert mirrored is not None
+    assert mirrored["status"] == "complete"
+    assert mirrored["ui_state"] == {"operation_in_progress": False}
+
+
+def test_cancel_sets_event_and_mirrors_flag(live_channel, monkeypatch):
+    TaskProgress.start_task("update_data", "Updating data from JIRA")
+    assert not TaskProgress.is_task_cancelled()
+
+    assert TaskProgress.cancel_task()
+
+    with monkeypatch.context() as patched:
+        patched.setattr(
+            task_progress,
+            "_get_backend",
+            lambda: pytest.fail("cancellation check must not hit the database"),
+        )
+        assert TaskProgress.is_task_cancelled()
+    mirrored = get_backend().get_task_state()
+    assert mirrored is not None and mirrored["cancelled"] is True
+
+
+def test_new_task_resets_cancellation(live_channel):
+    TaskProgress.start_task("update_data", "Updating data from JIRA")
+    TaskProgress.cancel_task()
+    TaskProgress.fail_task("update_data", "Operation cancelled by user")
+
+    assert TaskProgress.start_task("update_data", "Updating data from JIRA")
+
+    assert not TaskProgress.is_task_cancelled()
+
+
+def test_database_row_is_read_without_live_task(live_channel):
+    get_backend().save_task_state(
+        {"task_id": "update_data", "status": "error", "cancelled": True}
+    )
+
+    assert TaskProgress.get_task_state() == {
+        "task_id": "update_data",
+        "status": "error",
+        "cancelled": True,
+    }
+    assert TaskProgress.is_task_cancelled()
+
+    TaskProgress.clear_task_state()
+    assert TaskProgress.get_task_state() is None
@@ -0,0 +1,85 @@
+"""
+Tests for utils/startup_profiler.py
+
+Covers phase and import timing, report contents, and that a disabled
+profiler records nothing and writes no file.
+"""
+
+import json
+import sys
+
+from utils.startup_profiler import REPORT_FILENAME, StartupProfiler
+
+
+class TestStartupProfiler:
+    def test_disabled_profiler_is_noop(self, tmp_path) -> None:
+        profiler = StartupProfiler(enabled=False)
+        profiler.install_import_hook()
+        with profiler.phase("migration"):
+            pass
+        profiler.mark("imports")
+
+        assert profiler.phases == []
+        assert profiler._finder is None
+        assert profiler.write_report(tmp_path) is None
+        assert not (tmp_path / REPORT_FILENAME).exists()
+
+    def test_phases_and_marks_recorded_in_order(self) -> None:
+        profiler = StartupProfiler(enabled=True)
+        profiler.mark("imports")
+        with profiler.phase("migration"):
+            pass
+
+        names = [entry["name"] for entry in profiler.phases]
+        assert names == ["imports", "migration"]
+        assert all(entry["duration_ms"] >= 0 for entry in profiler.phases)
+
+    def test_from_environment(self, monkeypatch) -> None:
+        monkeypatch.setattr(sys, "argv", ["app.py"])
+        monkeypatch.delenv("BURNDOWN_STARTUP_PROFILE", raising=False)
+        assert StartupProfiler.from_environment().enabled is False
+
+        monkeypatch.setenv("BURNDOWN_STARTUP_PROFILE", "1")
+        assert StartupProfiler.from_environment().enabled is True
+
+        monkeypatch.delenv("BURNDOWN_STARTUP_PROFILE")
+        monkeypatch.setattr(sys, "argv", ["app.py", "--startup-profile"])
+        assert StartupProfiler.from_environment().enabled is True
+
+    def test_import_hook_times_new_imports(self, tmp_path, monkeypatch) -> None:
+        (tmp_path / "profiled_pkg").mkdir()
+        (tmp_path / "profiled_pkg" / "__init__.py").write_text("from . import child\n")
+        (tmp_path / "profiled_pkg" / "child.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = StartupProfiler(enabled=True)
+        profiler.install_import_hook()
+        try:
+            import profiled_pkg  # noqa: F401, PLC0415  # pyright: ignore[reportMissingImports]
+        finally:
+            profiler.remove_import_hook()
+            sys.modules.pop("profiled_pkg", None)
+            sys.modules.pop("profiled_pkg.child", None)
+
+        parent = profiler.imports["profiled_pkg"]
+        child = profiler.imports["profiled_pkg.child"]
+        assert parent["inclusive_ms"] >= child["inclusive_ms"]
+        assert parent["self_ms"] <= parent["inclusive_ms"]
+
+        report = profiler.build_report()
+        assert report["import_count"] == 2
+        assert "profiled_pkg" in report["imports_by_package_ms"]
+
+    def test_write_report(self, tmp_path) -> None:
+        profiler = StartupProfiler(enabled=True)
+        with profiler.phase("callback registration"):
+            pass
+
+        report_path = profiler.write_report(tmp_path / "logs")
+
+        assert report_path is not None
+        assert report_path == tmp_path / "logs" / REPORT_FILENAME
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["phases"][0]["name"] == "callback registration"
+        assert report["total_ms"] >= report["phases"][0]["duration_ms"]
+        assert set(report) >= {"slowest_imports", "imports_by_package_ms"}
@@ -15,6 +15,8 @@ from datetime import datetime, timedelta
 from dash import html
 
 from data.persistence import load_unified_project_data
+from data.processing import calculate_monte_carlo_forecast, compute_weekly_throughput
+from data.types import MonteCarloForecast
 from ui.budget_section import _create_budget_section
 from ui.dashboard.activity_quality import (
     create_quality_scope_section,
@@ -223,7 +225,22 @@ def create_comprehensive_dashboard(
                 f"statistics_rows={len(statistics_df)}"
             )
 
+    # Monte Carlo forecast from the same weekly throughput as the PERT forecast.
+    # The report runs the same simulation, so both show the same percentiles.
+    monte_carlo: MonteCarloForecast = {"items": None, "points": None, "trials": 0}
+    if not statistics_df.empty and "date" in statistics_df.columns:
+        monte_carlo = calculate_monte_carlo_forecast(
+            compute_weekly_throughput(statistics_df),
+            total_items,
+            total_points,
+            days_to_deadline if deadline_str else None,
+        )
+    monte_carlo_items = monte_carlo["items"]
+    monte_carlo_points = monte_carlo["points"] if pert_time_points else None
+    monte_carlo_forecast = monte_carlo_points or monte_carlo_items
+
     # Calculate statistically-based confidence intervals
+    # (fallback when there is no throughput history to simulate)
     # Using Monte Carlo-inspired approach:
     # forecast uncertainty grows with remaining work
     # Standard error of completion time ≈
@@ -270,6 +287,15 @@ def create_comprehensive_dashboard(
         else None
     )
 
+    # Simulated deadline odds replace the normal approximation when available
+    if monte_carlo_items and monte_carlo_items["deadline_probability"] is not None:
+        deadline_probability_items = monte_carlo_items["deadline_probability"]
+    if monte_carlo_points and monte_carlo_points["deadline_probability"] is not None:
+        deadline_probability_points = monte_carlo_points["deadline_probability"]
+    forecast_data["deadline_probability"] = (
+        monte_carlo_forecast["deadline_probability"] if monte_carlo_forecast else None
+    )
+
     if forecast_days and velocity_mean > 0 and velocity_std > 0:
         # Coefficient of variation as a ratio (not percentage)
         cv_ratio = velocity_std / velocity_mean
@@ -305,6 +331,13 @@ def create_comprehensive_dashboard(
             else deadline_probability_items
         )
 
+    # Monte Carlo percentiles replace the sigma-based intervals when available
+    ci_85_days = None
+    if monte_carlo_forecast:
+        ci_50_days = monte_carlo_forecast["p50_days"]
+        ci_85_days = monte_carlo_forecast["p85_days"]
+        ci_95_days = monte_carlo_forecast["p95_days"]
+
     # Ensure deadline_probability is not None before using in min()
     final_deadline_prob = (
         deadline_probability if deadline_probability is not None else 75
@@ -313,12 +346,14 @@ def create_comprehensive_dashboard(
     confidence_data = {
         "ci_50": max(0, ci_50_days),
         "ci_80": pert_time_items if pert_time_items else 0,  # Keep for compatibility
+        "ci_85": max(0, ci_85_days) if ci_85_days is not None else None,
         "ci_95": max(0, ci_95_days),
         "deadline_probability": max(0, min(100, final_deadline_prob)),
         "deadline_probability_items": max(0, min(100, deadline_probability_items)),
         "deadline_probability_points": max(0, min(100, deadline_probability_points))
-        if deadline_probability_points
+        if deadline_probability_points is not None
         else None,
+        "monte_carlo": monte_carlo,
     }
 
     # Prepare settings for sections
@@ -195,6 +195,8 @@ def create_executive_summary_section(
         "trend_direction": trend_direction,
         "recent_velocity_change": recent_velocity_change,
         "completion_confidence": completion_confidence,
+        # Monte Carlo odds of meeting the deadline (None without deadline/data)
+        "deadline_probability": forecast_data.get("deadline_probability"),
     }
 
     # DEBUG: Log health metrics to trace 18% vs 13% discrepancy
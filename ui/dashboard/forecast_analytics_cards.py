@@ -219,6 +219,72 @@ def _build_expected_completion_card(
     )
 
 
+def _build_confidence_interval_row(
+    label: str,
+    icon_class: str,
+    icon_color: str,
+    date_text: str,
+    status: dict,
+    row_between_class: str,
+    **row_props: Any,
+) -> html.Div:
+    """Build one confidence level (label, date, status badge and bar)."""
+    return html.Div(
+        [
+            html.Div(
+                [
+                    html.I(
+                        className=f"fas {icon_class} me-1",
+                        style={"color": icon_color, "fontSize": "0.9rem"},
+                    ),
+                    html.Span(
+                        label,
+                        className="text-muted",
+                        style={"fontSize": "0.75rem"},
+                    ),
+                ],
+                className="mb-1",
+            ),
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.Span(
+                                date_text,
+                                className="text-muted",
+                                style={"fontSize": "0.85rem", "fontWeight": "600"},
+                            ),
+                            html.Span(
+                                status["badge_text"],
+                                className="badge ms-2",
+                                style={
+                                    "backgroundColor": status["color"],
+                                    "fontSize": "0.75rem",
+                                },
+                            ),
+                        ],
+                        className=row_between_class,
+                    ),
+                    html.Div(
+                        html.Div(
+                            f"{status['percentage']:.1f}%",
+                            className="progress-bar",
+                            style={
+                                "width": f"{status['bar_width']}%",
+                                "backgroundColor": status["color"],
+                            },
+                            role="progressbar",
+                        ),
+                        className="progress",
+                        style={"height": "20px"},
+                    ),
+                ],
+            ),
+        ],
+        **row_props,
+    )
+
+
 def _build_confidence_intervals_card(
     optimistic_date: str,
     pessimistic_date: str,
@@ -226,8 +292,51 @@ def _build_confidence_intervals_card(
     ci_95_status: dict,
     confidence_intervals_tooltip: str,
     row_between_class: str,
+    likely_date: str | None = None,
+    ci_85_status: dict | None = None,
 ) -> dbc.Card:
-    """Build the Confidence Intervals metric card."""
+    """Build the Confidence Intervals metric card.
+
+    The 85% row is only shown when a Monte Carlo forecast provides it.
+    """
+    divided = {
+        "className": "pb-3 mb-3",
+        "style": {"borderBottom": "1px solid #e9ecef"},
+    }
+    rows = [
+        _build_confidence_interval_row(
+            "50% Confidence",
+            "fa-thumbs-up",
+            "#28a745",
+            optimistic_date,
+            ci_50_status,
+            row_between_class,
+            **divided,
+        )
+    ]
+    if likely_date and ci_85_status:
+        rows.append(
+            _build_confidence_interval_row(
+                "85% Confidence",
+                "fa-balance-scale",
+                "#fd7e14",
+                likely_date,
+                ci_85_status,
+                row_between_class,
+                **divided,
+            )
+        )
+    rows.append(
+        _build_confidence_interval_row(
+            "95% Confidence",
+            "fa-shield-alt",
+            "#dc3545",
+            pessimistic_date,
+            ci_95_status,
+            row_between_class,
+        )
+    )
+
     return dbc.Card(
         [
             create_metric_card_header(
@@ -235,142 +344,7 @@ def _build_confidence_intervals_card(
                 tooltip_text=confidence_intervals_tooltip,
                 tooltip_id="metric-confidence_intervals",
             ),
-            dbc.CardBody(
-                [
-                    html.Div(
-                        [
-                            html.Div(
-                                [
-                                    html.I(
-                                        className="fas fa-thumbs-up me-1",
-                                        style={
-                                            "color": "#28a745",
-                                            "fontSize": "0.9rem",
-                                        },
-                                    ),
-                                    html.Span(
-                                        "50% Confidence",
-                                        className="text-muted",
-                                        style={"fontSize": "0.75rem"},
-                                    ),
-                                ],
-                                className="mb-1",
-                            ),
-                            html.Div(
-                                [
-                                    html.Div(
-                                        [
-                                            html.Span(
-                                                optimistic_date,
-                                                className="text-muted",
-                                                style={
-                                                    "fontSize": "0.85rem",
-                                                    "fontWeight": "600",
-                                                },
-                                            ),
-                                            html.Span(
-                                                ci_50_status["badge_text"],
-                                                className="badge ms-2",
-                                                style={
-                                                    "backgroundColor": ci_50_status[
-                                                        "color"
-                                                    ],
-                                                    "fontSize": "0.75rem",
-                                                },
-                                            ),
-                                        ],
-                                        className=row_between_class,
-                                    ),
-                                    html.Div(
-                                        html.Div(
-                                            f"{ci_50_status['percentage']:.1f}%",
-                                            className="progress-bar",
-                                            style={
-                                                "width": (
-                                                    f"{ci_50_status['bar_width']}%"
-                                                ),
-                                                "backgroundColor": ci_50_status[
-                                                    "color"
-                                                ],
-                                            },
-                                            role="progressbar",
-                                        ),
-                                        className="progress",
-                                        style={"height": "20px"},
-                                    ),
-                                ],
-                            ),
-                        ],
-                        className="pb-3 mb-3",
-                        style={"borderBottom": "1px solid #e9ecef"},
-                    ),
-                    html.Div(
-                        [
-                            html.Div(
-                                [
-                                    html.I(
-                                        className="fas fa-shield-alt me-1",
-                                        style={
-                                            "color": "#dc3545",
-                                            "fontSize": "0.9rem",
-                                        },
-                                    ),
-                                    html.Span(
-                                        "95% Confidence",
-                                        className="text-muted",
-                                        style={"fontSize": "0.75rem"},
-                                    ),
-                                ],
-                                className="mb-1",
-                            ),
-                            html.Div(
-                                [
-                                    html.Div(
-                                        [
-                                            html.Span(
-                                                pessimistic_date,
-                                                className="text-muted",
-                                                style={
-                                                    "fontSize": "0.85rem",
-                                                    "fontWeight": "600",
-                                                },
-                                            ),
-                                            html.Span(
-                                                ci_95_status["badge_text"],
-                                                className="badge ms-2",
-                                                style={
-                                                    "backgroundColor": ci_95_status[
-                                                        "color"
-                                                    ],
-                                                    "fontSize": "0.75rem",
-                                                },
-                                            ),
-                                        ],
-                                        className=row_between_class,
-                                    ),
-                                    html.Div(
-                                        html.Div(
-                                            f"{ci_95_status['percentage']:.1f}%",
-                                            className="progress-bar",
-                                            style={
-                                                "width": (
-                                                    f"{ci_95_status['bar_width']}%"
-                                                ),
-                                                "backgroundColor": ci_95_status[
-                                                    "color"
-                                                ],
-                                            },
-                                            role="progressbar",
-                                        ),
-                                        className="progress",
-                                        style={"height": "20px"},
-                                    ),
-                                ],
-                            ),
-                        ],
-                    ),
-                ],
-            ),
+            dbc.CardBody(rows),
             dbc.CardFooter(
                 html.Small(
                     "Statistical delivery probability ranges",
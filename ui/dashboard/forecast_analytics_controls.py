@@ -146,7 +146,7 @@ def _build_on_track_card(
         dbc.Card component
     """
     points_track_content: Any
-    if show_points and deadline_prob_points is not None and deadline_prob_points > 0:
+    if show_points and deadline_prob_points is not None:
         points_track_content = html.Div(
             [
                 html.Div(
@@ -65,13 +65,20 @@ def create_forecast_analytics_section(
     pessimistic_date = (
         current_date + timedelta(days=confidence_data.get("ci_95", 0))
     ).strftime("%Y-%m-%d")
+    # 85% level only exists when the Monte Carlo forecast ran
+    has_monte_carlo = confidence_data.get("ci_85") is not None
+    likely_date = (
+        (current_date + timedelta(days=confidence_data["ci_85"])).strftime("%Y-%m-%d")
+        if has_monte_carlo
+        else None
+    )
 
     deadline_prob_items = confidence_data.get("deadline_probability_items", 75)
     deadline_prob_points = confidence_data.get("deadline_probability_points")
 
     deadline_prob = (
         deadline_prob_points
-        if (show_points and deadline_prob_points)
+        if (show_points and deadline_prob_points is not None)
         else deadline_prob_items
     )
     prob_tier, prob_color = _get_probability_tier(deadline_prob)
@@ -92,6 +99,11 @@ def create_forecast_analytics_section(
     ci_95_status = calculate_schedule_status(
         pessimistic_date, deadline_str, current_date
     )
+    ci_85_status = (
+        calculate_schedule_status(likely_date, deadline_str, current_date)
+        if likely_date
+        else None
+    )
 
     row_between_class = "d-flex justify-content-between align-items-center mb-2"
     points_disabled_text = (
@@ -110,21 +122,37 @@ def create_forecast_analytics_section(
         "while accounting for best/worst cases from historical velocity data. "
         "Same method used in Burndown and Report."
     )
-    confidence_intervals_tooltip = (
-        "Statistical probability ranges based on "
-        f"{forecast_metric} velocity variability. "
-        "50%: 50th percentile (median) - the PERT forecast itself. "
-        "95%: 95th percentile - conservative estimate with 1.65 sigma buffer "
-        "(adds uncertainty for remaining work). "
-        "Wider spread indicates higher velocity uncertainty. "
-        "Calculated from historical data variance."
-    )
-    on_track_tooltip = (
-        "Statistical probability of meeting deadline using normal distribution. "
-        "Calculated via Z-score: (deadline_days - expected_days) / forecast_std_dev. "
-        "Based on how many standard deviations your deadline is from expected "
-        "completion, adjusted for velocity consistency."
-    )
+    if has_monte_carlo:
+        confidence_intervals_tooltip = (
+            f"Monte Carlo simulation: {confidence_data['monte_carlo']['trials']:,} "
+            "possible futures, each replaying "
+            f"randomly drawn historical weeks of {forecast_metric} throughput "
+            "until the remaining work is done. "
+            "50%/85%/95%: share of simulated futures finished by that date. "
+            "Wider spread indicates higher velocity uncertainty."
+        )
+        on_track_tooltip = (
+            "Share of Monte Carlo simulated futures that finish by the deadline. "
+            "Each future replays randomly drawn historical weeks of throughput, "
+            "so velocity variability is taken directly from your data."
+        )
+    else:
+        confidence_intervals_tooltip = (
+            "Statistical probability ranges based on "
+            f"{forecast_metric} velocity variability. "
+            "50%: 50th percentile (median) - the PERT forecast itself. "
+            "95%: 95th percentile - conservative estimate with 1.65 sigma buffer "
+            "(adds uncertainty for remaining work). "
+            "Wider spread indicates higher velocity uncertainty. "
+            "Calculated from historical data variance."
+        )
+        on_track_tooltip = (
+            "Statistical probability of meeting deadline using normal "
+            "distribution. Calculated via Z-score: "
+            "(deadline_days - expected_days) / forecast_std_dev. "
+            "Based on how many standard deviations your deadline is from expected "
+            "completion, adjusted for velocity consistency."
+        )
 
     expected_completion_card = _build_expected_completion_card(
         items_pert_date=items_pert_date,
@@ -145,6 +173,8 @@ def create_forecast_analytics_section(
         ci_95_status=ci_95_status,
         confidence_intervals_tooltip=confidence_intervals_tooltip,
         row_between_class=row_between_class,
+        likely_date=likely_date,
+        ci_85_status=ci_85_status,
     )
 
     on_track_card = _build_on_track_card(
@@ -124,6 +124,7 @@ def calculate_project_health_score(
         recent_velocity_change=metrics.get("recent_velocity_change", 0),
         schedule_variance_days=metrics.get("schedule_variance_days", 0),
         completion_confidence=metrics.get("completion_confidence", 50),
+        deadline_probability=metrics.get("deadline_probability"),
     )
 
     completion_pct = metrics.get("completion_percentage", 0)
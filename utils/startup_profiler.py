@@ -0,0 +1,258 @@
+"""
+Startup Profiler Utility
+
+Records how long application startup takes, phase by phase and module by
+module, so slow launches (especially of the frozen Windows executable) can be
+diagnosed from a report instead of guesswork.
+
+Profiling is off by default and costs nothing then. Enable it with the
+BURNDOWN_STARTUP_PROFILE=1 environment variable or the --startup-profile
+command line flag. When enabled:
+
+- every module imported after this one is timed through an import hook
+  (inclusive time and self time, excluding nested imports)
+- app.py wraps each startup phase (migration, workspace validation, callback
+  registration, layout build, ...) in startup_profiler.phase()
+- write_report() saves startup_profile.json and logs the slowest entries
+"""
+
+#######################################################################
+# IMPORTS
+#######################################################################
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from importlib.abc import Loader, MetaPathFinder
+from pathlib import Path
+
+#######################################################################
+# CONFIGURATION
+#######################################################################
+
+logger = logging.getLogger(__name__)
+
+STARTUP_PROFILE_ENV = "BURNDOWN_STARTUP_PROFILE"
+STARTUP_PROFILE_FLAG = "--startup-profile"
+REPORT_FILENAME = "startup_profile.json"
+
+# Number of slowest imports listed in the log summary and the report
+TOP_IMPORTS = 25
+
+#######################################################################
+# IMPORT TIMING
+#######################################################################
+
+
+class _TimedLoader(Loader):
+    """Loader wrapper that times exec_module of the wrapped loader."""
+
+    def __init__(self, loader: Loader, fullname: str, profiler: StartupProfiler):
+        self._loader = loader
+        self._fullname = fullname
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._profiler._enter_import(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(self._fullname)
+
+    def __getattr__(self, name: str):
+        # get_data, is_package, get_resource_reader, ... of the real loader
+        return getattr(self._loader, name)
+
+
+class _TimedImportFinder(MetaPathFinder):
+    """Meta path finder that wraps every found loader in a _TimedLoader."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, fullname, self._profiler)
+            return spec
+        return None
+
+
+#######################################################################
+# PROFILER
+#######################################################################
+
+
+class StartupProfiler:
+    """
+    Collects startup phase and import timings.
+
+    All methods are no-ops while disabled, so app.py can call them
+    unconditionally.
+
+    Example:
+        >>> profiler = StartupProfiler(enabled=True)
+        >>> with profiler.phase("migration"):
+        ...     run_migration_if_needed()
+        >>> profiler.write_report(Path("logs"))
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.started_at = time.perf_counter()
+        self.phases: list[dict] = []
+        self.imports: dict[str, dict] = {}
+        self._last_mark = self.started_at
+        self._import_stack: list[list] = []
+        self._finder: _TimedImportFinder | None = None
+
+    @classmethod
+    def from_environment(cls) -> StartupProfiler:
+        """Create a profiler enabled by the environment variable or CLI flag."""
+        enabled = (
+            os.environ.get(STARTUP_PROFILE_ENV, "0") == "1"
+            or STARTUP_PROFILE_FLAG in sys.argv
+        )
+        return cls(enabled=enabled)
+
+    def install_import_hook(self) -> None:
+        """Start timing every module imported from now on."""
+        if not self.enabled or self._finder is not None:
+            return
+        self._finder = _TimedImportFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def remove_import_hook(self) -> None:
+        """Stop timing imports."""
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def _enter_import(self, fullname: str) -> None:
+        # [name, start, time spent in nested imports]
+        self._import_stack.append([fullname, time.perf_counter(), 0.0])
+
+    def _exit_import(self, fullname: str) -> None:
+        name, start, nested = self._import_stack.pop()
+        inclusive = time.perf_counter() - start
+        if self._import_stack:
+            self._import_stack[-1][2] += inclusive
+        self.imports[name] = {
+            "inclusive_ms": round(inclusive * 1000, 2),
+            "self_ms": round((inclusive - nested) * 1000, 2),
+        }
+
+    def _record_phase(self, name: str, start: float) -> None:
+        end = time.perf_counter()
+        self._last_mark = end
+        self.phases.append(
+            {
+                "name": name,
+                "offset_ms": round((start - self.started_at) * 1000, 2),
+                "duration_ms": round((end - start) * 1000, 2),
+            }
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named startup phase."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_phase(name, start)
+
+    def mark(self, name: str) -> None:
+        """Record the time since the previous phase (or start) as a phase."""
+        if self.enabled:
+            self._record_phase(name, self._last_mark)
+
+    def build_report(self) -> dict:
+        """Return the collected timings as a JSON-serializable dict."""
+        slowest = sorted(
+            self.imports.items(), key=lambda item: item[1]["self_ms"], reverse=True
+        )
+        top_level: dict[str, float] = {}
+        for name, timing in self.imports.items():
+            package = name.split(".", 1)[0]
+            top_level[package] = top_level.get(package, 0.0) + timing["self_ms"]
+        return {
+            "generated_at": datetime.now(UTC).isoformat(),
+            "total_ms": round((time.perf_counter() - self.started_at) * 1000, 2),
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "phases": self.phases,
+            "import_count": len(self.imports),
+            "imports_by_package_ms": dict(
+                sorted(
+                    ((name, round(ms, 2)) for name, ms in top_level.items()),
+                    key=lambda item: item[1],
+                    reverse=True,
+                )
+            ),
+            "slowest_imports": [
+                {"module": name, **timing} for name, timing in slowest[:TOP_IMPORTS]
+            ],
+        }
+
+    def write_report(self, output_dir: Path) -> Path | None:
+        """
+        Write startup_profile.json and log a summary.
+
+        Args:
+            output_dir: Directory for the report (normally the logs directory)
+
+        Returns:
+            Path of the written report, or None when profiling is disabled
+            or the report could not be written
+        """
+        if not self.enabled:
+            return None
+        self.remove_import_hook()
+        report = self.build_report()
+
+        logger.info(f"[Startup Profile] Total startup: {report['total_ms']:.0f} ms")
+        for entry in report["phases"]:
+            logger.info(
+                f"[Startup Profile] Phase {entry['name']}: "
+                f"{entry['duration_ms']:.0f} ms"
+            )
+        for entry in report["slowest_imports"][:10]:
+            logger.info(
+                f"[Startup Profile] Import {entry['module']}: "
+                f"{entry['self_ms']:.0f} ms self, "
+                f"{entry['inclusive_ms']:.0f} ms total"
+            )
+
+        report_path = Path(output_dir) / REPORT_FILENAME
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"[Startup Profile] Failed to write report: {e}")
+            return None
+        logger.info(f"[Startup Profile] Report written to {report_path}")
+        return report_path
+
+
+# Created (and hooked) on first import, so app.py imports this module before
+# any heavy dependency to include them in the import timings.
+startup_profiler = StartupProfiler.from_environment()
+startup_profiler.install_import_hook()